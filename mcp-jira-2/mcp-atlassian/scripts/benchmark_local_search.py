@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+"""
+Local search benchmark for MCP Atlassian
+
+Measures the offline full-text index behind jira_local_search and
+confluence_local_search: how fast synthetic issues and pages are synced into
+the SQLite mirrors (see JIRA_MIRROR_PATH and CONFLUENCE_MIRROR_PATH), and the
+latency of ranked queries against them.
+
+Usage:
+    python scripts/benchmark_local_search.py
+    python scripts/benchmark_local_search.py --issues 50000 --pages 5000
+    python scripts/benchmark_local_search.py --path /tmp/bench --queries 500
+
+No Atlassian instance is needed: issues and pages are generated and served by
+an in-process stand-in for the fetchers, so the timings cover conversion,
+SQLite writes and FTS5 indexing only.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import the package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["ATLASSIAN_CONVERSION_CACHE_TTL"] = "0"
+
+from src.mcp_atlassian.confluence.mirror import PageMirror  # noqa: E402
+from src.mcp_atlassian.jira.mirror import IssueMirror  # noqa: E402
+from src.mcp_atlassian.preprocessing.confluence import (  # noqa: E402
+    ConfluencePreprocessor,
+)
+
+WORDS = (
+    "gateway importer exporter timeout crash retry queue cache index payment "
+    "invoice login session token upgrade migration schema billing report "
+    "dashboard latency memory leak deadlock release rollback deploy staging "
+    "production customer tenant webhook scheduler backup restore search"
+).split()
+
+QUERIES = [
+    "gateway timeout",
+    "importer crash*",
+    "payment OR invoice",
+    "memory leak",
+    "rollback",
+    "deploy staging",
+    "webhook retry queue",
+    "migra*",
+]
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+class _Fetcher:
+    """Fetcher stand-in serving generated results in pages."""
+
+    def __init__(self, items: list[dict], page_size: int) -> None:
+        self.items = items
+        self.page_size = page_size
+        self.config = SimpleNamespace(
+            url="https://example.atlassian.net",
+            is_cloud=True,
+            auth_type="basic",
+            username="benchmark",
+            api_token="benchmark",  # noqa: S106
+            projects_filter=None,
+            spaces_filter=None,
+        )
+        self.jira = SimpleNamespace(myself=lambda: {"timeZone": "UTC"})
+        self.preprocessor = ConfluencePreprocessor(base_url=self.config.url)
+
+    def _pages(self) -> Iterator[list[dict]]:
+        for start in range(0, len(self.items), self.page_size):
+            yield self.items[start : start + self.page_size]
+
+    def iter_search_raw(
+        self, query: str, *args: object, **kwargs: object
+    ) -> Iterator[list[dict]]:
+        return self._pages()
+
+
+def synthetic_issues(count: int, rng: random.Random) -> list[dict]:
+    return [
+        {
+            "id": str(n),
+            "key": f"BENCH-{n}",
+            "fields": {
+                "summary": sentence(rng, 8),
+                "description": "\n".join(sentence(rng, 20) for _ in range(5)),
+                "comment": {
+                    "comments": [{"body": sentence(rng, 25)} for _ in range(3)]
+                },
+                "status": {"name": "Open"},
+                "issuetype": {"name": "Bug"},
+                "project": {"key": "BENCH"},
+                "updated": "2024-03-01T10:00:00.000+0000",
+            },
+        }
+        for n in range(count)
+    ]
+
+
+def synthetic_pages(count: int, rng: random.Random) -> list[dict]:
+    return [
+        {
+            "content": {
+                "id": str(n),
+                "title": sentence(rng, 5),
+                "space": {"key": "BENCH"},
+                "version": {"number": 1, "when": "2024-03-01T10:00:00.000Z"},
+                "body": {
+                    "storage": {
+                        "value": "".join(
+                            f"<h2>{sentence(rng, 3)}</h2><p>{sentence(rng, 60)}</p>"
+                            for _ in range(6)
+                        )
+                    }
+                },
+            }
+        }
+        for n in range(count)
+    ]
+
+
+def time_queries(search: Callable[[str], object], queries: int) -> list[float]:
+    """Run the query set round-robin and return the latencies in seconds."""
+    latencies = []
+    for n in range(queries):
+        start = time.perf_counter()
+        search(QUERIES[n % len(QUERIES)])
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(
+    name: str, items: int, unit: str, index_s: float, latencies: list[float]
+) -> None:
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p95 = latencies_ms[int(len(latencies_ms) * 0.95) - 1]
+    print(
+        f"{name:11} indexed {items} {unit} in {index_s:6.2f} s "
+        f"({items / index_s:8.0f}/s)  query p50 "
+        f"{statistics.median(latencies_ms):6.2f} ms  p95 {p95:6.2f} ms  "
+        f"max {latencies_ms[-1]:6.2f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--issues", type=int, default=10000, help="Issues to index")
+    parser.add_argument("--pages", type=int, default=1000, help="Pages to index")
+    parser.add_argument("--queries", type=int, default=200, help="Queries to time")
+    parser.add_argument("--limit", type=int, default=10, help="Results per query")
+    parser.add_argument("--path", help="Directory for the databases (default: temp)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)  # noqa: S311 - reproducible test data
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.path or tmp
+
+        issues = IssueMirror(os.path.join(directory, "issues.db"), ["BENCH"], 300, 0)
+        fetcher = _Fetcher(synthetic_issues(args.issues, rng), page_size=100)
+        start = time.perf_counter()
+        issues.sync(fetcher, full=True)
+        elapsed = time.perf_counter() - start
+        latencies = time_queries(
+            lambda q: issues.search_text(fetcher, q, limit=args.limit), args.queries
+        )
+        report("jira", args.issues, "issues", elapsed, latencies)
+        issues.close()
+
+        pages = PageMirror(os.path.join(directory, "pages.db"), ["BENCH"], 0)
+        fetcher = _Fetcher(synthetic_pages(args.pages, rng), page_size=50)
+        start = time.perf_counter()
+        pages.sync(fetcher, full=True)
+        elapsed = time.perf_counter() - start
+        latencies = time_queries(
+            lambda q: pages.search_text(fetcher, q, limit=args.limit), args.queries
+        )
+        report("confluence", args.pages, "pages", elapsed, latencies)
+        pages.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Tool output encoding benchmark for MCP Atlassian
+
+Compares the output formats of the search tools (see ATLASSIAN_OUTPUT_FORMAT):
+the size in bytes of a search result encoded as pretty, compact and table
+JSON, with and without ATLASSIAN_OUTPUT_OMIT_EMPTY, and the time it takes to
+encode it.
+
+Usage:
+    python scripts/benchmark_output_format.py
+    python scripts/benchmark_output_format.py --issues 5000 --rounds 20
+    python scripts/benchmark_output_format.py --fields "summary,status,assignee"
+
+No Atlassian instance is needed: the search responses are generated and
+converted the way jira_search converts them before encoding.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+# Add the parent directory to the path so we can import the package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS  # noqa: E402
+from src.mcp_atlassian.models.jira import JiraSearchProjection  # noqa: E402
+from src.mcp_atlassian.utils import output  # noqa: E402
+
+STATUSES = ["Open", "In Progress", "In Review", "Done"]
+PEOPLE = ["Ada Lovelace", "Alan Turing", "Grace Hopper", "Edsger Dijkstra"]
+
+
+def user(rng: random.Random) -> dict:
+    name = rng.choice(PEOPLE)
+    return {
+        "accountId": name.lower().replace(" ", "-"),
+        "displayName": name,
+        "emailAddress": f"{name.split()[0].lower()}@example.com",
+        "active": True,
+    }
+
+
+def synthetic_response(count: int, rng: random.Random) -> dict:
+    issues = []
+    for n in range(count):
+        status = rng.choice(STATUSES)
+        issues.append(
+            {
+                "id": str(10000 + n),
+                "key": f"BENCH-{n}",
+                "fields": {
+                    "summary": f"Synthetic issue {n}",
+                    "description": "Steps to reproduce\n" * rng.randint(0, 3),
+                    "status": {
+                        "name": status,
+                        "statusCategory": {"name": status, "colorName": "blue-gray"},
+                    },
+                    "issuetype": {"name": "Bug"},
+                    "priority": {"name": "Medium"},
+                    "assignee": user(rng) if rng.random() < 0.7 else None,
+                    "reporter": user(rng),
+                    "labels": ["backend", "regression"][: rng.randint(0, 2)],
+                    "created": "2024-01-01T10:00:00.000+0000",
+                    "updated": "2024-03-01T10:00:00.000+0000",
+                },
+            }
+        )
+    return {"issues": issues, "total": count, "startAt": 0, "maxResults": count}
+
+
+def median_ms(encode: Callable[[], str], rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        encode()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--issues", type=int, default=1000, help="Issues per result")
+    parser.add_argument("--rounds", type=int, default=10, help="Encodings to time")
+    parser.add_argument(
+        "--fields",
+        default=",".join(sorted(DEFAULT_READ_JIRA_FIELDS)),
+        help="Requested fields (default: the search tool's default fields)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)  # noqa: S311 - reproducible test data
+    result = JiraSearchProjection.from_api_response(
+        synthetic_response(args.issues, rng), requested_fields=args.fields
+    ).to_simplified_dict()
+
+    print(
+        f"{args.issues} issues, fields: {args.fields}, "
+        f"serializer: {'orjson' if output.orjson is not None else 'json'}"
+    )
+    baseline = None
+    for omit in ("false", "true"):
+        os.environ["ATLASSIAN_OUTPUT_OMIT_EMPTY"] = omit
+        for output_format in output.OUTPUT_FORMATS:
+            size = len(output.format_output(result, output_format).encode())
+            elapsed = median_ms(
+                lambda f=output_format: output.format_output(result, f), args.rounds
+            )
+            baseline = baseline or (size, elapsed)
+            label = output_format + (" + omit" if omit == "true" else "")
+            print(
+                f"{label:16} {size:10,} bytes ({size / baseline[0]:6.1%})  "
+                f"median {elapsed:8.2f} ms ({baseline[1] / elapsed:5.1f}x)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
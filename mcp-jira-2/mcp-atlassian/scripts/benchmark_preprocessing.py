@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+"""
+Preprocessing throughput benchmark for MCP Atlassian
+
+html suite: measures how fast Confluence storage-format pages are converted by
+BasePreprocessor.process_html_content with each HTML conversion engine
+(see ATLASSIAN_HTML_CONVERTER), and checks the engines agree on the output.
+
+pool suite: converts a batch of pages inline and with the opt-in conversion
+process pool (see ATLASSIAN_CONVERSION_PROCESSES), as get_space_pages does,
+and checks both give the same output.
+
+jira suite: micro-benchmarks JiraPreprocessor.jira_to_markdown,
+markdown_to_jira and clean_jira_text on a large issue description and on a
+long comment thread.
+
+Usage:
+    python scripts/benchmark_preprocessing.py
+    python scripts/benchmark_preprocessing.py --suite html page1.html page2.html
+    python scripts/benchmark_preprocessing.py --suite pool --processes 4
+    python scripts/benchmark_preprocessing.py --suite jira --repeat 20
+
+Pages can be exported from a real instance with
+GET /wiki/rest/api/content/{id}?expand=body.storage and saving body.storage.value.
+Without arguments a large synthetic page built from typical storage-format
+constructs (headings, tables, nested lists, code macros, mentions) is used.
+The conversion cache is disabled so every round does the full conversion.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable
+
+# Add the parent directory to the path so we can import the package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["ATLASSIAN_CONVERSION_CACHE_TTL"] = "0"
+
+from src.mcp_atlassian.preprocessing.base import BasePreprocessor  # noqa: E402
+from src.mcp_atlassian.preprocessing.conversion_pool import (  # noqa: E402
+    ConversionPool,
+)
+from src.mcp_atlassian.preprocessing.html_to_markdown import (  # noqa: E402
+    FAST,
+    HTML_CONVERTERS,
+    LXML,
+    MARKDOWNIFY,
+    is_lxml_available,
+)
+from src.mcp_atlassian.preprocessing.jira import JiraPreprocessor  # noqa: E402
+
+SECTION = """
+<h2>Section {n}</h2>
+<p>Owner: <ac:link><ri:user ri:account-id="user-{user}"/></ac:link>,
+updated for <strong>release {n}</strong> with <em>notes</em> and a
+<a href="https://example.atlassian.net/browse/PROJ-{n}">link to PROJ-{n}</a>.</p>
+<table><tbody>
+<tr><th>Key</th><th>Summary</th><th>Status</th></tr>
+<tr><td>PROJ-{n}</td><td>Fix the <code>snake_case</code> parser</td><td>Done</td></tr>
+<tr><td>PROJ-{m}</td><td>Document *all* options</td><td>In Progress</td></tr>
+</tbody></table>
+<ul>
+<li>First point with <b>bold</b> text
+<ul><li>Nested point</li><li>Another nested point</li></ul></li>
+<li>Second point<br/>continued on a new line</li>
+</ul>
+<ol start="2"><li>Step two</li><li>Step three</li></ol>
+<ac:structured-macro ac:name="info"><ac:rich-text-body>
+<p>Remember to update the changelog.</p>
+</ac:rich-text-body></ac:structured-macro>
+<blockquote><p>Quoted decision {n}</p></blockquote>
+"""
+
+CODE_MACRO = """
+<ac:structured-macro ac:name="code">
+<ac:parameter ac:name="language">python</ac:parameter>
+<ac:plain-text-body><![CDATA[def handler(event):
+    return {"status": 200}]]></ac:plain-text-body></ac:structured-macro>
+"""
+
+
+JIRA_SECTION = """h2. Part {n}
+bq. Reported by [~accountid:user-{n}] in \
+[PROJ-{n}|https://example.atlassian.net/browse/PROJ-{n}|smart-link]
+The *parser* fails on _some_ inputs with {{{{snake_case}}}} names, \
+see ??the spec?? and +new+ x^2^ H~2~O.
+# First step
+## Nested step with [a link|https://example.com/{n}]
+* Bullet with !screenshot-{n}.png|width=300,alt=Screenshot!
+{{code:python}}
+def handler(event_{n}):
+    return {{"status": 200}}
+{{code}}
+||Key||Summary||Status||
+|PROJ-{n}|Fix it|{{color:red}}Open{{color}}|
+{{quote}}Quoted text {n}{{quote}}
+"""
+
+MARKDOWN_SECTION = """## Part {n}
+> Reported in [PROJ-{n}](https://example.atlassian.net/browse/PROJ-{n})
+The **parser** fails on *some* inputs with `snake_case` names, ~~old~~ <ins>new</ins>.
+- First bullet
+  - Nested bullet with ![Screenshot](screenshot-{n}.png)
+    1. Numbered
+```python
+def handler(event_{n}):
+    return {{"status": 200}}
+```
+| Key | Summary |
+|-----|---------|
+| PROJ-{n} | Fix it |
+"""
+
+
+class _BenchmarkClient:
+    def get_user_details_by_accountid(self, account_id: str) -> dict:
+        return {"displayName": f"User {account_id}"}
+
+    def get_user_details_by_username(self, username: str) -> dict:
+        return {"displayName": f"User {username}"}
+
+
+def synthetic_page(sections: int, *, with_code: bool) -> str:
+    """Build a storage-format page of the given number of sections."""
+    parts = [SECTION.format(n=n, m=n + 1, user=n % 20) for n in range(sections)]
+    if with_code:
+        parts.append(CODE_MACRO)
+    return "".join(parts)
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Run func `repeat` times and return the fastest run in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(pages: list[str], engine: str, repeat: int) -> tuple[float, list[str]]:
+    """Convert all pages `repeat` times and return the best time per round."""
+    os.environ["ATLASSIAN_HTML_CONVERTER"] = engine
+    preprocessor = BasePreprocessor(
+        base_url="https://example.atlassian.net",
+        confluence_client=_BenchmarkClient(),
+    )
+    outputs = [preprocessor.process_html_content(page)[1] for page in pages]
+
+    def convert_all() -> None:
+        for page in pages:
+            preprocessor.process_html_content(page)
+
+    return best_time(convert_all, repeat), outputs
+
+
+def html_suite(args: argparse.Namespace) -> int:
+    """Compare the HTML conversion engines on storage-format pages."""
+    if args.pages:
+        pages = []
+        for path in args.pages:
+            with open(path, encoding="utf-8") as f:
+                pages.append(f.read())
+    else:
+        pages = [
+            synthetic_page(args.sections, with_code=False),
+            synthetic_page(args.sections, with_code=True),
+        ]
+    size_mb = sum(len(page.encode("utf-8")) for page in pages) / 1_000_000
+    print(f"{len(pages)} page(s), {size_mb:.2f} MB, best of {args.repeat} rounds")
+
+    engines = [e for e in HTML_CONVERTERS if e != LXML or is_lxml_available()]
+    results = {engine: run(pages, engine, args.repeat) for engine in engines}
+    baseline, expected = results[MARKDOWNIFY]
+    for engine, (elapsed, outputs) in results.items():
+        same = "identical" if outputs == expected else "DIFFERS"
+        print(
+            f"{engine:12} {elapsed * 1000:9.1f} ms  {size_mb / elapsed:7.2f} MB/s  "
+            f"{baseline / elapsed:5.2f}x  output {same}"
+        )
+    return 0 if results[FAST][1] == expected else 1
+
+
+def pool_suite(args: argparse.Namespace) -> int:
+    """Compare inline and process pool conversion of a batch of pages."""
+    preprocessor = BasePreprocessor(
+        base_url="https://example.atlassian.net",
+        confluence_client=_BenchmarkClient(),
+    )
+    sections = max(args.sections // 10, 1)
+    pages = [synthetic_page(sections, with_code=n % 2 == 0) for n in range(args.batch)]
+    size_mb = sum(len(page.encode("utf-8")) for page in pages) / 1_000_000
+    print(
+        f"{len(pages)} pages, {size_mb:.2f} MB, {args.processes} processes, "
+        f"best of {args.repeat} rounds"
+    )
+
+    inline = ConversionPool(processes=0, min_batch=1)
+    pool = ConversionPool(processes=args.processes, min_batch=1)
+    try:
+        expected = inline.process_html_contents(preprocessor, pages)
+        start = time.perf_counter()
+        outputs = pool.process_html_contents(preprocessor, pages)
+        print(f"pool start-up and first batch {time.perf_counter() - start:.2f} s")
+
+        baseline = best_time(
+            lambda: inline.process_html_contents(preprocessor, pages), args.repeat
+        )
+        elapsed = best_time(
+            lambda: pool.process_html_contents(preprocessor, pages), args.repeat
+        )
+    finally:
+        pool.shutdown()
+
+    same = "identical" if outputs == expected else "DIFFERS"
+    for name, seconds in (("inline", baseline), ("pool", elapsed)):
+        print(
+            f"{name:12} {seconds * 1000:9.1f} ms  {size_mb / seconds:7.2f} MB/s  "
+            f"{baseline / seconds:5.2f}x"
+        )
+    print(f"output {same}")
+    return 0 if outputs == expected else 1
+
+
+def jira_suite(args: argparse.Namespace) -> int:
+    """Time the Jira markup conversions on a description and a comment thread."""
+    preprocessor = JiraPreprocessor(base_url="https://example.atlassian.net")
+    description = "".join(JIRA_SECTION.format(n=n) for n in range(args.sections))
+    markdown = "".join(MARKDOWN_SECTION.format(n=n) for n in range(args.sections))
+    comments = [JIRA_SECTION.format(n=n) for n in range(args.sections * 5)]
+
+    cases: list[tuple[str, Callable[[], object], int]] = [
+        (
+            "jira_to_markdown  (description)",
+            lambda: preprocessor.jira_to_markdown(description),
+            len(description),
+        ),
+        (
+            "markdown_to_jira  (description)",
+            lambda: preprocessor.markdown_to_jira(markdown),
+            len(markdown),
+        ),
+        (
+            "clean_jira_text   (description)",
+            lambda: preprocessor.clean_jira_text(description),
+            len(description),
+        ),
+        (
+            f"clean_jira_text   ({len(comments)} comments)",
+            lambda: [preprocessor.clean_jira_text(c) for c in comments],
+            sum(len(c) for c in comments),
+        ),
+    ]
+    print(f"best of {args.repeat} rounds")
+    for name, func, size in cases:
+        elapsed = best_time(func, args.repeat)
+        print(
+            f"{name:36} {elapsed * 1000:9.1f} ms  "
+            f"{size / 1_000_000 / elapsed:7.2f} MB/s"
+        )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("pages", nargs="*", help="Storage-format HTML files")
+    parser.add_argument(
+        "--suite",
+        choices=["html", "pool", "jira", "all"],
+        default="all",
+        help="What to run",
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="Rounds per case")
+    parser.add_argument(
+        "--sections", type=int, default=200, help="Sections in the synthetic inputs"
+    )
+    parser.add_argument(
+        "--batch", type=int, default=32, help="Pages per batch in the pool suite"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 2,
+        help="Worker processes in the pool suite",
+    )
+    args = parser.parse_args()
+
+    status = 0
+    if args.suite in ("html", "all"):
+        status |= html_suite(args)
+    if args.suite in ("pool", "all"):
+        status |= pool_suite(args)
+    if args.suite in ("jira", "all"):
+        status |= jira_suite(args)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
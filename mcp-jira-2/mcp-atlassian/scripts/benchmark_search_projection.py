@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+Search result conversion benchmark for MCP Atlassian
+
+Compares the two ways a JQL search response becomes tool output: building
+JiraSearchResult (a pydantic JiraIssue per hit, with nested models) and
+flattening it with to_simplified_dict, against the JiraSearchProjection fast
+path used by jira_search and jira_search_all, which converts the raw issues
+straight into their simplified form.
+
+Usage:
+    python scripts/benchmark_search_projection.py
+    python scripts/benchmark_search_projection.py --issues 5000 --rounds 20
+    python scripts/benchmark_search_projection.py --fields "summary,status,assignee"
+
+No Atlassian instance is needed: the search responses are generated.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+# Add the parent directory to the path so we can import the package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS  # noqa: E402
+from src.mcp_atlassian.models.jira import (  # noqa: E402
+    JiraSearchProjection,
+    JiraSearchResult,
+)
+
+STATUSES = ["Open", "In Progress", "In Review", "Done"]
+PEOPLE = ["Ada Lovelace", "Alan Turing", "Grace Hopper", "Edsger Dijkstra"]
+
+
+def user(rng: random.Random) -> dict:
+    name = rng.choice(PEOPLE)
+    return {
+        "accountId": name.lower().replace(" ", "-"),
+        "displayName": name,
+        "emailAddress": f"{name.split()[0].lower()}@example.com",
+        "active": True,
+        "avatarUrls": {"48x48": "https://avatar/48", "24x24": "https://avatar/24"},
+        "timeZone": "UTC",
+    }
+
+
+def synthetic_response(count: int, rng: random.Random) -> dict:
+    issues = []
+    for n in range(count):
+        status = rng.choice(STATUSES)
+        issues.append(
+            {
+                "id": str(10000 + n),
+                "key": f"BENCH-{n}",
+                "self": f"https://example.atlassian.net/rest/api/2/issue/{10000 + n}",
+                "fields": {
+                    "summary": f"Synthetic issue {n}",
+                    "description": "Steps to reproduce\n" * 5,
+                    "status": {
+                        "id": "1",
+                        "name": status,
+                        "statusCategory": {
+                            "id": 2,
+                            "key": "new",
+                            "name": status,
+                            "colorName": "blue-gray",
+                        },
+                    },
+                    "issuetype": {"id": "10001", "name": "Bug"},
+                    "priority": {"id": "3", "name": "Medium"},
+                    "assignee": user(rng),
+                    "reporter": user(rng),
+                    "labels": ["backend", "regression"][: rng.randint(0, 2)],
+                    "created": "2024-01-01T10:00:00.000+0000",
+                    "updated": "2024-03-01T10:00:00.000+0000",
+                    "project": {"id": "1", "key": "BENCH", "name": "Benchmark"},
+                    "customfield_10010": rng.randint(1, 8),
+                },
+            }
+        )
+    return {"issues": issues, "total": count, "startAt": 0, "maxResults": count}
+
+
+def time_path(convert: Callable[[], dict], rounds: int) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        convert()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--issues", type=int, default=1000, help="Issues per result")
+    parser.add_argument("--rounds", type=int, default=10, help="Conversions to time")
+    parser.add_argument(
+        "--fields",
+        default=",".join(sorted(DEFAULT_READ_JIRA_FIELDS)),
+        help="Requested fields (default: the search tool's default fields)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)  # noqa: S311 - reproducible test data
+    response = synthetic_response(args.issues, rng)
+
+    def full() -> dict:
+        return JiraSearchResult.from_api_response(
+            response, requested_fields=args.fields
+        ).to_simplified_dict()
+
+    def projection() -> dict:
+        return JiraSearchProjection.from_api_response(
+            response, requested_fields=args.fields
+        ).to_simplified_dict()
+
+    if full() != projection():
+        print("Outputs differ", file=sys.stderr)
+        return 1
+
+    print(f"{args.issues} issues, fields: {args.fields}")
+    medians = {}
+    for name, convert in (("model", full), ("projection", projection)):
+        timings_ms = sorted(t * 1000 for t in time_path(convert, args.rounds))
+        medians[name] = statistics.median(timings_ms)
+        print(
+            f"{name:11} median {medians[name]:8.2f} ms  min {timings_ms[0]:8.2f} ms  "
+            f"({args.issues / medians[name] * 1000:9.0f} issues/s)"
+        )
+    print(f"speedup     {medians['model'] / medians['projection']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,13 +2,17 @@
 
 import logging
 import os
+from typing import Any
 
+import httpx
 from atlassian import Confluence
 from requests import Session
 
 from ..exceptions import MCPAtlassianAuthenticationError
+from ..utils.async_http import create_async_http_client, request_json
 from ..utils.logging import log_config_param, mask_sensitive
 from ..utils.oauth import configure_oauth_session
+from ..utils.rate_limit import get_rate_limiter
 from ..utils.ssl import configure_ssl_verification
 from .config import ConfluenceConfig
 
@@ -91,6 +95,8 @@ class ConfluenceClient:
             session=self.confluence._session,
             ssl_verify=self.config.ssl_verify,
         )
+        # Share the per-host rate-limit scheduler with every other client
+        get_rate_limiter().install(self.confluence._session)
 
         # Proxy configuration
         proxies = {}
@@ -114,7 +120,58 @@ class ConfluenceClient:
         from ..preprocessing.confluence import ConfluencePreprocessor
 
         self.preprocessor = ConfluencePreprocessor(
-            base_url=self.config.url, confluence_client=self.confluence
+            base_url=self.config.url,
+            confluence_client=self.confluence,
+            config=self.config,
+        )
+        self._async_client: httpx.AsyncClient | None = None
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Async HTTP client sharing this client's auth, SSL and proxy settings.
+
+        Created lazily on first use and reused for keep-alive connection pooling.
+        Call `aclose` to release its connections.
+        """
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = create_async_http_client(
+                service_name="Confluence",
+                config=self.config,
+                base_url=self.confluence.url,
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ) -> Any:
+        """Send a request through the async transport and decode the JSON body.
+
+        Args:
+            method: The HTTP method to use
+            path: API path relative to the Confluence base URL
+            params: Optional query parameters
+            json: Optional JSON body
+
+        Returns:
+            The decoded JSON response, or None for empty responses
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails (401/403)
+            httpx.HTTPStatusError: For other unsuccessful responses
+        """
+        return await request_json(
+            self.async_client, "Confluence", method, path, params=params, json=json
         )
 
     def _process_html_content(
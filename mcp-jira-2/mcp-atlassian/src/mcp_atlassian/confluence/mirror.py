@@ -0,0 +1,419 @@
+"""Opt-in local full-text index of Confluence pages in SQLite.
+
+With CONFLUENCE_MIRROR_PATH set, the pages of the spaces listed in
+CONFLUENCE_MIRROR_SPACES are pulled into a SQLite database: a full load
+first, then incremental syncs fetching only ``lastModified >= <watermark>``
+every CONFLUENCE_MIRROR_SYNC_INTERVAL seconds. Page bodies are converted to
+Markdown once per version (see process_html_contents) and indexed with FTS5
+together with the titles, for PageMirror.search_text (the
+confluence_local_search tool).
+
+The index only serves fetchers of the user it was synced as, on the same
+site; a refreshed or rotated token keeps it. Incremental syncs do not notice
+pages that were deleted or moved to another space, so every
+CONFLUENCE_MIRROR_FULL_SYNC_INTERVAL seconds the background sync reloads the
+spaces fully, which removes them.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+from ..preprocessing.conversion_pool import process_html_contents
+from ..utils.sqlite_mirror import (
+    SNIPPET_MARKERS,
+    SNIPPET_TOKENS,
+    UNKNOWN_TIMEZONE_MARGIN,
+    MirrorRead,
+    SQLiteMirror,
+    fts_match_expression,
+)
+
+logger = logging.getLogger("mcp-atlassian")
+
+# Pages requested per CQL call while syncing
+SYNC_PAGE_SIZE = 50
+
+_SYNC_EXPAND = "content.body.storage,content.version,content.space"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    space TEXT NOT NULL,
+    title TEXT,
+    version INTEGER,
+    last_modified TEXT,
+    last_modified_epoch REAL,
+    url TEXT,
+    body TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_space_modified
+    ON pages (space, last_modified_epoch);
+"""
+
+# Full-text entries share the rowid of their row in pages
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+    title, body, tokenize = 'porter unicode61'
+);
+"""
+
+_UPSERT = (
+    "INSERT INTO pages (id, space, title, version, last_modified, "
+    "last_modified_epoch, url, body, synced_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET space = excluded.space, title = excluded.title, "
+    "version = excluded.version, last_modified = excluded.last_modified, "
+    "last_modified_epoch = excluded.last_modified_epoch, url = excluded.url, "
+    "body = excluded.body, synced_at = excluded.synced_at"
+)
+
+
+def _parse_confluence_datetime(value: Any) -> float | None:
+    """Parse a Confluence timestamp such as 2024-01-31T09:30:00.000Z to epoch."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _page_url(base_url: str, space: str, page_id: str, *, is_cloud: bool) -> str:
+    # Same formats as ConfluencePage.from_api_response
+    if is_cloud:
+        return f"{base_url}/spaces/{space}/pages/{page_id}"
+    return f"{base_url}/pages/viewpage.action?pageId={page_id}"
+
+
+class PageMirror(SQLiteMirror):
+    """SQLite full-text index of the pages of selected Confluence spaces."""
+
+    schema = _SCHEMA
+    fts_schema = _FTS_SCHEMA
+    data_tables = ("pages", "pages_fts")
+    label = "Confluence page mirror"
+
+    def __init__(
+        self,
+        path: str | None,
+        spaces: list[str],
+        sync_interval: float,
+        full_sync_interval: float = 0,
+    ) -> None:
+        """Initialize the mirror; the database is opened on first use.
+
+        Args:
+            path: SQLite database file. None disables the mirror.
+            spaces: Keys of the spaces to mirror.
+            sync_interval: Seconds between background syncs. 0 disables them.
+            full_sync_interval: Seconds between full background syncs, which
+                drop deleted and moved pages. 0 disables them.
+        """
+        super().__init__(
+            path,
+            [space.strip() for space in spaces],
+            max_age=None,
+            sync_interval=sync_interval,
+            full_sync_interval=full_sync_interval,
+        )
+
+    @classmethod
+    def from_env(cls) -> "PageMirror":
+        """Create a mirror configured from environment variables.
+
+        Returns:
+            PageMirror stored at CONFLUENCE_MIRROR_PATH (unset disables it) for
+            the comma-separated CONFLUENCE_MIRROR_SPACES, syncing every
+            CONFLUENCE_MIRROR_SYNC_INTERVAL seconds (default 300) and fully
+            every CONFLUENCE_MIRROR_FULL_SYNC_INTERVAL seconds (default 86400).
+        """
+        return cls(
+            path=os.getenv("CONFLUENCE_MIRROR_PATH") or None,
+            spaces=os.getenv("CONFLUENCE_MIRROR_SPACES", "").split(","),
+            sync_interval=float(os.getenv("CONFLUENCE_MIRROR_SYNC_INTERVAL", "300")),
+            full_sync_interval=float(
+                os.getenv("CONFLUENCE_MIRROR_FULL_SYNC_INTERVAL", "86400")
+            ),
+        )
+
+    @property
+    def spaces(self) -> list[str]:
+        """Keys of the mirrored spaces."""
+        return self.scopes
+
+    # Sync
+
+    def _account_id(self, fetcher: Any) -> str:
+        user = fetcher.get_current_user_info()
+        # accountId on Cloud, userKey or username on Server/Data Center
+        for name in ("accountId", "userKey", "username"):
+            if isinstance(user.get(name), str) and user[name]:
+                return user[name]
+        msg = "Could not find accountId, userKey or username in user data"
+        raise ValueError(msg)
+
+    @staticmethod
+    def _watermark_cql(space: str, watermark: float | None) -> str:
+        cql = f'space = "{space}" AND type = page'
+        if watermark is not None:
+            # CQL dates are read in the user's time zone, which the API does
+            # not expose; unchanged versions are skipped, so overlap is cheap
+            since = (
+                datetime.fromtimestamp(watermark, timezone.utc)
+                - UNKNOWN_TIMEZONE_MARGIN
+            )
+            cql += f' AND lastModified >= "{since:%Y-%m-%d %H:%M}"'
+        return cql + " ORDER BY lastModified ASC"
+
+    def sync(
+        self,
+        fetcher: Any,
+        spaces: Iterable[str] | None = None,
+        *,
+        full: bool = False,
+    ) -> dict[str, int]:
+        """Pull new and updated pages of the mirrored spaces.
+
+        Args:
+            fetcher: ConfluenceFetcher to read pages with; its user owns the
+                mirror from now on
+            spaces: Spaces to sync, defaults to all mirrored spaces
+            full: Reload everything and drop pages no longer in the space
+
+        Returns:
+            Number of pages converted and stored per space
+        """
+        with self._lock:
+            self._claim(self._owner_identity(fetcher))
+        counts = {}
+        try:
+            for space in spaces or self.spaces:
+                counts[space] = self._sync_space(fetcher, space, full=full)
+        except Exception:
+            self._count(sync_errors=1)
+            raise
+        self._count(syncs=1)
+        return counts
+
+    def _sync_space(self, fetcher: Any, space: str, *, full: bool) -> int:
+        started = time.time()
+        synced_before, watermark = self._watermark(space)
+        if full:
+            watermark = None
+        base_url = str(fetcher.config.url).rstrip("/")
+        seen: set[str] = set()
+        stored = 0
+        for items in fetcher.iter_search_raw(
+            self._watermark_cql(space, watermark),
+            expand=_SYNC_EXPAND,
+            page_size=SYNC_PAGE_SIZE,
+        ):
+            contents = [
+                item["content"]
+                for item in items
+                if isinstance(item.get("content"), dict) and item["content"].get("id")
+            ]
+            ids = [str(content["id"]) for content in contents]
+            seen.update(ids)
+            with self._lock:
+                known_versions = dict(
+                    self._db()
+                    .execute(
+                        f"SELECT id, version FROM pages WHERE id IN "  # noqa: S608
+                        f"({', '.join('?' for _ in ids)})",
+                        ids,
+                    )
+                    .fetchall()
+                )
+            changed = []
+            for content in contents:
+                version = (content.get("version") or {}).get("number")
+                modified = _parse_confluence_datetime(
+                    (content.get("version") or {}).get("when")
+                )
+                if modified is not None:
+                    watermark = max(watermark or 0.0, modified)
+                if full or known_versions.get(str(content["id"])) != version:
+                    changed.append((content, version, modified))
+            if not changed:
+                continue
+
+            converted = process_html_contents(
+                fetcher.preprocessor,
+                [
+                    ((content.get("body") or {}).get("storage") or {}).get("value")
+                    or ""
+                    for content, _, _ in changed
+                ],
+                space_key=space,
+            )
+            rows = [
+                (
+                    str(content["id"]),
+                    (content.get("space") or {}).get("key") or space,
+                    content.get("title"),
+                    version,
+                    (content.get("version") or {}).get("when"),
+                    modified,
+                    _page_url(
+                        base_url,
+                        space,
+                        str(content["id"]),
+                        is_cloud=fetcher.config.is_cloud,
+                    ),
+                    markdown,
+                    started,
+                )
+                for (content, version, modified), (_, markdown) in zip(
+                    changed, converted, strict=True
+                )
+            ]
+            with self._lock, self._db() as db:
+                db.executemany(_UPSERT, rows)
+                if self._fts:
+                    self._index(db, rows)
+            stored += len(rows)
+
+        with self._lock, self._db() as db:
+            if full or not synced_before:
+                # A full load saw every page in the space; drop the others
+                known = {
+                    page_id
+                    for (page_id,) in db.execute(
+                        "SELECT id FROM pages WHERE space = ?", (space,)
+                    )
+                }
+                gone = [(page_id,) for page_id in known - seen]
+                if self._fts:
+                    db.executemany(
+                        "DELETE FROM pages_fts WHERE rowid = "
+                        "(SELECT rowid FROM pages WHERE id = ?)",
+                        gone,
+                    )
+                db.executemany("DELETE FROM pages WHERE id = ?", gone)
+            self._record_sync(db, space, watermark, started)
+        logger.info(f"Confluence page mirror synced {stored} pages of {space}")
+        return stored
+
+    @staticmethod
+    def _index(db: sqlite3.Connection, rows: list[tuple[Any, ...]]) -> None:
+        """Replace the full-text entries of upserted pages, keyed by rowid."""
+        rowids = dict(
+            db.execute(
+                f"SELECT id, rowid FROM pages WHERE id IN "  # noqa: S608
+                f"({', '.join('?' for _ in rows)})",
+                [row[0] for row in rows],
+            ).fetchall()
+        )
+        entries = [(rowids[row[0]], row[2] or "", row[7]) for row in rows]
+        db.executemany(
+            "DELETE FROM pages_fts WHERE rowid = ?", [(e[0],) for e in entries]
+        )
+        db.executemany(
+            "INSERT INTO pages_fts (rowid, title, body) VALUES (?, ?, ?)", entries
+        )
+
+    # Reads
+
+    def search_text(
+        self,
+        fetcher: Any,
+        query: str,
+        spaces: Iterable[str] | None = None,
+        limit: int = 10,
+    ) -> MirrorRead:
+        """Full-text search of page titles and Markdown bodies.
+
+        Matches are ranked by BM25, weighting titles over bodies.
+
+        Args:
+            fetcher: ConfluenceFetcher whose credentials must own the mirror
+            query: Words to search for, see fts_match_expression
+            spaces: Spaces to search, defaults to all mirrored spaces
+            limit: Maximum number of results
+
+        Returns:
+            MirrorRead with a list of result dicts (id, title, space, url,
+            last_modified, score and snippet)
+
+        Raises:
+            ValueError: If the search cannot be answered locally
+        """
+        match = fts_match_expression(query)
+        with self._lock:
+            selected = self._searchable(
+                fetcher, [s.strip() for s in spaces or [] if s.strip()]
+            )
+            staleness = self._staleness(selected)
+            if staleness is None:
+                msg = "The Confluence page mirror has not finished its first sync yet"
+                raise ValueError(msg)
+            open_mark, close_mark = SNIPPET_MARKERS
+            rows = (
+                self._db()
+                .execute(
+                    "SELECT p.id, p.title, p.space, p.url, p.last_modified, "  # noqa: S608
+                    "bm25(pages_fts, 5.0, 1.0) AS rank, "
+                    f"snippet(pages_fts, 1, ?, ?, '…', {SNIPPET_TOKENS}) "
+                    "FROM pages_fts JOIN pages p ON p.rowid = pages_fts.rowid "
+                    "WHERE pages_fts MATCH ? AND p.space IN "
+                    f"({', '.join('?' for _ in selected)}) "
+                    "ORDER BY rank LIMIT ?",
+                    [open_mark, close_mark, match, *sorted(selected), limit],
+                )
+                .fetchall()
+            )
+        self._count(local_searches=1)
+        return MirrorRead(
+            [
+                {
+                    "id": page_id,
+                    "title": title,
+                    "space": space,
+                    "url": url,
+                    "last_modified": last_modified,
+                    "score": round(-rank, 3),
+                    "snippet": snippet,
+                }
+                for page_id, title, space, url, last_modified, rank, snippet in rows
+            ],
+            staleness,
+        )
+
+    # Metrics
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of mirror metrics.
+
+        Returns:
+            Dictionary with configuration, pages and sync age per space and
+            search/sync counters.
+        """
+        return self._stats(
+            "SELECT s.scope, COUNT(p.id), s.synced_at FROM sync_state s "
+            "LEFT JOIN pages p ON p.space = s.scope GROUP BY s.scope",
+            "spaces",
+            "pages",
+        )
+
+
+_page_mirror: PageMirror | None = None
+_page_mirror_lock = threading.Lock()
+
+
+def get_page_mirror() -> PageMirror:
+    """Return the process-wide page mirror, creating it on first use."""
+    global _page_mirror
+    with _page_mirror_lock:
+        if _page_mirror is None:
+            _page_mirror = PageMirror.from_env()
+        return _page_mirror
@@ -1,12 +1,17 @@
 """Module for Confluence page operations."""
 
 import logging
+from functools import partial
+from typing import Any
 
+import anyio.to_thread
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage
+from ..preprocessing.conversion_pool import process_html_contents
+from ..utils.response_cache import cached_response, invalidates_response_cache
 from .client import ConfluenceClient
 
 logger = logging.getLogger("mcp-atlassian")
@@ -15,6 +20,9 @@ logger = logging.getLogger("mcp-atlassian")
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
 
+    @cached_response(
+        "confluence-page", entity_arg="page_id", revalidate="_is_cached_page_current"
+    )
     def get_page_content(
         self, page_id: str, *, convert_to_markdown: bool = True
     ) -> ConfluencePage:
@@ -76,6 +84,27 @@ class PagesMixin(ConfluenceClient):
             )
             raise Exception(f"Error retrieving page content: {str(e)}") from e
 
+    def _is_cached_page_current(
+        self, page: ConfluencePage, arguments: dict[str, Any]
+    ) -> bool:
+        """Check a cached page against the server's current version number.
+
+        Args:
+            page: The cached ConfluencePage
+            arguments: The arguments the page was fetched with
+
+        Returns:
+            True if the page has not changed since it was cached
+        """
+        if page.version is None or not page.version.number:
+            return False
+        data = self.confluence.get_page_by_id(
+            page_id=arguments["page_id"], expand="version"
+        )
+        if not isinstance(data, dict):
+            return False
+        return data.get("version", {}).get("number") == page.version.number
+
     def get_page_ancestors(self, page_id: str) -> list[ConfluencePage]:
         """
         Get ancestors (parent pages) of a specific page.
@@ -222,13 +251,17 @@ class PagesMixin(ConfluenceClient):
             space=space_key, start=start, limit=limit, expand="body.storage"
         )
 
-        page_models = []
-        for page in pages:
-            content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key
-            )
+        # Convert all bodies at once so large listings can use the process pool
+        converted = process_html_contents(
+            self.preprocessor,
+            [page["body"]["storage"]["value"] for page in pages],
+            space_key=space_key,
+        )
 
+        page_models = []
+        for page, (processed_html, processed_markdown) in zip(
+            pages, converted, strict=True
+        ):
             # Use the appropriate content format based on the convert_to_markdown flag
             page_content = processed_markdown if convert_to_markdown else processed_html
 
@@ -254,6 +287,7 @@ class PagesMixin(ConfluenceClient):
 
         return page_models
 
+    @invalidates_response_cache("confluence-search")
     def create_page(
         self,
         space_key: str,
@@ -314,6 +348,9 @@ class PagesMixin(ConfluenceClient):
                 f"Failed to create page '{title}' in space {space_key}: {str(e)}"
             ) from e
 
+    @invalidates_response_cache(
+        "confluence-page", entity_arg="page_id", also=("confluence-search",)
+    )
     def update_page(
         self,
         page_id: str,
@@ -407,51 +444,116 @@ class PagesMixin(ConfluenceClient):
                 page_id=page_id, type="page", start=start, limit=limit, expand=expand
             )
 
-            # Process results
-            page_models = []
-
-            # Handle both pagination modes
-            if isinstance(results, dict) and "results" in results:
-                child_pages = results.get("results", [])
-            else:
-                child_pages = results or []
+            return self._build_child_page_models(
+                results, convert_to_markdown=convert_to_markdown
+            )
 
-            space_key = ""
+        except Exception as e:
+            logger.error(f"Error fetching child pages for page {page_id}: {str(e)}")
+            logger.debug("Full exception details:", exc_info=True)
+            return []
 
-            # Get space key from the first result if available
-            if child_pages and "space" in child_pages[0]:
-                space_key = child_pages[0].get("space", {}).get("key", "")
+    async def get_page_children_async(
+        self,
+        page_id: str,
+        start: int = 0,
+        limit: int = 25,
+        expand: str = "version",
+        *,
+        convert_to_markdown: bool = True,
+    ) -> list[ConfluencePage]:
+        """
+        Awaitable counterpart of `get_page_children` using the async transport.
 
-            # Process each child page
-            for page in child_pages:
-                # Only process content if we have "body" expanded
-                content_override = None
-                if "body" in page and convert_to_markdown:
-                    content = page.get("body", {}).get("storage", {}).get("value", "")
-                    if content:
-                        _, processed_markdown = self.preprocessor.process_html_content(
-                            content, space_key=space_key
-                        )
-                        content_override = processed_markdown
+        Args:
+            page_id: The ID of the parent page
+            start: The starting index for pagination
+            limit: Maximum number of child pages to return
+            expand: Fields to expand in the response
+            convert_to_markdown: When True, returns content in markdown format,
+                               otherwise returns raw HTML (keyword-only)
 
-                # Create the page model
-                page_model = ConfluencePage.from_api_response(
-                    page,
-                    base_url=self.config.url,
-                    include_body=True,
-                    content_override=content_override,
-                    content_format="markdown" if convert_to_markdown else "storage",
+        Returns:
+            List of ConfluencePage models containing the child pages
+        """
+        try:
+            results = await self.request_async(
+                "GET",
+                f"rest/api/content/{page_id}/child/page",
+                params={"start": start, "limit": limit, "expand": expand},
+            )
+            if convert_to_markdown and "body" in expand:
+                # Converting page bodies is CPU-bound; keep it off the event loop
+                return await anyio.to_thread.run_sync(
+                    partial(
+                        self._build_child_page_models,
+                        results,
+                        convert_to_markdown=True,
+                    )
                 )
-
-                page_models.append(page_model)
-
-            return page_models
+            return self._build_child_page_models(
+                results, convert_to_markdown=convert_to_markdown
+            )
 
         except Exception as e:
             logger.error(f"Error fetching child pages for page {page_id}: {str(e)}")
             logger.debug("Full exception details:", exc_info=True)
             return []
 
+    def _build_child_page_models(
+        self, results: Any, *, convert_to_markdown: bool
+    ) -> list[ConfluencePage]:
+        """Build ConfluencePage models from a child page API response."""
+        page_models = []
+
+        # Handle both pagination modes
+        if isinstance(results, dict) and "results" in results:
+            child_pages = results.get("results", [])
+        else:
+            child_pages = results or []
+
+        space_key = ""
+
+        # Get space key from the first result if available
+        if child_pages and "space" in child_pages[0]:
+            space_key = child_pages[0].get("space", {}).get("key", "")
+
+        # Only process content if we have "body" expanded
+        contents: dict[int, str] = {}
+        if convert_to_markdown:
+            for index, page in enumerate(child_pages):
+                if "body" in page:
+                    content = page.get("body", {}).get("storage", {}).get("value", "")
+                    if content:
+                        contents[index] = content
+        converted = process_html_contents(
+            self.preprocessor, list(contents.values()), space_key=space_key
+        )
+        markdown_by_index = {
+            index: processed_markdown
+            for index, (_, processed_markdown) in zip(contents, converted, strict=True)
+        }
+
+        # Process each child page
+        for index, page in enumerate(child_pages):
+            content_override = markdown_by_index.get(index)
+
+            # Create the page model
+            page_model = ConfluencePage.from_api_response(
+                page,
+                base_url=self.config.url,
+                include_body=True,
+                content_override=content_override,
+                content_format="markdown" if convert_to_markdown else "storage",
+            )
+
+            page_models.append(page_model)
+
+        return page_models
+
+    @invalidates_response_cache(
+        "confluence-page", entity_arg="page_id", also=("confluence-search",)
+    )
     def delete_page(self, page_id: str) -> bool:
         """
         Delete a Confluence page by its ID.
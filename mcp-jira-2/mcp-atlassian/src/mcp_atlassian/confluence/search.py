@@ -1,31 +1,48 @@
 """Module for Confluence search operations."""
 
 import logging
+from collections.abc import Iterator
+from typing import Any
 
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage, ConfluenceSearchResult
+from ..preprocessing.conversion_pool import process_html_contents
+from ..utils.response_cache import cached_response
 from .client import ConfluenceClient
 from .utils import quote_cql_identifier_if_needed
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Results requested per CQL call; the server may return fewer
+CQL_PAGE_SIZE = 50
+
 
 class SearchMixin(ConfluenceClient):
     """Mixin for Confluence search operations."""
 
+    @cached_response("confluence-search", cache_empty=False)
     def search(
-        self, cql: str, limit: int = 10, spaces_filter: str | None = None
+        self,
+        cql: str,
+        limit: int = 10,
+        spaces_filter: str | None = None,
+        *,
+        start: int = 0,
     ) -> list[ConfluencePage]:
         """
         Search content using Confluence Query Language (CQL).
 
+        Results are fetched in pages of up to CQL_PAGE_SIZE until `limit` is
+        reached, so limits above what the server returns per request are honoured.
+
         Args:
             cql: Confluence Query Language string
             limit: Maximum number of results to return
             spaces_filter: Optional comma-separated list of space keys to filter by, overrides config
+            start: Offset of the first result to return (keyword-only)
 
         Returns:
             List of ConfluencePage models containing search results
@@ -34,64 +51,12 @@ class SearchMixin(ConfluenceClient):
             MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
         """
         try:
-            # Use spaces_filter parameter if provided, otherwise fall back to config
-            filter_to_use = spaces_filter or self.config.spaces_filter
-
-            # Apply spaces filter if present
-            if filter_to_use:
-                # Split spaces filter by commas and handle possible whitespace
-                spaces = [s.strip() for s in filter_to_use.split(",")]
-
-                # Build the space filter query part using proper quoting for each space key
-                space_query = " OR ".join(
-                    [
-                        f"space = {quote_cql_identifier_if_needed(space)}"
-                        for space in spaces
-                    ]
-                )
-
-                # Add the space filter to existing query with parentheses
-                if cql and space_query:
-                    if (
-                        "space = " not in cql
-                    ):  # Only add if not already filtering by space
-                        cql = f"({cql}) AND ({space_query})"
-                else:
-                    cql = space_query
-
-                logger.info(f"Applied spaces filter to query: {cql}")
-
-            # Execute the CQL search query
-            results = self.confluence.cql(cql=cql, limit=limit)
-
-            # Convert the response to a search result model
-            search_result = ConfluenceSearchResult.from_api_response(
-                results,
-                base_url=self.config.url,
-                cql_query=cql,
-                is_cloud=self.config.is_cloud,
-            )
-
-            # Process result excerpts as content
-            processed_pages = []
-            for page in search_result.results:
-                # Get the excerpt from the original search results
-                for result_item in results.get("results", []):
-                    if result_item.get("content", {}).get("id") == page.id:
-                        excerpt = result_item.get("excerpt", "")
-                        if excerpt:
-                            # Process the excerpt as HTML content
-                            space_key = page.space.key if page.space else ""
-                            processed_html, processed_markdown = (
-                                self.preprocessor.process_html_content(
-                                    excerpt, space_key=space_key
-                                )
-                            )
-                            # Create a new page with processed content
-                            page.content = processed_markdown
-                        break
-
-                processed_pages.append(page)
+            cql = self._apply_spaces_filter(cql, spaces_filter)
+            processed_pages: list[ConfluencePage] = []
+            for pages in self._iter_search_pages(
+                cql, page_size=min(limit, CQL_PAGE_SIZE), max_results=limit, start=start
+            ):
+                processed_pages.extend(pages)
 
             # Return the list of result pages with processed content
             return processed_pages
@@ -122,3 +87,192 @@ class SearchMixin(ConfluenceClient):
             logger.error(f"Unexpected error during search: {str(e)}")
             logger.debug("Full exception details for search:", exc_info=True)
             return []
+
+    def iter_search(
+        self,
+        cql: str,
+        page_size: int = CQL_PAGE_SIZE,
+        max_results: int | None = None,
+        spaces_filter: str | None = None,
+        *,
+        start: int = 0,
+    ) -> Iterator[list[ConfluencePage]]:
+        """
+        Lazily iterate over all content matching a CQL query, one page at a time.
+
+        Follows the `start`/`limit` cursor until the server reports no further
+        results. Each page is fetched only when the previous one has been
+        consumed, so callers can stop early.
+
+        Args:
+            cql: Confluence Query Language string
+            page_size: Results to request per page
+            max_results: Stop after this many results in total (None for no limit)
+            spaces_filter: Optional comma-separated list of space keys to filter by, overrides config
+            start: Offset of the first result (keyword-only)
+
+        Yields:
+            Lists of ConfluencePage models with processed excerpts, one per page
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
+            HTTPError: For other HTTP errors
+        """
+        cql = self._apply_spaces_filter(cql, spaces_filter)
+        try:
+            yield from self._iter_search_pages(
+                cql, page_size=page_size, max_results=max_results, start=start
+            )
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Confluence API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+
+    def iter_search_raw(
+        self, cql: str, expand: str | None = None, page_size: int = CQL_PAGE_SIZE
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Iterate over the raw results of a CQL query, one page at a time.
+
+        Unlike iter_search, results are neither converted nor filtered by
+        space; this is meant for bulk readers such as the local page mirror.
+
+        Args:
+            cql: Confluence Query Language string
+            expand: Fields to expand, e.g. 'content.body.storage'
+            page_size: Results to request per page
+
+        Yields:
+            Lists of raw result dicts, one per page
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
+            HTTPError: For other HTTP errors
+        """
+        start = 0
+        try:
+            while True:
+                results = self.confluence.cql(
+                    cql=cql, start=start, limit=page_size, expand=expand
+                )
+                items = results.get("results", [])
+                if items:
+                    yield items
+                start += len(items)
+                if self._search_exhausted(results, start):
+                    return
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Confluence API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+
+    @staticmethod
+    def _search_exhausted(results: dict[str, Any], start: int) -> bool:
+        """Whether a CQL response is the last page, given the next start offset."""
+        total = results.get("totalSize")
+        return (
+            not results.get("results")
+            or "next" not in results.get("_links", {})
+            or (isinstance(total, int) and start >= total)
+        )
+
+    def _iter_search_pages(
+        self, cql: str, *, page_size: int, max_results: int | None, start: int
+    ) -> Iterator[list[ConfluencePage]]:
+        """Yield processed search results page by page, advancing the start cursor."""
+        remaining = max_results
+        page_size = max(1, page_size)
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            results = self.confluence.cql(cql=cql, start=start, limit=limit)
+            items = results.get("results", [])
+            pages = self._process_search_results(results, cql)
+            if remaining is not None:
+                pages = pages[:remaining]
+                remaining -= len(pages)
+            if pages:
+                yield pages
+
+            start += len(items)
+            if self._search_exhausted(results, start):
+                return
+
+    def _process_search_results(
+        self, results: dict[str, Any], cql: str
+    ) -> list[ConfluencePage]:
+        """Build page models from one CQL response, with excerpts as content."""
+        # Convert the response to a search result model
+        search_result = ConfluenceSearchResult.from_api_response(
+            results,
+            base_url=self.config.url,
+            cql_query=cql,
+            is_cloud=self.config.is_cloud,
+        )
+
+        # Index excerpts by content id once, keeping the first result per id
+        excerpts: dict[Any, str] = {}
+        for result_item in results.get("results", []):
+            excerpts.setdefault(
+                result_item.get("content", {}).get("id"),
+                result_item.get("excerpt", ""),
+            )
+
+        # Process the excerpts as HTML content, one batch per space
+        by_space: dict[str, list[ConfluencePage]] = {}
+        for page in search_result.results:
+            if excerpts.get(page.id):
+                space_key = page.space.key if page.space else ""
+                by_space.setdefault(space_key, []).append(page)
+        for space_key, pages in by_space.items():
+            converted = process_html_contents(
+                self.preprocessor,
+                [excerpts[page.id] for page in pages],
+                space_key=space_key,
+            )
+            for page, (_, processed_markdown) in zip(pages, converted, strict=True):
+                page.content = processed_markdown
+
+        return search_result.results
+
+    def _apply_spaces_filter(self, cql: str, spaces_filter: str | None) -> str:
+        """Restrict a CQL query to the configured or requested spaces."""
+        # Use spaces_filter parameter if provided, otherwise fall back to config
+        filter_to_use = spaces_filter or self.config.spaces_filter
+
+        # Apply spaces filter if present
+        if filter_to_use:
+            # Split spaces filter by commas and handle possible whitespace
+            spaces = [s.strip() for s in filter_to_use.split(",")]
+
+            # Build the space filter query part using proper quoting for each space key
+            space_query = " OR ".join(
+                [f"space = {quote_cql_identifier_if_needed(space)}" for space in spaces]
+            )
+
+            # Add the space filter to existing query with parentheses
+            if cql and space_query:
+                if "space = " not in cql:  # Only add if not already filtering by space
+                    cql = f"({cql}) AND ({space_query})"
+            else:
+                cql = space_query
+
+            logger.info(f"Applied spaces filter to query: {cql}")
+        return cql
@@ -1,28 +1,194 @@
 """Attachment operations for Jira API."""
 
+import json
 import logging
+import mimetypes
 import os
+import threading
+import uuid
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from ..models.jira import JiraAttachment
+from ..utils.response_cache import invalidates_response_cache
 from .client import JiraClient
-from .protocols import AttachmentsOperationsProto
+from .protocols import AttachmentsOperationsProto, SearchOperationsProto
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
-
-class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
+# Attachments downloaded at the same time
+MAX_CONCURRENT_ATTACHMENT_DOWNLOADS = 4
+
+# Bounds of the streaming chunk size, which grows with the attachment size
+MIN_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MAX_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Attachments uploaded at the same time, unless the caller asks otherwise
+MAX_CONCURRENT_ATTACHMENT_UPLOADS = 4
+
+# Size of the reads streaming a file into an upload
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# File in each download directory recording which attachment every complete
+# file is
+ATTACHMENT_MANIFEST = ".jira-attachments.json"
+
+# Serializes the manifest updates of concurrent downloads
+_manifest_lock = threading.Lock()
+
+# An attachment download outcome ("downloaded", "skipped" or "failed") and
+# its entry in the results
+DownloadOutcome = tuple[str, dict[str, Any]]
+
+
+def _chunk_size(size: int | None) -> int:
+    """Chunk size for streaming a download: 1/16 of its size, within bounds."""
+    if not size:
+        return 4 * MIN_DOWNLOAD_CHUNK_SIZE
+    return max(MIN_DOWNLOAD_CHUNK_SIZE, min(MAX_DOWNLOAD_CHUNK_SIZE, size // 16))
+
+
+def _read_manifest(directory: Path) -> dict[str, Any]:
+    try:
+        with open(directory / ATTACHMENT_MANIFEST, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _write_manifest(directory: Path, manifest: dict[str, Any]) -> None:
+    try:
+        with open(directory / ATTACHMENT_MANIFEST, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not record the attachments in {directory}: {e}")
+
+
+def _record_download(directory: Path, filename: str, record: dict[str, Any]) -> None:
+    """Record a complete download in the manifest of its directory."""
+    with _manifest_lock:
+        manifest = _read_manifest(directory)
+        manifest[filename] = record
+        _write_manifest(directory, manifest)
+
+
+def _outcome(outcome: str, entry: dict[str, Any]) -> DownloadOutcome:
+    return outcome, entry
+
+
+def _run_downloads(
+    tasks: list[Callable[[], DownloadOutcome]],
+) -> list[DownloadOutcome]:
+    """Run download tasks with bounded concurrency, returning outcomes in order."""
+    if len(tasks) <= 1:
+        return [task() for task in tasks]
+    with ThreadPoolExecutor(
+        max_workers=min(len(tasks), MAX_CONCURRENT_ATTACHMENT_DOWNLOADS),
+        thread_name_prefix="jira-attachment",
+    ) as executor:
+        return list(executor.map(lambda task: task(), tasks))
+
+
+def _collect(outcomes: list[DownloadOutcome]) -> dict[str, list[dict[str, Any]]]:
+    results: dict[str, list[dict[str, Any]]] = {
+        "downloaded": [],
+        "skipped": [],
+        "failed": [],
+    }
+    for outcome, entry in outcomes:
+        results[outcome].append(entry)
+    return results
+
+
+def summarize_attachment_downloads(
+    jql: str, issues: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Sum up the per-issue results of iter_attachment_downloads.
+
+    Args:
+        jql: JQL query the issues were selected with
+        issues: Download results of every processed issue
+
+    Returns:
+        A dictionary with the results of the issues that have attachments
+        and overall counts
+    """
+    with_attachments = [issue for issue in issues if issue["total"]]
+    return {
+        "success": True,
+        "jql": jql,
+        "issues_processed": len(issues),
+        "issues": with_attachments,
+        "downloaded": sum(len(issue["downloaded"]) for issue in with_attachments),
+        "skipped": sum(len(issue["skipped"]) for issue in with_attachments),
+        "failed": sum(len(issue["failed"]) for issue in with_attachments),
+    }
+
+
+class _MultipartFileBody:
+    """A multipart/form-data body holding one file, read from disk as it is sent.
+
+    requests builds multipart bodies in memory; this iterable with a known
+    length is streamed instead, keeping memory use independent of file size.
+    """
+
+    def __init__(self, file_path: str, field_name: str = "file") -> None:
+        self.file_path = file_path
+        self.boundary = uuid.uuid4().hex
+        filename = os.path.basename(file_path)
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        quoted = filename.replace("\\", "\\\\").replace('"', '\\"')
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; '
+            f'filename="{quoted}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._size = os.path.getsize(file_path)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self._size + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        with open(self.file_path, "rb") as f:
+            while chunk := f.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+        yield self._tail
+
+
+class AttachmentsMixin(JiraClient, AttachmentsOperationsProto, SearchOperationsProto):
     """Mixin for Jira attachment operations."""
 
-    def download_attachment(self, url: str, target_path: str) -> bool:
+    def download_attachment(
+        self,
+        url: str,
+        target_path: str,
+        expected_size: int | None = None,
+        resume: bool = False,
+    ) -> bool:
         """
         Download a Jira attachment to the specified path.
 
         Args:
             url: The URL of the attachment to download
             target_path: The path where the attachment should be saved
+            expected_size: Size of the attachment in bytes, if known. Used to
+                pick the chunk size and to check the download is complete.
+            resume: Continue a partial file at target_path with an HTTP Range
+                request instead of downloading from the start
 
         Returns:
             True if successful, False otherwise
@@ -41,18 +207,40 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             # Create the directory if it doesn't exist
             os.makedirs(os.path.dirname(target_path), exist_ok=True)
 
+            offset = 0
+            if resume and os.path.exists(target_path):
+                offset = os.path.getsize(target_path)
+
             # Use the Jira session to download the file
-            response = self.jira._session.get(url, stream=True)
+            if offset:
+                response = self.jira._session.get(
+                    url, stream=True, headers={"Range": f"bytes={offset}-"}
+                )
+            else:
+                response = self.jira._session.get(url, stream=True)
             response.raise_for_status()
+            if offset and response.status_code != 206:
+                # The server ignored the range and sends the whole file
+                offset = 0
+            elif offset:
+                logger.info(f"Resuming {target_path} at {offset} bytes")
 
             # Write the file to disk
-            with open(target_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            with open(target_path, "ab" if offset else "wb") as f:
+                for chunk in response.iter_content(
+                    chunk_size=_chunk_size(expected_size)
+                ):
                     f.write(chunk)
 
             # Verify the file was created
             if os.path.exists(target_path):
                 file_size = os.path.getsize(target_path)
+                if expected_size is not None and file_size != expected_size:
+                    logger.error(
+                        f"Incomplete download of {target_path}: {file_size} of "
+                        f"{expected_size} bytes"
+                    )
+                    return False
                 logger.info(
                     f"Successfully downloaded attachment to {target_path} (size: {file_size} bytes)"
                 )
@@ -71,6 +259,9 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
         """
         Download all attachments for a Jira issue.
 
+        Attachments are downloaded concurrently. Files already downloaded
+        from the same attachment are skipped and partial ones are resumed.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             target_dir: The directory where attachments should be saved
@@ -103,10 +294,6 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             logger.error(f"Could not retrieve issue {issue_key}")
             return {"success": False, "error": f"Could not retrieve issue {issue_key}"}
 
-        # Process attachments
-        attachments = []
-        results = []
-
         # Extract attachments from the API response
         attachment_data = issue_data.get("fields", {}).get("attachment", [])
 
@@ -119,50 +306,195 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             }
 
         # Create JiraAttachment objects for each attachment
-        for attachment in attachment_data:
-            if isinstance(attachment, dict):
-                attachments.append(JiraAttachment.from_api_response(attachment))
+        attachments = [
+            JiraAttachment.from_api_response(attachment)
+            for attachment in attachment_data
+            if isinstance(attachment, dict)
+        ]
 
-        # Download each attachment
-        downloaded = []
-        failed = []
+        outcomes = _run_downloads(self._plan_downloads(attachments, target_path))
+        return {
+            "success": True,
+            "issue_key": issue_key,
+            "total": len(attachments),
+            **_collect(outcomes),
+        }
+
+    def iter_attachment_downloads(
+        self, jql: str, target_dir: str, max_issues: int = 50
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Download the attachments of the issues matching a JQL query.
+
+        Each issue's attachments go to a subdirectory named after its key.
+        Downloads of all issues share one bounded pool, and the next page of
+        issues is fetched while the previous one downloads.
+
+        Args:
+            jql: JQL query selecting the issues
+            target_dir: The directory where attachments should be saved
+            max_issues: Maximum number of issues to process
+
+        Yields:
+            The download results of each processed issue, including those
+            without attachments, in search order, as soon as its downloads
+            are done
+        """
+        root = Path(os.path.abspath(target_dir))
+        root.mkdir(parents=True, exist_ok=True)
+        pending: list[tuple[str, int, list[Future[DownloadOutcome]]]] = []
+        seen = 0
+
+        with ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_ATTACHMENT_DOWNLOADS,
+            thread_name_prefix="jira-attachment",
+        ) as executor:
+            for page in self.iter_search_raw(
+                jql, fields="attachment", page_size=min(max_issues, 100)
+            ):
+                ready, pending = pending, []
+                for issue in page[: max_issues - seen]:
+                    seen += 1
+                    attachments = [
+                        JiraAttachment.from_api_response(attachment)
+                        for attachment in (issue.get("fields") or {}).get("attachment")
+                        or []
+                        if isinstance(attachment, dict)
+                    ]
+                    tasks: list[Callable[[], DownloadOutcome]] = []
+                    if attachments:
+                        target_path = root / Path(issue["key"]).name
+                        target_path.mkdir(exist_ok=True)
+                        tasks = self._plan_downloads(attachments, target_path)
+                    pending.append(
+                        (
+                            issue["key"],
+                            len(attachments),
+                            [executor.submit(task) for task in tasks],
+                        )
+                    )
+                # Downloads of this page run while the previous one is reported
+                for issue_key, total, futures in ready:
+                    yield self._issue_download_results(issue_key, total, futures)
+                if seen >= max_issues:
+                    break
+            for issue_key, total, futures in pending:
+                yield self._issue_download_results(issue_key, total, futures)
+
+    def download_attachments_for_jql(
+        self, jql: str, target_dir: str, max_issues: int = 50
+    ) -> dict[str, Any]:
+        """
+        Download the attachments of all issues matching a JQL query.
+
+        Args:
+            jql: JQL query selecting the issues
+            target_dir: The directory where attachments should be saved,
+                one subdirectory per issue key
+            max_issues: Maximum number of issues to process
+
+        Returns:
+            A dictionary with the results per issue and overall counts
+        """
+        return summarize_attachment_downloads(
+            jql, list(self.iter_attachment_downloads(jql, target_dir, max_issues))
+        )
+
+    @staticmethod
+    def _issue_download_results(
+        issue_key: str, total: int, futures: list[Future[DownloadOutcome]]
+    ) -> dict[str, Any]:
+        outcomes = [future.result() for future in futures]
+        return {"issue_key": issue_key, "total": total, **_collect(outcomes)}
+
+    def _plan_downloads(
+        self, attachments: list[JiraAttachment], target_path: Path
+    ) -> list[Callable[[], DownloadOutcome]]:
+        """
+        Plan the downloads of one issue's attachments into a directory.
+
+        Files are named after the attachment, prefixed with its id when
+        several attachments share a name. They are downloaded to a hidden
+        ``.<id>-<name>.part`` file, resumed if present, and moved into place
+        once complete. Only then does the directory manifest record the
+        attachment id and size of the file, which is skipped from then on.
+
+        Returns:
+            One task per attachment, in input order
+        """
+        manifest = _read_manifest(target_path)
+        names = Counter(Path(attachment.filename).name for attachment in attachments)
+        tasks: list[Callable[[], DownloadOutcome]] = []
 
         for attachment in attachments:
             if not attachment.url:
                 logger.warning(f"No URL for attachment {attachment.filename}")
-                failed.append(
-                    {"filename": attachment.filename, "error": "No URL available"}
+                tasks.append(
+                    partial(
+                        _outcome,
+                        "failed",
+                        {"filename": attachment.filename, "error": "No URL available"},
+                    )
                 )
                 continue
 
             # Create a safe filename
             safe_filename = Path(attachment.filename).name
+            if names[safe_filename] > 1:
+                safe_filename = f"{attachment.id}_{safe_filename}"
             file_path = target_path / safe_filename
+            entry = {
+                "filename": attachment.filename,
+                "path": str(file_path),
+                "size": attachment.size,
+            }
 
-            # Download the attachment
-            success = self.download_attachment(attachment.url, str(file_path))
-
-            if success:
-                downloaded.append(
-                    {
-                        "filename": attachment.filename,
-                        "path": str(file_path),
-                        "size": attachment.size,
-                    }
-                )
-            else:
-                failed.append(
-                    {"filename": attachment.filename, "error": "Download failed"}
+            record = {"id": str(attachment.id), "size": attachment.size}
+            on_disk = file_path.stat().st_size if file_path.is_file() else 0
+            known = manifest.get(safe_filename) == record
+            if known and on_disk and on_disk == attachment.size:
+                tasks.append(partial(_outcome, "skipped", entry))
+                continue
+            tasks.append(
+                partial(
+                    self._fetch_attachment,
+                    attachment,
+                    file_path,
+                    target_path / f".{attachment.id}-{safe_filename}.part",
+                    entry,
+                    record,
                 )
-
-        return {
-            "success": True,
-            "issue_key": issue_key,
-            "total": len(attachments),
-            "downloaded": downloaded,
-            "failed": failed,
-        }
-
+            )
+        return tasks
+
+    def _fetch_attachment(
+        self,
+        attachment: JiraAttachment,
+        file_path: Path,
+        part_path: Path,
+        entry: dict[str, Any],
+        record: dict[str, Any],
+    ) -> DownloadOutcome:
+        failed = {"filename": attachment.filename, "error": "Download failed"}
+        partial_size = part_path.stat().st_size if part_path.is_file() else 0
+        if not self.download_attachment(
+            attachment.url or "",
+            str(part_path),
+            expected_size=attachment.size or None,
+            resume=0 < partial_size < attachment.size,
+        ):
+            return "failed", failed
+        try:
+            os.replace(part_path, file_path)
+        except OSError as e:
+            logger.error(f"Could not move {part_path} to {file_path}: {e}")
+            return "failed", failed
+        _record_download(file_path.parent, file_path.name, record)
+        return "downloaded", entry
+
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def upload_attachment(self, issue_key: str, file_path: str) -> dict[str, Any]:
         """
         Upload a single attachment to a Jira issue.
@@ -194,12 +526,12 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
             logger.info(f"Uploading attachment from {file_path} to issue {issue_key}")
 
-            # Use the Jira API to upload the file
+            # Stream the file to the Jira API
             filename = os.path.basename(file_path)
-            with open(file_path, "rb") as file:
-                attachment = self.jira.add_attachment(
-                    issue_key=issue_key, filename=file_path
-                )
+            attachment = self._post_attachment(issue_key, file_path)
+            # Jira answers with the list of attachments created
+            if isinstance(attachment, list):
+                attachment = attachment[0] if attachment else None
 
             if attachment:
                 file_size = os.path.getsize(file_path)
@@ -227,15 +559,24 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             logger.error(f"Error uploading attachment: {error_msg}")
             return {"success": False, "error": error_msg}
 
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def upload_attachments(
-        self, issue_key: str, file_paths: list[str]
+        self,
+        issue_key: str,
+        file_paths: list[str],
+        max_concurrent: int = MAX_CONCURRENT_ATTACHMENT_UPLOADS,
     ) -> dict[str, Any]:
         """
         Upload multiple attachments to a Jira issue.
 
+        Files are streamed, with up to max_concurrent uploads in flight.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             file_paths: List of paths to files to upload
+            max_concurrent: Maximum number of uploads in flight
 
         Returns:
             A dictionary with upload results
@@ -250,13 +591,21 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
         logger.info(f"Uploading {len(file_paths)} attachments to issue {issue_key}")
 
-        # Upload each attachment
+        # Upload the attachments concurrently; a failure does not stop the others
+        upload = partial(self.upload_attachment, issue_key)
+        if len(file_paths) == 1 or max_concurrent <= 1:
+            results = [upload(file_path) for file_path in file_paths]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(file_paths), max_concurrent),
+                thread_name_prefix="jira-attachment-upload",
+            ) as executor:
+                results = list(executor.map(upload, file_paths))
+
         uploaded = []
         failed = []
 
-        for file_path in file_paths:
-            result = self.upload_attachment(issue_key, file_path)
-
+        for file_path, result in zip(file_paths, results, strict=True):
             if result.get("success"):
                 uploaded.append(
                     {
@@ -280,3 +629,19 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             "uploaded": uploaded,
             "failed": failed,
         }
+
+    def _post_attachment(self, issue_key: str, file_path: str) -> Any:
+        """Stream a file to an issue's attachments endpoint and return the JSON."""
+        body = _MultipartFileBody(file_path)
+        url = self.jira.url_joiner(
+            self.jira.url, f"{self.jira.resource_url('issue')}/{issue_key}/attachments"
+        )
+        response = self.jira._session.post(
+            url,
+            data=body,
+            headers={**self.jira.no_check_headers, "Content-Type": body.content_type},
+            timeout=self.jira.timeout,
+            verify=self.jira.verify_ssl,
+        )
+        self.jira.raise_for_status(response)
+        return response.json() if response.text else None
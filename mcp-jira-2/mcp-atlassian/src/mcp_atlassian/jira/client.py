@@ -2,18 +2,23 @@
 
 import logging
 import os
+from collections.abc import Iterator
 from typing import Any, Literal
 
+import httpx
 from atlassian import Jira
 from requests import Session
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.async_http import create_async_http_client, request_json
 from mcp_atlassian.utils.logging import log_config_param, mask_sensitive
 from mcp_atlassian.utils.oauth import configure_oauth_session
+from mcp_atlassian.utils.rate_limit import get_rate_limiter
 from mcp_atlassian.utils.ssl import configure_ssl_verification
 
 from .config import JiraConfig
+from .user_cache import get_user_identity_cache
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
@@ -24,6 +29,7 @@ class JiraClient:
 
     _field_ids_cache: list[dict[str, Any]] | None
     _current_user_account_id: str | None
+    _async_client: httpx.AsyncClient | None
 
     config: JiraConfig
     preprocessor: JiraPreprocessor
@@ -102,6 +108,8 @@ class JiraClient:
             session=self.jira._session,
             ssl_verify=self.config.ssl_verify,
         )
+        # Share the per-host rate-limit scheduler with every other client
+        get_rate_limiter().install(self.jira._session)
 
         # Proxy configuration
         proxies = {}
@@ -122,9 +130,62 @@ class JiraClient:
             log_config_param(logger, "Jira", "NO_PROXY", self.config.no_proxy)
 
         # Initialize the text preprocessor for text processing capabilities
-        self.preprocessor = JiraPreprocessor(base_url=self.config.url)
+        self.preprocessor = JiraPreprocessor(
+            base_url=self.config.url, display_name_for=self._cached_display_name
+        )
         self._field_ids_cache = None
         self._current_user_account_id = None
+        self._async_client = None
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Async HTTP client sharing this client's auth, SSL and proxy settings.
+
+        Created lazily on first use and reused for keep-alive connection pooling.
+        Call `aclose` to release its connections.
+        """
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = create_async_http_client(
+                service_name="Jira", config=self.config, base_url=self.jira.url
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ) -> Any:
+        """Send a request through the async transport and decode the JSON body.
+
+        Args:
+            method: The HTTP method to use
+            path: API path relative to the Jira base URL (e.g. from `resource_url`)
+            params: Optional query parameters
+            json: Optional JSON body
+
+        Returns:
+            The decoded JSON response, or None for empty responses
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails (401/403)
+            httpx.HTTPStatusError: For other unsuccessful responses
+        """
+        return await request_json(
+            self.async_client, "Jira", method, path, params=params, json=json
+        )
+
+    def _cached_display_name(self, account_id: str) -> str | None:
+        """Return the display name cached for an account under these credentials."""
+        return get_user_identity_cache().display_name_for(self.config, account_id)
 
     def _clean_text(self, text: str) -> str:
         """Clean text content by:
@@ -185,6 +246,34 @@ class JiraClient:
         Returns:
             List of requested json data
 
+        Raises:
+            ValueError: If using paged request on non-cloud Jira
+        """
+        return list(self.iter_paged(method, url, params_or_json, absolute=absolute))
+
+    def iter_paged(
+        self,
+        method: Literal["get", "post"],
+        url: str,
+        params_or_json: dict | None = None,
+        *,
+        absolute: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Lazily fetch paged data from Jira API using `nextPageToken` to paginate.
+
+        Each page is requested only when the previous one has been consumed,
+        so callers can stop early without fetching the remaining pages.
+
+        Args:
+            method: The HTTP method to use
+            url: The URL to retrieve data from
+            params_or_json: Optional query parameters or JSON data to send
+            absolute: Whether to use absolute URL
+
+        Yields:
+            The json data of each page
+
         Raises:
             ValueError: If using paged request on non-cloud Jira
         """
@@ -194,7 +283,6 @@ class JiraClient:
                 "Paged requests are only available for Jira Cloud platform"
             )
 
-        all_results: list[dict] = []
         current_data = params_or_json or {}
 
         while True:
@@ -212,8 +300,7 @@ class JiraClient:
                 logger.error(error_message)
                 raise ValueError(error_message)
 
-            # Extract values from response
-            all_results.append(api_result)
+            yield api_result
 
             # Check if this is the last page
             if "nextPageToken" not in api_result:
@@ -222,6 +309,52 @@ class JiraClient:
             # Update for next iteration
             current_data["nextPageToken"] = api_result["nextPageToken"]
 
+    async def get_paged_async(
+        self,
+        method: Literal["get", "post"],
+        url: str,
+        params_or_json: dict | None = None,
+    ) -> list[dict]:
+        """
+        Awaitable counterpart of `get_paged` using the async transport.
+
+        Args:
+            method: The HTTP method to use
+            url: The URL to retrieve data from
+            params_or_json: Optional query parameters or JSON data to send
+
+        Returns:
+            List of requested json data
+
+        Raises:
+            ValueError: If using paged request on non-cloud Jira
+        """
+        if not self.config.is_cloud:
+            raise ValueError(
+                "Paged requests are only available for Jira Cloud platform"
+            )
+
+        all_results: list[dict] = []
+        current_data = dict(params_or_json or {})
+
+        while True:
+            if method == "get":
+                api_result = await self.request_async("GET", url, params=current_data)
+            else:
+                api_result = await self.request_async("POST", url, json=current_data)
+
+            if not isinstance(api_result, dict):
+                error_message = f"API result is not a dictionary: {api_result}"
+                logger.error(error_message)
+                raise ValueError(error_message)
+
+            all_results.append(api_result)
+
+            if "nextPageToken" not in api_result:
+                break
+
+            current_data["nextPageToken"] = api_result["nextPageToken"]
+
         return all_results
 
     def create_version(
@@ -4,6 +4,7 @@ import logging
 from typing import Any
 
 from ..utils import parse_date
+from ..utils.response_cache import invalidates_response_cache
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
@@ -52,6 +53,9 @@ class CommentsMixin(JiraClient):
             logger.error(f"Error getting comments for issue {issue_key}: {str(e)}")
             raise Exception(f"Error getting comments: {str(e)}") from e
 
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def add_comment(self, issue_key: str, comment: str) -> dict[str, Any]:
         """
         Add a comment to an issue.
@@ -1,9 +1,15 @@
 """Module for Jira epic operations."""
 
 import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
 from ..models.jira import JiraIssue
+from ..utils.response_cache import invalidates_response_cache
 from .client import JiraClient
 from .protocols import (
     FieldsOperationsProto,
@@ -14,6 +20,121 @@ from .protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# How long (seconds) a learned epic lookup strategy is reused before re-probing
+EPIC_STRATEGY_TTL = int(os.getenv("JIRA_EPIC_STRATEGY_TTL", "3600"))
+
+COMMON_EPIC_LINK_FIELDS = [
+    "customfield_10014",
+    "customfield_10008",
+    "customfield_10100",
+    "customfield_10001",
+    "customfield_10002",
+    "customfield_10003",
+    "customfield_10004",
+    "customfield_10005",
+    "customfield_10006",
+    "customfield_10007",
+    "customfield_11703",
+]
+
+EPIC_ISSUE_LINK_TYPES = ["relates to", "blocks", "is blocked by", "is part of"]
+
+# Strategies of a tier raced at the same time; larger tiers run in waves
+MAX_CONCURRENT_EPIC_STRATEGIES = 4
+
+
+@dataclass(frozen=True)
+class EpicLookupStrategy:
+    """A JQL query that finds the children of an epic."""
+
+    name: str
+    jql_template: str
+    # Whether a successful but empty search counts as an answer
+    accepts_empty: bool = False
+    # Epic Link field id to remember when this strategy works
+    epic_link_field_id: str | None = None
+
+    def jql(self, epic_key: str) -> str:
+        """Build the JQL query for an epic."""
+        return self.jql_template.replace("{epic_key}", epic_key)
+
+
+def _epic_strategy_tiers(
+    epic_link_field: str | None,
+) -> list[list[EpicLookupStrategy]]:
+    """Candidate strategies in priority order, grouped into tiers raced in turn."""
+    primary = [
+        EpicLookupStrategy(
+            "issueFunction",
+            'issueFunction in issuesScopedToEpic("{epic_key}")',
+            accepts_empty=True,
+        ),
+        EpicLookupStrategy("parent relationship", 'parent = "{epic_key}"'),
+    ]
+    if epic_link_field:
+        primary.append(
+            EpicLookupStrategy(
+                f"epic link field {epic_link_field}",
+                f'"{epic_link_field}" = "{{epic_key}}"',
+            )
+        )
+    primary.append(
+        EpicLookupStrategy("'Epic Link' field name", '"Epic Link" = "{epic_key}"')
+    )
+    fallback = [
+        EpicLookupStrategy(
+            f"issue links with type '{link_type}'",
+            f'issueLink = "{link_type}" and issueLink = "{{epic_key}}"',
+        )
+        for link_type in EPIC_ISSUE_LINK_TYPES
+    ] + [
+        EpicLookupStrategy(
+            f"field ID {field_id}",
+            f'"{field_id}" = "{{epic_key}}"',
+            epic_link_field_id=field_id,
+        )
+        for field_id in COMMON_EPIC_LINK_FIELDS
+    ]
+    return [primary, fallback]
+
+
+_epic_lookup_executor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="jira-epic-lookup"
+)
+_epic_strategies: dict[str, tuple[EpicLookupStrategy, float]] = {}
+_epic_strategies_lock = threading.Lock()
+# Guards additions to a fetcher's _field_ids_cache from concurrent tool calls
+_field_ids_cache_lock = threading.Lock()
+
+
+def _get_cached_epic_strategy(base_url: str) -> EpicLookupStrategy | None:
+    key = base_url.rstrip("/").lower()
+    with _epic_strategies_lock:
+        cached = _epic_strategies.get(key)
+        if cached is None:
+            return None
+        strategy, learned_at = cached
+        if time.monotonic() - learned_at >= EPIC_STRATEGY_TTL:
+            del _epic_strategies[key]
+            return None
+        return strategy
+
+
+def _store_epic_strategy(base_url: str, strategy: EpicLookupStrategy) -> None:
+    with _epic_strategies_lock:
+        _epic_strategies[base_url.rstrip("/").lower()] = (strategy, time.monotonic())
+
+
+def _forget_epic_strategy(base_url: str) -> None:
+    with _epic_strategies_lock:
+        _epic_strategies.pop(base_url.rstrip("/").lower(), None)
+
+
+def clear_epic_strategy_cache() -> None:
+    """Forget the epic lookup strategies learned for all Jira instances."""
+    with _epic_strategies_lock:
+        _epic_strategies.clear()
+
 
 class EpicsMixin(
     JiraClient,
@@ -253,6 +374,9 @@ class EpicsMixin(
         logger.debug("Could not determine Epic Color field ID")
         return None
 
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def link_issue_to_epic(self, issue_key: str, epic_key: str) -> JiraIssue:
         """
         Link an existing issue to an epic.
@@ -350,9 +474,7 @@ class EpicsMixin(
                     )
 
                     # If we get here, it worked - update our cached field ID
-                    if self._field_ids_cache is None:
-                        self._field_ids_cache = []
-                    self._field_ids_cache.append({"id": field_id, "name": "epic_link"})
+                    self._remember_epic_link_field(field_id)
                     return self.get_issue(issue_key)
                 except Exception as e:
                     logger.info(f"Couldn't link using fields {fields}: {str(e)}")
@@ -397,6 +519,13 @@ class EpicsMixin(
         """
         Get all issues linked to a specific epic.
 
+        The JQL strategy that finds epic children on this Jira instance is
+        learned once per base URL and reused until JIRA_EPIC_STRATEGY_TTL
+        expires, or until it finds nothing for an epic. Otherwise candidate
+        strategies are raced in waves of up to MAX_CONCURRENT_EPIC_STRATEGIES
+        and the highest-priority one that succeeds wins. The epic's issue type
+        is checked concurrently with the search.
+
         Args:
             epic_key: The key of the epic (e.g. 'PROJ-123')
             start: Starting index for pagination
@@ -410,177 +539,55 @@ class EpicsMixin(
             Exception: If there is an error getting epic issues
         """
         try:
-            # First, check if the issue is an Epic
-            epic = self.jira.get_issue(epic_key)
-            if not isinstance(epic, dict):
-                msg = (
-                    f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
-                )
-                logger.error(msg)
-                raise TypeError(msg)
-            fields_data = epic.get("fields", {})
-
-            # Safely check if the issue is an Epic
-            issue_type = None
-            issuetype_data = fields_data.get("issuetype")
-            if issuetype_data is not None:
-                issue_type = issuetype_data.get("name", "")
-
-            if issue_type != "Epic":
-                error_msg = (
-                    f"Issue {epic_key} is not an Epic, it is a "
-                    f"{issue_type or 'unknown type'}"
-                )
-                raise ValueError(error_msg)
-
-            # Track which methods we've tried
-            tried_methods = set()
-            issues = []
-
-            # Find the Epic Link field
-            field_ids = self.get_field_ids_to_epic()
-            epic_link_field = self._find_epic_link_field(field_ids)
-
-            # METHOD 1: Try with 'issueFunction in issuesScopedToEpic' - this works in many Jira instances
-            if "issueFunction" not in tried_methods:
-                tried_methods.add("issueFunction")
-                try:
-                    jql = f'issueFunction in issuesScopedToEpic("{epic_key}")'
-                    logger.info(f"Trying to get epic issues with issueFunction: {jql}")
-
-                    search_result = self.search_issues(jql, start=start, limit=limit)
-                    if search_result:
-                        logger.info(
-                            f"Successfully found {len(search_result.issues)} issues for epic {epic_key} using issueFunction"
-                        )
-                        return search_result.issues
-                except Exception as e:
-                    # Log exception but continue with fallback
-                    logger.warning(
-                        f"Error searching epic issues with issueFunction: {str(e)}"
-                    )
+            epic_check = _epic_lookup_executor.submit(
+                self.jira.get_issue, epic_key, fields="issuetype"
+            )
 
-            # METHOD 2: Try using parent relationship - common in many Jira setups
-            if "parent" not in tried_methods:
-                tried_methods.add("parent")
+            cached_strategy = _get_cached_epic_strategy(self.config.url)
+            if cached_strategy is not None:
+                strategy_future = _epic_lookup_executor.submit(
+                    self._run_epic_strategy, cached_strategy, epic_key, start, limit
+                )
+                self._check_is_epic(epic_key, epic_check.result())
                 try:
-                    jql = f'parent = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with parent relationship: {jql}"
-                    )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using parent relationship"
-                        )
+                    issues = strategy_future.result()
+                    if issues is not None:
                         return issues
-                except Exception as parent_error:
-                    logger.warning(
-                        f"Error with parent relationship approach: {str(parent_error)}"
-                    )
-
-            # METHOD 3: If we found an Epic Link field, try using it
-            if epic_link_field and "epicLinkField" not in tried_methods:
-                tried_methods.add("epicLinkField")
-                try:
-                    jql = f'"{epic_link_field}" = "{epic_key}"'
+                    # Found nothing; another strategy may still find children
                     logger.info(
-                        f"Trying to get epic issues with epic link field: {jql}"
+                        f"Learned epic lookup '{cached_strategy.name}' found no "
+                        f"issues for {epic_key}, probing other strategies"
                     )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using epic link field {epic_link_field}"
-                        )
-                        return issues
                 except Exception as e:
                     logger.warning(
-                        f"Error using epic link field {epic_link_field}: {str(e)}"
+                        f"Learned epic lookup '{cached_strategy.name}' failed, "
+                        f"probing again: {str(e)}"
                     )
+                    _forget_epic_strategy(self.config.url)
 
-            # METHOD 4: Try using 'Epic Link' as a textual field name
-            if "epicLinkName" not in tried_methods:
-                tried_methods.add("epicLinkName")
-                try:
-                    jql = f'"Epic Link" = "{epic_key}"'
+            # Find the Epic Link field
+            field_ids = self.get_field_ids_to_epic()
+            epic_link_field = self._find_epic_link_field(field_ids)
+
+            waves = [
+                tier[i : i + MAX_CONCURRENT_EPIC_STRATEGIES]
+                for tier in _epic_strategy_tiers(epic_link_field)
+                for i in range(0, len(tier), MAX_CONCURRENT_EPIC_STRATEGIES)
+            ]
+            for wave in waves:
+                found = self._race_epic_strategies(
+                    wave, epic_key, start, limit, epic_check
+                )
+                if found is not None:
+                    strategy, issues = found
                     logger.info(
-                        f"Trying to get epic issues with 'Epic Link' field name: {jql}"
+                        f"Successfully found {len(issues)} issues for epic {epic_key} using {strategy.name}"
                     )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using 'Epic Link' field name"
-                        )
-                        return issues
-                except Exception as e:
-                    logger.warning(f"Error using 'Epic Link' field name: {str(e)}")
-
-            # METHOD 5: Try using issue links with a specific link type
-            if "issueLinks" not in tried_methods:
-                tried_methods.add("issueLinks")
-                try:
-                    # Try to find issues linked to this epic with standard link types
-                    link_types = ["relates to", "blocks", "is blocked by", "is part of"]
-                    for link_type in link_types:
-                        jql = f'issueLink = "{link_type}" and issueLink = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with issue links: {jql}"
-                        )
-                        try:
-                            issues = self._get_epic_issues_by_jql(
-                                epic_key, jql, start, limit
-                            )
-                            if issues:
-                                logger.info(
-                                    f"Successfully found {len(issues)} issues for epic {epic_key} using issue links with type '{link_type}'"
-                                )
-                                return issues
-                        except Exception:
-                            # Just try the next link type
-                            continue
-                except Exception as e:
-                    logger.warning(f"Error using issue links approach: {str(e)}")
-
-            # METHOD 6: Last resort - try each common Epic Link field ID directly
-            if "commonFields" not in tried_methods:
-                tried_methods.add("commonFields")
-                common_epic_fields = [
-                    "customfield_10014",
-                    "customfield_10008",
-                    "customfield_10100",
-                    "customfield_10001",
-                    "customfield_10002",
-                    "customfield_10003",
-                    "customfield_10004",
-                    "customfield_10005",
-                    "customfield_10006",
-                    "customfield_10007",
-                    "customfield_11703",
-                ]
-
-                for field_id in common_epic_fields:
-                    try:
-                        jql = f'"{field_id}" = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with common field ID: {jql}"
-                        )
-                        issues = self._get_epic_issues_by_jql(
-                            epic_key, jql, start, limit
-                        )
-                        if issues:
-                            logger.info(
-                                f"Successfully found {len(issues)} issues for epic {epic_key} using field ID {field_id}"
-                            )
-                            # Cache this successful field ID for future use
-                            if self._field_ids_cache is None:
-                                self._field_ids_cache = []
-                            self._field_ids_cache.append(
-                                {"id": field_id, "name": "epic_link"}
-                            )
-                            return issues
-                    except Exception:
-                        # Just try the next field ID
-                        continue
+                    _store_epic_strategy(self.config.url, strategy)
+                    if strategy.epic_link_field_id:
+                        # Cache this successful field ID for future use
+                        self._remember_epic_link_field(strategy.epic_link_field_id)
+                    return issues
 
             # If we've tried everything and found no issues, return an empty list
             logger.warning(
@@ -596,6 +603,98 @@ class EpicsMixin(
             logger.error(f"Error getting issues for epic {epic_key}: {str(e)}")
             raise Exception(f"Error getting epic issues: {str(e)}") from e
 
+    def _remember_epic_link_field(self, field_id: str) -> None:
+        """Record a working Epic Link field id in the field cache.
+
+        The cached list is replaced rather than appended to, so callers
+        iterating over it from other threads are unaffected.
+        """
+        with _field_ids_cache_lock:
+            cached = self._field_ids_cache or []
+            entry = {"id": field_id, "name": "epic_link"}
+            if entry not in cached:
+                self._field_ids_cache = [*cached, entry]
+
+    @staticmethod
+    def _check_is_epic(epic_key: str, epic: Any) -> None:
+        """Raise if the fetched issue is not an Epic."""
+        if not isinstance(epic, dict):
+            msg = f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        fields_data = epic.get("fields", {})
+
+        # Safely check if the issue is an Epic
+        issue_type = None
+        issuetype_data = fields_data.get("issuetype")
+        if issuetype_data is not None:
+            issue_type = issuetype_data.get("name", "")
+
+        if issue_type != "Epic":
+            error_msg = (
+                f"Issue {epic_key} is not an Epic, it is a "
+                f"{issue_type or 'unknown type'}"
+            )
+            raise ValueError(error_msg)
+
+    def _race_epic_strategies(
+        self,
+        strategies: list[EpicLookupStrategy],
+        epic_key: str,
+        start: int,
+        limit: int,
+        epic_check: Future,
+    ) -> tuple[EpicLookupStrategy, list[JiraIssue]] | None:
+        """
+        Run lookup strategies concurrently and pick the first in priority order that succeeds.
+
+        A lower-priority strategy only wins once every strategy before it has
+        failed or found nothing, so the outcome matches trying them in turn.
+
+        Returns:
+            Tuple of the winning strategy and its issues, or None
+        """
+        futures = [
+            _epic_lookup_executor.submit(
+                self._run_epic_strategy, strategy, epic_key, start, limit
+            )
+            for strategy in strategies
+        ]
+        try:
+            self._check_is_epic(epic_key, epic_check.result())
+            for strategy, future in zip(strategies, futures, strict=True):
+                try:
+                    issues = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Error searching epic issues with {strategy.name}: {str(e)}"
+                    )
+                    continue
+                if issues is not None:
+                    return strategy, issues
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _run_epic_strategy(
+        self, strategy: EpicLookupStrategy, epic_key: str, start: int, limit: int
+    ) -> list[JiraIssue] | None:
+        """
+        Search epic children with one strategy.
+
+        Returns:
+            The issues, or None if the strategy found nothing
+        """
+        jql = strategy.jql(epic_key)
+        logger.info(f"Trying to get epic issues with {strategy.name}: {jql}")
+        if strategy.accepts_empty:
+            search_result = self.search_issues(
+                jql, start=start, limit=limit, include_total=False
+            )
+            return search_result.issues if search_result else None
+        return self._get_epic_issues_by_jql(epic_key, jql, start, limit) or None
+
     def _find_epic_link_field(self, field_ids: dict[str, str]) -> str | None:
         """
         Find the Epic Link field with fallback mechanisms.
@@ -789,11 +888,16 @@ class EpicsMixin(
             List of JiraIssue models
         """
 
-        search_result = self.search_issues(jql, start=start, limit=limit)
+        search_result = self.search_issues(
+            jql, start=start, limit=limit, include_total=False
+        )
         if not search_result:
             logger.warning(f"No issues found for epic {epic_key} with query: {jql}")
         return search_result.issues
 
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def update_epic_fields(self, issue_key: str, kwargs: dict[str, Any]) -> JiraIssue:
         """
         Update Epic-specific fields after Epic creation.
@@ -0,0 +1,193 @@
+"""Process-wide cache of Jira field metadata.
+
+The ``/field`` payload can contain thousands of custom fields and rarely
+changes, so it is shared across all fetchers that talk to the same Jira
+instance instead of being refetched per fetcher. Entries expire after
+JIRA_FIELD_CACHE_TTL seconds and, when JIRA_FIELD_CACHE_DIR is set, are
+snapshotted to disk so a restarted server does not need to refetch them.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("mcp-jira.field_catalog")
+
+DEFAULT_FIELD_CACHE_TTL = 3600
+
+
+def build_field_indexes(
+    fields: list[dict[str, Any]],
+) -> tuple[dict[str, str], dict[str, dict[str, Any]]]:
+    """Build the lookup tables for a list of field definitions.
+
+    Args:
+        fields: Field definitions as returned by ``/rest/api/2/field``
+
+    Returns:
+        Tuple of (lowercase name or id -> field id, field id -> definition).
+        Names map to the first field carrying them; ids always map to themselves.
+    """
+    name_map: dict[str, str] = {}
+    id_map: dict[str, str] = {}
+    by_id: dict[str, dict[str, Any]] = {}
+    for field_def in fields:
+        field_id = field_def.get("id")
+        field_name = field_def.get("name")
+        if field_id:
+            id_map[field_id] = field_id
+            by_id.setdefault(field_id, field_def)
+            if field_name:
+                name_map.setdefault(field_name.lower(), field_id)
+    return name_map | id_map, by_id
+
+
+@dataclass
+class FieldCatalog:
+    """Field definitions of one Jira instance with O(1) lookup tables."""
+
+    fields: list[dict[str, Any]]
+    fetched_at: float
+    name_to_id: dict[str, str] = field(default_factory=dict)
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_fields(
+        cls, fields: list[dict[str, Any]], fetched_at: float | None = None
+    ) -> "FieldCatalog":
+        """Create a catalog and its lookup tables from field definitions."""
+        name_to_id, by_id = build_field_indexes(fields)
+        return cls(
+            fields=fields,
+            fetched_at=time.time() if fetched_at is None else fetched_at,
+            name_to_id=name_to_id,
+            by_id=by_id,
+        )
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Check whether the catalog is younger than the given TTL in seconds."""
+        return time.time() - self.fetched_at < ttl
+
+
+_catalogs: dict[str, FieldCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_field_cache_ttl() -> int:
+    """Return the field catalog TTL in seconds (JIRA_FIELD_CACHE_TTL)."""
+    return int(os.getenv("JIRA_FIELD_CACHE_TTL", str(DEFAULT_FIELD_CACHE_TTL)))
+
+
+def _normalize_url(base_url: str) -> str:
+    return base_url.rstrip("/").lower()
+
+
+def _snapshot_path(base_url: str) -> Path | None:
+    cache_dir = os.getenv("JIRA_FIELD_CACHE_DIR")
+    if not cache_dir:
+        return None
+    digest = hashlib.sha256(_normalize_url(base_url).encode("utf-8")).hexdigest()
+    return Path(cache_dir).expanduser() / f"jira-fields-{digest[:16]}.json"
+
+
+def _load_snapshot(base_url: str) -> FieldCatalog | None:
+    path = _snapshot_path(base_url)
+    if path is None or not path.is_file():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("url") != _normalize_url(base_url):
+            return None
+        fields = data["fields"]
+        if not isinstance(fields, list):
+            return None
+        return FieldCatalog.from_fields(fields, fetched_at=float(data["fetched_at"]))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable field cache snapshot {path}: {e}")
+        return None
+
+
+def _save_snapshot(base_url: str, catalog: FieldCatalog) -> None:
+    path = _snapshot_path(base_url)
+    if path is None:
+        return
+    payload = {
+        "url": _normalize_url(base_url),
+        "fetched_at": catalog.fetched_at,
+        "fields": catalog.fields,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=path.name, suffix=".tmp"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_name, path)
+    except OSError as e:
+        logger.warning(f"Could not write field cache snapshot {path}: {e}")
+
+
+def get_field_catalog(base_url: str) -> FieldCatalog | None:
+    """Return the cached field catalog for a Jira instance, if still fresh.
+
+    Falls back to the on-disk snapshot when the in-memory entry is missing.
+
+    Args:
+        base_url: The Jira base URL
+
+    Returns:
+        The FieldCatalog, or None if nothing fresh is cached.
+    """
+    ttl = get_field_cache_ttl()
+    key = _normalize_url(base_url)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+    if catalog is not None and catalog.is_fresh(ttl):
+        return catalog
+
+    catalog = _load_snapshot(base_url)
+    if catalog is None or not catalog.is_fresh(ttl):
+        return None
+    logger.debug(f"Loaded {len(catalog.fields)} Jira fields from disk snapshot")
+    with _catalogs_lock:
+        _catalogs[key] = catalog
+    return catalog
+
+
+def store_field_catalog(base_url: str, fields: list[dict[str, Any]]) -> FieldCatalog:
+    """Cache freshly fetched field definitions for a Jira instance.
+
+    Args:
+        base_url: The Jira base URL
+        fields: Field definitions as returned by ``/rest/api/2/field``
+
+    Returns:
+        The new FieldCatalog.
+    """
+    catalog = FieldCatalog.from_fields(fields)
+    with _catalogs_lock:
+        _catalogs[_normalize_url(base_url)] = catalog
+    _save_snapshot(base_url, catalog)
+    return catalog
+
+
+def invalidate_field_catalog(base_url: str | None = None) -> None:
+    """Drop cached field catalogs from memory.
+
+    Args:
+        base_url: The Jira base URL to drop, or None to drop all of them.
+            On-disk snapshots are left in place and expire by their TTL.
+    """
+    with _catalogs_lock:
+        if base_url is None:
+            _catalogs.clear()
+        else:
+            _catalogs.pop(_normalize_url(base_url), None)
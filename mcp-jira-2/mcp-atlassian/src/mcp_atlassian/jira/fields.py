@@ -6,6 +6,11 @@ from typing import Any
 from thefuzz import fuzz
 
 from .client import JiraClient
+from .field_catalog import (
+    build_field_indexes,
+    get_field_catalog,
+    store_field_catalog,
+)
 from .protocols import EpicOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
@@ -20,11 +25,15 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
     """
 
     _field_name_to_id_map: dict[str, str] | None = None  # Cache for name -> id mapping
+    _field_by_id_map: dict[str, dict[str, Any]] | None = None  # Cache for id -> field
 
     def get_fields(self, refresh: bool = False) -> list[dict[str, Any]]:
         """
         Get all available fields from Jira.
 
+        Field definitions are shared with every fetcher for the same Jira
+        instance through the process-wide field catalog.
+
         Args:
             refresh: When True, forces a refresh from the server instead of using cache
 
@@ -40,6 +49,15 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 self._field_name_to_id_map = (
                     None  # Clear name map cache if refreshing fields
                 )
+                self._field_by_id_map = None
+            else:
+                catalog = get_field_catalog(self.config.url)
+                if catalog is not None:
+                    # Copy the list so local additions don't leak into the shared catalog
+                    self._field_ids_cache = list(catalog.fields)
+                    self._field_name_to_id_map = catalog.name_to_id
+                    self._field_by_id_map = catalog.by_id
+                    return self._field_ids_cache
 
             # Fetch fields from Jira API
             fields = self.jira.get_all_fields()
@@ -48,16 +66,16 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 logger.error(msg)
                 raise TypeError(msg)
 
-            # Cache the fields
-            self._field_ids_cache = fields
-
-            # Regenerate the name map upon fetching new fields
-            self._generate_field_map(force_regenerate=True)
+            # Cache the fields, locally and for other fetchers of this instance
+            catalog = store_field_catalog(self.config.url, fields)
+            self._field_ids_cache = list(fields)
+            self._field_name_to_id_map = catalog.name_to_id
+            self._field_by_id_map = catalog.by_id
 
             # Log available fields for debugging
             self._log_available_fields(fields)
 
-            return fields
+            return self._field_ids_cache
 
         except Exception as e:
             logger.error(f"Error getting Jira fields: {str(e)}")
@@ -74,21 +92,10 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         )  # Uses cache if available unless force_regenerate was True
         if not fields:
             self._field_name_to_id_map = {}
+            self._field_by_id_map = {}
             return {}
 
-        name_map: dict[str, str] = {}
-        id_map: dict[str, str] = {}  # Also map ID to ID for consistency
-        for field in fields:
-            field_id = field.get("id")
-            field_name = field.get("name")
-            if field_id:
-                id_map[field_id] = field_id  # Map ID to itself
-                if field_name:
-                    # Store lowercase name -> ID. Handle potential name collisions if necessary.
-                    name_map.setdefault(field_name.lower(), field_id)
-
-        # Combine maps, ensuring IDs can also be looked up directly
-        self._field_name_to_id_map = name_map | id_map
+        self._field_name_to_id_map, self._field_by_id_map = build_field_indexes(fields)
         logger.debug(
             f"Generated/Updated field name map: {len(self._field_name_to_id_map)} entries"
         )
@@ -141,10 +148,12 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         """
         try:
             fields = self.get_fields(refresh=refresh)
+            if self._field_by_id_map is None:
+                _, self._field_by_id_map = build_field_indexes(fields)
 
-            for field in fields:
-                if field.get("id") == field_id:
-                    return field
+            field = self._field_by_id_map.get(field_id)
+            if field is not None:
+                return field
 
             logger.warning(f"Field with ID '{field_id}' not found")
             return None
@@ -2,14 +2,19 @@
 
 import logging
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import anyio
+import httpx
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.jira import JiraIssue
 from ..models.jira.common import JiraChangelog
 from ..utils import parse_date
+from ..utils.response_cache import cached_response, invalidates_response_cache
 from .client import JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
 from .protocols import (
@@ -22,6 +27,14 @@ from .protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# Issues fetched per `key in (...)` search, and how many such searches run at once
+ISSUE_KEY_SEARCH_CHUNK_SIZE = 50
+MAX_CONCURRENT_KEY_SEARCHES = 4
+
+# Issues per changelog/bulkfetch request, and how many changelog requests run at once
+CHANGELOG_BULKFETCH_CHUNK_SIZE = 100
+MAX_CONCURRENT_CHANGELOG_FETCHES = 4
+
 
 class IssuesMixin(
     JiraClient,
@@ -33,6 +46,9 @@ class IssuesMixin(
 ):
     """Mixin for Jira issue operations."""
 
+    @cached_response(
+        "jira-issue", entity_arg="issue_key", revalidate="_is_cached_issue_current"
+    )
     def get_issue(
         self,
         issue_key: str,
@@ -61,54 +77,7 @@ class IssuesMixin(
             Exception: If there is an error retrieving the issue
         """
         try:
-            # Determine fields_param: use provided fields or default from constant
-            fields_param = fields
-            if fields_param is None:
-                fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
-            elif isinstance(fields_param, list | tuple | set):
-                fields_param = ",".join(fields_param)
-
-            # Ensure necessary fields are included based on special parameters
-            if (
-                fields_param == ",".join(DEFAULT_READ_JIRA_FIELDS)
-                or fields_param == "*all"
-            ):
-                # Default fields are being used - preserve the order
-                default_fields_list = (
-                    fields_param.split(",")
-                    if fields_param != "*all"
-                    else list(DEFAULT_READ_JIRA_FIELDS)
-                )
-                additional_fields = []
-
-                # Add appropriate fields based on expand parameter
-                if expand:
-                    expand_params = expand.split(",")
-                    if (
-                        "changelog" in expand_params
-                        and "changelog" not in default_fields_list
-                        and "changelog" not in additional_fields
-                    ):
-                        additional_fields.append("changelog")
-                    if (
-                        "renderedFields" in expand_params
-                        and "rendered" not in default_fields_list
-                        and "rendered" not in additional_fields
-                    ):
-                        additional_fields.append("rendered")
-
-                # Add appropriate fields based on properties parameter
-                if (
-                    properties
-                    and "properties" not in default_fields_list
-                    and "properties" not in additional_fields
-                ):
-                    additional_fields.append("properties")
-
-                # Combine default fields with additional fields, preserving order
-                if additional_fields:
-                    fields_param = ",".join(default_fields_list + additional_fields)
-            # Handle non-default fields string
+            fields_param = self._build_fields_param(fields, expand, properties)
 
             # Build expand parameter if provided
             expand_param = expand
@@ -206,6 +175,89 @@ class IssuesMixin(
             logger.error(f"Error retrieving issue {issue_key}: {error_msg}")
             raise Exception(f"Error retrieving issue {issue_key}: {error_msg}") from e
 
+    def _is_cached_issue_current(
+        self, issue: JiraIssue, arguments: dict[str, Any]
+    ) -> bool:
+        """Check a cached issue against the server's `updated` timestamp.
+
+        Args:
+            issue: The cached JiraIssue
+            arguments: The arguments the issue was fetched with
+
+        Returns:
+            True if the issue has not changed since it was cached
+        """
+        if not issue.updated:
+            return False
+        data = self.jira.get_issue(
+            arguments["issue_key"], fields="updated", update_history=False
+        )
+        if not isinstance(data, dict):
+            return False
+        return str(data.get("fields", {}).get("updated", "")) == issue.updated
+
+    @staticmethod
+    def _build_fields_param(
+        fields: str | list[str] | tuple[str, ...] | set[str] | None,
+        expand: str | None = None,
+        properties: str | list[str] | None = None,
+    ) -> str:
+        """Build the ``fields`` request parameter for issue reads.
+
+        Args:
+            fields: Fields to return, or None for the default set
+            expand: Fields to expand in the response
+            properties: Issue properties to return
+
+        Returns:
+            Comma-separated fields, including those required by expand/properties
+        """
+        # Determine fields_param: use provided fields or default from constant
+        fields_param = fields
+        if fields_param is None:
+            fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
+        elif isinstance(fields_param, list | tuple | set):
+            fields_param = ",".join(fields_param)
+
+        # Ensure necessary fields are included based on special parameters
+        if fields_param == ",".join(DEFAULT_READ_JIRA_FIELDS) or fields_param == "*all":
+            # Default fields are being used - preserve the order
+            default_fields_list = (
+                fields_param.split(",")
+                if fields_param != "*all"
+                else list(DEFAULT_READ_JIRA_FIELDS)
+            )
+            additional_fields = []
+
+            # Add appropriate fields based on expand parameter
+            if expand:
+                expand_params = expand.split(",")
+                if (
+                    "changelog" in expand_params
+                    and "changelog" not in default_fields_list
+                    and "changelog" not in additional_fields
+                ):
+                    additional_fields.append("changelog")
+                if (
+                    "renderedFields" in expand_params
+                    and "rendered" not in default_fields_list
+                    and "rendered" not in additional_fields
+                ):
+                    additional_fields.append("rendered")
+
+            # Add appropriate fields based on properties parameter
+            if (
+                properties
+                and "properties" not in default_fields_list
+                and "properties" not in additional_fields
+            ):
+                additional_fields.append("properties")
+
+            # Combine default fields with additional fields, preserving order
+            if additional_fields:
+                fields_param = ",".join(default_fields_list + additional_fields)
+        return fields_param
+
     def _normalize_comment_limit(self, comment_limit: int | str | None) -> int | None:
         """
         Normalize the comment limit to an integer or None.
@@ -477,6 +529,7 @@ class IssuesMixin(
 
         return metadata
 
+    @invalidates_response_cache("jira-search")
     def create_issue(
         self,
         project_key: str,
@@ -864,6 +917,9 @@ class IssuesMixin(
         else:
             logger.error(f"Error creating {issue_type}: {error_msg}")
 
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def update_issue(
         self,
         issue_key: str,
@@ -1097,6 +1153,9 @@ class IssuesMixin(
             raise TypeError(msg)
         return JiraIssue.from_api_response(issue_data)
 
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def delete_issue(self, issue_key: str) -> bool:
         """
         Delete a Jira issue.
@@ -1185,6 +1244,9 @@ class IssuesMixin(
                 f"Error getting transitions for issue {issue_key}: {str(e)}"
             ) from e
 
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def transition_issue(self, issue_key: str, transition_id: str) -> JiraIssue:
         """
         Transition an issue to a new status.
@@ -1208,6 +1270,7 @@ class IssuesMixin(
             logger.error(f"Error transitioning issue {issue_key}: {str(e)}")
             raise
 
+    @invalidates_response_cache("jira-search")
     def batch_create_issues(
         self,
         issues: list[dict[str, Any]],
@@ -1236,6 +1299,8 @@ class IssuesMixin(
         if not issues:
             return []
 
+        assignee_identifiers = self._resolve_batch_assignees(issues)
+
         # Prepare issues for bulk creation
         issue_updates = []
         for issue_data in issues:
@@ -1265,14 +1330,11 @@ class IssuesMixin(
                 if description:
                     fields["description"] = description
 
-                # Add assignee if provided
+                # Add assignee if provided (resolved once per distinct assignee)
                 if assignee:
-                    try:
-                        # _get_account_id now returns the correct identifier (accountId for cloud, name for server)
-                        assignee_identifier = self._get_account_id(assignee)
+                    assignee_identifier = assignee_identifiers.get(assignee)
+                    if assignee_identifier:
                         self._add_assignee_to_fields(fields, assignee_identifier)
-                    except ValueError as e:
-                        logger.warning(f"Could not assign issue: {str(e)}")
 
                 # Add components if provided
                 if components:
@@ -1316,31 +1378,17 @@ class IssuesMixin(
                 logger.error(msg)
                 raise TypeError(msg)
 
-            # Process results
-            created_issues = []
-            for issue_info in response.get("issues", []):
-                issue_key = issue_info.get("key")
-                if issue_key:
-                    try:
-                        # Fetch the full issue data
-                        issue_data = self.jira.get_issue(issue_key)
-                        if not isinstance(issue_data, dict):
-                            msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
-                            logger.error(msg)
-                            raise TypeError(msg)
-
-                        created_issues.append(
-                            JiraIssue.from_api_response(
-                                issue_data,
-                                base_url=self.config.url
-                                if hasattr(self, "config")
-                                else None,
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error fetching created issue {issue_key}: {str(e)}"
-                        )
+            # Fetch the created issues with a few JQL searches instead of one
+            # request per issue
+            created_keys = [
+                issue_info["key"]
+                for issue_info in response.get("issues", [])
+                if issue_info.get("key")
+            ]
+            found_issues, missing_keys = self.get_issues(created_keys, fields="*all")
+            created_issues = self._with_unindexed_issues(
+                created_keys, found_issues, missing_keys
+            )
 
             # Log any errors from the bulk creation
             errors = response.get("errors", [])
@@ -1354,15 +1402,195 @@ class IssuesMixin(
             logger.error(f"Error in bulk issue creation: {str(e)}")
             raise
 
+    def _with_unindexed_issues(
+        self,
+        issue_keys: list[str],
+        issues: list[JiraIssue],
+        missing_keys: list[str],
+    ) -> list[JiraIssue]:
+        """Add the issues a key search missed, read one by one.
+
+        Jira Cloud indexes new issues with a delay, so searching for issues
+        that were just created can miss some of them.
+
+        Args:
+            issue_keys: Keys of the created issues, in creation order
+            issues: The issues the search returned
+            missing_keys: Keys the search did not return
+
+        Returns:
+            The issues in creation order. Issues that cannot be read are
+            logged and left out.
+        """
+        if not missing_keys:
+            return issues
+        issues_by_key = {issue.key.upper(): issue for issue in issues if issue.key}
+        for issue_key in missing_keys:
+            try:
+                issue_data = self.jira.get_issue(issue_key)
+                if not isinstance(issue_data, dict):
+                    msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
+                    logger.error(msg)
+                    raise TypeError(msg)
+                issues_by_key[issue_key.upper()] = JiraIssue.from_api_response(
+                    issue_data, base_url=self.config.url
+                )
+            except Exception as e:
+                logger.error(f"Error fetching created issue {issue_key}: {str(e)}")
+        return [
+            issues_by_key[key.upper()]
+            for key in dict.fromkeys(issue_keys)
+            if key.upper() in issues_by_key
+        ]
+
+    def _resolve_batch_assignees(
+        self, issues: list[dict[str, Any]]
+    ) -> dict[str, str | None]:
+        """Resolve each distinct assignee of a batch once.
+
+        Args:
+            issues: The issue dictionaries passed to batch_create_issues
+
+        Returns:
+            Mapping of assignee as given to its identifier (accountId on Cloud,
+            name on Server/DC), or None if it could not be resolved
+        """
+        return self.resolve_accounts(
+            issue_data["assignee"]
+            for issue_data in issues
+            if isinstance(issue_data.get("assignee"), str)
+        )
+
+    def get_issues(
+        self,
+        issue_keys: list[str],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        expand: str | None = None,
+    ) -> tuple[list[JiraIssue], list[str]]:
+        """
+        Get multiple Jira issues by key.
+
+        Keys are fetched with `key in (...)` searches of up to
+        ISSUE_KEY_SEARCH_CHUNK_SIZE keys, run concurrently. Unlike get_issue,
+        comments and epic details are taken from the search response as-is
+        rather than looked up per issue.
+
+        Args:
+            issue_keys: The issue keys (e.g., ["PROJECT-1", "PROJECT-2"])
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            expand: Fields to expand in the response
+
+        Returns:
+            Tuple of the JiraIssue models in input order (duplicates removed)
+            and the keys that were not found or could not be read
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+        """
+        unique_keys = list(dict.fromkeys(key.strip() for key in issue_keys if key))
+        unique_keys = [key for key in unique_keys if key]
+        if not unique_keys:
+            return [], []
+
+        fields_param = self._build_fields_param(fields, expand)
+        chunks = [
+            unique_keys[i : i + ISSUE_KEY_SEARCH_CHUNK_SIZE]
+            for i in range(0, len(unique_keys), ISSUE_KEY_SEARCH_CHUNK_SIZE)
+        ]
+
+        def fetch_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+            return self._search_issues_by_keys(chunk, fields_param, expand)
+
+        if len(chunks) == 1:
+            results = [fetch_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(chunks), MAX_CONCURRENT_KEY_SEARCHES),
+                thread_name_prefix="jira-key-search",
+            ) as executor:
+                results = list(executor.map(fetch_chunk, chunks))
+
+        issues_by_key: dict[str, dict[str, Any]] = {}
+        for chunk_result in results:
+            for issue_data in chunk_result:
+                if isinstance(issue_data, dict) and issue_data.get("key"):
+                    issues_by_key[issue_data["key"].upper()] = issue_data
+
+        issues = []
+        missing_keys = []
+        for issue_key in unique_keys:
+            issue_data = issues_by_key.get(issue_key.upper())
+            if issue_data is None:
+                missing_keys.append(issue_key)
+                continue
+            issues.append(
+                JiraIssue.from_api_response(
+                    issue_data, base_url=self.config.url, requested_fields=fields
+                )
+            )
+        if missing_keys:
+            logger.warning(f"Issues not found or not readable: {missing_keys}")
+        return issues, missing_keys
+
+    def _search_issues_by_keys(
+        self, issue_keys: list[str], fields: str, expand: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch raw issue data for one chunk of keys.
+
+        JQL rejects the whole query with a 400 when one key names a project
+        that does not exist or is not visible, so a rejected chunk is split in
+        halves and retried until the offending keys are isolated. Other errors
+        (besides authentication failures) are logged and the chunk's keys are
+        treated as not found.
+        """
+        quoted_keys = ", ".join(f'"{key}"' for key in issue_keys)
+        jql = f"key in ({quoted_keys})"
+        try:
+            if self.config.is_cloud:
+                response = self.jira.enhanced_jql_get_list_of_tickets(
+                    jql, fields=fields, limit=len(issue_keys), expand=expand
+                )
+                if isinstance(response, list):
+                    return response
+            else:
+                response = self.jira.jql(
+                    jql, fields=fields, limit=len(issue_keys), expand=expand
+                )
+                if isinstance(response, dict):
+                    return response.get("issues", [])
+            logger.error(
+                f"Unexpected return value type when fetching issues by key: {type(response)}"
+            )
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            if http_err.response is not None and http_err.response.status_code == 400:
+                if len(issue_keys) > 1:
+                    middle = len(issue_keys) // 2
+                    return self._search_issues_by_keys(
+                        issue_keys[:middle], fields, expand
+                    ) + self._search_issues_by_keys(issue_keys[middle:], fields, expand)
+                logger.debug(f"Issue key rejected by JQL: {issue_keys[0]}")
+                return []
+            logger.error(f"Error fetching issues {issue_keys}: {http_err}")
+        except Exception as e:
+            logger.error(f"Error fetching issues {issue_keys}: {str(e)}")
+        return []
+
     def batch_get_changelogs(
         self, issue_ids_or_keys: list[str], fields: list[str] | None = None
     ) -> list[JiraIssue]:
         """
         Get changelogs for multiple issues in a batch. Repeatly fetch data if necessary.
 
-        Warning:
-            This function is only avaiable on Jira Cloud.
-
         Args:
             issue_ids_or_keys: List of issue IDs or keys
             fields: Filter the changelogs by fields, e.g. ['status', 'assignee']. Default to None for all fields.
@@ -1370,13 +1598,61 @@ class IssuesMixin(
         Returns:
             List of JiraIssue objects that only contain changelogs and id
         """
+        return list(self.iter_changelogs(issue_ids_or_keys, fields=fields))
 
-        if not self.config.is_cloud:
-            error_msg = "Batch get issue changelogs is only available on Jira Cloud."
-            logger.error(error_msg)
-            raise NotImplementedError(error_msg)
+    def iter_changelogs(
+        self, issue_ids_or_keys: list[str], fields: list[str] | None = None
+    ) -> Iterator[JiraIssue]:
+        """
+        Yield the changelogs of many issues as soon as they are fetched.
+
+        On Jira Cloud the issues are split into chunks of
+        CHANGELOG_BULKFETCH_CHUNK_SIZE fetched from ``changelog/bulkfetch``;
+        on Server/DC each issue is read with ``expand=changelog``. At most
+        MAX_CONCURRENT_CHANGELOG_FETCHES requests run at once. Chunks are
+        yielded in input order, each as soon as it and all earlier chunks
+        are fetched.
+
+        Args:
+            issue_ids_or_keys: List of issue IDs or keys
+            fields: Filter the changelogs by fields, e.g. ['status', 'assignee']. Default to None for all fields.
+
+        Yields:
+            JiraIssue objects that only contain changelogs and id
+        """
+        chunk_size = CHANGELOG_BULKFETCH_CHUNK_SIZE if self.config.is_cloud else 1
+        chunks = [
+            issue_ids_or_keys[i : i + chunk_size]
+            for i in range(0, len(issue_ids_or_keys), chunk_size)
+        ]
+        if not chunks:
+            return
+
+        def fetch_chunk(chunk: list[str]) -> list[JiraIssue]:
+            if self.config.is_cloud:
+                return self._fetch_bulk_changelogs(chunk, fields)
+            return self._fetch_issue_changelogs(chunk[0], fields)
 
-        # Get paged api results
+        if len(chunks) == 1:
+            yield from fetch_chunk(chunks[0])
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(chunks), MAX_CONCURRENT_CHANGELOG_FETCHES),
+            thread_name_prefix="jira-changelog",
+        )
+        try:
+            futures = [executor.submit(fetch_chunk, chunk) for chunk in chunks]
+            for future in futures:
+                yield from future.result()
+        finally:
+            # Stop pending chunks if the caller stops iterating early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_bulk_changelogs(
+        self, issue_ids_or_keys: list[str], fields: list[str] | None
+    ) -> list[JiraIssue]:
+        """Fetch the changelogs of one chunk of issues from the Cloud bulk API."""
         paged_api_results = self.get_paged(
             method="post",
             url=self.jira.resource_url("changelog/bulkfetch"),
@@ -1385,7 +1661,135 @@ class IssuesMixin(
                 "issueIdsOrKeys": issue_ids_or_keys,
             },
         )
+        return self._parse_bulk_changelogs(paged_api_results)
+
+    def _fetch_issue_changelogs(
+        self, issue_id_or_key: str, fields: list[str] | None
+    ) -> list[JiraIssue]:
+        """Fetch the changelog of one issue with ``expand=changelog`` (Server/DC).
 
+        Issues that cannot be read are logged and skipped.
+        """
+        try:
+            issue = self.jira.get_issue(
+                issue_id_or_key,
+                fields="summary",
+                expand="changelog",
+                update_history=False,
+            )
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            logger.error(f"Error fetching changelog of {issue_id_or_key}: {http_err}")
+            return []
+        except Exception as e:
+            logger.error(f"Error fetching changelog of {issue_id_or_key}: {str(e)}")
+            return []
+        return self._parse_issue_changelogs(issue, fields)
+
+    def _parse_issue_changelogs(
+        self, issue: Any, fields: list[str] | None
+    ) -> list[JiraIssue]:
+        """Build the changelog-only JiraIssue of an ``expand=changelog`` response."""
+        if not isinstance(issue, dict):
+            return []
+
+        histories = (issue.get("changelog") or {}).get("histories", [])
+        changelogs = []
+        for history in histories:
+            if fields:
+                items = [
+                    item
+                    for item in history.get("items", [])
+                    if item.get("fieldId", item.get("field")) in fields
+                    or item.get("field") in fields
+                ]
+                if not items:
+                    continue
+                history = {**history, "items": items}
+            changelogs.append(JiraChangelog.from_api_response(history))
+        return [JiraIssue(id=str(issue.get("id", "")), changelogs=changelogs)]
+
+    async def batch_get_changelogs_async(
+        self, issue_ids_or_keys: list[str], fields: list[str] | None = None
+    ) -> list[JiraIssue]:
+        """
+        Awaitable counterpart of `batch_get_changelogs` using the async transport.
+
+        The chunks (Cloud) or issues (Server/DC) are requested concurrently on
+        the async client instead of worker threads, at most
+        MAX_CONCURRENT_CHANGELOG_FETCHES at once, and returned in input order.
+
+        Args:
+            issue_ids_or_keys: List of issue IDs or keys
+            fields: Filter the changelogs by fields, e.g. ['status', 'assignee']. Default to None for all fields.
+
+        Returns:
+            List of JiraIssue objects that only contain changelogs and id
+        """
+        chunk_size = CHANGELOG_BULKFETCH_CHUNK_SIZE if self.config.is_cloud else 1
+        chunks = [
+            issue_ids_or_keys[i : i + chunk_size]
+            for i in range(0, len(issue_ids_or_keys), chunk_size)
+        ]
+        results: list[list[JiraIssue]] = [[] for _ in chunks]
+        errors: list[Exception] = []
+        semaphore = anyio.Semaphore(MAX_CONCURRENT_CHANGELOG_FETCHES)
+
+        async def fetch_chunk(index: int, chunk: list[str]) -> None:
+            async with semaphore:
+                try:
+                    if self.config.is_cloud:
+                        paged_api_results = await self.get_paged_async(
+                            method="post",
+                            url=self.jira.resource_url("changelog/bulkfetch"),
+                            params_or_json={
+                                "fieldIds": fields,
+                                "issueIdsOrKeys": chunk,
+                            },
+                        )
+                        results[index] = self._parse_bulk_changelogs(paged_api_results)
+                    else:
+                        results[index] = await self._fetch_issue_changelogs_async(
+                            chunk[0], fields
+                        )
+                except Exception as e:
+                    errors.append(e)
+
+        async with anyio.create_task_group() as task_group:
+            for index, chunk in enumerate(chunks):
+                task_group.start_soon(fetch_chunk, index, chunk)
+        if errors:
+            raise errors[0]
+        return [issue for chunk_issues in results for issue in chunk_issues]
+
+    async def _fetch_issue_changelogs_async(
+        self, issue_id_or_key: str, fields: list[str] | None
+    ) -> list[JiraIssue]:
+        """Async counterpart of `_fetch_issue_changelogs` (Server/DC)."""
+        try:
+            issue = await self.request_async(
+                "GET",
+                f"{self.jira.resource_url('issue')}/{issue_id_or_key}",
+                params={"fields": "summary", "expand": "changelog"},
+            )
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Error fetching changelog of {issue_id_or_key}: {e}")
+            return []
+        return self._parse_issue_changelogs(issue, fields)
+
+    def _parse_bulk_changelogs(
+        self, paged_api_results: list[dict[str, Any]]
+    ) -> list[JiraIssue]:
+        """Group bulk-fetched changelog pages into per-issue JiraIssue objects."""
         # Save (issue_id, changelogs)
         issue_changelog_results: defaultdict[str, list[JiraChangelog]] = defaultdict(
             list
@@ -7,6 +7,7 @@ from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.jira import JiraIssueLinkType
+from ..utils.response_cache import invalidates_response_cache
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
@@ -65,6 +66,7 @@ class LinksMixin(JiraClient):
             logger.error(f"Error getting issue link types: {error_msg}", exc_info=True)
             raise Exception(f"Error getting issue link types: {error_msg}") from e
 
+    @invalidates_response_cache("jira-issue", also=("jira-search",))
     def create_issue_link(self, data: dict[str, Any]) -> dict[str, Any]:
         """
         Create a link between two issues.
@@ -135,6 +137,7 @@ class LinksMixin(JiraClient):
             logger.error(f"Error creating issue link: {error_msg}", exc_info=True)
             raise Exception(f"Error creating issue link: {error_msg}") from e
 
+    @invalidates_response_cache("jira-issue", also=("jira-search",))
     def remove_issue_link(self, link_id: str) -> dict[str, Any]:
         """
         Remove a link between two issues.
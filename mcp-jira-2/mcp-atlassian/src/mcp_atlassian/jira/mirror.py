@@ -0,0 +1,965 @@
+"""Opt-in local mirror of Jira issues in SQLite.
+
+With JIRA_MIRROR_PATH set, the issues of the projects listed in
+JIRA_MIRROR_PROJECTS are pulled into a SQLite database: a full load first,
+then incremental syncs fetching only ``updated >= <watermark>`` every
+JIRA_MIRROR_SYNC_INTERVAL seconds. Each issue is stored as the raw JSON the
+API returned plus normalized columns (project, status, type, assignee, dates,
+...) to query on.
+
+Reads asking for ``source="mirror"`` are answered from the database when the
+projects involved were synced less than JIRA_MIRROR_MAX_AGE seconds ago and
+the JQL only uses what the mirror can evaluate (see translate_jql); anything
+else goes to Jira as usual. The mirror only serves fetchers of the user it
+was synced as, on the same site; a refreshed or rotated token keeps it.
+Incremental syncs do not notice issues that were deleted or moved to another
+project, so every JIRA_MIRROR_FULL_SYNC_INTERVAL seconds the background sync
+reloads the projects fully, which removes them.
+
+Summaries, descriptions and comments are also kept in an FTS5 index queried
+by IssueMirror.search_text (the jira_local_search tool), which answers from
+whatever was last synced.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, tzinfo
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from ..models.jira import JiraIssue, JiraSearchResult
+from ..utils.sqlite_mirror import (
+    SNIPPET_MARKERS,
+    SNIPPET_TOKENS,
+    UNKNOWN_TIMEZONE_MARGIN,
+    MirrorRead,
+    SQLiteMirror,
+    fts_match_expression,
+)
+from .constants import DEFAULT_READ_JIRA_FIELDS
+
+logger = logging.getLogger("mcp-jira.mirror")
+
+# Issues requested per page while syncing
+SYNC_PAGE_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    id TEXT,
+    project TEXT NOT NULL,
+    key_num INTEGER,
+    summary TEXT,
+    status TEXT,
+    status_category TEXT,
+    issue_type TEXT,
+    priority TEXT,
+    resolution TEXT,
+    assignee TEXT,
+    assignee_id TEXT,
+    assignee_email TEXT,
+    reporter TEXT,
+    reporter_id TEXT,
+    reporter_email TEXT,
+    labels TEXT NOT NULL DEFAULT '[]',
+    created TEXT,
+    created_epoch REAL,
+    updated TEXT,
+    updated_epoch REAL,
+    raw TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project_updated
+    ON issues (project, updated_epoch);
+"""
+
+# Full-text entries share the rowid of their row in issues
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5(
+    summary, description, comments, tokenize = 'porter unicode61'
+);
+"""
+
+_COLUMNS = (
+    "key",
+    "id",
+    "project",
+    "key_num",
+    "summary",
+    "status",
+    "status_category",
+    "issue_type",
+    "priority",
+    "resolution",
+    "assignee",
+    "assignee_id",
+    "assignee_email",
+    "reporter",
+    "reporter_id",
+    "reporter_email",
+    "labels",
+    "created",
+    "created_epoch",
+    "updated",
+    "updated_epoch",
+    "raw",
+    "synced_at",
+)
+
+_UPDATED_EPOCH = _COLUMNS.index("updated_epoch")
+
+# Only column names and placeholders are interpolated into SQL in this module
+_UPSERT = (
+    f"INSERT INTO issues ({', '.join(_COLUMNS)}) "  # noqa: S608
+    f"VALUES ({', '.join('?' for _ in _COLUMNS)}) "
+    "ON CONFLICT(key) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])
+)
+
+
+def _parse_jira_datetime(value: Any) -> float | None:
+    """Parse a Jira timestamp such as 2024-01-31T09:30:00.000+0000 to epoch."""
+    if not isinstance(value, str) or not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt).timestamp()  # noqa: DTZ007 - %z
+        except ValueError:
+            continue
+    return None
+
+
+def _user_columns(user: Any) -> tuple[str | None, str | None, str | None]:
+    if not isinstance(user, dict):
+        return None, None, None
+    return (
+        user.get("displayName"),
+        user.get("accountId") or user.get("name") or user.get("key"),
+        user.get("emailAddress"),
+    )
+
+
+def _named(value: Any, name: str = "name") -> str | None:
+    return value.get(name) if isinstance(value, dict) else None
+
+
+def _plain_text(value: Any) -> str:
+    """Text of a wiki markup string or of an Atlassian Document Format node."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        text = value.get("text")
+        return (text if isinstance(text, str) else "") + " ".join(
+            _plain_text(child) for child in value.get("content") or []
+        )
+    return ""
+
+
+def _issue_text(issue: dict[str, Any]) -> tuple[str, str, str]:
+    """Summary, description and comments of a raw issue for the full-text index."""
+    fields = issue.get("fields") or {}
+    comment = fields.get("comment")
+    comments = comment.get("comments") if isinstance(comment, dict) else None
+    return (
+        _plain_text(fields.get("summary")),
+        _plain_text(fields.get("description")),
+        "\n".join(
+            _plain_text(c.get("body")) for c in comments or [] if isinstance(c, dict)
+        ),
+    )
+
+
+def _issue_row(issue: dict[str, Any], synced_at: float) -> tuple[Any, ...]:
+    """Normalize a raw issue into a row of the issues table."""
+    fields = issue.get("fields") or {}
+    key = str(issue["key"]).upper()
+    project_key, _, number = key.rpartition("-")
+    status = fields.get("status")
+    labels = fields.get("labels")
+    return (
+        key,
+        str(issue.get("id", "")),
+        _named(fields.get("project"), "key") or project_key,
+        int(number) if number.isdigit() else None,
+        fields.get("summary"),
+        _named(status),
+        _named(status.get("statusCategory")) if isinstance(status, dict) else None,
+        _named(fields.get("issuetype")),
+        _named(fields.get("priority")),
+        _named(fields.get("resolution")),
+        *_user_columns(fields.get("assignee")),
+        *_user_columns(fields.get("reporter")),
+        json.dumps(labels if isinstance(labels, list) else []),
+        fields.get("created"),
+        _parse_jira_datetime(fields.get("created")),
+        fields.get("updated"),
+        _parse_jira_datetime(fields.get("updated")),
+        json.dumps(issue),
+        synced_at,
+    )
+
+
+class _UnsupportedJqlError(Exception):
+    """The JQL uses something the mirror cannot evaluate."""
+
+
+@dataclass
+class MirrorQuery:
+    """A JQL query translated to SQL over the issues table."""
+
+    where: list[str] = field(default_factory=list)
+    params: list[Any] = field(default_factory=list)
+    order_by: str = "created_epoch DESC, key_num DESC"
+    # Projects the query is restricted to, None when unrestricted
+    projects: set[str] | None = None
+
+    def restrict_to(self, projects: Iterable[str]) -> None:
+        """Narrow the projects the query can match."""
+        projects = {p.upper() for p in projects}
+        self.projects = projects if self.projects is None else self.projects & projects
+
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:"((?:[^"\\]|\\.)*)"|'((?:[^'\\]|\\.)*)'|(!=|>=|<=|!~|[=<>~(),])|([^\s()=!<>~,"']+))"""
+)
+_RELATIVE_DATE_RE = re.compile(r"^([-+]?)((?:\d+[wdhm])+)$", re.IGNORECASE)
+_RELATIVE_UNITS = {"w": 604800, "d": 86400, "h": 3600, "m": 60}
+_DATE_FORMATS = ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d")
+
+# JQL field -> column compared case-insensitively
+_TEXT_COLUMNS = {
+    "status": "status",
+    "statuscategory": "status_category",
+    "issuetype": "issue_type",
+    "type": "issue_type",
+    "priority": "priority",
+    "resolution": "resolution",
+}
+_USER_FIELDS = ("assignee", "reporter")
+_DATE_COLUMNS = {
+    "created": "created_epoch",
+    "createddate": "created_epoch",
+    "updated": "updated_epoch",
+    "updateddate": "updated_epoch",
+}
+_ORDER_COLUMNS = {
+    "key": ("project", "key_num"),
+    "issuekey": ("project", "key_num"),
+    "created": ("created_epoch",),
+    "updated": ("updated_epoch",),
+    "summary": ("summary",),
+}
+
+
+@dataclass
+class _Token:
+    kind: str  # "string", "op" or "word"
+    value: str
+
+    def is_word(self, *words: str) -> bool:
+        return self.kind == "word" and self.value.upper() in words
+
+
+def _tokenize(jql: str) -> list[_Token]:
+    tokens: list[_Token] = []
+    position = 0
+    jql = jql.rstrip()
+    while position < len(jql):
+        match = _TOKEN_RE.match(jql, position)
+        if not match or match.end() == position:
+            raise _UnsupportedJqlError(jql[position:])
+        position = match.end()
+        double_quoted, single_quoted, op, word = match.groups()
+        if op is not None:
+            tokens.append(_Token("op", op))
+        elif word is not None:
+            tokens.append(_Token("word", word))
+        else:
+            text = double_quoted if double_quoted is not None else single_quoted
+            tokens.append(_Token("string", re.sub(r"\\(.)", r"\1", text or "")))
+    return tokens
+
+
+class _JqlTranslator:
+    """Recursive-descent translation of an AND-only subset of JQL."""
+
+    def __init__(self, tokens: list[_Token], tz: tzinfo, now: float) -> None:
+        self.tokens = tokens
+        self.position = 0
+        self.tz = tz
+        self.now = now
+        self.query = MirrorQuery()
+
+    def peek(self) -> _Token | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self) -> _Token:
+        token = self.peek()
+        if token is None:
+            raise _UnsupportedJqlError("unexpected end of query")
+        self.position += 1
+        return token
+
+    def translate(self) -> MirrorQuery:
+        token = self.peek()
+        if token is not None and not token.is_word("ORDER"):
+            self.conjunction()
+        token = self.peek()
+        if token is not None:
+            if not token.is_word("ORDER"):
+                raise _UnsupportedJqlError(token.value)
+            self.take()
+            if not self.take().is_word("BY"):
+                raise _UnsupportedJqlError("ORDER")
+            self.order_by()
+        return self.query
+
+    def conjunction(self) -> None:
+        self.clause()
+        while (token := self.peek()) is not None and token.is_word("AND"):
+            self.take()
+            self.clause()
+        if token is not None and token.is_word("OR", "NOT"):
+            raise _UnsupportedJqlError(token.value)
+
+    def clause(self) -> None:
+        token = self.take()
+        if token.kind == "op" and token.value == "(":
+            self.conjunction()
+            closing = self.take()
+            if closing.value != ")":
+                raise _UnsupportedJqlError(closing.value)
+            return
+        if token.kind != "word":
+            raise _UnsupportedJqlError(token.value)
+        name = token.value.lower()
+        operator = self.operator()
+        if operator in ("IS", "IS NOT"):
+            empty = self.take()
+            if not empty.is_word("EMPTY", "NULL"):
+                raise _UnsupportedJqlError(empty.value)
+            self.empty_condition(name, negate=operator == "IS NOT")
+        elif operator in ("IN", "NOT IN"):
+            self.condition(name, operator, self.value_list())
+        else:
+            self.condition(name, operator, [self.value()])
+
+    def operator(self) -> str:
+        token = self.take()
+        if token.kind == "op" and token.value in ("=", "!=", ">", ">=", "<", "<="):
+            return token.value
+        if token.is_word("IN"):
+            return "IN"
+        if token.is_word("IS"):
+            if (next_token := self.peek()) is not None and next_token.is_word("NOT"):
+                self.take()
+                return "IS NOT"
+            return "IS"
+        if token.is_word("NOT") and self.take().is_word("IN"):
+            return "NOT IN"
+        raise _UnsupportedJqlError(token.value)
+
+    def value(self) -> str:
+        token = self.take()
+        if token.kind == "op" or (
+            token.kind == "word"
+            and (token.is_word("EMPTY", "NULL") or self._is_function(token))
+        ):
+            raise _UnsupportedJqlError(token.value)
+        return token.value
+
+    def _is_function(self, token: _Token) -> bool:
+        next_token = self.peek()
+        return (
+            token.kind == "word"
+            and next_token is not None
+            and next_token.kind == "op"
+            and next_token.value == "("
+        )
+
+    def value_list(self) -> list[str]:
+        if self.take().value != "(":
+            raise _UnsupportedJqlError("IN")
+        values = [self.value()]
+        while (token := self.take()).value == ",":
+            values.append(self.value())
+        if token.value != ")":
+            raise _UnsupportedJqlError(token.value)
+        return values
+
+    @staticmethod
+    def empty_sql(name: str) -> str:
+        if name == "labels":
+            return "labels = '[]'"
+        if name in _TEXT_COLUMNS:
+            return f"{_TEXT_COLUMNS[name]} IS NULL"
+        if name in _USER_FIELDS:
+            return f"{name}_id IS NULL"
+        if name in ("project", "key", "issuekey"):
+            return "0"
+        raise _UnsupportedJqlError(name)
+
+    def empty_condition(self, name: str, *, negate: bool) -> None:
+        sql = self.empty_sql(name)
+        self.query.where.append(f"NOT ({sql})" if negate else sql)
+
+    def condition(self, name: str, operator: str, values: list[str]) -> None:
+        query = self.query
+        if name in _DATE_COLUMNS:
+            if operator not in (">", ">=", "<", "<="):
+                raise _UnsupportedJqlError(operator)
+            query.where.append(f"{_DATE_COLUMNS[name]} {operator} ?")
+            query.params.append(self.date(values[0]))
+            return
+        if operator not in ("=", "!=", "IN", "NOT IN"):
+            raise _UnsupportedJqlError(operator)
+        negate = operator in ("!=", "NOT IN")
+
+        if name in ("project", "key", "issuekey"):
+            values = [value.upper() for value in values]
+            if name == "project":
+                column = "project"
+                projects = values
+            else:
+                column = "key"
+                projects = [value.rpartition("-")[0] for value in values]
+            if not negate:
+                query.restrict_to(projects)
+            sql = self._in(column, len(values))
+        elif name in _TEXT_COLUMNS:
+            sql = self._in(f"{_TEXT_COLUMNS[name]} COLLATE NOCASE", len(values))
+        elif name in _USER_FIELDS:
+            sql = " OR ".join(
+                self._in(f"{name}{suffix} COLLATE NOCASE", len(values))
+                for suffix in ("", "_id", "_email")
+            )
+            values = values * 3
+        elif name == "labels":
+            sql = (
+                "EXISTS (SELECT 1 FROM json_each(issues.labels) "  # noqa: S608
+                f"WHERE {self._in('json_each.value', len(values))})"
+            )
+        else:
+            raise _UnsupportedJqlError(name)
+
+        if negate:
+            # JQL's != and NOT IN never match issues where the field is empty
+            sql = f"NOT ({sql}) AND NOT ({self.empty_sql(name)})"
+        query.where.append(f"({sql})")
+        query.params.extend(values)
+
+    @staticmethod
+    def _in(column: str, count: int) -> str:
+        if count == 1:
+            return f"{column} = ?"
+        return f"{column} IN ({', '.join('?' for _ in range(count))})"
+
+    def date(self, value: str) -> float:
+        if match := _RELATIVE_DATE_RE.match(value.replace(" ", "")):
+            sign, spec = match.groups()
+            seconds = sum(
+                int(amount) * _RELATIVE_UNITS[unit.lower()]
+                for amount, unit in re.findall(r"(\d+)([wdhm])", spec, re.IGNORECASE)
+            )
+            return self.now - seconds if sign == "-" else self.now + seconds
+        for fmt in _DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt).replace(tzinfo=self.tz).timestamp()
+            except ValueError:
+                continue
+        raise _UnsupportedJqlError(value)
+
+    def order_by(self) -> None:
+        terms = []
+        while True:
+            token = self.take()
+            columns = _ORDER_COLUMNS.get(token.value.lower())
+            direction = self.take() if self.peek() is not None else None
+            # Jira's default direction differs per field, so require one
+            if (
+                columns is None
+                or direction is None
+                or not direction.is_word("ASC", "DESC")
+            ):
+                raise _UnsupportedJqlError(token.value)
+            terms += [f"{column} {direction.value.upper()}" for column in columns]
+            token = self.peek()
+            if token is None:
+                break
+            if self.take().value != ",":
+                raise _UnsupportedJqlError(token.value)
+        self.query.order_by = ", ".join(terms)
+
+
+def translate_jql(
+    jql: str, tz: tzinfo = timezone.utc, now: float | None = None
+) -> MirrorQuery | None:
+    """Translate JQL to a query over the mirror, if the mirror can answer it.
+
+    Supported are clauses joined by AND (optionally parenthesized) on project,
+    key, status, statusCategory, issuetype, priority, resolution, assignee,
+    reporter and labels with =, !=, IN, NOT IN, IS [NOT] EMPTY; created and
+    updated compared with absolute or relative (-7d) dates; and ORDER BY key,
+    created, updated or summary with an explicit direction.
+
+    Args:
+        jql: JQL query string
+        tz: Time zone absolute JQL dates are read in
+        now: Reference time for relative dates, defaults to the current time
+
+    Returns:
+        MirrorQuery, or None if the query uses anything else
+    """
+    try:
+        return _JqlTranslator(
+            _tokenize(jql), tz, time.time() if now is None else now
+        ).translate()
+    except _UnsupportedJqlError as e:
+        logger.debug(f"JQL not answerable from the mirror ({e}): {jql}")
+        return None
+
+
+class IssueMirror(SQLiteMirror):
+    """SQLite mirror of the issues of selected Jira projects."""
+
+    schema = _SCHEMA
+    fts_schema = _FTS_SCHEMA
+    data_tables = ("issues", "issues_fts")
+    label = "Jira mirror"
+
+    def __init__(
+        self,
+        path: str | None,
+        projects: list[str],
+        max_age: float,
+        sync_interval: float,
+        full_sync_interval: float = 0,
+    ) -> None:
+        """Initialize the mirror; the database is opened on first use.
+
+        Args:
+            path: SQLite database file. None disables the mirror.
+            projects: Keys of the projects to mirror.
+            max_age: Seconds after a sync during which reads may be answered.
+            sync_interval: Seconds between background syncs. 0 disables them.
+            full_sync_interval: Seconds between full background syncs, which
+                drop deleted and moved issues. 0 disables them.
+        """
+        super().__init__(
+            path,
+            [p.strip().upper() for p in projects],
+            max_age,
+            sync_interval,
+            full_sync_interval,
+        )
+        self._timezones: dict[str, tzinfo | None] = {}
+
+    @classmethod
+    def from_env(cls) -> "IssueMirror":
+        """Create a mirror configured from environment variables.
+
+        Returns:
+            IssueMirror stored at JIRA_MIRROR_PATH (unset disables it) for the
+            comma-separated JIRA_MIRROR_PROJECTS, answering reads up to
+            JIRA_MIRROR_MAX_AGE seconds (default 300) after a sync, syncing
+            every JIRA_MIRROR_SYNC_INTERVAL seconds (default 120) and fully
+            every JIRA_MIRROR_FULL_SYNC_INTERVAL seconds (default 86400).
+        """
+        return cls(
+            path=os.getenv("JIRA_MIRROR_PATH") or None,
+            projects=os.getenv("JIRA_MIRROR_PROJECTS", "").split(","),
+            max_age=float(os.getenv("JIRA_MIRROR_MAX_AGE", "300")),
+            sync_interval=float(os.getenv("JIRA_MIRROR_SYNC_INTERVAL", "120")),
+            full_sync_interval=float(
+                os.getenv("JIRA_MIRROR_FULL_SYNC_INTERVAL", "86400")
+            ),
+        )
+
+    @property
+    def projects(self) -> list[str]:
+        """Keys of the mirrored projects."""
+        return self.scopes
+
+    # Sync
+
+    def _account_id(self, fetcher: Any) -> str:
+        return fetcher.get_current_user_account_id()
+
+    def _timezone(self, fetcher: Any) -> tzinfo | None:
+        """The time zone Jira reads JQL dates in for the fetcher's user."""
+        url = str(fetcher.config.url)
+        if url not in self._timezones:
+            try:
+                self._timezones[url] = ZoneInfo(fetcher.jira.myself()["timeZone"])
+            except (KeyError, TypeError, ValueError, ZoneInfoNotFoundError) as e:
+                logger.warning(f"Unknown Jira user time zone, syncing with margin: {e}")
+                self._timezones[url] = None
+            except Exception as e:  # noqa: BLE001 - fall back to the safe margin
+                logger.warning(f"Could not read Jira user time zone: {e}")
+                return None
+        return self._timezones[url]
+
+    def _watermark_jql(
+        self, project: str, watermark: float | None, tz: tzinfo | None
+    ) -> str:
+        jql = f'project = "{project}"'
+        if watermark is not None:
+            since = datetime.fromtimestamp(watermark, tz or timezone.utc)
+            if tz is None:
+                since -= UNKNOWN_TIMEZONE_MARGIN
+            # JQL dates have minute precision; re-fetched issues are upserted
+            jql += f' AND updated >= "{since:%Y-%m-%d %H:%M}"'
+        return jql + " ORDER BY updated ASC"
+
+    def sync(
+        self,
+        fetcher: Any,
+        projects: Iterable[str] | None = None,
+        *,
+        full: bool = False,
+    ) -> dict[str, int]:
+        """Pull new and updated issues of the mirrored projects.
+
+        Args:
+            fetcher: JiraFetcher to read issues with; its user owns the
+                mirror from now on
+            projects: Projects to sync, defaults to all mirrored projects
+            full: Reload everything and drop issues no longer in the project
+
+        Returns:
+            Number of issues stored per project
+        """
+        with self._lock:
+            self._claim(self._owner_identity(fetcher))
+            tz = self._timezone(fetcher)
+        counts = {}
+        try:
+            for project in projects or self.projects:
+                counts[project] = self._sync_project(
+                    fetcher, project.upper(), tz, full=full
+                )
+        except Exception:
+            self._count(sync_errors=1)
+            raise
+        self._count(syncs=1)
+        return counts
+
+    def _sync_project(
+        self, fetcher: Any, project: str, tz: tzinfo | None, *, full: bool
+    ) -> int:
+        started = time.time()
+        synced_before, watermark = self._watermark(project)
+        if full:
+            watermark = None
+        seen: set[str] = set()
+        stored = 0
+        for issues in fetcher.iter_search_raw(
+            self._watermark_jql(project, watermark, tz), page_size=SYNC_PAGE_SIZE
+        ):
+            issues = [issue for issue in issues if issue.get("key")]
+            rows = [_issue_row(issue, started) for issue in issues]
+            with self._lock, self._db() as db:
+                db.executemany(_UPSERT, rows)
+                if self._fts:
+                    self._index(db, rows, issues)
+            seen.update(r[0] for r in rows)
+            stored += len(rows)
+            updated = [r[_UPDATED_EPOCH] for r in rows if r[_UPDATED_EPOCH] is not None]
+            if updated:
+                watermark = max(watermark or 0.0, *updated)
+
+        with self._lock, self._db() as db:
+            if full or not synced_before:
+                # A full load saw every issue in the project; drop the others
+                known = {
+                    key
+                    for (key,) in db.execute(
+                        "SELECT key FROM issues WHERE project = ?", (project,)
+                    )
+                }
+                gone = [(key,) for key in known - seen]
+                if self._fts:
+                    db.executemany(
+                        "DELETE FROM issues_fts WHERE rowid = "
+                        "(SELECT rowid FROM issues WHERE key = ?)",
+                        gone,
+                    )
+                db.executemany("DELETE FROM issues WHERE key = ?", gone)
+            self._record_sync(db, project, watermark, started)
+        logger.info(f"Jira mirror synced {stored} issues of {project}")
+        return stored
+
+    @staticmethod
+    def _index(
+        db: sqlite3.Connection, rows: list[tuple[Any, ...]], issues: list[dict]
+    ) -> None:
+        """Replace the full-text entries of upserted issues, keyed by rowid."""
+        rowids = dict(
+            db.execute(
+                f"SELECT key, rowid FROM issues WHERE key IN "  # noqa: S608
+                f"({', '.join('?' for _ in rows)})",
+                [row[0] for row in rows],
+            ).fetchall()
+        )
+        entries = [
+            (rowids[row[0]], *_issue_text(issue))
+            for row, issue in zip(rows, issues, strict=True)
+        ]
+        db.executemany(
+            "DELETE FROM issues_fts WHERE rowid = ?", [(e[0],) for e in entries]
+        )
+        db.executemany(
+            "INSERT INTO issues_fts (rowid, summary, description, comments) "
+            "VALUES (?, ?, ?, ?)",
+            entries,
+        )
+
+    # Reads
+
+    def search_issues(
+        self,
+        fetcher: Any,
+        jql: str,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        start: int = 0,
+        limit: int = 50,
+        projects_filter: str | None = None,
+    ) -> MirrorRead | None:
+        """Answer a JQL search from the mirror, like JiraFetcher.search_issues.
+
+        Returns:
+            MirrorRead with a JiraSearchResult, or None if the search has to go
+            to Jira (query not supported, projects not mirrored or stale).
+        """
+        with self._lock:
+            result = self._search_issues(
+                fetcher, jql, fields, start, limit, projects_filter
+            )
+        self._count(**{"mirror_reads" if result else "live_reads": 1})
+        return result
+
+    def _search_issues(
+        self,
+        fetcher: Any,
+        jql: str,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None,
+        start: int,
+        limit: int,
+        projects_filter: str | None,
+    ) -> MirrorRead | None:
+        if not self._usable_by(fetcher):
+            return None
+        tz = self._timezones.get(str(fetcher.config.url)) or timezone.utc
+        query = translate_jql(jql, tz)
+        if query is None:
+            return None
+        filter_to_use = projects_filter or fetcher.config.projects_filter
+        if filter_to_use and "project = " not in jql and "project IN" not in jql:
+            # Same rule as the live search
+            projects = [p.strip().upper() for p in filter_to_use.split(",")]
+            query.restrict_to(projects)
+            query.where.append(f"project IN ({', '.join('?' for _ in projects)})")
+            query.params.extend(projects)
+        staleness = self._freshness(query.projects or set())
+        if staleness is None:
+            return None
+
+        where = " AND ".join(query.where) or "1"
+        db = self._db()
+        (total,) = db.execute(
+            f"SELECT COUNT(*) FROM issues WHERE {where}",  # noqa: S608
+            query.params,
+        ).fetchone()
+        rows = db.execute(
+            f"SELECT raw FROM issues WHERE {where} ORDER BY {query.order_by} "  # noqa: S608
+            "LIMIT ? OFFSET ?",
+            [*query.params, limit, start],
+        ).fetchall()
+        search_result = JiraSearchResult.from_api_response(
+            {
+                "issues": [json.loads(raw) for (raw,) in rows],
+                "total": total,
+                "startAt": start,
+                "maxResults": limit,
+            },
+            requested_fields=_format_fields(fields),
+        )
+        return MirrorRead(search_result, staleness)
+
+    def get_issue(
+        self,
+        fetcher: Any,
+        issue_key: str,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        comment_limit: int = 10,
+    ) -> MirrorRead | None:
+        """Answer an issue lookup from the mirror, like JiraFetcher.get_issue.
+
+        Epic names are not resolved and comments are those the search API
+        returned with the issue.
+
+        Returns:
+            MirrorRead with a JiraIssue, or None if the issue has to be read
+            from Jira.
+        """
+        with self._lock:
+            result = self._get_issue(fetcher, issue_key, fields, comment_limit)
+        self._count(**{"mirror_reads" if result else "live_reads": 1})
+        return result
+
+    def _get_issue(
+        self,
+        fetcher: Any,
+        issue_key: str,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None,
+        comment_limit: int,
+    ) -> MirrorRead | None:
+        issue_key = issue_key.strip().upper()
+        if not self._usable_by(fetcher):
+            return None
+        staleness = self._freshness({issue_key.rpartition("-")[0]})
+        if staleness is None:
+            return None
+        row = (
+            self._db()
+            .execute("SELECT raw FROM issues WHERE key = ?", (issue_key,))
+            .fetchone()
+        )
+        if row is None:
+            return None
+        issue = json.loads(row[0])
+        comment = (issue.get("fields") or {}).get("comment")
+        if isinstance(comment, dict) and isinstance(comment.get("comments"), list):
+            comment["comments"] = comment["comments"][:comment_limit]
+        return MirrorRead(
+            JiraIssue.from_api_response(
+                issue,
+                base_url=fetcher.config.url,
+                requested_fields=fields,
+            ),
+            staleness,
+        )
+
+    def search_text(
+        self,
+        fetcher: Any,
+        query: str,
+        projects: Iterable[str] | None = None,
+        limit: int = 10,
+    ) -> MirrorRead:
+        """Full-text search of summaries, descriptions and comments.
+
+        Matches are ranked by BM25, weighting summaries over descriptions over
+        comments, whatever the age of the last sync.
+
+        Args:
+            fetcher: JiraFetcher whose credentials must own the mirror
+            query: Words to search for, see fts_match_expression
+            projects: Projects to search, defaults to all mirrored projects
+            limit: Maximum number of results
+
+        Returns:
+            MirrorRead with a list of result dicts (key, summary, status, ...,
+            score and snippet)
+
+        Raises:
+            ValueError: If the search cannot be answered locally
+        """
+        match = fts_match_expression(query)
+        with self._lock:
+            selected = self._searchable(
+                fetcher, [p.strip().upper() for p in projects or [] if p.strip()]
+            )
+            staleness = self._staleness(selected)
+            if staleness is None:
+                msg = "The Jira mirror has not finished its first sync yet"
+                raise ValueError(msg)
+            open_mark, close_mark = SNIPPET_MARKERS
+            rows = (
+                self._db()
+                .execute(
+                    "SELECT i.key, i.summary, i.project, i.status, i.issue_type, "  # noqa: S608
+                    "i.assignee, i.updated, bm25(issues_fts, 10.0, 2.0, 1.0) AS rank, "
+                    f"snippet(issues_fts, -1, ?, ?, '…', {SNIPPET_TOKENS}) "
+                    "FROM issues_fts JOIN issues i ON i.rowid = issues_fts.rowid "
+                    "WHERE issues_fts MATCH ? AND i.project IN "
+                    f"({', '.join('?' for _ in selected)}) "
+                    "ORDER BY rank LIMIT ?",
+                    [open_mark, close_mark, match, *sorted(selected), limit],
+                )
+                .fetchall()
+            )
+        self._count(local_searches=1)
+        return MirrorRead(
+            [
+                {
+                    "key": key,
+                    "summary": summary,
+                    "project": project,
+                    "status": status,
+                    "issue_type": issue_type,
+                    "assignee": assignee,
+                    "updated": updated,
+                    "score": round(-rank, 3),
+                    "snippet": snippet,
+                }
+                for (
+                    key,
+                    summary,
+                    project,
+                    status,
+                    issue_type,
+                    assignee,
+                    updated,
+                    rank,
+                    snippet,
+                ) in rows
+            ],
+            staleness,
+        )
+
+    # Metrics
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of mirror metrics.
+
+        Returns:
+            Dictionary with configuration, issues and sync age per project and
+            read/sync counters.
+        """
+        return self._stats(
+            "SELECT s.scope, COUNT(i.key), s.synced_at FROM sync_state s "
+            "LEFT JOIN issues i ON i.project = s.scope GROUP BY s.scope",
+            "projects",
+            "issues",
+        )
+
+
+def _format_fields(
+    fields: str | list[str] | tuple[str, ...] | set[str] | None,
+) -> str:
+    if fields is None:
+        return ",".join(DEFAULT_READ_JIRA_FIELDS)
+    if isinstance(fields, list | tuple | set):
+        return ",".join(fields)
+    return fields
+
+
+_issue_mirror: IssueMirror | None = None
+_issue_mirror_lock = threading.Lock()
+
+
+def get_issue_mirror() -> IssueMirror:
+    """Return the process-wide issue mirror, creating it on first use."""
+    global _issue_mirror
+    with _issue_mirror_lock:
+        if _issue_mirror is None:
+            _issue_mirror = IssueMirror.from_env()
+        return _issue_mirror
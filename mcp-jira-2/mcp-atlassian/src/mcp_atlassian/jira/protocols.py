@@ -1,6 +1,7 @@
 """Module for Jira protocol definitions."""
 
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Any, Protocol, runtime_checkable
 
 from ..models.jira import JiraIssue
@@ -12,7 +13,7 @@ class AttachmentsOperationsProto(Protocol):
 
     @abstractmethod
     def upload_attachments(
-        self, issue_key: str, file_paths: list[str]
+        self, issue_key: str, file_paths: list[str], max_concurrent: int = 4
     ) -> dict[str, Any]:
         """
         Upload multiple attachments to a Jira issue.
@@ -20,6 +21,7 @@ class AttachmentsOperationsProto(Protocol):
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             file_paths: List of paths to files to upload
+            max_concurrent: Maximum number of uploads in flight
 
         Returns:
             A dictionary with upload results
@@ -62,9 +64,17 @@ class SearchOperationsProto(Protocol):
         limit: int = 50,
         expand: str | None = None,
         projects_filter: str | None = None,
+        *,
+        include_total: bool = True,
     ) -> JiraSearchResult:
         """Search for issues using JQL."""
 
+    @abstractmethod
+    def iter_search_raw(
+        self, jql: str, fields: str = "*all", page_size: int = 100
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Lazily iterate over the raw issue JSON matching a JQL query."""
+
 
 class EpicOperationsProto(Protocol):
     """Protocol defining epic operations interface."""
@@ -171,3 +181,14 @@ class UsersOperationsProto(Protocol):
         Raises:
             ValueError: If the account ID could not be found
         """
+
+    @abstractmethod
+    def resolve_accounts(self, identifiers: Iterable[str]) -> dict[str, str | None]:
+        """Resolve many usernames to account IDs, one lookup per distinct user.
+
+        Args:
+            identifiers: Usernames, emails, display names or account IDs
+
+        Returns:
+            Account ID per distinct identifier, or None if it could not be found
+        """
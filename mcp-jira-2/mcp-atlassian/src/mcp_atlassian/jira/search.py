@@ -1,12 +1,24 @@
 """Module for Jira search operations."""
 
 import logging
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
 
 import requests
+from cachetools import TTLCache
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
-from ..models.jira import JiraSearchResult
+from ..models.jira import (
+    JiraIssue,
+    JiraIssueProjection,
+    JiraSearchProjection,
+    JiraSearchResult,
+)
+from ..utils.response_cache import cached_response
 from .client import JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
 from .protocols import IssueOperationsProto
@@ -14,9 +26,31 @@ from .protocols import IssueOperationsProto
 logger = logging.getLogger("mcp-jira")
 
 
+SEARCH_TOTAL_CACHE_TTL = int(os.getenv("JIRA_SEARCH_COUNT_CACHE_TTL", "30"))
+SEARCH_TOTAL_CACHE_MAXSIZE = 256
+
+_search_total_executor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="jira-search-total"
+)
+_search_total_cache_lock = threading.Lock()
+
+# Search results as full models or as lightweight projections
+SearchResultT = TypeVar("SearchResultT", JiraSearchResult, JiraSearchProjection)
+
+
+def _normalize_jql(jql: str) -> str:
+    """Normalize insignificant whitespace so equivalent queries share a cache key."""
+    return " ".join(jql.split())
+
+
 class SearchMixin(JiraClient, IssueOperationsProto):
     """Mixin for Jira search operations."""
 
+    # Short-lived cache of search inputs -> total, per fetcher (and thus per
+    # credential set)
+    _search_total_cache: TTLCache | None = None
+
+    @cached_response("jira-search")
     def search_issues(
         self,
         jql: str,
@@ -25,6 +59,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         limit: int = 50,
         expand: str | None = None,
         projects_filter: str | None = None,
+        *,
+        include_total: bool = True,
     ) -> JiraSearchResult:
         """
         Search for issues using JQL (Jira Query Language).
@@ -38,6 +74,9 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             limit: Maximum issues to return
             expand: Optional items to expand (comma-separated)
             projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+            include_total: Whether to determine the total number of matches. On Cloud
+                this costs an extra (concurrent, briefly cached) request; when False
+                the total is reported as -1.
 
         Returns:
             JiraSearchResult object containing issues and metadata (total, start_at, max_results)
@@ -46,71 +85,87 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
             Exception: If there is an error searching for issues
         """
+        return self._search(
+            JiraSearchResult,
+            jql,
+            fields,
+            start,
+            limit,
+            expand,
+            projects_filter,
+            include_total,
+        )
+
+    @cached_response("jira-search")
+    def search_issue_projections(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        start: int = 0,
+        limit: int = 50,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        *,
+        include_total: bool = True,
+    ) -> JiraSearchProjection:
+        """
+        Search for issues using JQL, returning lightweight projections.
+
+        Takes the same arguments as search_issues, but converts the issues
+        straight into JiraIssueProjection objects of the requested fields, for
+        callers that only need their simplified dictionaries.
+
+        Returns:
+            JiraSearchProjection object containing issues and metadata
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error searching for issues
+        """
+        return self._search(
+            JiraSearchProjection,
+            jql,
+            fields,
+            start,
+            limit,
+            expand,
+            projects_filter,
+            include_total,
+        )
+
+    def _search(
+        self,
+        result_class: type[SearchResultT],
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None,
+        start: int,
+        limit: int,
+        expand: str | None,
+        projects_filter: str | None,
+        include_total: bool,
+    ) -> SearchResultT:
+        """Run a JQL search and convert the response with result_class."""
         try:
-            # Use projects_filter parameter if provided, otherwise fall back to config
-            filter_to_use = projects_filter or self.config.projects_filter
-
-            # Apply projects filter if present
-            if filter_to_use:
-                # Split projects filter by commas and handle possible whitespace
-                projects = [p.strip() for p in filter_to_use.split(",")]
-
-                # Build the project filter query part
-                if len(projects) == 1:
-                    project_query = f"project = {projects[0]}"
-                else:
-                    quoted_projects = [f'"{p}"' for p in projects]
-                    projects_list = ", ".join(quoted_projects)
-                    project_query = f"project IN ({projects_list})"
-
-                # Add the project filter to existing query
-                if jql and project_query:
-                    if "project = " not in jql and "project IN" not in jql:
-                        # Only add if not already filtering by project
-                        jql = f"({jql}) AND {project_query}"
-                else:
-                    jql = project_query
-
-                logger.info(f"Applied projects filter to query: {jql}")
-
-            # Convert fields to proper format if it's a list/tuple/set
-            fields_param: str | None
-            if fields is None:  # Use default if None
-                fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
-            elif isinstance(fields, list | tuple | set):
-                fields_param = ",".join(fields)
-            else:
-                fields_param = fields
+            jql = self._apply_projects_filter(jql, projects_filter)
+            fields_param = self._format_search_fields(fields)
 
             if self.config.is_cloud:
+                # The issue search endpoint does not report a total, so it is
+                # fetched from the classic search API concurrently (or from cache)
                 actual_total = -1
-                try:
-                    # Call 1: Get metadata (including total) using standard search API
-                    metadata_params = {"jql": jql, "maxResults": 0}
-                    metadata_response = self.jira.get(
-                        self.jira.resource_url("search"), params=metadata_params
-                    )
-
-                    if (
-                        isinstance(metadata_response, dict)
-                        and "total" in metadata_response
-                    ):
-                        try:
-                            actual_total = int(metadata_response["total"])
-                        except (ValueError, TypeError):
-                            logger.warning(
-                                f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
-                            )
+                total_future: Future[int] | None = None
+                if include_total:
+                    # The requested fields do not change the count
+                    total_key = (_normalize_jql(jql), projects_filter)
+                    cached_total = self._get_cached_search_total(total_key)
+                    if cached_total is not None:
+                        actual_total = cached_total
                     else:
-                        logger.warning(
-                            f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
+                        total_future = _search_total_executor.submit(
+                            self._fetch_search_total, jql, total_key
                         )
-                except Exception as meta_err:
-                    logger.error(
-                        f"Error fetching metadata for JQL '{jql}': {str(meta_err)}"
-                    )
 
-                # Call 2: Get the actual issues using the enhanced method
+                # Get the actual issues using the enhanced method
                 issues_response_list = self.jira.enhanced_jql_get_list_of_tickets(
                     jql, fields=fields_param, limit=limit, expand=expand
                 )
@@ -120,12 +175,15 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                     logger.error(msg)
                     raise TypeError(msg)
 
+                if total_future is not None:
+                    actual_total = total_future.result()
+
                 response_dict_for_model = {
                     "issues": issues_response_list,
                     "total": actual_total,
                 }
 
-                search_result = JiraSearchResult.from_api_response(
+                search_result = result_class.from_api_response(
                     response_dict_for_model,
                     base_url=self.config.url,
                     requested_fields=fields_param,
@@ -144,7 +202,7 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                     raise TypeError(msg)
 
                 # Convert the response to a search result model
-                search_result = JiraSearchResult.from_api_response(
+                search_result = result_class.from_api_response(
                     response, base_url=self.config.url, requested_fields=fields_param
                 )
 
@@ -169,6 +227,278 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
             raise Exception(f"Error searching issues: {str(e)}") from e
 
+    def _fetch_search_total(self, jql: str, cache_key: tuple | None = None) -> int:
+        """Fetch the total number of issues matching a JQL query (Cloud).
+
+        Runs on the executor, overlapping the page request.
+
+        Args:
+            jql: The JQL query (with any projects filter already applied)
+            cache_key: Key under which a successfully fetched total is cached
+
+        Returns:
+            The total, or -1 if it could not be determined
+        """
+        actual_total = -1
+        try:
+            metadata_params = {"jql": jql, "maxResults": 0}
+            metadata_response = self.jira.get(
+                self.jira.resource_url("search"), params=metadata_params
+            )
+
+            if isinstance(metadata_response, dict) and "total" in metadata_response:
+                try:
+                    actual_total = int(metadata_response["total"])
+                except (ValueError, TypeError):
+                    logger.warning(
+                        f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
+                    )
+            else:
+                logger.warning(
+                    f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
+                )
+        except Exception as meta_err:
+            logger.error(f"Error fetching metadata for JQL '{jql}': {str(meta_err)}")
+
+        if actual_total >= 0 and cache_key is not None:
+            with _search_total_cache_lock:
+                if self._search_total_cache is None:
+                    self._search_total_cache = TTLCache(
+                        maxsize=SEARCH_TOTAL_CACHE_MAXSIZE,
+                        ttl=SEARCH_TOTAL_CACHE_TTL,
+                    )
+                self._search_total_cache[cache_key] = actual_total
+        return actual_total
+
+    def _get_cached_search_total(self, cache_key: tuple) -> int | None:
+        """Return a recently fetched total for the same search inputs, if any."""
+        if self._search_total_cache is None:
+            return None
+        with _search_total_cache_lock:
+            return self._search_total_cache.get(cache_key)
+
+    def iter_search_issues(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        page_size: int = 50,
+        max_results: int | None = None,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+    ) -> Iterator[list[JiraIssue]]:
+        """
+        Lazily iterate over all issues matching a JQL query, one page at a time.
+
+        Follows `nextPageToken` on Cloud and `startAt` on Server/Data Center.
+        Each page is fetched only when the previous one has been consumed, so
+        memory stays bounded by the page size and callers can stop early.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            page_size: Issues to request per page (capped at 50 on Server/Data Center)
+            max_results: Stop after this many issues in total (None for no limit)
+            expand: Optional items to expand (comma-separated)
+            projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+
+        Yields:
+            Lists of JiraIssue objects, one per page
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error searching for issues
+        """
+        yield from self._iter_search(
+            JiraSearchResult,
+            jql,
+            fields,
+            page_size,
+            max_results,
+            expand,
+            projects_filter,
+        )
+
+    def iter_search_projections(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        page_size: int = 50,
+        max_results: int | None = None,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+    ) -> Iterator[list[JiraIssueProjection]]:
+        """
+        Lazily iterate over all issues matching a JQL query as projections.
+
+        Takes the same arguments as iter_search_issues, but yields pages of
+        JiraIssueProjection objects of the requested fields.
+
+        Yields:
+            Lists of JiraIssueProjection objects, one per page
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error searching for issues
+        """
+        yield from self._iter_search(
+            JiraSearchProjection,
+            jql,
+            fields,
+            page_size,
+            max_results,
+            expand,
+            projects_filter,
+        )
+
+    def _iter_search(
+        self,
+        result_class: type[JiraSearchResult] | type[JiraSearchProjection],
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None,
+        page_size: int,
+        max_results: int | None,
+        expand: str | None,
+        projects_filter: str | None,
+    ) -> Iterator[list[Any]]:
+        """Yield pages of search results converted with result_class."""
+        jql = self._apply_projects_filter(jql, projects_filter)
+        fields_param = self._format_search_fields(fields)
+        remaining = max_results
+        page_size = max(1, page_size)
+
+        try:
+            for response in self._iter_search_pages(
+                jql, fields_param, page_size, expand
+            ):
+                issues = result_class.from_api_response(
+                    response, base_url=self.config.url, requested_fields=fields_param
+                ).issues
+                if remaining is not None:
+                    issues = issues[:remaining]
+                    remaining -= len(issues)
+                if issues:
+                    yield issues
+                if remaining is not None and remaining <= 0:
+                    return
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            else:
+                logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+                raise http_err
+        except Exception as e:
+            logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
+            raise Exception(f"Error searching issues: {str(e)}") from e
+
+    def iter_search_raw(
+        self, jql: str, fields: str = "*all", page_size: int = 100
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Lazily iterate over the raw issue JSON matching a JQL query, page by page.
+
+        Unlike iter_search_issues, no projects filter is applied and issues are
+        not converted to models, e.g. for storing them as returned by the API.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return (comma-separated string or "*all")
+            page_size: Issues to request per page (capped at 50 on Server/Data Center)
+
+        Yields:
+            Lists of issue dictionaries, one per page
+        """
+        for response in self._iter_search_pages(jql, fields, max(1, page_size), None):
+            issues = response.get("issues") or []
+            if issues:
+                yield issues
+
+    def _iter_search_pages(
+        self, jql: str, fields_param: str, page_size: int, expand: str | None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield raw search result pages for the deployment type."""
+        if self.config.is_cloud:
+            params: dict[str, Any] = {
+                "jql": jql,
+                "fields": fields_param,
+                "maxResults": page_size,
+            }
+            if expand:
+                params["expand"] = expand
+            for response in self.iter_paged(
+                "get", self.jira.resource_url("search/jql"), params
+            ):
+                yield response
+                if not response.get("issues"):
+                    return
+            return
+
+        page_size = min(page_size, 50)
+        start = 0
+        while True:
+            response = self.jira.jql(
+                jql, fields=fields_param, start=start, limit=page_size, expand=expand
+            )
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            yield response
+
+            page_issues = response.get("issues") or []
+            start += len(page_issues)
+            total = response.get("total")
+            if not page_issues or (isinstance(total, int) and start >= total):
+                return
+
+    def _apply_projects_filter(self, jql: str, projects_filter: str | None) -> str:
+        """Restrict a JQL query to the configured or requested projects."""
+        # Use projects_filter parameter if provided, otherwise fall back to config
+        filter_to_use = projects_filter or self.config.projects_filter
+
+        # Apply projects filter if present
+        if filter_to_use:
+            # Split projects filter by commas and handle possible whitespace
+            projects = [p.strip() for p in filter_to_use.split(",")]
+
+            # Build the project filter query part
+            if len(projects) == 1:
+                project_query = f"project = {projects[0]}"
+            else:
+                quoted_projects = [f'"{p}"' for p in projects]
+                projects_list = ", ".join(quoted_projects)
+                project_query = f"project IN ({projects_list})"
+
+            # Add the project filter to existing query
+            if jql and project_query:
+                if "project = " not in jql and "project IN" not in jql:
+                    # Only add if not already filtering by project
+                    jql = f"({jql}) AND {project_query}"
+            else:
+                jql = project_query
+
+            logger.info(f"Applied projects filter to query: {jql}")
+
+        return jql
+
+    @staticmethod
+    def _format_search_fields(
+        fields: list[str] | tuple[str, ...] | set[str] | str | None,
+    ) -> str:
+        """Convert the fields argument to the comma-separated form the API expects."""
+        if fields is None:  # Use default if None
+            return ",".join(DEFAULT_READ_JIRA_FIELDS)
+        if isinstance(fields, list | tuple | set):
+            return ",".join(fields)
+        return fields
+
     def get_board_issues(
         self,
         board_id: str,
@@ -7,6 +7,7 @@ from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models import JiraIssue, JiraTransition
+from ..utils.response_cache import invalidates_response_cache
 from .client import JiraClient
 from .protocols import IssueOperationsProto, UsersOperationsProto
 
@@ -114,6 +115,9 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
 
         return result
 
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def transition_issue(
         self,
         issue_key: str,
@@ -0,0 +1,233 @@
+"""Process-wide cache of resolved Jira user identities.
+
+Resolving an assignee string (username, email or display name) to the
+identifier Jira expects (accountId on Cloud, name on Server/DC) takes one or
+more user searches. Results are shared by all fetchers using the same
+credentials (see credential_identity), as user search results depend on what
+the caller may see. Successful lookups are kept for JIRA_USER_CACHE_TTL
+seconds in both directions: identifier -> account, and account -> the
+identifiers and user record seen for it, used to render and look up users
+known by account. Lookups that found no such user are remembered for
+JIRA_USER_CACHE_NEGATIVE_TTL seconds so repeated typos do not hit the API
+again.
+"""
+
+import logging
+import os
+import threading
+from typing import Any
+
+from cachetools import TTLCache
+
+from ..utils.response_cache import credential_identity
+
+logger = logging.getLogger("mcp-jira.user_cache")
+
+
+# Fields of a Jira user record naming the user, besides its account
+_USER_IDENTIFIER_FIELDS = ("name", "key", "emailAddress", "displayName")
+
+
+def _normalize_identifier(identifier: str) -> str:
+    return identifier.strip().lower()
+
+
+def user_account(user: dict[str, Any]) -> str | None:
+    """The identifier Jira expects for a user record: accountId, else name or key."""
+    for field in ("accountId", "name", "key"):
+        value = user.get(field)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+class UserIdentityCache:
+    """Thread-safe bidirectional identifier <-> account cache with negative entries."""
+
+    def __init__(self, maxsize: int, ttl: float, negative_ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries per direction and of failed
+                lookups.
+            ttl: Seconds a resolved identity is kept. 0 disables the cache.
+            negative_ttl: Seconds a failed lookup is remembered. 0 disables
+                negative caching.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._accounts: TTLCache[tuple[str, str], str] = TTLCache(
+            maxsize=max(maxsize, 1), ttl=max(ttl, 1)
+        )
+        self._identifiers: TTLCache[tuple[str, str], frozenset[str]] = TTLCache(
+            maxsize=max(maxsize, 1), ttl=max(ttl, 1)
+        )
+        self._users: TTLCache[tuple[str, str], dict[str, Any]] = TTLCache(
+            maxsize=max(maxsize, 1), ttl=max(ttl, 1)
+        )
+        self._not_found: TTLCache[tuple[str, str], bool] = TTLCache(
+            maxsize=max(maxsize, 1), ttl=max(negative_ttl, 1)
+        )
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_env(cls) -> "UserIdentityCache":
+        """Create a cache configured from environment variables.
+
+        Returns:
+            UserIdentityCache sized by JIRA_USER_CACHE_MAXSIZE (default 4096),
+            keeping identities for JIRA_USER_CACHE_TTL seconds (default 3600)
+            and failed lookups for JIRA_USER_CACHE_NEGATIVE_TTL seconds
+            (default 60).
+        """
+        return cls(
+            maxsize=int(os.getenv("JIRA_USER_CACHE_MAXSIZE", "4096")),
+            ttl=float(os.getenv("JIRA_USER_CACHE_TTL", "3600")),
+            negative_ttl=float(os.getenv("JIRA_USER_CACHE_NEGATIVE_TTL", "60")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether identities are cached at all."""
+        return self.ttl > 0 and self.maxsize > 0
+
+    def lookup(self, config: Any, identifier: str) -> tuple[bool, str | None]:
+        """Look up the account an identifier resolves to.
+
+        Args:
+            config: The Jira configuration (instance and credentials)
+            identifier: Username, email or display name
+
+        Returns:
+            Tuple of (cached, account). ``(True, None)`` means the identifier is
+            known not to resolve; ``(False, None)`` means it is not cached.
+        """
+        if not self.enabled:
+            return False, None
+        key = (credential_identity(config), _normalize_identifier(identifier))
+        with self._lock:
+            account = self._accounts.get(key)
+            if account is not None:
+                self._hits += 1
+                return True, account
+            if self.negative_ttl > 0 and key in self._not_found:
+                self._hits += 1
+                return True, None
+            self._misses += 1
+            return False, None
+
+    def identifiers_for(self, config: Any, account: str) -> frozenset[str]:
+        """Return the identifiers known to resolve to an account."""
+        if not self.enabled:
+            return frozenset()
+        with self._lock:
+            return self._identifiers.get(
+                (credential_identity(config), account), frozenset()
+            )
+
+    def user_for(self, config: Any, account: str) -> dict[str, Any] | None:
+        """Return the last user record seen for an account, if any."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            user = self._users.get((credential_identity(config), account))
+        return dict(user) if user is not None else None
+
+    def display_name_for(self, config: Any, account: str) -> str | None:
+        """Return the display name last seen for an account, if any."""
+        user = self.user_for(config, account)
+        name = user.get("displayName") if user else None
+        return name if isinstance(name, str) and name else None
+
+    def store(self, config: Any, identifier: str, account: str) -> None:
+        """Remember that an identifier resolves to an account."""
+        if not self.enabled:
+            return
+        credentials = credential_identity(config)
+        with self._lock:
+            self._store(credentials, [identifier], account)
+
+    def store_user(self, config: Any, user: dict[str, Any]) -> None:
+        """Remember a user record and the identifiers it names the user by.
+
+        Args:
+            config: The Jira configuration (instance and credentials)
+            user: A user as returned by the Jira API
+        """
+        account = user_account(user)
+        if not self.enabled or account is None:
+            return
+        credentials = credential_identity(config)
+        identifiers = [
+            user[field]
+            for field in _USER_IDENTIFIER_FIELDS
+            if isinstance(user.get(field), str) and user[field].strip()
+        ]
+        with self._lock:
+            self._store(credentials, identifiers, account)
+            self._users[(credentials, account)] = dict(user)
+
+    def _store(self, credentials: str, identifiers: list[str], account: str) -> None:
+        # Callers hold self._lock
+        known = self._identifiers.get((credentials, account), frozenset())
+        for identifier in identifiers:
+            key = (credentials, _normalize_identifier(identifier))
+            self._accounts[key] = account
+            self._not_found.pop(key, None)
+        self._identifiers[(credentials, account)] = known | {
+            identifier.strip() for identifier in identifiers
+        }
+
+    def store_not_found(self, config: Any, identifier: str) -> None:
+        """Remember that an identifier does not resolve to any account."""
+        if not self.enabled or self.negative_ttl <= 0:
+            return
+        key = (credential_identity(config), _normalize_identifier(identifier))
+        with self._lock:
+            self._not_found[key] = True
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._accounts.clear()
+            self._identifiers.clear()
+            self._users.clear()
+            self._not_found.clear()
+            self._hits = self._misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of cache metrics.
+
+        Returns:
+            Dictionary with configuration, current sizes and hit/miss counters.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "negative_ttl": self.negative_ttl,
+                "size": len(self._accounts),
+                "accounts_size": len(self._identifiers),
+                "not_found_size": len(self._not_found),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_user_identity_cache: UserIdentityCache | None = None
+_user_identity_cache_lock = threading.Lock()
+
+
+def get_user_identity_cache() -> UserIdentityCache:
+    """Return the process-wide user identity cache, creating it on first use."""
+    global _user_identity_cache
+    with _user_identity_cache_lock:
+        if _user_identity_cache is None:
+            _user_identity_cache = UserIdentityCache.from_env()
+        return _user_identity_cache
@@ -2,6 +2,8 @@
 
 import logging
 import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, TypeVar
 
 import requests
@@ -11,6 +13,7 @@ from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.models.jira.common import JiraUser
 
 from .client import JiraClient
+from .user_cache import get_user_identity_cache
 
 if TYPE_CHECKING:
     from mcp_atlassian.models.jira.common import JiraUser
@@ -19,6 +22,25 @@ JiraUserType = TypeVar("JiraUserType", bound="JiraUser")
 
 logger = logging.getLogger("mcp-jira")
 
+# Distinct users resolved at once by resolve_accounts
+MAX_CONCURRENT_USER_LOOKUPS = 8
+
+
+def _is_transient_lookup_error(error: Exception) -> bool:
+    """Check whether a user lookup failed for a reason other than the user.
+
+    Throttling, server errors and network failures say nothing about whether
+    the user exists, so they are raised instead of reported as not found.
+    """
+    if isinstance(error, requests.ConnectionError | requests.Timeout):
+        return True
+    response = getattr(error, "response", None)
+    return (
+        isinstance(error, HTTPError)
+        and response is not None
+        and (response.status_code == 429 or response.status_code >= 500)
+    )
+
 
 class UsersMixin(JiraClient):
     """Mixin for Jira user operations."""
@@ -105,17 +127,66 @@ class UsersMixin(JiraClient):
         if assignee.startswith("5") and len(assignee) >= 10:
             return assignee
 
-        account_id = self._lookup_user_directly(assignee)
-        if account_id:
-            return account_id
+        error_msg = f"Could not find account ID for user: {assignee}"
+        user_cache = get_user_identity_cache()
+        cached, account_id = user_cache.lookup(self.config, assignee)
+        if cached:
+            if account_id:
+                return account_id
+            raise ValueError(error_msg)
 
-        account_id = self._lookup_user_by_permissions(assignee)
+        try:
+            account_id = self._lookup_user_directly(
+                assignee
+            ) or self._lookup_user_by_permissions(assignee)
+        except requests.RequestException as e:
+            # Not a verdict on the user: don't remember it as not found
+            logger.warning(f"Error looking up user {assignee}: {str(e)}")
+            raise ValueError(error_msg) from e
         if account_id:
+            user_cache.store(self.config, assignee, account_id)
             return account_id
 
-        error_msg = f"Could not find account ID for user: {assignee}"
+        user_cache.store_not_found(self.config, assignee)
         raise ValueError(error_msg)
 
+    def resolve_accounts(self, identifiers: Iterable[str]) -> dict[str, str | None]:
+        """
+        Resolve many usernames, emails or display names to account IDs.
+
+        Each distinct identifier is looked up at most once, concurrently for
+        those not already in the shared user cache.
+
+        Args:
+            identifiers: Usernames, emails, display names or account IDs.
+
+        Returns:
+            dict[str, str | None]: Account ID (name on Server/DC) per distinct
+            identifier, or None if it could not be resolved.
+        """
+        unique = [
+            identifier
+            for identifier in dict.fromkeys(identifiers)
+            if isinstance(identifier, str) and identifier
+        ]
+        if not unique:
+            return {}
+
+        def resolve(identifier: str) -> str | None:
+            try:
+                return self._get_account_id(identifier)
+            except ValueError as e:
+                logger.warning(f"Could not resolve user: {str(e)}")
+                return None
+
+        if len(unique) == 1:
+            return {unique[0]: resolve(unique[0])}
+        with ThreadPoolExecutor(
+            max_workers=min(len(unique), MAX_CONCURRENT_USER_LOOKUPS),
+            thread_name_prefix="jira-user-lookup",
+        ) as executor:
+            return dict(zip(unique, executor.map(resolve, unique), strict=True))
+
     def _lookup_user_directly(self, username: str) -> str | None:
         """
         Look up a user account ID directly.
@@ -125,6 +196,10 @@ class UsersMixin(JiraClient):
 
         Returns:
             Optional[str]: Account ID if found, None otherwise.
+
+        Raises:
+            requests.RequestException: If the lookup was throttled or failed
+                with a server or network error.
         """
         try:
             params = {}
@@ -145,6 +220,7 @@ class UsersMixin(JiraClient):
                     or user.get("name", "").lower() == username.lower()
                     or user.get("emailAddress", "").lower() == username.lower()
                 ):
+                    get_user_identity_cache().store_user(self.config, user)
                     if self.config.is_cloud:
                         if "accountId" in user:
                             return user["accountId"]
@@ -161,6 +237,8 @@ class UsersMixin(JiraClient):
                             return user["key"]
             return None
         except Exception as e:
+            if _is_transient_lookup_error(e):
+                raise
             logger.info(f"Error looking up user directly: {str(e)}")
             return None
 
@@ -173,6 +251,10 @@ class UsersMixin(JiraClient):
 
         Returns:
             Optional[str]: Account ID if found, None otherwise.
+
+        Raises:
+            requests.RequestException: If the lookup was throttled or failed
+                with a server or network error.
         """
         try:
             url = f"{self.config.url}/rest/api/2/user/permission/search"
@@ -193,6 +275,8 @@ class UsersMixin(JiraClient):
                 verify=self.config.ssl_verify,
             )
 
+            if response.status_code == 429 or response.status_code >= 500:
+                response.raise_for_status()
             if response.status_code == 200:
                 data = response.json()
                 for user in data.get("users", []):
@@ -212,6 +296,8 @@ class UsersMixin(JiraClient):
                             return user["key"]
             return None
         except Exception as e:
+            if _is_transient_lookup_error(e):
+                raise
             logger.info(f"Error looking up user by permissions: {str(e)}")
             return None
 
@@ -314,6 +400,16 @@ class UsersMixin(JiraClient):
             MCPAtlassianAuthenticationError: If authentication fails.
             Exception: For other API errors.
         """
+        user_cache = get_user_identity_cache()
+        cached_user = user_cache.user_for(self.config, identifier)
+        if cached_user is None:
+            cached, account = user_cache.lookup(self.config, identifier)
+            if cached and account:
+                cached_user = user_cache.user_for(self.config, account)
+        if cached_user is not None:
+            logger.debug(f"Using cached profile for user '{identifier}'")
+            return JiraUser.from_api_response(cached_user)
+
         api_kwargs = self._determine_user_api_params(identifier)
 
         try:
@@ -324,6 +420,7 @@ class UsersMixin(JiraClient):
                     f"User lookup for '{identifier}' returned unexpected type: {type(user_data)}. Data: {user_data}"
                 )
                 raise ValueError(f"User '{identifier}' not found or lookup failed.")
+            user_cache.store_user(self.config, user_data)
             return JiraUser.from_api_response(user_data)
         except HTTPError as http_err:
             if http_err.response is not None:
@@ -6,6 +6,7 @@ from typing import Any
 
 from ..models import JiraWorklog
 from ..utils import parse_date
+from ..utils.response_cache import invalidates_response_cache
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
@@ -61,6 +62,9 @@ class WorklogMixin(JiraClient):
 
         return total_seconds
 
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
     def add_worklog(
         self,
         issue_key: str,
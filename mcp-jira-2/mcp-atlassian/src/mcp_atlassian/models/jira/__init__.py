@@ -25,6 +25,7 @@ from .link import (
     JiraLinkedIssueFields,
 )
 from .project import JiraProject
+from .projection import JiraIssueProjection, JiraSearchProjection
 from .search import JiraSearchResult
 from .workflow import JiraTransition
 from .worklog import JiraWorklog
@@ -48,6 +49,8 @@ __all__ = [
     "JiraSprint",
     "JiraIssue",
     "JiraSearchResult",
+    "JiraIssueProjection",
+    "JiraSearchProjection",
     "JiraIssueLinkType",
     "JiraIssueLink",
     "JiraLinkedIssue",
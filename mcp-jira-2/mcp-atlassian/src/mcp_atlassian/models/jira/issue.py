@@ -89,30 +89,27 @@ class JiraIssue(ApiModel, TimestampMixin):
     changelogs: list[JiraChangelog] = Field(default_factory=list)
     issuelinks: list[JiraIssueLink] = Field(default_factory=list)
 
-    def __getattribute__(self, name: str) -> Any:
+    def __getattr__(self, name: str) -> Any:
         """
         Custom attribute access to handle custom field access.
 
         This allows accessing custom fields by their name as if they were
-        regular attributes of the JiraIssue class.
+        regular attributes of the JiraIssue class. Only called when normal
+        attribute lookup fails, so regular fields are read at full speed.
 
         Args:
             name: The attribute name to access
 
         Returns:
-            The attribute value or custom field value
+            The custom field value
         """
-        # First try to get the attribute normally
         try:
-            return super().__getattribute__(name)
+            return super().__getattr__(name)  # type: ignore[misc]
         except AttributeError:
             # If the attribute doesn't exist, check if it's a custom field
-            try:
-                custom_fields = super().__getattribute__("custom_fields")
-                if name in custom_fields:
-                    return custom_fields[name]
-            except AttributeError:
-                pass
+            custom_fields = self.__dict__.get("custom_fields") or {}
+            if name in custom_fields:
+                return custom_fields[name]
             # Re-raise the original AttributeError
             raise
 
@@ -669,7 +666,8 @@ class JiraIssue(ApiModel, TimestampMixin):
 
         return {k: v for k, v in result.items() if v is not None}
 
-    def _process_custom_field_value(self, field_value: Any) -> Any:
+    @staticmethod
+    def _process_custom_field_value(field_value: Any) -> Any:
         """
         Process a custom field value for simplified dict output.
 
@@ -691,7 +689,7 @@ class JiraIssue(ApiModel, TimestampMixin):
             return field_value
 
         if isinstance(field_value, list):
-            return [self._process_custom_field_value(item) for item in field_value]
+            return [JiraIssue._process_custom_field_value(item) for item in field_value]
 
         return str(field_value)
 
@@ -0,0 +1,454 @@
+"""
+Lightweight projections of Jira search results.
+
+List and search tools only need the simplified dictionary of each issue.
+Building it through JiraIssue validates a pydantic model per issue and per
+nested user, status, project and so on, only to flatten them again. The
+projections here convert the raw API dictionaries straight into the same
+simplified values, computing only the requested fields.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from ..constants import (
+    EMPTY_STRING,
+    JIRA_DEFAULT_ID,
+    JIRA_DEFAULT_KEY,
+    NONE_VALUE,
+    UNASSIGNED,
+    UNKNOWN,
+)
+from .comment import JiraComment
+from .common import JiraAttachment, JiraChangelog
+from .issue import JiraIssue
+
+
+def _user(data: Any) -> dict[str, Any]:
+    """JiraUser.to_simplified_dict of a raw user."""
+    if not isinstance(data, dict):
+        data = {}
+    avatars = data.get("avatarUrls")
+    display_name = str(data.get("displayName", UNASSIGNED))
+    return {
+        "display_name": display_name,
+        "name": display_name,
+        "email": data.get("emailAddress"),
+        "avatar_url": avatars.get("48x48") if isinstance(avatars, dict) else None,
+    }
+
+
+def _status(data: Any) -> dict[str, Any]:
+    """JiraStatus.to_simplified_dict of a raw status."""
+    if not isinstance(data, dict):
+        return {"name": UNKNOWN}
+    result = {"name": str(data.get("name", UNKNOWN))}
+    if category := data.get("statusCategory"):
+        if not isinstance(category, dict):
+            category = {}
+        result["category"] = str(category.get("name", UNKNOWN))
+        result["color"] = str(category.get("colorName", EMPTY_STRING))
+    return result
+
+
+def _named(default: str) -> Callable[[Any], dict[str, Any]]:
+    """to_simplified_dict of a raw issue type or priority."""
+
+    def simplify(data: Any) -> dict[str, Any]:
+        if not isinstance(data, dict):
+            return {"name": default}
+        return {"name": str(data.get("name", default))}
+
+    return simplify
+
+
+_issue_type = _named(UNKNOWN)
+_priority = _named(NONE_VALUE)
+
+
+def _project(data: dict[str, Any]) -> dict[str, Any]:
+    """JiraProject.to_simplified_dict of a raw project."""
+    result = {
+        "key": str(data.get("key", EMPTY_STRING)),
+        "name": str(data.get("name", UNKNOWN)),
+    }
+    if description := data.get("description"):
+        result["description"] = description
+    category = data.get("projectCategory")
+    if isinstance(category, dict) and category.get("name"):
+        result["category"] = category["name"]
+    avatars = data.get("avatarUrls")
+    if isinstance(avatars, dict) and avatars.get("48x48"):
+        result["avatar_url"] = avatars["48x48"]
+    if lead := data.get("lead"):
+        result["lead"] = _user(lead)
+    return result
+
+
+def _resolution(data: dict[str, Any]) -> dict[str, Any]:
+    """JiraResolution.to_simplified_dict of a raw resolution."""
+    result = {"name": data.get("name", UNKNOWN)}
+    resolution_id = str(data.get("id", JIRA_DEFAULT_ID))
+    if resolution_id != JIRA_DEFAULT_ID:
+        result["id"] = resolution_id
+    return result
+
+
+def _timetracking(data: Any) -> dict[str, Any]:
+    """JiraTimetracking.to_simplified_dict of raw time tracking."""
+    if not isinstance(data, dict):
+        return {}
+    result = {}
+    for api_name, name in (
+        ("originalEstimate", "original_estimate"),
+        ("remainingEstimate", "remaining_estimate"),
+        ("timeSpent", "time_spent"),
+    ):
+        if data.get(api_name):
+            result[name] = data[api_name]
+    return result
+
+
+def _names(values: Any, *, key: str | None = None) -> list[str]:
+    """Non-empty list items as strings, read from ``key`` of dictionaries."""
+    if not isinstance(values, list):
+        return []
+    if key is None:
+        return [str(value) for value in values if value]
+    return [
+        str(value.get(key, "")) if isinstance(value, dict) else str(value)
+        for value in values
+        if value
+    ]
+
+
+def _truthy_dict(value: Any) -> dict | None:
+    return value if isinstance(value, dict) and value else None
+
+
+def _truthy_str(value: Any) -> str | None:
+    return value if isinstance(value, str) and value else None
+
+
+def _nonempty(values: list) -> list | None:
+    return values or None
+
+
+def _comments(fields: dict[str, Any]) -> list | None:
+    comment_field = fields.get("comment")
+    comments = (
+        comment_field.get("comments") if isinstance(comment_field, dict) else None
+    )
+    if not isinstance(comments, list):
+        return None
+    return _nonempty(
+        [
+            JiraComment.from_api_response(comment).to_simplified_dict()
+            for comment in comments
+            if comment
+        ]
+    )
+
+
+def _attachments(fields: dict[str, Any]) -> list | None:
+    attachments = fields.get("attachment")
+    if not isinstance(attachments, list):
+        return None
+    return _nonempty(
+        [
+            JiraAttachment.from_api_response(attachment).to_simplified_dict()
+            for attachment in attachments
+            if attachment
+        ]
+    )
+
+
+def _epic_field(
+    patterns: list[str],
+) -> Callable[[dict[str, Any]], str | None]:
+    def find(fields: dict[str, Any]) -> str | None:
+        return _truthy_str(
+            JiraIssue._find_custom_field_in_api_response(fields, patterns)
+        )
+
+    return find
+
+
+# Simplified fields in JiraIssue.to_simplified_dict order: the name checked
+# against the requested fields, the output key and how to compute its value
+# from the raw fields (None leaves it out)
+_FIELDS: tuple[tuple[str, str, Callable[[dict[str, Any]], Any]], ...] = (
+    ("summary", "summary", lambda f: str(f.get("summary", EMPTY_STRING))),
+    ("description", "description", lambda f: f.get("description") or None),
+    ("status", "status", lambda f: _status(f["status"]) if f.get("status") else None),
+    (
+        "issue_type",
+        "issue_type",
+        lambda f: _issue_type(f["issuetype"]) if f.get("issuetype") else None,
+    ),
+    (
+        "priority",
+        "priority",
+        lambda f: _priority(f["priority"]) if f.get("priority") else None,
+    ),
+    (
+        "project",
+        "project",
+        lambda f: (
+            _project(f["project"]) if isinstance(f.get("project"), dict) else None
+        ),
+    ),
+    (
+        "resolution",
+        "resolution",
+        lambda f: (
+            _resolution(f["resolution"])
+            if isinstance(f.get("resolution"), dict)
+            else None
+        ),
+    ),
+    ("duedate", "duedate", lambda f: _truthy_str(f.get("duedate"))),
+    (
+        "resolutiondate",
+        "resolutiondate",
+        lambda f: _truthy_str(f.get("resolutiondate")),
+    ),
+    ("parent", "parent", lambda f: _truthy_dict(f.get("parent"))),
+    (
+        "subtasks",
+        "subtasks",
+        lambda f: _nonempty(
+            [task for task in f.get("subtasks") or [] if isinstance(task, dict)]
+            if isinstance(f.get("subtasks"), list)
+            else []
+        ),
+    ),
+    ("security", "security", lambda f: _truthy_dict(f.get("security"))),
+    ("worklog", "worklog", lambda f: _truthy_dict(f.get("worklog"))),
+    (
+        "assignee",
+        "assignee",
+        lambda f: (
+            _user(f["assignee"]) if f.get("assignee") else {"display_name": UNASSIGNED}
+        ),
+    ),
+    (
+        "reporter",
+        "reporter",
+        lambda f: _user(f["reporter"]) if f.get("reporter") else None,
+    ),
+    ("labels", "labels", lambda f: _nonempty(_names(f.get("labels")))),
+    (
+        "components",
+        "components",
+        lambda f: _nonempty(_names(f.get("components"), key="name")),
+    ),
+    (
+        "fix_versions",
+        "fix_versions",
+        lambda f: _nonempty(_names(f.get("fixVersions"), key="name")),
+    ),
+    ("epic_key", "epic_key", _epic_field(["epic link", "parent epic"])),
+    ("epic_name", "epic_name", _epic_field(["epic name"])),
+    (
+        "timetracking",
+        "timetracking",
+        lambda f: _timetracking(f["timetracking"]) if f.get("timetracking") else None,
+    ),
+    ("created", "created", lambda f: str(f.get("created", EMPTY_STRING)) or None),
+    ("updated", "updated", lambda f: str(f.get("updated", EMPTY_STRING)) or None),
+    ("comment", "comments", _comments),
+    ("attachment", "attachments", _attachments),
+)
+
+
+def _requested_custom_fields(
+    data: dict[str, Any], fields: dict[str, Any], requested: list[str]
+) -> dict[str, Any]:
+    """The requested custom fields, matched by id, name or cf_ alias."""
+    names = data.get("names", {})
+    custom_fields = {}
+    for field_id, value in fields.items():
+        if field_id.startswith("customfield_"):
+            custom_fields[field_id] = {"value": value}
+            if names.get(field_id):
+                custom_fields[field_id]["name"] = names[field_id]
+    if not custom_fields:
+        return {}
+
+    def simplified(field: dict[str, Any]) -> dict[str, Any]:
+        result = {"value": JiraIssue._process_custom_field_value(field.get("value"))}
+        if "name" in field:
+            result["name"] = field["name"]
+        return result
+
+    result = {}
+    for requested_field in requested:
+        if (
+            requested_field.startswith("customfield_")
+            and requested_field in custom_fields
+        ):
+            result[requested_field] = simplified(custom_fields[requested_field])
+            continue
+        found = False
+        for field_id, field in custom_fields.items():
+            if field.get("name", "").lower() == requested_field.lower():
+                result[field_id] = simplified(field)
+                found = True
+                break
+        if not found and requested_field.startswith("cf_"):
+            field_id = "customfield_" + requested_field[3:]
+            if field_id in custom_fields:
+                result[field_id] = simplified(custom_fields[field_id])
+    return result
+
+
+class JiraIssueProjection:
+    """
+    The simplified form of a Jira issue, built from the raw API response.
+
+    Gives the same result as JiraIssue.from_api_response(...).to_simplified_dict()
+    without building the model. Only an explicit list of requested fields is
+    projected; "*all" falls back to the full model.
+    """
+
+    __slots__ = ("id", "key", "values")
+
+    def __init__(self, issue_id: str, key: str, values: dict[str, Any]) -> None:
+        self.id = issue_id
+        self.key = key
+        self.values = values
+
+    @classmethod
+    def from_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> "JiraIssueProjection":
+        """
+        Create a JiraIssueProjection from a Jira API response.
+
+        Args:
+            data: The issue data from the Jira API
+            **kwargs: requested_fields, as for JiraIssue.from_api_response
+
+        Returns:
+            A JiraIssueProjection instance
+        """
+        requested = kwargs.get("requested_fields")
+        if isinstance(requested, str) and requested != "*all":
+            requested = [field.strip() for field in requested.split(",")]
+        if not isinstance(requested, list) or not isinstance(data, dict) or not data:
+            values = JiraIssue.from_api_response(
+                data, requested_fields=requested
+            ).to_simplified_dict()
+            return cls(values.pop("id"), values.pop("key"), values)
+
+        fields = data.get("fields", {})
+        if not isinstance(fields, dict):
+            fields = {}
+        wanted = set(requested)
+        values: dict[str, Any] = {}
+        for name, output_key, project in _FIELDS:
+            if name in wanted:
+                value = project(fields)
+                if value is not None:
+                    values[output_key] = value
+            if name == "summary" and "url" in wanted and data.get("self"):
+                values["url"] = data["self"]
+
+        # Changelogs are only present when expanded, and then always shown
+        changelog = data.get("changelog")
+        if isinstance(changelog, dict) and changelog.get("histories"):
+            values["changelogs"] = [
+                JiraChangelog.from_api_response(history).to_simplified_dict()
+                for history in changelog["histories"]
+            ]
+        if "issuelinks" in wanted:
+            links = JiraIssue._extract_issue_links(fields)
+            if links:
+                values["issuelinks"] = [link.to_simplified_dict() for link in links]
+        values.update(_requested_custom_fields(data, fields, requested))
+
+        return cls(
+            str(data.get("id", JIRA_DEFAULT_ID)),
+            str(data.get("key", JIRA_DEFAULT_KEY)),
+            values,
+        )
+
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response."""
+        return {"id": self.id, "key": self.key, **self.values}
+
+
+class JiraSearchProjection:
+    """
+    A Jira search (JQL) result holding JiraIssueProjection objects.
+
+    Mirrors JiraSearchResult for callers that only need simplified output.
+    """
+
+    __slots__ = ("total", "start_at", "max_results", "issues")
+
+    def __init__(
+        self,
+        total: int = 0,
+        start_at: int = 0,
+        max_results: int = 0,
+        issues: list[JiraIssueProjection] | None = None,
+    ) -> None:
+        self.total = total
+        self.start_at = start_at
+        self.max_results = max_results
+        self.issues = issues or []
+
+    @classmethod
+    def from_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> "JiraSearchProjection":
+        """
+        Create a JiraSearchProjection from a Jira API response.
+
+        Args:
+            data: The search result data from the Jira API
+            **kwargs: requested_fields, as for JiraSearchResult.from_api_response
+
+        Returns:
+            A JiraSearchProjection instance
+        """
+        if not data or not isinstance(data, dict):
+            return cls()
+
+        requested_fields = kwargs.get("requested_fields")
+        issues_data = data.get("issues", [])
+        issues = (
+            [
+                JiraIssueProjection.from_api_response(
+                    issue_data, requested_fields=requested_fields
+                )
+                for issue_data in issues_data
+                if issue_data
+            ]
+            if isinstance(issues_data, list)
+            else []
+        )
+
+        def as_int(name: str) -> int:
+            try:
+                return int(data[name]) if data.get(name) is not None else -1
+            except (ValueError, TypeError):
+                return -1
+
+        return cls(
+            total=as_int("total"),
+            start_at=as_int("startAt"),
+            max_results=as_int("maxResults"),
+            issues=issues,
+        )
+
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response."""
+        return {
+            "total": self.total,
+            "start_at": self.start_at,
+            "max_results": self.max_results,
+            "issues": [issue.to_simplified_dict() for issue in self.issues],
+        }
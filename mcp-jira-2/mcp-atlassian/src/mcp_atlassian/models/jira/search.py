@@ -84,6 +84,15 @@ class JiraSearchResult(ApiModel):
             issues=issues,
         )
 
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response."""
+        return {
+            "total": self.total,
+            "start_at": self.start_at,
+            "max_results": self.max_results,
+            "issues": [issue.to_simplified_dict() for issue in self.issues],
+        }
+
     @model_validator(mode="after")
     def validate_search_result(self) -> "JiraSearchResult":
         """
@@ -6,7 +6,17 @@ import warnings
 from typing import Any, Protocol
 
 from bs4 import BeautifulSoup, Tag
-from markdownify import markdownify as md
+
+from ..utils.response_cache import credential_identity
+from .conversion_cache import memoized_conversion
+from .html_to_markdown import (
+    convert_to_markdown,
+    get_html_converter,
+    html_to_markdown,
+    parse_html,
+    serialize_html,
+)
+from .user_lookup import ACCOUNT_ID, USER_KEY, UserRef, resolve_display_names
 
 logger = logging.getLogger("mcp-atlassian")
 
@@ -23,11 +33,27 @@ class ConfluenceClient(Protocol):
         ...
 
 
+# (processed_html, processed_markdown, users rendered with a fallback
+# because their display name could not be resolved)
+RenderedContent = tuple[str, str, frozenset[UserRef]]
+
+
+def _resolved_all_users(
+    preprocessor: "BasePreprocessor", result: RenderedContent
+) -> bool:
+    """Whether every user referenced by a converted page was resolved."""
+    _, _, unresolved = result
+    return not unresolved
+
+
 class BasePreprocessor:
     """Base class for text preprocessing operations."""
 
     def __init__(
-        self, base_url: str = "", confluence_client: ConfluenceClient | None = None
+        self,
+        base_url: str = "",
+        confluence_client: ConfluenceClient | None = None,
+        config: Any | None = None,
     ) -> None:
         """
         Initialize the base text preprocessor.
@@ -35,9 +61,15 @@ class BasePreprocessor:
         Args:
             base_url: Base URL for API server
             confluence_client: Optional Confluence client for user lookups
+            config: Optional configuration holding the credentials of the
+                client, so resolved user names are only shared with callers
+                using the same credentials
         """
         self.base_url = base_url.rstrip("/") if base_url else ""
         self.confluence_client = confluence_client
+        self.credentials = (
+            credential_identity(config) if config is not None else self.base_url.lower()
+        )
 
     def process_html_content(
         self, html_content: str, space_key: str = ""
@@ -45,6 +77,9 @@ class BasePreprocessor:
         """
         Process HTML content to replace user refs and page links.
 
+        Results are memoized by content hash (see conversion_cache), except
+        when a mentioned user could not be resolved.
+
         Args:
             html_content: The HTML content to process
             space_key: Optional space key for context
@@ -52,53 +87,166 @@ class BasePreprocessor:
         Returns:
             Tuple of (processed_html, processed_markdown)
         """
-        try:
-            # Parse the HTML content
-            soup = BeautifulSoup(html_content, "html.parser")
+        processed_html, processed_markdown, _ = self.convert_html_content(
+            html_content, space_key=space_key
+        )
+        return processed_html, processed_markdown
+
+    @memoized_conversion(cache_if=_resolved_all_users)
+    def convert_html_content(
+        self, html_content: str, space_key: str = ""
+    ) -> RenderedContent:
+        """
+        Convert HTML content like process_html_content, reporting unresolved users.
 
-            # Process user mentions
-            self._process_user_mentions_in_soup(soup)
-            self._process_user_profile_macros_in_soup(soup)
+        Args:
+            html_content: The HTML content to process
+            space_key: Optional space key for context
 
-            # Convert to string and markdown
-            processed_html = str(soup)
-            processed_markdown = md(processed_html)
+        Returns:
+            Tuple of (processed_html, processed_markdown, unresolved user refs)
+        """
+        try:
+            # Parse the HTML content with the configured engine
+            engine = get_html_converter()
+            soup, root = parse_html(html_content, engine)
 
-            return processed_html, processed_markdown
+            # Resolve every mentioned user once, then rewrite mentions and macros
+            display_names = self._resolve_user_references(soup)
+            return self._render_html(soup, root, display_names, engine)
 
         except Exception as e:
             logger.error(f"Error in process_html_content: {str(e)}")
             raise
 
-    def _process_user_mentions_in_soup(self, soup: BeautifulSoup) -> None:
+    def _render_html(
+        self,
+        soup: BeautifulSoup,
+        root: Tag,
+        display_names: dict[UserRef, str | None],
+        engine: str,
+    ) -> RenderedContent:
+        """
+        Rewrite user references in parsed HTML and convert it to markdown.
+
+        Args:
+            soup: Parsed document returned by parse_html
+            root: Element to serialize and convert returned by parse_html
+            display_names: Display names of the referenced users
+            engine: HTML conversion engine the document was parsed for
+
+        Returns:
+            Tuple of (processed_html, processed_markdown, refs of the users
+            rendered with a fallback as their name could not be resolved).
+            Without a Confluence client, fallbacks are expected and no user
+            is reported.
+        """
+        unresolved: frozenset[UserRef] = frozenset()
+        if self.confluence_client is not None:
+            unresolved = frozenset(
+                ref
+                for ref in self._collect_user_references(soup)
+                if not self._lookup_display_name(ref, display_names)
+            )
+        self._process_user_mentions_in_soup(soup, display_names)
+        self._process_user_profile_macros_in_soup(soup, display_names)
+
+        # Convert to string and markdown
+        processed_html = serialize_html(soup, root)
+        processed_markdown = convert_to_markdown(root, engine, processed_html)
+        return processed_html, processed_markdown, unresolved
+
+    def _collect_user_references(self, soup: BeautifulSoup) -> list[UserRef]:
+        """
+        Collect the users referenced by mentions and profile macros.
+
+        Args:
+            soup: BeautifulSoup object containing HTML
+
+        Returns:
+            List of (ACCOUNT_ID or USER_KEY, identifier) references
+        """
+        refs: list[UserRef] = []
+        for user_element in soup.find_all("ac:link"):
+            user_ref = user_element.find("ri:user")
+            account_id = user_ref.get("ri:account-id") if user_ref else None
+            if isinstance(account_id, str) and account_id:
+                refs.append((ACCOUNT_ID, account_id))
+
+        for macro_element in soup.find_all(
+            "ac:structured-macro", attrs={"ac:name": "profile"}
+        ):
+            user_param = macro_element.find("ac:parameter", attrs={"ac:name": "user"})
+            user_ref = user_param.find("ri:user") if user_param else None
+            if not user_ref:
+                continue
+            account_id = user_ref.get("ri:account-id")
+            userkey = user_ref.get("ri:userkey")
+            if isinstance(account_id, str) and account_id:
+                refs.append((ACCOUNT_ID, account_id))
+            elif isinstance(userkey, str) and userkey:
+                refs.append((USER_KEY, userkey))
+        return refs
+
+    def _resolve_user_references(
+        self, soup: BeautifulSoup
+    ) -> dict[UserRef, str | None]:
+        """
+        Resolve the display names of all users referenced in the soup at once.
+
+        Args:
+            soup: BeautifulSoup object containing HTML
+
+        Returns:
+            Display name per reference, or None if it could not be resolved
+        """
+        refs = self._collect_user_references(soup)
+        if not refs or self.confluence_client is None:
+            return {}
+        return resolve_display_names(self.confluence_client, self.credentials, refs)
+
+    def _lookup_display_name(
+        self, ref: UserRef, display_names: dict[UserRef, str | None] | None
+    ) -> str | None:
+        """Return a display name from pre-resolved names, resolving it if absent."""
+        if display_names is not None and ref in display_names:
+            return display_names[ref]
+        if self.confluence_client is None:
+            return None
+        return resolve_display_names(self.confluence_client, self.credentials, [ref])[
+            ref
+        ]
+
+    def _process_user_mentions_in_soup(
+        self,
+        soup: BeautifulSoup,
+        display_names: dict[UserRef, str | None] | None = None,
+    ) -> None:
         """
         Process user mentions in BeautifulSoup object.
 
         Args:
             soup: BeautifulSoup object containing HTML
+            display_names: Display names resolved by _resolve_user_references
         """
         # Find all ac:link elements that might contain user mentions
         user_mentions = soup.find_all("ac:link")
+        if display_names is None and user_mentions:
+            display_names = self._resolve_user_references(soup)
 
         for user_element in user_mentions:
             user_ref = user_element.find("ri:user")
             if user_ref and user_ref.get("ri:account-id"):
-                # Case 1: Direct user reference without link-body
+                # Direct user reference, with or without an @ link-body
                 account_id = user_ref.get("ri:account-id")
                 if isinstance(account_id, str):
-                    self._replace_user_mention(user_element, account_id)
-                    continue
+                    self._replace_user_mention(user_element, account_id, display_names)
 
-            # Case 2: User reference with link-body containing @
-            link_body = user_element.find("ac:link-body")
-            if link_body and "@" in link_body.get_text(strip=True):
-                user_ref = user_element.find("ri:user")
-                if user_ref and user_ref.get("ri:account-id"):
-                    account_id = user_ref.get("ri:account-id")
-                    if isinstance(account_id, str):
-                        self._replace_user_mention(user_element, account_id)
-
-    def _process_user_profile_macros_in_soup(self, soup: BeautifulSoup) -> None:
+    def _process_user_profile_macros_in_soup(
+        self,
+        soup: BeautifulSoup,
+        display_names: dict[UserRef, str | None] | None = None,
+    ) -> None:
         """
         Process Confluence User Profile macros in BeautifulSoup object.
         Replaces <ac:structured-macro ac:name="profile">...</ac:structured-macro>
@@ -106,10 +254,13 @@ class BasePreprocessor:
 
         Args:
             soup: BeautifulSoup object containing HTML
+            display_names: Display names resolved by _resolve_user_references
         """
         profile_macros = soup.find_all(
             "ac:structured-macro", attrs={"ac:name": "profile"}
         )
+        if display_names is None and profile_macros:
+            display_names = self._resolve_user_references(soup)
 
         for macro_element in profile_macros:
             user_param = macro_element.find("ac:parameter", attrs={"ac:name": "user"})
@@ -135,23 +286,13 @@ class BasePreprocessor:
             display_name = None
 
             if self.confluence_client and user_identifier_for_log:
-                try:
-                    if account_id and isinstance(account_id, str):
-                        user_details = (
-                            self.confluence_client.get_user_details_by_accountid(
-                                account_id
-                            )
-                        )
-                        display_name = user_details.get("displayName")
-                    elif userkey and isinstance(userkey, str):
-                        # For Confluence Server/DC, userkey might be the username
-                        user_details = (
-                            self.confluence_client.get_user_details_by_username(userkey)
-                        )
-                        display_name = user_details.get("displayName")
-                except Exception as e:
-                    logger.warning(
-                        f"Error fetching user details for profile macro (user: {user_identifier_for_log}): {e}"
+                if account_id and isinstance(account_id, str):
+                    display_name = self._lookup_display_name(
+                        (ACCOUNT_ID, account_id), display_names
+                    )
+                elif userkey and isinstance(userkey, str):
+                    display_name = self._lookup_display_name(
+                        (USER_KEY, userkey), display_names
                     )
             elif not self.confluence_client:
                 logger.warning(
@@ -171,25 +312,28 @@ class BasePreprocessor:
                 macro_element.replace_with(fallback_text)
                 logger.debug(f"Using fallback for user profile macro: {fallback_text}")
 
-    def _replace_user_mention(self, user_element: Tag, account_id: str) -> None:
+    def _replace_user_mention(
+        self,
+        user_element: Tag,
+        account_id: str,
+        display_names: dict[UserRef, str | None] | None = None,
+    ) -> None:
         """
         Replace a user mention with the user's display name.
 
         Args:
             user_element: The HTML element containing the user mention
             account_id: The user's account ID
+            display_names: Display names resolved by _resolve_user_references
         """
         try:
-            # Only attempt to get user details if we have a valid confluence client
-            if self.confluence_client is not None:
-                user_details = self.confluence_client.get_user_details_by_accountid(
-                    account_id
-                )
-                display_name = user_details.get("displayName", "")
-                if display_name:
-                    new_text = f"@{display_name}"
-                    user_element.replace_with(new_text)
-                    return
+            display_name = self._lookup_display_name(
+                (ACCOUNT_ID, account_id), display_names
+            )
+            if display_name:
+                new_text = f"@{display_name}"
+                user_element.replace_with(new_text)
+                return
             # If we don't have a confluence client or couldn't get user details,
             # use fallback
             self._use_fallback_user_mention(user_element, account_id)
@@ -216,8 +360,10 @@ class BasePreprocessor:
                 with warnings.catch_warnings():
                     warnings.filterwarnings("ignore", category=UserWarning)
                     soup = BeautifulSoup(f"<div>{text}</div>", "html.parser")
-                    html = str(soup.div.decode_contents()) if soup.div else text
-                    text = md(html)
+                    if soup.div:
+                        text = convert_to_markdown(soup.div)
+                    else:
+                        text = html_to_markdown(text)
             except Exception as e:
                 logger.warning(f"Error converting HTML to markdown: {str(e)}")
         return text
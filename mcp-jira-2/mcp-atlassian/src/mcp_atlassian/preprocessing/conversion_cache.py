@@ -0,0 +1,255 @@
+"""Memo cache for converted page and issue bodies.
+
+Preprocessor methods decorated with ``memoized_conversion`` are memoized per
+method, preprocessor options (base URL, credentials, whether a Confluence
+client is available, HTML conversion engine) and a hash of their arguments, so
+unchanged page bodies and descriptions are not parsed and converted again on
+every read. The cache is bounded by the total size of the cached results
+(ATLASSIAN_CONVERSION_CACHE_MAXBYTES) rather than by entry count, and entries
+expire after ATLASSIAN_CONVERSION_CACHE_TTL seconds so user display names
+resolved into the output are eventually refreshed.
+"""
+
+import hashlib
+import logging
+import os
+import sys
+import threading
+from collections.abc import Callable, Hashable
+from functools import wraps
+from typing import Any, TypeVar
+
+from cachetools import TTLCache
+
+from .html_to_markdown import get_html_converter
+
+logger = logging.getLogger("mcp-atlassian")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Bookkeeping overhead charged per entry on top of the result size
+ENTRY_OVERHEAD_BYTES = 256
+
+
+def _sizeof(value: Any) -> int:
+    if isinstance(value, tuple | list):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class _SizedTTLCache(TTLCache):
+    """TTLCache counting the entries evicted to make room."""
+
+    evictions = 0
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+
+class ConversionCache:
+    """Thread-safe, byte-bounded TTL/LRU cache of conversion results."""
+
+    def __init__(self, maxbytes: int, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxbytes: Maximum total size of cached results. 0 disables the cache.
+            ttl: Seconds a result is kept. 0 disables the cache.
+        """
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: _SizedTTLCache = _SizedTTLCache(
+            maxsize=max(maxbytes, 1),
+            ttl=max(ttl, 1),
+            getsizeof=lambda value: _sizeof(value) + ENTRY_OVERHEAD_BYTES,
+        )
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_env(cls) -> "ConversionCache":
+        """Create a cache configured from environment variables.
+
+        Returns:
+            ConversionCache holding up to ATLASSIAN_CONVERSION_CACHE_MAXBYTES
+            bytes of results (default 32 MiB) for ATLASSIAN_CONVERSION_CACHE_TTL
+            seconds (default 3600).
+        """
+        return cls(
+            maxbytes=int(
+                os.getenv("ATLASSIAN_CONVERSION_CACHE_MAXBYTES", str(32 * 1024 * 1024))
+            ),
+            ttl=float(os.getenv("ATLASSIAN_CONVERSION_CACHE_TTL", "3600")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self.ttl > 0 and self.maxbytes > 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a result.
+
+        Returns:
+            Tuple of (found, result).
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return False, None
+            self._hits += 1
+            return True, value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result, evicting the least recently used ones to make room."""
+        with self._lock:
+            try:
+                self._entries[key] = value
+            except ValueError:
+                # Larger than the whole cache
+                logger.debug("Conversion result too large to cache")
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._entries.evictions = 0
+            self._hits = self._misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of cache metrics.
+
+        Returns:
+            Dictionary with configuration, current size and hit/miss and
+            eviction counters.
+        """
+        with self._lock:
+            self._entries.expire()
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "maxbytes": self.maxbytes,
+                "ttl": self.ttl,
+                "entries": len(self._entries),
+                "bytes": self._entries.currsize,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._entries.evictions,
+            }
+
+
+_conversion_cache: ConversionCache | None = None
+_conversion_cache_lock = threading.Lock()
+
+
+def get_conversion_cache() -> ConversionCache:
+    """Return the process-wide conversion cache, creating it on first use."""
+    global _conversion_cache
+    with _conversion_cache_lock:
+        if _conversion_cache is None:
+            _conversion_cache = ConversionCache.from_env()
+        return _conversion_cache
+
+
+def _content_digest(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    for value in (*args, *sorted(kwargs.items())):
+        digest.update(
+            value.encode("utf-8")
+            if isinstance(value, str)
+            else repr(value).encode("utf-8")
+        )
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def _memo_key(
+    qualname: str, preprocessor: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[Any, ...]:
+    return (
+        qualname,
+        getattr(preprocessor, "base_url", ""),
+        # Output may contain user names resolved with the preprocessor's credentials
+        getattr(preprocessor, "credentials", ""),
+        getattr(preprocessor, "confluence_client", None) is not None,
+        get_html_converter(),
+        _content_digest(args, kwargs),
+    )
+
+
+def memoized_conversion(
+    cache_if: Callable[[Any, Any], bool] | None = None,
+) -> Callable[[F], F]:
+    """Memoize a preprocessor conversion method.
+
+    Args:
+        cache_if: Optional ``(preprocessor, result) -> bool`` deciding whether a
+            result may be cached, e.g. not when a lookup it depends on failed.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            cache = get_conversion_cache()
+            if not cache.enabled:
+                return func(self, *args, **kwargs)
+
+            key = _memo_key(func.__qualname__, self, args, kwargs)
+            found, value = cache.get(key)
+            if found:
+                return value
+
+            value = func(self, *args, **kwargs)
+            if cache_if is None or cache_if(self, value):
+                cache.put(key, value)
+            return value
+
+        wrapper.cache_if = cache_if  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def lookup_memoized(
+    method: Callable[..., Any], *args: Any, **kwargs: Any
+) -> tuple[bool, Any]:
+    """Look up the memoized result of a bound ``memoized_conversion`` method call.
+
+    Used by callers that compute results outside the method (e.g. in worker
+    processes) and still want to share the cache with it.
+
+    Returns:
+        Tuple of (found, result).
+    """
+    cache = get_conversion_cache()
+    if not cache.enabled:
+        return False, None
+    return cache.get(
+        _memo_key(method.__func__.__qualname__, method.__self__, args, kwargs)  # type: ignore[attr-defined]
+    )
+
+
+def store_memoized(
+    method: Callable[..., Any], value: Any, *args: Any, **kwargs: Any
+) -> None:
+    """Memoize a result computed for a bound ``memoized_conversion`` method call."""
+    cache = get_conversion_cache()
+    preprocessor = method.__self__  # type: ignore[attr-defined]
+    cache_if = getattr(method, "cache_if", None)
+    if not cache.enabled or (
+        cache_if is not None and not cache_if(preprocessor, value)
+    ):
+        return
+    cache.put(
+        _memo_key(method.__func__.__qualname__, preprocessor, args, kwargs),  # type: ignore[attr-defined]
+        value,
+    )
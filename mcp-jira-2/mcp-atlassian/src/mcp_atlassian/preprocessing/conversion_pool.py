@@ -0,0 +1,299 @@
+"""Optional process pool converting page bodies in parallel.
+
+Listing a space or the children of a page, and searching, converts the
+storage HTML (or excerpt) of every result, which is CPU bound and serialized
+by the GIL when done in the request thread. With ATLASSIAN_CONVERSION_PROCESSES set to a positive number, batches
+of at least ATLASSIAN_CONVERSION_POOL_MIN_BATCH pages are converted by a pool
+of worker processes started on first use. The users mentioned in a batch are
+resolved in this process first, with one batched lookup, so workers never talk
+to Confluence. Smaller batches, and all batches while the pool is disabled
+(the default), are converted inline after the same batched user lookup.
+Results are returned in input order and share the conversion cache with
+``BasePreprocessor.convert_html_content``.
+"""
+
+import html
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from typing import Any
+
+from .base import BasePreprocessor, RenderedContent
+from .conversion_cache import lookup_memoized, store_memoized
+from .html_to_markdown import get_html_converter, parse_html
+from .user_lookup import UserRef, resolve_display_names
+
+logger = logging.getLogger("mcp-atlassian")
+
+# Matches the ri:user attributes _collect_user_references reads. Scanning the
+# raw HTML may find a few more users than the parser does, never fewer.
+_USER_REF_RE = re.compile(r"""ri:(account-id|userkey)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+
+class _PreResolvedClient:
+    """Client stand-in for workers; every referenced user is already resolved."""
+
+    def get_user_details_by_accountid(self, account_id: str) -> dict[str, Any]:
+        return {}
+
+    def get_user_details_by_username(self, username: str) -> dict[str, Any]:
+        return {}
+
+
+def _scan_user_references(html_content: str) -> list[UserRef]:
+    return [
+        (kind, html.unescape(double_quoted or single_quoted))
+        for kind, double_quoted, single_quoted in _USER_REF_RE.findall(html_content)
+        if double_quoted or single_quoted
+    ]
+
+
+def _resolve_batch_users(
+    preprocessor: BasePreprocessor, html_contents: Sequence[str]
+) -> tuple[list[list[UserRef]], dict[UserRef, str | None]]:
+    """Resolve the users referenced by several pages with one concurrent lookup.
+
+    Returns:
+        Tuple of (references per page, display name per reference)
+    """
+    page_refs = [_scan_user_references(content) for content in html_contents]
+    client = preprocessor.confluence_client
+    if client is None or not any(page_refs):
+        return page_refs, {}
+    return page_refs, resolve_display_names(
+        client, preprocessor.credentials, chain.from_iterable(page_refs)
+    )
+
+
+def _convert_in_worker(
+    base_url: str,
+    has_client: bool,
+    engine: str,
+    html_content: str,
+    display_names: dict[UserRef, str | None],
+) -> RenderedContent:
+    """Convert one page in a worker process, see convert_html_content."""
+    preprocessor = BasePreprocessor(
+        base_url=base_url,
+        confluence_client=_PreResolvedClient() if has_client else None,
+    )
+    soup, root = parse_html(html_content, engine)
+    return preprocessor._render_html(soup, root, display_names, engine)
+
+
+def _convert_inline(
+    preprocessor: BasePreprocessor, html_content: str, space_key: str
+) -> RenderedContent:
+    """Convert one page in this process, bypassing the memo lookup already done."""
+    method = preprocessor.convert_html_content
+    value = method.__wrapped__(preprocessor, html_content, space_key=space_key)  # type: ignore[attr-defined]
+    store_memoized(method, value, html_content, space_key=space_key)
+    return value
+
+
+class ConversionPool:
+    """Lazily started pool of worker processes converting storage HTML."""
+
+    def __init__(self, processes: int, min_batch: int) -> None:
+        """Initialize the pool without starting any process.
+
+        Args:
+            processes: Number of worker processes. 0 disables the pool.
+            min_batch: Smallest number of pages worth sending to the workers.
+        """
+        self.processes = processes
+        self.min_batch = max(min_batch, 1)
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._parallel_batches = 0
+        self._inline_batches = 0
+        self._parallel_pages = 0
+        self._failures = 0
+
+    @classmethod
+    def from_env(cls) -> "ConversionPool":
+        """Create a pool configured from environment variables.
+
+        Returns:
+            ConversionPool with ATLASSIAN_CONVERSION_PROCESSES workers (default
+            0, disabled) used for batches of at least
+            ATLASSIAN_CONVERSION_POOL_MIN_BATCH pages (default 4).
+        """
+        return cls(
+            processes=int(os.getenv("ATLASSIAN_CONVERSION_PROCESSES", "0")),
+            min_batch=int(os.getenv("ATLASSIAN_CONVERSION_POOL_MIN_BATCH", "4")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether batches may be converted by worker processes."""
+        return self.processes > 0
+
+    def process_html_contents(
+        self,
+        preprocessor: BasePreprocessor,
+        html_contents: Sequence[str],
+        space_key: str = "",
+    ) -> list[tuple[str, str]]:
+        """Convert several pages, like process_html_content on each of them.
+
+        Args:
+            preprocessor: Preprocessor providing the base URL and the client
+                used to resolve user mentions
+            html_contents: Storage-format HTML of each page
+            space_key: Optional space key for context
+
+        Returns:
+            (processed_html, processed_markdown) per page, in input order
+        """
+        if not self.enabled or len(html_contents) < self.min_batch:
+            self._count(inline_batches=1)
+            if len(html_contents) > 1 and isinstance(preprocessor, BasePreprocessor):
+                # Later conversions find every user in the display name cache
+                _resolve_batch_users(preprocessor, html_contents)
+            return [
+                preprocessor.process_html_content(content, space_key=space_key)
+                for content in html_contents
+            ]
+
+        results: list[RenderedContent | None] = []
+        pending: list[int] = []
+        for index, content in enumerate(html_contents):
+            found, value = lookup_memoized(
+                preprocessor.convert_html_content, content, space_key=space_key
+            )
+            results.append(value if found else None)
+            if not found:
+                pending.append(index)
+
+        pending_contents = [html_contents[index] for index in pending]
+        converted: list[RenderedContent] | None = None
+        if len(pending) >= self.min_batch:
+            try:
+                converted = self._convert_in_workers(preprocessor, pending_contents)
+            except BrokenProcessPool as e:
+                logger.warning(f"Conversion pool failed, converting inline: {e}")
+                self._discard_executor()
+                self._count(failures=1)
+            else:
+                for content, value in zip(pending_contents, converted, strict=True):
+                    store_memoized(
+                        preprocessor.convert_html_content,
+                        value,
+                        content,
+                        space_key=space_key,
+                    )
+        if converted is None:
+            self._count(inline_batches=1)
+            if len(pending_contents) > 1:
+                _resolve_batch_users(preprocessor, pending_contents)
+            converted = [
+                _convert_inline(preprocessor, content, space_key)
+                for content in pending_contents
+            ]
+
+        for index, value in zip(pending, converted, strict=True):
+            results[index] = value
+        return [
+            (processed_html, processed_markdown)
+            for processed_html, processed_markdown, _ in results  # type: ignore[misc]
+        ]
+
+    def _convert_in_workers(
+        self, preprocessor: BasePreprocessor, html_contents: list[str]
+    ) -> list[RenderedContent]:
+        """Resolve the mentioned users once and convert the pages in the pool."""
+        page_refs, display_names = _resolve_batch_users(preprocessor, html_contents)
+        client = preprocessor.confluence_client
+        count = len(html_contents)
+        converted = list(
+            self._get_executor().map(
+                _convert_in_worker,
+                [preprocessor.base_url] * count,
+                [client is not None] * count,
+                [get_html_converter()] * count,
+                html_contents,
+                [{ref: display_names[ref] for ref in refs} for refs in page_refs],
+                chunksize=max(1, count // (self.processes * 4)),
+            )
+        )
+        self._count(parallel_batches=1, parallel_pages=count)
+        return converted
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                logger.info(
+                    f"Starting page conversion pool with {self.processes} processes"
+                )
+                # Spawned rather than forked: the server runs threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _discard_executor(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; the next parallel batch restarts them."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for name, increment in increments.items():
+                setattr(self, f"_{name}", getattr(self, f"_{name}") + increment)
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of pool metrics.
+
+        Returns:
+            Dictionary with configuration, whether workers are running and
+            batch/page counters.
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "processes": self.processes,
+                "min_batch": self.min_batch,
+                "started": self._executor is not None,
+                "parallel_batches": self._parallel_batches,
+                "parallel_pages": self._parallel_pages,
+                "inline_batches": self._inline_batches,
+                "failures": self._failures,
+            }
+
+
+_conversion_pool: ConversionPool | None = None
+_conversion_pool_lock = threading.Lock()
+
+
+def get_conversion_pool() -> ConversionPool:
+    """Return the process-wide conversion pool, creating it on first use."""
+    global _conversion_pool
+    with _conversion_pool_lock:
+        if _conversion_pool is None:
+            _conversion_pool = ConversionPool.from_env()
+        return _conversion_pool
+
+
+def process_html_contents(
+    preprocessor: BasePreprocessor, html_contents: Sequence[str], space_key: str = ""
+) -> list[tuple[str, str]]:
+    """Convert several pages with the process-wide pool, see ConversionPool."""
+    return get_conversion_pool().process_html_contents(
+        preprocessor, html_contents, space_key=space_key
+    )
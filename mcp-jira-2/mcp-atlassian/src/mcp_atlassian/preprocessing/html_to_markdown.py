@@ -0,0 +1,454 @@
+"""Pluggable HTML parsing and HTML-to-Markdown conversion.
+
+The legacy pipeline serializes the processed soup with ``str(soup)`` and has
+``markdownify`` parse it a second time. The ``fast`` engine instead walks the
+already-parsed tree once and emits the same Markdown markdownify produces with
+its default options, without reparsing, mutating the tree or searching for
+ancestors per text node. The ``lxml`` engine additionally parses with lxml
+when it is installed.
+
+The engine is selected with ATLASSIAN_HTML_CONVERTER:
+
+- ``markdownify`` (default): html.parser + markdownify
+- ``fast``: html.parser + single-pass emitter
+- ``lxml``: lxml parser + single-pass emitter. Pages containing CDATA sections
+  (code macros) or that do not start with a tag fall back to html.parser, as
+  lxml would drop or rewrap their content. lxml repairs malformed markup the
+  way browsers do, so output may differ from ``fast`` on such pages.
+"""
+
+import importlib.util
+import logging
+import os
+import re
+from dataclasses import dataclass
+
+from bs4 import BeautifulSoup, Comment, Doctype, NavigableString, Tag
+from markdownify import markdownify as md
+
+logger = logging.getLogger("mcp-atlassian")
+
+FAST = "fast"
+LXML = "lxml"
+MARKDOWNIFY = "markdownify"
+HTML_CONVERTERS = (FAST, LXML, MARKDOWNIFY)
+
+_heading_re = re.compile(r"h[1-6]")
+_heading_level_re = re.compile(r"h(\d+)")
+_line_beginning_re = re.compile(r"^", re.MULTILINE)
+_whitespace_re = re.compile(r"[\t ]+")
+_all_whitespace_re = re.compile(r"[\t \r\n]+")
+_newline_whitespace_re = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_lxml_unsafe_re = re.compile(r"<!\[CDATA\[|<(?:html|head|body)[\s>/]", re.IGNORECASE)
+
+_BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "blockquote",
+        "ol",
+        "ul",
+        "li",
+        "table",
+        "thead",
+        "tbody",
+        "tfoot",
+        "tr",
+        "td",
+        "th",
+    }
+)
+_CODE_TAGS = frozenset({"pre", "code", "kbd", "samp"})
+_INLINE_MARKUP = {
+    "b": "**",
+    "strong": "**",
+    "em": "*",
+    "i": "*",
+    "del": "~~",
+    "s": "~~",
+    "sub": "",
+    "sup": "",
+}
+_BULLETS = "*+-"
+
+
+def get_html_converter() -> str:
+    """Return the configured conversion engine (ATLASSIAN_HTML_CONVERTER)."""
+    engine = os.getenv("ATLASSIAN_HTML_CONVERTER", MARKDOWNIFY).strip().lower()
+    if engine not in HTML_CONVERTERS:
+        logger.warning(
+            f"Unknown ATLASSIAN_HTML_CONVERTER '{engine}', using '{MARKDOWNIFY}' "
+            "instead"
+        )
+        return MARKDOWNIFY
+    return engine
+
+
+def is_lxml_available() -> bool:
+    """Check whether the optional ``lxml`` parser is installed."""
+    return importlib.util.find_spec("lxml") is not None
+
+
+def parse_html(
+    html_content: str, engine: str | None = None
+) -> tuple[BeautifulSoup, Tag]:
+    """Parse HTML with the parser of the given engine.
+
+    Args:
+        html_content: The HTML to parse
+        engine: Conversion engine, defaults to the configured one
+
+    Returns:
+        Tuple of (soup, root). ``root`` is the element holding the content:
+        the soup itself, or the ``<body>`` lxml wrapped the content in.
+    """
+    engine = engine or get_html_converter()
+    if (
+        engine == LXML
+        and is_lxml_available()
+        and html_content.lstrip().startswith("<")
+        and not _lxml_unsafe_re.search(html_content)
+    ):
+        soup = BeautifulSoup(html_content, "lxml")
+        return soup, soup.body or soup
+    soup = BeautifulSoup(html_content, "html.parser")
+    return soup, soup
+
+
+def serialize_html(soup: BeautifulSoup, root: Tag) -> str:
+    """Serialize a tree returned by parse_html back to HTML."""
+    return str(soup) if root is soup else root.decode_contents()
+
+
+def convert_to_markdown(
+    root: Tag, engine: str | None = None, html: str | None = None
+) -> str:
+    """Convert the children of a parsed tree to Markdown.
+
+    Args:
+        root: Tag or soup whose children are converted
+        engine: Conversion engine, defaults to the configured one
+        html: Serialized form of ``root``'s children, if already available;
+            only used by the ``markdownify`` engine
+
+    Returns:
+        The Markdown text
+    """
+    engine = engine or get_html_converter()
+    if engine == MARKDOWNIFY:
+        return md(root.decode_contents() if html is None else html)
+    # Strings that were split by tree edits would be one string after a reparse
+    root.smooth()
+    return MarkdownEmitter().convert(root)
+
+
+def html_to_markdown(html_content: str, engine: str | None = None) -> str:
+    """Convert an HTML string to Markdown with the configured engine."""
+    engine = engine or get_html_converter()
+    if engine == MARKDOWNIFY:
+        return md(html_content)
+    _, root = parse_html(html_content, engine)
+    return MarkdownEmitter().convert(root)
+
+
+def _removes_whitespace_inside(el: object) -> bool:
+    if not el:
+        return False
+    name = getattr(el, "name", None)
+    if not name:
+        return False
+    return name in _BLOCK_TAGS or _heading_re.match(name) is not None
+
+
+def _removes_whitespace_outside(el: object) -> bool:
+    return _removes_whitespace_inside(el) or bool(
+        el and getattr(el, "name", None) == "pre"
+    )
+
+
+def _chomp(text: str) -> tuple[str, str, str]:
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def _colspan(cell: Tag) -> int:
+    colspan = cell.attrs.get("colspan")
+    if isinstance(colspan, str) and colspan.isdigit():
+        return int(colspan)
+    return 1
+
+
+@dataclass(frozen=True)
+class _Context:
+    """Ancestor facts markdownify looks up with find_parent."""
+
+    in_pre: bool = False
+    in_code: bool = False
+    in_li: bool = False
+    ul_depth: int = 0
+
+    def enter(self, name: str) -> "_Context":
+        if name not in _CODE_TAGS and name not in ("li", "ul"):
+            return self
+        return _Context(
+            in_pre=self.in_pre or name == "pre",
+            in_code=self.in_code or name in _CODE_TAGS,
+            in_li=self.in_li or name == "li",
+            ul_depth=self.ul_depth + (name == "ul"),
+        )
+
+
+@dataclass
+class _Node:
+    """A tag with its ancestor context and siblings after whitespace removal."""
+
+    el: Tag
+    ctx: _Context
+    prev: object
+    next: object
+    index: int
+    parent_prev: object
+
+
+class MarkdownEmitter:
+    """Single-pass Markdown emitter matching markdownify's default output."""
+
+    def convert(self, root: Tag) -> str:
+        """Convert the children of a tag or soup to Markdown."""
+        return self._children_text(root, _Context(), as_inline=False, node_prev=None)
+
+    def _significant_children(self, node: Tag) -> list:
+        # Same whitespace-only text removal as markdownify, including its
+        # skipping of the node following a removed one
+        items = list(node.contents)
+        remove_inside = _removes_whitespace_inside(node)
+        i = 0
+        while i < len(items):
+            el = items[i]
+            i += 1
+            if not isinstance(el, NavigableString) or el.strip():
+                continue
+            prev = items[i - 2] if i >= 2 else None
+            nxt = items[i] if i < len(items) else None
+            if (
+                (remove_inside and (not prev or not nxt))
+                or _removes_whitespace_outside(prev)
+                or _removes_whitespace_outside(nxt)
+            ):
+                del items[i - 1]
+        return items
+
+    def _children_text(
+        self, node: Tag, ctx: _Context, as_inline: bool, node_prev: object
+    ) -> str:
+        items = self._significant_children(node)
+        parent_is_block = _removes_whitespace_inside(node)
+        parts: list[str] = []
+        last = len(items) - 1
+        for i, el in enumerate(items):
+            if isinstance(el, Comment | Doctype):
+                continue
+            prev = items[i - 1] if i > 0 else None
+            nxt = items[i + 1] if i < last else None
+            if isinstance(el, NavigableString):
+                parts.append(self._text(el, ctx, parent_is_block, prev, nxt))
+                continue
+
+            next_text = self._tag(_Node(el, ctx, prev, nxt, i, node_prev), as_inline)
+            next_text_strip = next_text.lstrip("\n")
+            newlines_right = len(next_text) - len(next_text_strip)
+            newlines_left = 0
+            while parts:
+                tail = parts[-1]
+                tail_strip = tail.rstrip("\n")
+                newlines_left += len(tail) - len(tail_strip)
+                if tail_strip:
+                    parts[-1] = tail_strip
+                    break
+                parts.pop()
+            parts.append("\n" * max(newlines_left, newlines_right))
+            parts.append(next_text_strip)
+        return "".join(parts)
+
+    def _text(
+        self,
+        el: NavigableString,
+        ctx: _Context,
+        parent_is_block: bool,
+        prev: object,
+        nxt: object,
+    ) -> str:
+        text = str(el)
+        if not ctx.in_pre:
+            text = _newline_whitespace_re.sub("\n", text)
+            text = _whitespace_re.sub(" ", text)
+        if not ctx.in_code and text:
+            text = text.replace("*", r"\*").replace("_", r"\_")
+        if _removes_whitespace_outside(prev) or (parent_is_block and not prev):
+            text = text.lstrip()
+        if _removes_whitespace_outside(nxt) or (parent_is_block and not nxt):
+            text = text.rstrip()
+        return text
+
+    def _tag(self, node: _Node, as_inline: bool) -> str:
+        el = node.el
+        name = el.name
+        children_inline = as_inline or name in ("td", "th")
+        if _heading_re.match(name) is not None:
+            children_inline = True
+        text = self._children_text(el, node.ctx.enter(name), children_inline, node.prev)
+
+        if name in _INLINE_MARKUP:
+            return self._inline(node, text, _INLINE_MARKUP[name])
+        convert = getattr(self, f"_convert_{name}", None)
+        if convert is not None:
+            return convert(node, text, as_inline)
+        heading = _heading_level_re.match(name)
+        if heading is not None:
+            return self._heading(int(heading.group(1)), text, as_inline)
+        return text
+
+    def _inline(self, node: _Node, text: str, markup: str) -> str:
+        if node.ctx.in_code:
+            return text
+        prefix, suffix, text = _chomp(text)
+        if not text:
+            return ""
+        return f"{prefix}{markup}{text}{markup}{suffix}"
+
+    def _heading(self, level: int, text: str, as_inline: bool) -> str:
+        if as_inline:
+            return text
+        level = max(1, min(6, level))
+        text = text.strip()
+        if level <= 2:
+            text = text.rstrip()
+            line = "=" if level == 1 else "-"
+            return f"\n\n{text}\n{line * len(text)}\n\n" if text else ""
+        text = _all_whitespace_re.sub(" ", text)
+        return f"\n{'#' * level} {text}\n\n"
+
+    def _convert_a(self, node: _Node, text: str, as_inline: bool) -> str:
+        prefix, suffix, text = _chomp(text)
+        if not text:
+            return ""
+        href = node.el.get("href")
+        title = node.el.get("title")
+        if text.replace(r"\_", "_") == href and not title:
+            return f"<{href}>"
+        title_part = ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+        return f"{prefix}[{text}]({href}{title_part}){suffix}" if href else text
+
+    def _convert_blockquote(self, node: _Node, text: str, as_inline: bool) -> str:
+        if as_inline:
+            return " " + text.strip() + " "
+        if not text:
+            return ""
+        return "\n" + _line_beginning_re.sub("> ", text.strip()) + "\n\n"
+
+    def _convert_br(self, node: _Node, text: str, as_inline: bool) -> str:
+        return "" if as_inline else "  \n"
+
+    def _convert_code(self, node: _Node, text: str, as_inline: bool) -> str:
+        if node.el.parent is not None and node.el.parent.name == "pre":
+            return text
+        return self._inline(node, text, "`")
+
+    _convert_kbd = _convert_code
+    _convert_samp = _convert_code
+
+    def _convert_hr(self, node: _Node, text: str, as_inline: bool) -> str:
+        return "\n\n---\n\n"
+
+    def _convert_img(self, node: _Node, text: str, as_inline: bool) -> str:
+        alt = node.el.attrs.get("alt") or ""
+        if as_inline:
+            return alt
+        src = node.el.attrs.get("src") or ""
+        title = node.el.attrs.get("title") or ""
+        title_part = ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+        return f"![{alt}]({src}{title_part})"
+
+    def _convert_list(self, node: _Node, text: str, as_inline: bool) -> str:
+        before_paragraph = bool(
+            node.next and getattr(node.next, "name", None) not in ("ul", "ol")
+        )
+        if node.ctx.in_li:
+            return "\n" + text.rstrip()
+        return "\n\n" + text + ("\n" if before_paragraph else "")
+
+    _convert_ul = _convert_list
+    _convert_ol = _convert_list
+
+    def _convert_li(self, node: _Node, text: str, as_inline: bool) -> str:
+        parent = node.el.parent
+        if parent is not None and parent.name == "ol":
+            start = parent.get("start")
+            if start and str(start).isnumeric():
+                bullet = f"{int(str(start)) + node.index}."
+            else:
+                bullet = f"{1 + node.index}."
+        else:
+            depth = node.ctx.ul_depth - 1
+            bullet = _BULLETS[depth % len(_BULLETS)]
+        bullet += " "
+        text = (text or "").strip()
+        if text:
+            text = _line_beginning_re.sub(" " * len(bullet), text)
+            text = bullet + text[len(bullet) :]
+        return f"{text}\n"
+
+    def _convert_p(self, node: _Node, text: str, as_inline: bool) -> str:
+        if as_inline:
+            return " " + text.strip() + " "
+        return f"\n\n{text}\n\n" if text else ""
+
+    def _convert_pre(self, node: _Node, text: str, as_inline: bool) -> str:
+        return f"\n```\n{text}\n```\n" if text else ""
+
+    def _convert_script(self, node: _Node, text: str, as_inline: bool) -> str:
+        return ""
+
+    _convert_style = _convert_script
+
+    def _convert_table(self, node: _Node, text: str, as_inline: bool) -> str:
+        return "\n\n" + text + "\n"
+
+    def _convert_caption(self, node: _Node, text: str, as_inline: bool) -> str:
+        return text + "\n"
+
+    def _convert_figcaption(self, node: _Node, text: str, as_inline: bool) -> str:
+        return "\n\n" + text + "\n\n"
+
+    def _convert_td(self, node: _Node, text: str, as_inline: bool) -> str:
+        return " " + text.strip().replace("\n", " ") + " |" * _colspan(node.el)
+
+    _convert_th = _convert_td
+
+    def _convert_tr(self, node: _Node, text: str, as_inline: bool) -> str:
+        el = node.el
+        parent = el.parent
+        parent_name = parent.name if parent is not None else None
+        cells = el.find_all(["td", "th"])
+        is_headrow = (
+            all(cell.name == "th" for cell in cells)
+            or (not node.prev and parent_name != "tbody")
+            or (
+                not node.prev
+                and parent_name == "tbody"
+                and parent is not None
+                and parent.parent is not None
+                and len(parent.parent.find_all(["thead"])) < 1
+            )
+        )
+        overline = ""
+        underline = ""
+        if is_headrow and not node.prev:
+            full_colspan = sum(_colspan(cell) for cell in cells)
+            underline = "| " + " | ".join(["---"] * full_colspan) + " |\n"
+        elif not node.prev and (
+            parent_name == "table" or (parent_name == "tbody" and not node.parent_prev)
+        ):
+            overline = "| " + " | ".join([""] * len(cells)) + " |\n"
+            overline += "| " + " | ".join(["---"] * len(cells)) + " |\n"
+        return overline + "|" + text + "\n" + underline
@@ -1,26 +1,220 @@
-"""Jira-specific text preprocessing module."""
+"""Jira-specific text preprocessing module.
+
+Jira wiki markup and Markdown are converted by ordered rule tables whose
+patterns are compiled once at import. Each rule names literal trigger strings
+that must occur for its pattern to match, so rules that cannot apply to a
+text are skipped without scanning it with a regex.
+"""
 
 import logging
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from .base import BasePreprocessor
+from .conversion_cache import memoized_conversion
 
 logger = logging.getLogger("mcp-atlassian")
 
 
+@dataclass(frozen=True)
+class _Rule:
+    """A precompiled substitution applied to the whole text."""
+
+    pattern: re.Pattern[str]
+    replacement: str | Callable[[re.Match[str]], str]
+    # Literals one of which must occur for the pattern to match; empty = always
+    triggers: tuple[str, ...] = ()
+
+    def apply(self, text: str) -> str:
+        if self.triggers and not any(trigger in text for trigger in self.triggers):
+            return text
+        return self.pattern.sub(self.replacement, text)
+
+
+def _apply_rules(text: str, rules: tuple[_Rule, ...]) -> str:
+    for rule in rules:
+        text = rule.apply(text)
+    return text
+
+
+def _jira_emphasis(match: re.Match[str]) -> str:
+    if match.group(1) is not None:
+        return "**" + match.group(1) + "**"
+    return "*" + match.group(2) + "*"
+
+
+def _jira_quote(match: re.Match[str]) -> str:
+    return "\n".join(f"> {line}" for line in match.group(1).split("\n"))
+
+
+def _markdown_code_block(match: re.Match[str]) -> str:
+    syntax = match.group(1) or ""
+    return "{code" + (":" + syntax if syntax else "") + "}" + match.group(2) + "{code}"
+
+
+def _markdown_underlined_header(match: re.Match[str]) -> str:
+    return f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}"
+
+
+def _markdown_emphasis(match: re.Match[str]) -> str:
+    marker = "_" if len(match.group(1)) == 1 else "*"
+    return marker + match.group(2) + marker
+
+
+def _markdown_bullet(match: re.Match[str]) -> str:
+    if not match.group(1):
+        return "* " + match.group(2)
+    return "  " * (len(match.group(1)) // 2) + "* " + match.group(2)
+
+
+def _markdown_numbered(match: re.Match[str]) -> str:
+    return "#" * (int(len(match.group(1)) / 4) + 2) + " " + match.group(2)
+
+
+_MENTION_RE = re.compile(r"\[~accountid:(.*?)\]")
+_SMART_LINK_RE = re.compile(r"\[(.*?)\|(.*?)\|smart-link\]")
+_ISSUE_BROWSE_RE = re.compile(r"browse/([A-Z]+-\d+)")
+_CONFLUENCE_PAGE_RE = re.compile(r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)")
+_ISSUE_KEY_PREFIX_RE = re.compile(r"^[A-Z]+-\d+\s+")
+
+# Jira markup -> Markdown, applied in order around the list conversion
+_JIRA_BLOCK_RULES = (
+    # Block quotes
+    _Rule(re.compile(r"^bq\.(.*)$", re.MULTILINE), r"> \1\n", ("bq.",)),
+    # Text formatting (bold, italic)
+    _Rule(re.compile(r"\*([^\n*]*)\*|_([^\n_]*)_"), _jira_emphasis, ("*", "_")),
+)
+_JIRA_LIST_RE = re.compile(r"^([#\-+*]+) (.*)$", re.MULTILINE)
+_JIRA_INLINE_RULES = (
+    # Headers
+    _Rule(
+        re.compile(r"^h([0-6])\.(.*)$", re.MULTILINE),
+        lambda match: "#" * int(match.group(1)) + match.group(2),
+        ("h",),
+    ),
+    # Inline code
+    _Rule(re.compile(r"\{\{([^}]+)\}\}"), r"`\1`", ("{{",)),
+    # Citation
+    _Rule(re.compile(r"\?\?((?:.[^?]|[^?].)+)\?\?"), r"<cite>\1</cite>", ("??",)),
+    # Inserted text
+    _Rule(re.compile(r"\+([^+]*)\+"), r"<ins>\1</ins>", ("+",)),
+    # Superscript
+    _Rule(re.compile(r"\^([^^]*)\^"), r"<sup>\1</sup>", ("^",)),
+    # Subscript
+    _Rule(re.compile(r"~([^~]*)~"), r"<sub>\1</sub>", ("~",)),
+    # Code blocks with optional language specification
+    _Rule(
+        re.compile(r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}", re.MULTILINE),
+        r"```\1\n\2\n```",
+        ("{code",),
+    ),
+    # No format
+    _Rule(
+        re.compile(r"\{noformat\}([\s\S]*?)\{noformat\}"),
+        r"```\n\1\n```",
+        ("{noformat}",),
+    ),
+    # Quote blocks
+    _Rule(
+        re.compile(r"\{quote\}([\s\S]*)\{quote\}", re.MULTILINE),
+        _jira_quote,
+        ("{quote}",),
+    ),
+    # Images with alt text
+    _Rule(
+        re.compile(r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!"),
+        r"![\3](\1)",
+        ("!",),
+    ),
+    # Images with other parameters (ignore them)
+    _Rule(re.compile(r"!([^|\n\s]+)\|([^\n!]*)!"), r"![](\1)", ("!",)),
+    # Images without parameters
+    _Rule(re.compile(r"!([^\n\s!]+)!"), r"![](\1)", ("!",)),
+    # Links
+    _Rule(re.compile(r"\[([^|]+)\|(.+?)\]"), r"[\1](\2)", ("[",)),
+    _Rule(re.compile(r"\[(.+?)\]([^\(]+)"), r"<\1>\2", ("[",)),
+    # Colored text
+    _Rule(
+        re.compile(r"\{color:([^}]+)\}([\s\S]*?)\{color\}", re.MULTILINE),
+        r"<span style=\"color:\1\">\2</span>",
+        ("{color:",),
+    ),
+)
+
+# Markdown -> Jira markup, applied in order
+_HTML_TAG_MARKUP = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
+_MARKDOWN_RULES = (
+    # Code blocks and inline code
+    _Rule(re.compile(r"```(\w*)\n([\s\S]+?)```"), _markdown_code_block, ("```",)),
+    _Rule(re.compile(r"`([^`]+)`"), r"{{\1}}", ("`",)),
+    # Headers with = or - underlines
+    _Rule(
+        re.compile(r"^(.*)\n([=-])+$", re.MULTILINE),
+        _markdown_underlined_header,
+        ("=", "-"),
+    ),
+    # Headers with # prefix
+    _Rule(
+        re.compile(r"^(#+)(.*)$", re.MULTILINE),
+        lambda match: f"h{len(match.group(1))}." + match.group(2),
+        ("#",),
+    ),
+    # Bold and italic
+    _Rule(re.compile(r"([*_]+)(.*?)\1"), _markdown_emphasis, ("*", "_")),
+    # Multi-level bulleted list
+    _Rule(re.compile(r"^(\s*)- (.*)$", re.MULTILINE), _markdown_bullet, ("- ",)),
+    # Multi-level numbered list
+    _Rule(re.compile(r"^(\s+)1\. (.*)$", re.MULTILINE), _markdown_numbered, ("1. ",)),
+    # HTML formatting tags to Jira markup
+    *(
+        _Rule(
+            re.compile(rf"<{tag}>(.*?)<\/{tag}>"),
+            rf"{markup}\1{markup}",
+            (f"<{tag}>",),
+        )
+        for tag, markup in _HTML_TAG_MARKUP.items()
+    ),
+    # Colored text
+    _Rule(
+        re.compile(r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>", re.MULTILINE),
+        r"{color:\1}\2{color}",
+        ('<span style="color:',),
+    ),
+    # Strikethrough
+    _Rule(re.compile(r"~~(.*?)~~"), r"-\1-", ("~~",)),
+    # Images without alt text
+    _Rule(re.compile(r"!\[\]\(([^)\n\s]+)\)"), r"!\1!", ("![",)),
+    # Images with alt text
+    _Rule(re.compile(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)"), r"!\2|alt=\1!", ("![",)),
+    # Links
+    _Rule(re.compile(r"\[([^\]]+)\]\(([^)]+)\)"), r"[\1|\2]", ("](",)),
+    _Rule(re.compile(r"<([^>]+)>"), r"[\1]", ("<",)),
+)
+_MARKDOWN_TABLE_SEPARATOR_RE = re.compile(r"\|[-\s|]+\|")
+
+
 class JiraPreprocessor(BasePreprocessor):
     """Handles text preprocessing for Jira content."""
 
-    def __init__(self, base_url: str = "", **kwargs: Any) -> None:
+    def __init__(
+        self,
+        base_url: str = "",
+        display_name_for: Callable[[str], str | None] | None = None,
+        **kwargs: Any,
+    ) -> None:
         """
         Initialize the Jira text preprocessor.
 
         Args:
             base_url: Base URL for Jira API
+            display_name_for: Returns the known display name of an account ID,
+                or None, used to render user mentions
             **kwargs: Additional arguments for the base class
         """
         super().__init__(base_url=base_url, **kwargs)
+        self.display_name_for = display_name_for
 
     def clean_jira_text(self, text: str) -> str:
         """
@@ -32,10 +226,14 @@ class JiraPreprocessor(BasePreprocessor):
         if not text:
             return ""
 
-        # Process user mentions
+        # Mentions are rendered with names known to this client's credentials,
+        # so they are resolved before the shared conversion cache is consulted
         mention_pattern = r"\[~accountid:(.*?)\]"
-        text = self._process_mentions(text, mention_pattern)
+        return self._clean_jira_markup(self._process_mentions(text, mention_pattern))
 
+    @memoized_conversion()
+    def _clean_jira_markup(self, text: str) -> str:
+        """Convert Jira text whose user mentions are already rendered."""
         # Process Jira smart links
         text = self._process_smart_links(text)
 
@@ -56,51 +254,59 @@ class JiraPreprocessor(BasePreprocessor):
             pattern: Regular expression pattern to match mentions
 
         Returns:
-            Text with mentions replaced with display names
+            Text with mentions replaced with display names, or ``User:<id>``
+            for accounts whose name is not known
         """
-        mentions = re.findall(pattern, text)
-        for account_id in mentions:
-            try:
-                # Note: This is a placeholder - actual user fetching should be injected
-                display_name = f"User:{account_id}"
-                text = text.replace(f"[~accountid:{account_id}]", display_name)
-            except Exception as e:
-                logger.error(f"Error processing mention for {account_id}: {str(e)}")
-        return text
+        account_ids = set(re.findall(pattern, text))
+        if not account_ids:
+            return text
+
+        names: dict[str, str | None] = {
+            account_id: self.display_name_for(account_id)
+            if self.display_name_for
+            else None
+            for account_id in account_ids
+        }
+
+        def replace(match: re.Match[str]) -> str:
+            account_id = match.group(1)
+            if account_id not in account_ids:
+                return match.group(0)
+            name = names[account_id]
+            return f"@{name}" if name else f"User:{account_id}"
+
+        return _MENTION_RE.sub(replace, text)
 
     def _process_smart_links(self, text: str) -> str:
         """Process Jira/Confluence smart links."""
         # Pattern matches: [text|url|smart-link]
-        link_pattern = r"\[(.*?)\|(.*?)\|smart-link\]"
-        matches = re.finditer(link_pattern, text)
-
-        for match in matches:
-            full_match = match.group(0)
-            link_text = match.group(1)
-            link_url = match.group(2)
-
-            # Extract issue key if it's a Jira issue link
-            issue_key_match = re.search(r"browse/([A-Z]+-\d+)", link_url)
-            # Check if it's a Confluence wiki link
-            confluence_match = re.search(
-                r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)", link_url
-            )
-
-            if issue_key_match:
-                issue_key = issue_key_match.group(1)
-                clean_url = f"{self.base_url}/browse/{issue_key}"
-                text = text.replace(full_match, f"[{issue_key}]({clean_url})")
-            elif confluence_match:
-                url_title = confluence_match.group(1)
-                readable_title = url_title.replace("+", " ")
-                readable_title = re.sub(r"^[A-Z]+-\d+\s+", "", readable_title)
-                text = text.replace(full_match, f"[{readable_title}]({link_url})")
-            else:
-                clean_url = link_url.split("?")[0]
-                text = text.replace(full_match, f"[{link_text}]({clean_url})")
-
-        return text
-
+        if "|smart-link]" not in text:
+            return text
+        return _SMART_LINK_RE.sub(self._convert_smart_link, text)
+
+    def _convert_smart_link(self, match: re.Match[str]) -> str:
+        """Convert one smart link match to a Markdown link."""
+        link_text = match.group(1)
+        link_url = match.group(2)
+
+        # Extract issue key if it's a Jira issue link
+        issue_key_match = _ISSUE_BROWSE_RE.search(link_url)
+        # Check if it's a Confluence wiki link
+        confluence_match = _CONFLUENCE_PAGE_RE.search(link_url)
+
+        if issue_key_match:
+            issue_key = issue_key_match.group(1)
+            clean_url = f"{self.base_url}/browse/{issue_key}"
+            return f"[{issue_key}]({clean_url})"
+        if confluence_match:
+            url_title = confluence_match.group(1)
+            readable_title = url_title.replace("+", " ")
+            readable_title = _ISSUE_KEY_PREFIX_RE.sub("", readable_title)
+            return f"[{readable_title}]({link_url})"
+        clean_url = link_url.split("?")[0]
+        return f"[{link_text}]({clean_url})"
+
+    @memoized_conversion()
     def jira_to_markdown(self, input_text: str) -> str:
         """
         Convert Jira markup to Markdown format.
@@ -114,122 +320,32 @@ class JiraPreprocessor(BasePreprocessor):
         if not input_text:
             return ""
 
-        # Block quotes
-        output = re.sub(r"^bq\.(.*?)$", r"> \1\n", input_text, flags=re.MULTILINE)
-
-        # Text formatting (bold, italic)
-        output = re.sub(
-            r"([*_])(.*?)\1",
-            lambda match: ("**" if match.group(1) == "*" else "*")
-            + match.group(2)
-            + ("**" if match.group(1) == "*" else "*"),
-            output,
-        )
+        output = _apply_rules(input_text, _JIRA_BLOCK_RULES)
 
         # Multi-level numbered list
-        output = re.sub(
-            r"^((?:#|-|\+|\*)+) (.*)$",
-            lambda match: self._convert_jira_list_to_markdown(match),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Headers
-        output = re.sub(
-            r"^h([0-6])\.(.*)$",
-            lambda match: "#" * int(match.group(1)) + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Inline code
-        output = re.sub(r"\{\{([^}]+)\}\}", r"`\1`", output)
-
-        # Citation
-        output = re.sub(r"\?\?((?:.[^?]|[^?].)+)\?\?", r"<cite>\1</cite>", output)
+        output = _JIRA_LIST_RE.sub(self._convert_jira_list_to_markdown, output)
 
-        # Inserted text
-        output = re.sub(r"\+([^+]*)\+", r"<ins>\1</ins>", output)
-
-        # Superscript
-        output = re.sub(r"\^([^^]*)\^", r"<sup>\1</sup>", output)
-
-        # Subscript
-        output = re.sub(r"~([^~]*)~", r"<sub>\1</sub>", output)
-
-        # Strikethrough
-        output = re.sub(r"-([^-]*)-", r"-\1-", output)
-
-        # Code blocks with optional language specification
-        output = re.sub(
-            r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}",
-            r"```\1\n\2\n```",
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # No format
-        output = re.sub(r"\{noformat\}([\s\S]*?)\{noformat\}", r"```\n\1\n```", output)
-
-        # Quote blocks
-        output = re.sub(
-            r"\{quote\}([\s\S]*)\{quote\}",
-            lambda match: "\n".join(
-                [f"> {line}" for line in match.group(1).split("\n")]
-            ),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Images with alt text
-        output = re.sub(
-            r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!",
-            r"![\3](\1)",
-            output,
-        )
-
-        # Images with other parameters (ignore them)
-        output = re.sub(r"!([^|\n\s]+)\|([^\n!]*)!", r"![](\1)", output)
-
-        # Images without parameters
-        output = re.sub(r"!([^\n\s!]+)!", r"![](\1)", output)
-
-        # Links
-        output = re.sub(r"\[([^|]+)\|(.+?)\]", r"[\1](\2)", output)
-        output = re.sub(r"\[(.+?)\]([^\(]+)", r"<\1>\2", output)
-
-        # Colored text
-        output = re.sub(
-            r"\{color:([^}]+)\}([\s\S]*?)\{color\}",
-            r"<span style=\"color:\1\">\2</span>",
-            output,
-            flags=re.MULTILINE,
-        )
+        output = _apply_rules(output, _JIRA_INLINE_RULES)
 
         # Convert Jira table headers (||) to markdown table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            if "||" in line:
-                # Replace Jira table headers
-                lines[i] = lines[i].replace("||", "|")
-
-                # Add a separator line for markdown tables
-                header_cells = lines[i].count("|") - 1
-                if header_cells > 0:
-                    separator_line = "|" + "---|" * header_cells
-                    lines.insert(i + 1, separator_line)
-                    i += 1  # Skip the newly inserted line in next iteration
-
-            i += 1
-
-        # Rejoin the lines
-        output = "\n".join(lines)
-
-        return output
-
+        if "||" not in output:
+            return output
+        lines: list[str] = []
+        for line in output.split("\n"):
+            if "||" not in line:
+                lines.append(line)
+                continue
+            # Replace Jira table headers
+            line = line.replace("||", "|")
+            lines.append(line)
+            # Add a separator line for markdown tables
+            header_cells = line.count("|") - 1
+            if header_cells > 0:
+                lines.append("|" + "---|" * header_cells)
+
+        return "\n".join(lines)
+
+    @memoized_conversion()
     def markdown_to_jira(self, input_text: str) -> str:
         """
         Convert Markdown syntax to Jira markup syntax.
@@ -243,141 +359,26 @@ class JiraPreprocessor(BasePreprocessor):
         if not input_text:
             return ""
 
-        # Save code blocks to prevent recursive processing
-        code_blocks = []
-        inline_codes = []
-
-        # Extract code blocks
-        def save_code_block(match: re.Match) -> str:
-            """
-            Process and save a code block.
-
-            Args:
-                match: Regex match object containing the code block
-
-            Returns:
-                Jira-formatted code block
-            """
-            syntax = match.group(1) or ""
-            content = match.group(2)
-            code = "{code"
-            if syntax:
-                code += ":" + syntax
-            code += "}" + content + "{code}"
-            code_blocks.append(code)
-            return str(code)  # Ensure we return a string
-
-        # Extract inline code
-        def save_inline_code(match: re.Match) -> str:
-            """
-            Process and save inline code.
-
-            Args:
-                match: Regex match object containing the inline code
-
-            Returns:
-                Jira-formatted inline code
-            """
-            content = match.group(1)
-            code = "{{" + content + "}}"
-            inline_codes.append(code)
-            return str(code)  # Ensure we return a string
-
-        # Save code sections temporarily
-        output = re.sub(r"```(\w*)\n([\s\S]+?)```", save_code_block, input_text)
-        output = re.sub(r"`([^`]+)`", save_inline_code, output)
-
-        # Headers with = or - underlines
-        output = re.sub(
-            r"^(.*?)\n([=-])+$",
-            lambda match: f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}",
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Headers with # prefix
-        output = re.sub(
-            r"^([#]+)(.*?)$",
-            lambda match: f"h{len(match.group(1))}." + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Bold and italic
-        output = re.sub(
-            r"([*_]+)(.*?)\1",
-            lambda match: ("_" if len(match.group(1)) == 1 else "*")
-            + match.group(2)
-            + ("_" if len(match.group(1)) == 1 else "*"),
-            output,
-        )
-
-        # Multi-level bulleted list
-        output = re.sub(
-            r"^(\s*)- (.*)$",
-            lambda match: (
-                "* " + match.group(2)
-                if not match.group(1)
-                else "  " * (len(match.group(1)) // 2) + "* " + match.group(2)
-            ),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Multi-level numbered list
-        output = re.sub(
-            r"^(\s+)1\. (.*)$",
-            lambda match: "#" * (int(len(match.group(1)) / 4) + 2)
-            + " "
-            + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # HTML formatting tags to Jira markup
-        tag_map = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
-
-        for tag, replacement in tag_map.items():
-            output = re.sub(
-                rf"<{tag}>(.*?)<\/{tag}>", rf"{replacement}\1{replacement}", output
-            )
-
-        # Colored text
-        output = re.sub(
-            r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>",
-            r"{color:\1}\2{color}",
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Strikethrough
-        output = re.sub(r"~~(.*?)~~", r"-\1-", output)
-
-        # Images without alt text
-        output = re.sub(r"!\[\]\(([^)\n\s]+)\)", r"!\1!", output)
-
-        # Images with alt text
-        output = re.sub(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)", r"!\2|alt=\1!", output)
-
-        # Links
-        output = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"[\1|\2]", output)
-        output = re.sub(r"<([^>]+)>", r"[\1]", output)
+        output = _apply_rules(input_text, _MARKDOWN_RULES)
 
         # Convert markdown tables to Jira table format
-        lines = output.split("\n")
+        if "|" not in output:
+            return output
+        source = output.split("\n")
+        lines: list[str] = []
         i = 0
-        while i < len(lines):
-            if i < len(lines) - 1 and re.match(r"\|[-\s|]+\|", lines[i + 1]):
-                # Convert header row to Jira format
-                lines[i] = lines[i].replace("|", "||")
-                # Remove the separator line
-                lines.pop(i + 1)
-            i += 1
-
-        # Rejoin the lines
-        output = "\n".join(lines)
-
-        return output
+        while i < len(source):
+            if i < len(source) - 1 and _MARKDOWN_TABLE_SEPARATOR_RE.match(
+                source[i + 1]
+            ):
+                # Convert header row to Jira format and drop the separator line
+                lines.append(source[i].replace("|", "||"))
+                i += 2
+            else:
+                lines.append(source[i])
+                i += 1
+
+        return "\n".join(lines)
 
     def _convert_jira_list_to_markdown(self, match: re.Match) -> str:
         """
@@ -0,0 +1,135 @@
+"""Shared, batched lookup of Confluence user display names.
+
+User mentions and profile macros only carry an account ID (Cloud) or user key
+(Server/DC). Display names are resolved once per distinct user, concurrently,
+and kept in a process-wide cache keyed by the credentials they were resolved
+with (see credential_identity) for CONFLUENCE_USER_CACHE_TTL seconds. Users
+Confluence reports as not found are remembered for
+CONFLUENCE_USER_CACHE_NEGATIVE_TTL seconds; lookups that failed for another
+reason (throttling, server or network errors) are not cached.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from atlassian.errors import ApiNotFoundError
+from cachetools import TTLCache
+from requests.exceptions import HTTPError
+
+logger = logging.getLogger("mcp-atlassian")
+
+ACCOUNT_ID = "account-id"
+USER_KEY = "userkey"
+
+# Distinct users fetched at once when resolving a page
+MAX_CONCURRENT_USER_LOOKUPS = 8
+
+UserRef = tuple[str, str]  # (ACCOUNT_ID | USER_KEY, identifier)
+
+_cache_lock = threading.Lock()
+_display_names: TTLCache[tuple[str, str, str], str] = TTLCache(
+    maxsize=int(os.getenv("CONFLUENCE_USER_CACHE_MAXSIZE", "4096")),
+    ttl=float(os.getenv("CONFLUENCE_USER_CACHE_TTL", "3600")),
+)
+_not_found: TTLCache[tuple[str, str, str], bool] = TTLCache(
+    maxsize=int(os.getenv("CONFLUENCE_USER_CACHE_MAXSIZE", "4096")),
+    ttl=float(os.getenv("CONFLUENCE_USER_CACHE_NEGATIVE_TTL", "60")),
+)
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Check whether a lookup failed because the user does not exist."""
+    if isinstance(error, ApiNotFoundError):
+        return True
+    response = getattr(error, "response", None)
+    return (
+        isinstance(error, HTTPError)
+        and response is not None
+        and response.status_code == 404
+    )
+
+
+def _fetch_display_name(client: Any, ref: UserRef) -> tuple[str | None, bool]:
+    """Fetch the display name of a user.
+
+    Returns:
+        Tuple of (display name or None, whether the answer may be cached)
+    """
+    kind, identifier = ref
+    try:
+        if kind == ACCOUNT_ID:
+            user_details = client.get_user_details_by_accountid(identifier)
+        else:
+            # For Confluence Server/DC, userkey might be the username
+            user_details = client.get_user_details_by_username(identifier)
+    except Exception as e:
+        if _is_not_found(e):
+            logger.debug(f"User {identifier} not found: {e}")
+            return None, True
+        # Not a verdict on the user: don't remember it as not found
+        logger.warning(f"Error fetching user details for {identifier}: {e}")
+        return None, False
+    if not isinstance(user_details, dict):
+        return None, True
+    return user_details.get("displayName") or None, True
+
+
+def resolve_display_names(
+    client: Any, credentials: str, refs: Iterable[UserRef]
+) -> dict[UserRef, str | None]:
+    """Resolve user references to display names.
+
+    Args:
+        client: Client providing get_user_details_by_accountid and
+            get_user_details_by_username
+        credentials: Identity of the credentials the client resolves users
+            with (see credential_identity)
+        refs: (ACCOUNT_ID or USER_KEY, identifier) pairs; duplicates are fine
+
+    Returns:
+        Display name per distinct reference, or None if it could not be resolved
+    """
+    resolved: dict[UserRef, str | None] = {}
+    missing: list[UserRef] = []
+    with _cache_lock:
+        for ref in dict.fromkeys(refs):
+            key = (credentials, *ref)
+            if key in _display_names:
+                resolved[ref] = _display_names[key]
+            elif key in _not_found:
+                resolved[ref] = None
+            else:
+                missing.append(ref)
+    if not missing:
+        return resolved
+
+    if len(missing) == 1:
+        fetched = [_fetch_display_name(client, missing[0])]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(len(missing), MAX_CONCURRENT_USER_LOOKUPS),
+            thread_name_prefix="confluence-user-lookup",
+        ) as executor:
+            fetched = list(
+                executor.map(lambda ref: _fetch_display_name(client, ref), missing)
+            )
+
+    with _cache_lock:
+        for ref, (display_name, cacheable) in zip(missing, fetched, strict=True):
+            resolved[ref] = display_name
+            if display_name:
+                _display_names[(credentials, *ref)] = display_name
+            elif cacheable:
+                _not_found[(credentials, *ref)] = True
+    return resolved
+
+
+def clear_display_name_cache() -> None:
+    """Drop all cached display names."""
+    with _cache_lock:
+        _display_names.clear()
+        _not_found.clear()
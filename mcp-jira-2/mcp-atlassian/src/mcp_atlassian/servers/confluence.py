@@ -1,17 +1,19 @@
 """Confluence FastMCP server instance and tool definitions."""
 
-import json
 import logging
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from mcp_atlassian.confluence.mirror import get_page_mirror
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.servers.dispatch import run_blocking
 from mcp_atlassian.utils.decorators import (
     check_write_access,
     convert_empty_defaults_to_none,
 )
+from mcp_atlassian.utils.output import OutputFormatArg, format_output
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,13 @@ confluence_mcp = FastMCP(
 )
 
 
+def _is_simple_query(query: str) -> bool:
+    """Check whether a search query is plain text rather than CQL."""
+    return bool(query) and not any(
+        x in query for x in ["=", "~", ">", "<", " AND ", " OR ", "currentUser()"]
+    )
+
+
 @convert_empty_defaults_to_none
 @confluence_mcp.tool(tags={"confluence", "read"})
 async def search(
@@ -69,6 +78,7 @@ async def search(
             default="",
         ),
     ] = "",
+    output_format: OutputFormatArg = "",
 ) -> str:
     """Search Confluence content using simple terms or CQL.
 
@@ -77,37 +87,200 @@ async def search(
         query: Search query - can be simple text or a CQL query string.
         limit: Maximum number of results (1-50).
         spaces_filter: Comma-separated list of space keys to filter by.
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
 
     Returns:
         JSON string representing a list of simplified Confluence page objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     # Check if the query is a simple search term or already a CQL query
-    if query and not any(
-        x in query for x in ["=", "~", ">", "<", " AND ", " OR ", "currentUser()"]
-    ):
+    if _is_simple_query(query):
         original_query = query
         try:
             query = f'siteSearch ~ "{original_query}"'
             logger.info(
                 f"Converting simple search term to CQL using siteSearch: {query}"
             )
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            pages = await run_blocking(
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
         except Exception as e:
             logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
             query = f'text ~ "{original_query}"'
             logger.info(f"Falling back to text search with CQL: {query}")
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            pages = await run_blocking(
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
     else:
-        pages = confluence_fetcher.search(
-            query, limit=limit, spaces_filter=spaces_filter
+        pages = await run_blocking(
+            confluence_fetcher.search, query, limit=limit, spaces_filter=spaces_filter
         )
     search_results = [page.to_simplified_dict() for page in pages]
-    return json.dumps(search_results, indent=2, ensure_ascii=False)
+    return format_output(search_results, output_format)
+
+
+@convert_empty_defaults_to_none
+@confluence_mcp.tool(tags={"confluence", "read"})
+async def search_all(
+    ctx: Context,
+    query: Annotated[
+        str,
+        Field(
+            description=(
+                "Search query - simple text (searched with 'siteSearch', falling back "
+                "to 'text') or a CQL query string. All matching content is fetched "
+                "page by page until the result budget is reached."
+            )
+        ),
+    ],
+    max_results: Annotated[
+        int,
+        Field(
+            description="Maximum number of results to return in total (1-1000)",
+            default=200,
+            ge=1,
+            le=1000,
+        ),
+    ] = 200,
+    page_size: Annotated[
+        int,
+        Field(
+            description="Results fetched per request (1-50)",
+            default=50,
+            ge=1,
+            le=50,
+        ),
+    ] = 50,
+    spaces_filter: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of space keys to filter results by. "
+                "Overrides the environment variable CONFLUENCE_SPACES_FILTER if provided."
+            ),
+            default="",
+        ),
+    ] = "",
+    output_format: OutputFormatArg = "",
+) -> str:
+    """Fetch all Confluence content matching a query, following pagination automatically.
+
+    Reports progress after every page and stops once max_results results
+    have been collected.
+
+    Args:
+        ctx: The FastMCP context.
+        query: Search query - can be simple text or a CQL query string.
+        max_results: Maximum number of results to return in total.
+        page_size: Results fetched per request.
+        spaces_filter: Comma-separated list of space keys to filter by.
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
+
+    Returns:
+        JSON string with the collected results and whether the budget was reached.
+    """
+    confluence_fetcher = await get_confluence_fetcher(ctx)
+
+    def iter_pages(cql: str) -> Any:
+        return confluence_fetcher.iter_search(
+            cql,
+            page_size=page_size,
+            max_results=max_results,
+            spaces_filter=spaces_filter,
+        )
+
+    if _is_simple_query(query):
+        pages = iter_pages(f'siteSearch ~ "{query}"')
+        try:
+            page = await run_blocking(next, pages, None)
+        except Exception as e:
+            logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
+            pages = iter_pages(f'text ~ "{query}"')
+            page = await run_blocking(next, pages, None)
+    else:
+        pages = iter_pages(query)
+        page = await run_blocking(next, pages, None)
+
+    results: list[dict[str, Any]] = []
+    while page is not None:
+        results.extend(result.to_simplified_dict() for result in page)
+        await ctx.report_progress(progress=len(results), total=max_results)
+        page = await run_blocking(next, pages, None)
+
+    result = {
+        "total_fetched": len(results),
+        "budget_reached": len(results) >= max_results,
+        "results": results,
+    }
+    return format_output(result, output_format)
+
+
+@convert_empty_defaults_to_none
+@confluence_mcp.tool(tags={"confluence", "read"})
+async def local_search(
+    ctx: Context,
+    query: Annotated[
+        str,
+        Field(
+            description=(
+                "Words to search for in page titles and bodies. All words must match; "
+                "end a word with '*' for a prefix match and put OR between words to "
+                "match either. Answered from the local page mirror without calling "
+                "Confluence, ranked by relevance."
+            )
+        ),
+    ],
+    spaces_filter: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of mirrored space keys to search. "
+                "Defaults to every mirrored space."
+            ),
+            default="",
+        ),
+    ] = "",
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of results (1-50)", default=10, ge=1, le=50),
+    ] = 10,
+    output_format: OutputFormatArg = "",
+) -> str:
+    """Full-text search of the local Confluence page mirror, ranked by BM25.
+
+    Args:
+        ctx: The FastMCP context.
+        query: Words to search for.
+        spaces_filter: Comma-separated list of space keys to search.
+        limit: Maximum number of results.
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
+
+    Returns:
+        JSON string with the matching pages, their snippets and the mirror's staleness.
+
+    Raises:
+        ValueError: If the mirror is not configured or was synced as another user.
+    """
+    confluence_fetcher = await get_confluence_fetcher(ctx)
+    found = await run_blocking(
+        get_page_mirror().search_text,
+        confluence_fetcher,
+        query,
+        spaces=spaces_filter.split(",") if spaces_filter else None,
+        limit=limit,
+    )
+    result = {
+        "source": "local",
+        "staleness_seconds": round(found.staleness, 1),
+        "results": found.value,
+    }
+    return format_output(result, output_format)
 
 
 @convert_empty_defaults_to_none
@@ -185,27 +358,28 @@ async def get_page(
                 "page_id was provided; title and space_key parameters will be ignored."
             )
         try:
-            page_object = confluence_fetcher.get_page_content(
-                page_id, convert_to_markdown=convert_to_markdown
+            page_object = await run_blocking(
+                confluence_fetcher.get_page_content,
+                page_id,
+                convert_to_markdown=convert_to_markdown,
             )
         except Exception as e:
             logger.error(f"Error fetching page by ID '{page_id}': {e}")
-            return json.dumps(
-                {"error": f"Failed to retrieve page by ID '{page_id}': {e}"},
-                indent=2,
-                ensure_ascii=False,
+            return format_output(
+                {"error": f"Failed to retrieve page by ID '{page_id}': {e}"}
             )
     elif title and space_key:
-        page_object = confluence_fetcher.get_page_by_title(
-            space_key, title, convert_to_markdown=convert_to_markdown
+        page_object = await run_blocking(
+            confluence_fetcher.get_page_by_title,
+            space_key,
+            title,
+            convert_to_markdown=convert_to_markdown,
         )
         if not page_object:
-            return json.dumps(
+            return format_output(
                 {
                     "error": f"Page with title '{title}' not found in space '{space_key}'."
-                },
-                indent=2,
-                ensure_ascii=False,
+                }
             )
     else:
         raise ValueError(
@@ -213,18 +387,14 @@ async def get_page(
         )
 
     if not page_object:
-        return json.dumps(
-            {"error": "Page not found with the provided identifiers."},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return format_output({"error": "Page not found with the provided identifiers."})
 
     if include_metadata:
         result = {"metadata": page_object.to_simplified_dict()}
     else:
         result = {"content": {"value": page_object.content}}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -270,6 +440,7 @@ async def get_page_children(
         int,
         Field(description="Starting index for pagination (0-based)", default=0, ge=0),
     ] = 0,
+    output_format: OutputFormatArg = "",
 ) -> str:
     """Get child pages of a specific Confluence page.
 
@@ -281,6 +452,7 @@ async def get_page_children(
         include_content: Whether to include page content.
         convert_to_markdown: Convert content to markdown if include_content is true.
         start: Starting index for pagination.
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
 
     Returns:
         JSON string representing a list of child page objects.
@@ -290,7 +462,7 @@ async def get_page_children(
         expand = f"{expand},body.storage" if expand else "body.storage"
 
     try:
-        pages = confluence_fetcher.get_page_children(
+        pages = await confluence_fetcher.get_page_children_async(
             page_id=parent_id,
             start=start,
             limit=limit,
@@ -312,7 +484,7 @@ async def get_page_children(
         )
         result = {"error": f"Failed to get child pages: {e}"}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result, output_format)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -339,9 +511,9 @@ async def get_comments(
         JSON string representing a list of comment objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    comments = confluence_fetcher.get_page_comments(page_id)
+    comments = await run_blocking(confluence_fetcher.get_page_comments, page_id)
     formatted_comments = [comment.to_simplified_dict() for comment in comments]
-    return json.dumps(formatted_comments, indent=2, ensure_ascii=False)
+    return format_output(formatted_comments)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -368,9 +540,9 @@ async def get_labels(
         JSON string representing a list of label objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.get_page_labels(page_id)
+    labels = await run_blocking(confluence_fetcher.get_page_labels, page_id)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return format_output(formatted_labels)
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -394,9 +566,9 @@ async def add_label(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.add_page_label(page_id, name)
+    labels = await run_blocking(confluence_fetcher.add_page_label, page_id, name)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return format_output(formatted_labels)
 
 
 @convert_empty_defaults_to_none
@@ -441,7 +613,8 @@ async def create_page(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    page = confluence_fetcher.create_page(
+    page = await run_blocking(
+        confluence_fetcher.create_page,
         space_key=space_key,
         title=title,
         body=content,
@@ -449,11 +622,7 @@ async def create_page(
         is_markdown=True,
     )
     result = page.to_simplified_dict()
-    return json.dumps(
-        {"message": "Page created successfully", "page": result},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return format_output({"message": "Page created successfully", "page": result})
 
 
 @convert_empty_defaults_to_none
@@ -498,7 +667,8 @@ async def update_page(
     # TODO: revert this once Cursor IDE handles optional parameters with Union types correctly.
     actual_parent_id = parent_id if parent_id else None
 
-    updated_page = confluence_fetcher.update_page(
+    updated_page = await run_blocking(
+        confluence_fetcher.update_page,
         page_id=page_id,
         title=title,
         body=content,
@@ -508,11 +678,7 @@ async def update_page(
         parent_id=actual_parent_id,
     )
     page_data = updated_page.to_simplified_dict()
-    return json.dumps(
-        {"message": "Page updated successfully", "page": page_data},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return format_output({"message": "Page updated successfully", "page": page_data})
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -535,7 +701,7 @@ async def delete_page(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        result = confluence_fetcher.delete_page(page_id=page_id)
+        result = await run_blocking(confluence_fetcher.delete_page, page_id=page_id)
         if result:
             response = {
                 "success": True,
@@ -554,7 +720,7 @@ async def delete_page(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return format_output(response)
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -583,7 +749,9 @@ async def add_comment(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        comment = confluence_fetcher.add_comment(page_id=page_id, content=content)
+        comment = await run_blocking(
+            confluence_fetcher.add_comment, page_id=page_id, content=content
+        )
         if comment:
             comment_data = comment.to_simplified_dict()
             response = {
@@ -604,4 +772,4 @@ async def add_comment(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return format_output(response)
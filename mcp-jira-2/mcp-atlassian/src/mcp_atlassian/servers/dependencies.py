@@ -6,9 +6,16 @@ Provides get_jira_fetcher and get_confluence_fetcher for use in tool functions.
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import logging
-from typing import TYPE_CHECKING, Any
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
+import httpx
+from cachetools import TLRUCache
 from fastmcp import Context
 from fastmcp.server.dependencies import get_http_request
 from starlette.requests import Request
@@ -16,7 +23,8 @@ from starlette.requests import Request
 from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
 from mcp_atlassian.jira import JiraConfig, JiraFetcher
 from mcp_atlassian.servers.context import MainAppContext
-from mcp_atlassian.utils.oauth import OAuthConfig
+from mcp_atlassian.servers.dispatch import run_blocking
+from mcp_atlassian.utils.oauth import TOKEN_EXPIRY_MARGIN, OAuthConfig
 
 if TYPE_CHECKING:
     from mcp_atlassian.confluence.config import (
@@ -26,6 +34,201 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
+FetcherType = TypeVar("FetcherType", JiraFetcher, ConfluenceFetcher)
+
+# Fetchers are expensive to build (new requests.Session, TLS handshake, empty
+# field caches), so they are pooled process-wide and keyed by credentials.
+FETCHER_CACHE_MAXSIZE = int(os.getenv("ATLASSIAN_FETCHER_CACHE_MAXSIZE", "100"))
+FETCHER_CACHE_TTL = int(os.getenv("ATLASSIAN_FETCHER_CACHE_TTL", "300"))
+
+
+@dataclasses.dataclass
+class _FetcherCacheEntry:
+    """A pooled fetcher together with the result of validating its credentials."""
+
+    fetcher: JiraFetcher | ConfluenceFetcher
+    validated: bool
+    validation_result: Any
+    expires_at: float
+
+
+def _fetcher_entry_ttu(key: str, entry: _FetcherCacheEntry, now: float) -> float:
+    """Time-to-use for a fetcher cache entry (see cachetools.TLRUCache)."""
+    return entry.expires_at
+
+
+class _FetcherCache(TLRUCache[str, _FetcherCacheEntry]):
+    """TLRUCache that retires the fetchers it evicts, expires or replaces.
+
+    Retired fetchers holding an open async HTTP client are closed by
+    ``close_retired_fetchers``; the cache is only used under
+    ``_fetcher_cache_lock``, which also guards ``_retired_fetchers``.
+    """
+
+    def expire(self, time: float | None = None) -> Any:
+        expired = super().expire(time)
+        for _, entry in expired:
+            _retire_fetcher(entry)
+        return expired
+
+    def popitem(self) -> tuple[str, _FetcherCacheEntry]:
+        key, entry = super().popitem()
+        _retire_fetcher(entry)
+        return key, entry
+
+    def __setitem__(self, key: str, value: _FetcherCacheEntry) -> None:  # type: ignore[override]
+        previous = self.get(key)
+        super().__setitem__(key, value)
+        if previous is not None and previous.fetcher is not value.fetcher:
+            _retire_fetcher(previous)
+
+
+_fetcher_cache: TLRUCache[str, _FetcherCacheEntry] = _FetcherCache(
+    maxsize=FETCHER_CACHE_MAXSIZE, ttu=_fetcher_entry_ttu, timer=time.time
+)
+_fetcher_cache_lock = threading.Lock()
+_retired_fetchers: list[JiraFetcher | ConfluenceFetcher] = []
+
+
+def _retire_fetcher(entry: _FetcherCacheEntry) -> None:
+    """Queue a dropped fetcher for closing if it opened an async HTTP client."""
+    if isinstance(getattr(entry.fetcher, "_async_client", None), httpx.AsyncClient):
+        _retired_fetchers.append(entry.fetcher)
+
+
+async def close_retired_fetchers() -> None:
+    """Close the async HTTP clients of fetchers dropped from the pool."""
+    with _fetcher_cache_lock:
+        retired = list(_retired_fetchers)
+        _retired_fetchers.clear()
+    for fetcher in retired:
+        try:
+            await fetcher.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close the async client of a fetcher: {e}")
+
+
+async def close_all_fetchers() -> None:
+    """Drop every pooled fetcher and close their async HTTP clients (shutdown)."""
+    clear_fetcher_cache()
+    await close_retired_fetchers()
+
+
+def _get_fetcher_cache_key(config: JiraConfig | ConfluenceConfig) -> str:
+    """Build a stable, non-reversible cache key for a fetcher configuration.
+
+    The key covers everything that changes how requests are sent: the product,
+    auth type and credentials, base URL, SSL verification and proxy settings.
+
+    Args:
+        config: The JiraConfig or ConfluenceConfig the fetcher is built from.
+
+    Returns:
+        SHA-256 hex digest identifying the configuration.
+    """
+    oauth_config = config.oauth_config
+    parts = [
+        type(config).__name__,
+        config.auth_type,
+        config.url,
+        config.username,
+        config.api_token,
+        config.personal_token,
+        oauth_config.cloud_id if oauth_config else None,
+        oauth_config.access_token if oauth_config else None,
+        oauth_config.refresh_token if oauth_config else None,
+        str(config.ssl_verify),
+        config.http_proxy,
+        config.https_proxy,
+        config.no_proxy,
+        config.socks_proxy,
+    ]
+    raw_key = "\x1f".join(part or "" for part in parts)
+    return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+
+def _get_fetcher_expiry(config: JiraConfig | ConfluenceConfig) -> float:
+    """Determine until when a pooled fetcher for this config may be reused.
+
+    Entries live for FETCHER_CACHE_TTL seconds, but never beyond the expiry of
+    a known OAuth access token, so a refreshed session is built in time.
+    """
+    expires_at = time.time() + FETCHER_CACHE_TTL
+    oauth_config = config.oauth_config
+    if config.auth_type == "oauth" and oauth_config and oauth_config.expires_at:
+        expires_at = min(expires_at, oauth_config.expires_at - TOKEN_EXPIRY_MARGIN)
+    return expires_at
+
+
+def _get_or_create_fetcher(
+    config: JiraConfig | ConfluenceConfig,
+    fetcher_class: type[FetcherType],
+    validate: Callable[[FetcherType], Any] | None = None,
+) -> tuple[FetcherType, Any]:
+    """Return a pooled fetcher for the config, creating and validating it if needed.
+
+    Args:
+        config: The configuration the fetcher should use.
+        fetcher_class: JiraFetcher or ConfluenceFetcher.
+        validate: Optional callable run once against a new fetcher to validate
+            its credentials. Its result is cached alongside the fetcher.
+
+    Returns:
+        Tuple of (fetcher, validation result). The validation result is None
+        when no validator was given.
+
+    Raises:
+        Exception: Whatever the fetcher constructor or validator raises. Failed
+            validations are not cached.
+    """
+    cache_key = _get_fetcher_cache_key(config)
+    with _fetcher_cache_lock:
+        entry = _fetcher_cache.get(cache_key)
+    if entry is not None and isinstance(entry.fetcher, fetcher_class):
+        if validate is None or entry.validated:
+            logger.debug(
+                f"Reusing pooled {fetcher_class.__name__} (key ...{cache_key[-8:]})"
+            )
+            return entry.fetcher, entry.validation_result  # type: ignore[return-value]
+
+    logger.debug(f"Creating new {fetcher_class.__name__} (key ...{cache_key[-8:]})")
+    fetcher = fetcher_class(config=config)
+    validation_result = validate(fetcher) if validate else None
+    new_entry = _FetcherCacheEntry(
+        fetcher=fetcher,
+        validated=validate is not None,
+        validation_result=validation_result,
+        expires_at=_get_fetcher_expiry(config),
+    )
+    with _fetcher_cache_lock:
+        _fetcher_cache[cache_key] = new_entry
+    return fetcher, validation_result
+
+
+def get_pooled_fetcher(
+    config: JiraConfig | ConfluenceConfig, fetcher_class: type[FetcherType]
+) -> FetcherType:
+    """Return the pooled fetcher for a server-side config, creating it if needed.
+
+    For work outside a tool call, such as startup warm-up and background
+    mirror syncs, which does not validate user credentials.
+
+    Args:
+        config: The configuration the fetcher should use.
+        fetcher_class: JiraFetcher or ConfluenceFetcher.
+
+    Returns:
+        The pooled fetcher.
+    """
+    fetcher, _ = _get_or_create_fetcher(config, fetcher_class)
+    return fetcher
+
+
+def clear_fetcher_cache() -> None:
+    """Drop all pooled fetchers (e.g. after configuration changes or in tests)."""
+    with _fetcher_cache_lock:
+        _fetcher_cache.clear()
+
 
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
@@ -144,6 +347,7 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
         ValueError: If configuration or credentials are invalid.
     """
     logger.debug(f"get_jira_fetcher: ENTERED. Context ID: {id(ctx)}")
+    await close_retired_fetchers()
     try:
         request: Request = get_http_request()
         logger.debug(
@@ -192,8 +396,12 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                 credentials=credentials,
             )
             try:
-                user_jira_fetcher = JiraFetcher(config=user_specific_config)
-                current_user_id = user_jira_fetcher.get_current_user_account_id()
+                user_jira_fetcher, current_user_id = await run_blocking(
+                    _get_or_create_fetcher,
+                    user_specific_config,
+                    JiraFetcher,
+                    validate=lambda fetcher: fetcher.get_current_user_account_id(),
+                )
                 logger.debug(
                     f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
                 )
@@ -225,7 +433,12 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             "get_jira_fetcher: Using global JiraFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_jira_config.auth_type}"
         )
-        return JiraFetcher(config=app_lifespan_ctx_global.full_jira_config)
+        global_jira_fetcher, _ = await run_blocking(
+            _get_or_create_fetcher,
+            app_lifespan_ctx_global.full_jira_config,
+            JiraFetcher,
+        )
+        return global_jira_fetcher
     logger.error("Jira configuration could not be resolved.")
     raise ValueError(
         "Jira client (fetcher) not available. Ensure server is configured correctly."
@@ -245,6 +458,7 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
         ValueError: If configuration or credentials are invalid.
     """
     logger.debug(f"get_confluence_fetcher: ENTERED. Context ID: {id(ctx)}")
+    await close_retired_fetchers()
     try:
         request: Request = get_http_request()
         logger.debug(
@@ -294,8 +508,12 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                 credentials=credentials,
             )
             try:
-                user_confluence_fetcher = ConfluenceFetcher(config=user_specific_config)
-                current_user_data = user_confluence_fetcher.get_current_user_info()
+                user_confluence_fetcher, current_user_data = await run_blocking(
+                    _get_or_create_fetcher,
+                    user_specific_config,
+                    ConfluenceFetcher,
+                    validate=lambda fetcher: fetcher.get_current_user_info(),
+                )
                 # Try to get email from Confluence if not provided (can happen with PAT)
                 derived_email = (
                     current_user_data.get("email")
@@ -344,7 +562,12 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             "get_confluence_fetcher: Using global ConfluenceFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_confluence_config.auth_type}"
         )
-        return ConfluenceFetcher(config=app_lifespan_ctx_global.full_confluence_config)
+        global_confluence_fetcher, _ = await run_blocking(
+            _get_or_create_fetcher,
+            app_lifespan_ctx_global.full_confluence_config,
+            ConfluenceFetcher,
+        )
+        return global_confluence_fetcher
     logger.error("Confluence configuration could not be resolved.")
     raise ValueError(
         "Confluence client (fetcher) not available. Ensure server is configured correctly."
@@ -0,0 +1,258 @@
+"""Dispatch layer that runs blocking fetcher calls off the event loop.
+
+JiraFetcher and ConfluenceFetcher are built on the synchronous ``requests``
+library. Calling them directly from ``async def`` tools blocks the event loop,
+so one slow request stalls every other client of the server. Tools therefore
+route fetcher calls through ``run_blocking``, which executes them on a bounded
+pool of worker threads with global and per-user concurrency limits.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import anyio
+import anyio.lowlevel
+import anyio.to_thread
+from fastmcp.server.dependencies import get_http_request
+
+logger = logging.getLogger("mcp-atlassian.servers.dispatch")
+
+T = TypeVar("T")
+
+GLOBAL_USER_KEY = "global"
+
+
+@dataclass
+class _LoopLimits:
+    """Concurrency limits bound to a single event loop.
+
+    anyio primitives are tied to the event loop they are created on, so each
+    running loop gets its own set of semaphores and its own thread limiter.
+    """
+
+    global_semaphore: anyio.Semaphore
+    thread_limiter: anyio.CapacityLimiter
+    user_semaphores: dict[str, anyio.Semaphore] = field(default_factory=dict)
+    user_refcounts: dict[str, int] = field(default_factory=dict)
+
+
+class ToolDispatcher:
+    """Runs blocking callables on a bounded pool of worker threads.
+
+    Calls are admitted in two stages: first a per-user semaphore (so a single
+    client cannot monopolize the server), then a global semaphore sized to
+    the worker pool. Calls waiting on either semaphore count towards the
+    queue depth. If the awaiting request is cancelled, queued work is dropped;
+    work that already started runs to completion and its result is discarded.
+    """
+
+    def __init__(self, max_workers: int, max_concurrent_per_user: int) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            max_workers: Number of worker threads, i.e. the global concurrency limit.
+            max_concurrent_per_user: Maximum concurrent calls for a single user.
+
+        Raises:
+            ValueError: If either limit is smaller than 1.
+        """
+        if max_workers < 1 or max_concurrent_per_user < 1:
+            raise ValueError("Dispatcher concurrency limits must be at least 1")
+        self.max_workers = max_workers
+        self.max_concurrent_per_user = max_concurrent_per_user
+        self._lock = threading.Lock()
+        self._loop_limits: weakref.WeakKeyDictionary[object, _LoopLimits] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._queued = 0
+        self._active = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+
+    @classmethod
+    def from_env(cls) -> ToolDispatcher:
+        """Create a dispatcher configured from environment variables.
+
+        Returns:
+            ToolDispatcher sized by ATLASSIAN_MAX_WORKERS (default 16) and
+            ATLASSIAN_MAX_CONCURRENT_PER_USER (default 4).
+        """
+        return cls(
+            max_workers=int(os.getenv("ATLASSIAN_MAX_WORKERS", "16")),
+            max_concurrent_per_user=int(
+                os.getenv("ATLASSIAN_MAX_CONCURRENT_PER_USER", "4")
+            ),
+        )
+
+    def _get_loop_limits(self) -> _LoopLimits:
+        token = anyio.lowlevel.current_token()
+        with self._lock:
+            limits = self._loop_limits.get(token)
+            if limits is None:
+                limits = _LoopLimits(
+                    global_semaphore=anyio.Semaphore(self.max_workers),
+                    thread_limiter=anyio.CapacityLimiter(self.max_workers),
+                )
+                self._loop_limits[token] = limits
+            return limits
+
+    def _acquire_user_semaphore(
+        self, limits: _LoopLimits, user_key: str
+    ) -> anyio.Semaphore:
+        semaphore = limits.user_semaphores.get(user_key)
+        if semaphore is None:
+            semaphore = anyio.Semaphore(self.max_concurrent_per_user)
+            limits.user_semaphores[user_key] = semaphore
+        limits.user_refcounts[user_key] = limits.user_refcounts.get(user_key, 0) + 1
+        return semaphore
+
+    def _release_user_semaphore(self, limits: _LoopLimits, user_key: str) -> None:
+        remaining = limits.user_refcounts.get(user_key, 1) - 1
+        if remaining <= 0:
+            limits.user_refcounts.pop(user_key, None)
+            limits.user_semaphores.pop(user_key, None)
+        else:
+            limits.user_refcounts[user_key] = remaining
+
+    def _update_counters(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, f"_{name}", getattr(self, f"_{name}") + delta)
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+    async def run(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        user_key: str = GLOBAL_USER_KEY,
+        **kwargs: Any,
+    ) -> T:
+        """Run a blocking callable on a worker thread.
+
+        Args:
+            func: The blocking callable, typically a bound fetcher method.
+            *args: Positional arguments for the callable.
+            user_key: Identity used for per-user concurrency limits.
+            **kwargs: Keyword arguments for the callable.
+
+        Returns:
+            Whatever the callable returns.
+
+        Raises:
+            Exception: Whatever the callable raises, or the backend's
+                cancellation exception if the awaiting request was cancelled.
+        """
+        limits = self._get_loop_limits()
+        user_semaphore = self._acquire_user_semaphore(limits, user_key)
+        self._update_counters(queued=1)
+        dequeued = False
+        try:
+            async with user_semaphore, limits.global_semaphore:
+                self._update_counters(queued=-1, active=1)
+                dequeued = True
+                try:
+                    call = functools.partial(
+                        contextvars.copy_context().run, func, *args, **kwargs
+                    )
+                    result = await anyio.to_thread.run_sync(
+                        call,
+                        abandon_on_cancel=True,
+                        limiter=limits.thread_limiter,
+                    )
+                except anyio.get_cancelled_exc_class():
+                    raise
+                except Exception:
+                    self._update_counters(failed=1)
+                    raise
+                finally:
+                    self._update_counters(active=-1)
+                self._update_counters(completed=1)
+                return result
+        except anyio.get_cancelled_exc_class():
+            self._update_counters(cancelled=1)
+            logger.info(
+                f"Cancelled dispatched call to {getattr(func, '__name__', func)} "
+                f"({'running' if dequeued else 'queued'})"
+            )
+            raise
+        finally:
+            if not dequeued:
+                self._update_counters(queued=-1)
+            self._release_user_semaphore(limits, user_key)
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of dispatcher metrics.
+
+        Returns:
+            Dictionary with pool limits, current queue depth and active calls,
+            the peak queue depth and completed/failed/cancelled counters.
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_concurrent_per_user": self.max_concurrent_per_user,
+                "queue_depth": self._queued,
+                "max_queue_depth": self._max_queue_depth,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "cancelled": self._cancelled,
+            }
+
+
+_dispatcher: ToolDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> ToolDispatcher:
+    """Return the process-wide dispatcher, creating it on first use."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = ToolDispatcher.from_env()
+        return _dispatcher
+
+
+def get_user_key() -> str:
+    """Identify the user behind the current request for per-user limits.
+
+    Requests authenticated with a per-user token are keyed by a hash of that
+    token; everything else shares the global key.
+
+    Returns:
+        A short, non-reversible user key.
+    """
+    try:
+        request = get_http_request()
+    except RuntimeError:
+        return GLOBAL_USER_KEY
+    token = getattr(request.state, "user_atlassian_token", None)
+    if not token or not isinstance(token, str):
+        return GLOBAL_USER_KEY
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking fetcher call on the shared dispatcher.
+
+    Args:
+        func: The blocking callable, typically a bound fetcher method.
+        *args: Positional arguments for the callable.
+        **kwargs: Keyword arguments for the callable.
+
+    Returns:
+        Whatever the callable returns.
+    """
+    return await get_dispatcher().run(func, *args, user_key=get_user_key(), **kwargs)
@@ -2,18 +2,22 @@
 
 import json
 import logging
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from fastmcp import Context, FastMCP
 from pydantic import Field
 from requests.exceptions import HTTPError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.jira.attachments import summarize_attachment_downloads
 from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
+from mcp_atlassian.jira.mirror import get_issue_mirror
 from mcp_atlassian.models.jira.common import JiraUser
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
+from mcp_atlassian.servers.dispatch import run_blocking
 from mcp_atlassian.utils import convert_empty_defaults_to_none
 from mcp_atlassian.utils.decorators import check_write_access
+from mcp_atlassian.utils.output import OutputFormatArg, format_output
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +52,9 @@ async def get_user_profile(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        user: JiraUser = jira.get_user_profile_by_identifier(user_identifier)
+        user: JiraUser = await run_blocking(
+            jira.get_user_profile_by_identifier, user_identifier
+        )
         result = user.to_simplified_dict()
         response_data = {"success": True, "user": result}
     except Exception as e:
@@ -78,7 +84,7 @@ async def get_user_profile(
             f"get_user_profile failed for '{user_identifier}': {error_message}",
         )
         response_data = error_result
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return format_output(response_data)
 
 
 @convert_empty_defaults_to_none
@@ -130,6 +136,17 @@ async def get_issue(
             default=True,
         ),
     ] = True,
+    source: Annotated[
+        Literal["live", "mirror"],
+        Field(
+            description=(
+                "(Optional) 'mirror' to answer from the local issue mirror when it is "
+                "fresh enough and can evaluate the request, falling back to Jira "
+                "otherwise. Mirror answers report their staleness in seconds."
+            ),
+            default="live",
+        ),
+    ] = "live",
 ) -> str:
     """Get details of a specific Jira issue including its Epic links and relationship information.
 
@@ -141,6 +158,7 @@ async def get_issue(
         comment_limit: Maximum number of comments.
         properties: Issue properties to return.
         update_history: Whether to update issue view history.
+        source: 'live' or 'mirror' (local issue mirror, if fresh).
 
     Returns:
         JSON string representing the Jira issue object.
@@ -153,7 +171,22 @@ async def get_issue(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    issue = jira.get_issue(
+    if source == "mirror" and not expand and not properties:
+        mirrored = await run_blocking(
+            get_issue_mirror().get_issue,
+            jira,
+            issue_key,
+            fields=fields_list,
+            comment_limit=comment_limit,
+        )
+        if mirrored is not None:
+            result = mirrored.value.to_simplified_dict()
+            result["source"] = "mirror"
+            result["staleness_seconds"] = round(mirrored.staleness, 1)
+            return format_output(result)
+
+    issue = await run_blocking(
+        jira.get_issue,
         issue_key=issue_key,
         fields=fields_list,
         expand=expand,
@@ -162,7 +195,75 @@ async def get_issue(
         update_history=update_history,
     )
     result = issue.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    if source == "mirror":
+        result["source"] = "live"
+    return format_output(result)
+
+
+@convert_empty_defaults_to_none
+@jira_mcp.tool(tags={"jira", "read"})
+async def batch_get_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str],
+        Field(
+            description="List of Jira issue keys, e.g. ['PROJ-123', 'PROJ-124']",
+            min_length=1,
+            max_length=500,
+        ),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of fields to return (e.g., 'summary,status,customfield_10010'). "
+                "You may also provide a single field as a string (e.g., 'duedate'). "
+                "Use '*all' for all fields (including custom fields), or omit for essential fields only."
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    expand: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Fields to expand. Examples: 'renderedFields' (for rendered content), "
+                "'changelog' (for history)"
+            ),
+            default="",
+        ),
+    ] = "",
+) -> str:
+    """Get details of multiple Jira issues in as few requests as possible.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: List of issue keys.
+        fields: Comma-separated list of fields to return, '*all' for all fields, or omitted for essentials.
+        expand: Optional fields to expand.
+
+    Returns:
+        JSON string with the issues in input order and the keys that were not found.
+
+    Raises:
+        ValueError: If the Jira client is not configured or available.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    issues, missing_keys = await run_blocking(
+        jira.get_issues,
+        issue_keys=issue_keys,
+        fields=fields_list,
+        expand=expand or None,
+    )
+    result = {
+        "issues": [issue.to_simplified_dict() for issue in issues],
+        "not_found": missing_keys,
+    }
+    return format_output(result)
 
 
 @convert_empty_defaults_to_none
@@ -221,6 +322,18 @@ async def search(
             default="",
         ),
     ] = "",
+    source: Annotated[
+        Literal["live", "mirror"],
+        Field(
+            description=(
+                "(Optional) 'mirror' to answer from the local issue mirror when it is "
+                "fresh enough and can evaluate the request, falling back to Jira "
+                "otherwise. Mirror answers report their staleness in seconds."
+            ),
+            default="live",
+        ),
+    ] = "live",
+    output_format: OutputFormatArg = "",
 ) -> str:
     """Search Jira issues using JQL (Jira Query Language).
 
@@ -232,6 +345,8 @@ async def search(
         start_at: Starting index for pagination.
         projects_filter: Comma-separated list of project keys to filter by.
         expand: Optional fields to expand.
+        source: 'live' or 'mirror' (local issue mirror, if fresh).
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
 
     Returns:
         JSON string representing the search results including pagination info.
@@ -241,7 +356,24 @@ async def search(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.search_issues(
+    if source == "mirror" and not expand:
+        mirrored = await run_blocking(
+            get_issue_mirror().search_issues,
+            jira,
+            jql,
+            fields=fields_list,
+            start=start_at,
+            limit=limit,
+            projects_filter=projects_filter,
+        )
+        if mirrored is not None:
+            result = mirrored.value.to_simplified_dict()
+            result["source"] = "mirror"
+            result["staleness_seconds"] = round(mirrored.staleness, 1)
+            return format_output(result, output_format)
+
+    search_result = await run_blocking(
+        jira.search_issue_projections,
         jql=jql,
         fields=fields_list,
         limit=limit,
@@ -250,7 +382,169 @@ async def search(
         projects_filter=projects_filter,
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    if source == "mirror":
+        result["source"] = "live"
+    return format_output(result, output_format)
+
+
+@convert_empty_defaults_to_none
+@jira_mcp.tool(tags={"jira", "read"})
+async def search_all(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(
+            description=(
+                "JQL query string (Jira Query Language). All matching issues are "
+                "fetched page by page until the result budget is reached."
+            )
+        ),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated fields to return in the results. "
+                "Use '*all' for all fields, or specify individual fields like 'summary,status,assignee,priority'"
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    max_results: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues to return in total (1-1000)",
+            default=200,
+            ge=1,
+            le=1000,
+        ),
+    ] = 200,
+    page_size: Annotated[
+        int,
+        Field(
+            description="Issues fetched per request (1-100, capped at 50 on Server/Data Center)",
+            default=50,
+            ge=1,
+            le=100,
+        ),
+    ] = 50,
+    projects_filter: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of project keys to filter results by. "
+                "Overrides the environment variable JIRA_PROJECTS_FILTER if provided."
+            ),
+            default="",
+        ),
+    ] = "",
+    output_format: OutputFormatArg = "",
+) -> str:
+    """Fetch all Jira issues matching a JQL query, following pagination automatically.
+
+    Reports progress after every page and stops once max_results issues
+    have been collected.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query string.
+        fields: Comma-separated fields to return.
+        max_results: Maximum number of issues to return in total.
+        page_size: Issues fetched per request.
+        projects_filter: Comma-separated list of project keys to filter by.
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
+
+    Returns:
+        JSON string with the collected issues and whether the budget was reached.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    pages = jira.iter_search_projections(
+        jql=jql,
+        fields=fields_list,
+        page_size=page_size,
+        max_results=max_results,
+        projects_filter=projects_filter,
+    )
+    issues: list[dict[str, Any]] = []
+    while True:
+        page = await run_blocking(next, pages, None)
+        if page is None:
+            break
+        issues.extend(issue.to_simplified_dict() for issue in page)
+        await ctx.report_progress(progress=len(issues), total=max_results)
+
+    result = {
+        "total_fetched": len(issues),
+        "budget_reached": len(issues) >= max_results,
+        "issues": issues,
+    }
+    return format_output(result, output_format)
+
+
+@convert_empty_defaults_to_none
+@jira_mcp.tool(tags={"jira", "read"})
+async def local_search(
+    ctx: Context,
+    query: Annotated[
+        str,
+        Field(
+            description=(
+                "Words to search for in issue summaries, descriptions and comments. "
+                "All words must match; end a word with '*' for a prefix match and "
+                "put OR between words to match either. Answered from the local issue "
+                "mirror without calling Jira, ranked by relevance."
+            )
+        ),
+    ],
+    projects_filter: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of mirrored project keys to search. "
+                "Defaults to every mirrored project."
+            ),
+            default="",
+        ),
+    ] = "",
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of results (1-50)", default=10, ge=1, le=50),
+    ] = 10,
+    output_format: OutputFormatArg = "",
+) -> str:
+    """Full-text search of the local Jira issue mirror, ranked by BM25.
+
+    Args:
+        ctx: The FastMCP context.
+        query: Words to search for.
+        projects_filter: Comma-separated list of project keys to search.
+        limit: Maximum number of results.
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
+
+    Returns:
+        JSON string with the matching issues, their snippets and the mirror's staleness.
+
+    Raises:
+        ValueError: If the mirror is not configured or was synced as another user.
+    """
+    jira = await get_jira_fetcher(ctx)
+    found = await run_blocking(
+        get_issue_mirror().search_text,
+        jira,
+        query,
+        projects=projects_filter.split(",") if projects_filter else None,
+        limit=limit,
+    )
+    result = {
+        "source": "local",
+        "staleness_seconds": round(found.staleness, 1),
+        "results": found.value,
+    }
+    return format_output(result, output_format)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -283,8 +577,10 @@ async def search_fields(
         JSON string representing a list of matching field definitions.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.search_fields(keyword, limit=limit, refresh=refresh)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(
+        jira.search_fields, keyword, limit=limit, refresh=refresh
+    )
+    return format_output(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -299,6 +595,7 @@ async def get_project_issues(
         int,
         Field(description="Starting index for pagination (0-based)", default=0, ge=0),
     ] = 0,
+    output_format: OutputFormatArg = "",
 ) -> str:
     """Get all issues for a specific Jira project.
 
@@ -307,16 +604,17 @@ async def get_project_issues(
         project_key: The project key.
         limit: Maximum number of results.
         start_at: Starting index for pagination.
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
 
     Returns:
         JSON string representing the search results including pagination info.
     """
     jira = await get_jira_fetcher(ctx)
-    search_result = jira.get_project_issues(
-        project_key=project_key, start=start_at, limit=limit
+    search_result = await run_blocking(
+        jira.get_project_issues, project_key=project_key, start=start_at, limit=limit
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result, output_format)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -335,8 +633,8 @@ async def get_transitions(
     """
     jira = await get_jira_fetcher(ctx)
     # Underlying method returns list[dict] in the desired format
-    transitions = jira.get_available_transitions(issue_key)
-    return json.dumps(transitions, indent=2, ensure_ascii=False)
+    transitions = await run_blocking(jira.get_available_transitions, issue_key)
+    return format_output(transitions)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -354,9 +652,9 @@ async def get_worklog(
         JSON string representing the worklog entries.
     """
     jira = await get_jira_fetcher(ctx)
-    worklogs = jira.get_worklogs(issue_key)
+    worklogs = await run_blocking(jira.get_worklogs, issue_key)
     result = {"worklogs": worklogs}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -378,8 +676,67 @@ async def download_attachments(
         JSON string indicating the result of the download operation.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.download_issue_attachments(issue_key=issue_key, target_dir=target_dir)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(
+        jira.download_issue_attachments, issue_key=issue_key, target_dir=target_dir
+    )
+    return format_output(result)
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def download_attachments_for_jql(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(description="JQL query selecting the issues whose attachments to fetch"),
+    ],
+    target_dir: Annotated[
+        str,
+        Field(
+            description=(
+                "Directory where attachments should be saved, "
+                "in one subdirectory per issue key"
+            )
+        ),
+    ],
+    max_issues: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues to process (1-500)",
+            default=50,
+            ge=1,
+            le=500,
+        ),
+    ] = 50,
+) -> str:
+    """Download the attachments of all Jira issues matching a JQL query.
+
+    Reports the number of issues processed after every issue. Files already
+    downloaded by an earlier call are skipped and interrupted downloads are
+    resumed.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query string.
+        target_dir: Directory to save attachments.
+        max_issues: Maximum number of issues to process.
+
+    Returns:
+        JSON string with the results per issue and overall counts.
+    """
+    jira = await get_jira_fetcher(ctx)
+    downloads = jira.iter_attachment_downloads(
+        jql=jql, target_dir=target_dir, max_issues=max_issues
+    )
+    issues: list[dict[str, Any]] = []
+    while True:
+        issue = await run_blocking(next, downloads, None)
+        if issue is None:
+            break
+        issues.append(issue)
+        # The number of matching issues is not known up front
+        await ctx.report_progress(progress=len(issues))
+
+    return format_output(summarize_attachment_downloads(jql, issues))
 
 
 @convert_empty_defaults_to_none
@@ -421,7 +778,8 @@ async def get_agile_boards(
         JSON string representing a list of board objects.
     """
     jira = await get_jira_fetcher(ctx)
-    boards = jira.get_all_agile_boards_model(
+    boards = await run_blocking(
+        jira.get_all_agile_boards_model,
         board_name=board_name,
         project_key=project_key,
         board_type=board_type,
@@ -429,7 +787,7 @@ async def get_agile_boards(
         limit=limit,
     )
     result = [board.to_simplified_dict() for board in boards]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result)
 
 
 @convert_empty_defaults_to_none
@@ -478,6 +836,7 @@ async def get_board_issues(
             default="version",
         ),
     ] = "version",
+    output_format: OutputFormatArg = "",
 ) -> str:
     """Get all issues linked to a specific board filtered by JQL.
 
@@ -489,6 +848,7 @@ async def get_board_issues(
         start_at: Starting index for pagination.
         limit: Maximum number of results.
         expand: Optional fields to expand.
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
 
     Returns:
         JSON string representing the search results including pagination info.
@@ -498,7 +858,8 @@ async def get_board_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_board_issues(
+    search_result = await run_blocking(
+        jira.get_board_issues,
         board_id=board_id,
         jql=jql,
         fields=fields_list,
@@ -507,7 +868,7 @@ async def get_board_issues(
         expand=expand,
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result, output_format)
 
 
 @convert_empty_defaults_to_none
@@ -541,11 +902,15 @@ async def get_sprints_from_board(
         JSON string representing a list of sprint objects.
     """
     jira = await get_jira_fetcher(ctx)
-    sprints = jira.get_all_sprints_from_board_model(
-        board_id=board_id, state=state, start=start_at, limit=limit
+    sprints = await run_blocking(
+        jira.get_all_sprints_from_board_model,
+        board_id=board_id,
+        state=state,
+        start=start_at,
+        limit=limit,
     )
     result = [sprint.to_simplified_dict() for sprint in sprints]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result)
 
 
 @convert_empty_defaults_to_none
@@ -572,6 +937,7 @@ async def get_sprint_issues(
         int,
         Field(description="Maximum number of results (1-50)", default=10, ge=1, le=50),
     ] = 10,
+    output_format: OutputFormatArg = "",
 ) -> str:
     """Get jira issues from sprint.
 
@@ -581,6 +947,7 @@ async def get_sprint_issues(
         fields: Comma-separated fields to return.
         start_at: Starting index.
         limit: Maximum results.
+        output_format: 'pretty', 'compact' or 'table' (server default if empty).
 
     Returns:
         JSON string representing the search results including pagination info.
@@ -590,11 +957,15 @@ async def get_sprint_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_sprint_issues(
-        sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
+    search_result = await run_blocking(
+        jira.get_sprint_issues,
+        sprint_id=sprint_id,
+        fields=fields_list,
+        start=start_at,
+        limit=limit,
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result, output_format)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -608,9 +979,9 @@ async def get_link_types(ctx: Context) -> str:
         JSON string representing a list of issue link type objects.
     """
     jira = await get_jira_fetcher(ctx)
-    link_types = jira.get_issue_link_types()
+    link_types = await run_blocking(jira.get_issue_link_types)
     formatted_link_types = [link_type.to_simplified_dict() for link_type in link_types]
-    return json.dumps(formatted_link_types, indent=2, ensure_ascii=False)
+    return format_output(formatted_link_types)
 
 
 @convert_empty_defaults_to_none
@@ -702,7 +1073,8 @@ async def create_issue(
     if not isinstance(extra_fields, dict):
         raise ValueError("additional_fields must be a dictionary.")
 
-    issue = jira.create_issue(
+    issue = await run_blocking(
+        jira.create_issue,
         project_key=project_key,
         summary=summary,
         issue_type=issue_type,
@@ -712,11 +1084,7 @@ async def create_issue(
         **extra_fields,
     )
     result = issue.to_simplified_dict()
-    return json.dumps(
-        {"message": "Issue created successfully", "issue": result},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return format_output({"message": "Issue created successfully", "issue": result})
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -774,7 +1142,9 @@ async def batch_create_issues(
         raise ValueError(f"Invalid input for issues: {e}") from e
 
     # Create issues in batch
-    created_issues = jira.batch_create_issues(issues_list, validate_only=validate_only)
+    created_issues = await run_blocking(
+        jira.batch_create_issues, issues_list, validate_only=validate_only
+    )
 
     message = (
         "Issues validated successfully"
@@ -785,7 +1155,7 @@ async def batch_create_issues(
         "message": message,
         "issues": [issue.to_simplified_dict() for issue in created_issues],
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result)
 
 
 @convert_empty_defaults_to_none
@@ -818,7 +1188,7 @@ async def batch_get_changelogs(
         ),
     ] = -1,
 ) -> str:
-    """Get changelogs for multiple Jira issues (Cloud only).
+    """Get changelogs for multiple Jira issues.
 
     Args:
         ctx: The FastMCP context.
@@ -830,18 +1200,12 @@ async def batch_get_changelogs(
         JSON string representing a list of issues with their changelogs.
 
     Raises:
-        NotImplementedError: If run on Jira Server/Data Center.
         ValueError: If Jira client is unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    # Ensure this runs only on Cloud, as per original function docstring
-    if not jira.config.is_cloud:
-        raise NotImplementedError(
-            "Batch get issue changelogs is only available on Jira Cloud."
-        )
 
-    # Call the underlying method
-    issues_with_changelogs = jira.batch_get_changelogs(
+    # Fetched concurrently on the async transport, without a thread per request
+    issues_with_changelogs = await jira.batch_get_changelogs_async(
         issue_ids_or_keys=issue_ids_or_keys, fields=fields
     )
 
@@ -858,7 +1222,7 @@ async def batch_get_changelogs(
                 ],
             }
         )
-    return json.dumps(results, indent=2, ensure_ascii=False)
+    return format_output(results)
 
 
 @convert_empty_defaults_to_none
@@ -946,18 +1310,16 @@ async def update_issue(
         all_updates["attachments"] = attachment_paths
 
     try:
-        issue = jira.update_issue(issue_key=issue_key, **all_updates)
+        issue = await run_blocking(
+            jira.update_issue, issue_key=issue_key, **all_updates
+        )
         result = issue.to_simplified_dict()
         if (
             hasattr(issue, "custom_fields")
             and "attachment_results" in issue.custom_fields
         ):
             result["attachment_results"] = issue.custom_fields["attachment_results"]
-        return json.dumps(
-            {"message": "Issue updated successfully", "issue": result},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return format_output({"message": "Issue updated successfully", "issue": result})
     except Exception as e:
         logger.error(f"Error updating issue {issue_key}: {str(e)}", exc_info=True)
         raise ValueError(f"Failed to update issue {issue_key}: {str(e)}")
@@ -982,10 +1344,10 @@ async def delete_issue(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    deleted = jira.delete_issue(issue_key)
+    deleted = await run_blocking(jira.delete_issue, issue_key)
     result = {"message": f"Issue {issue_key} has been deleted successfully."}
     # The underlying method raises on failure, so if we reach here, it's success.
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1010,8 +1372,8 @@ async def add_comment(
     """
     jira = await get_jira_fetcher(ctx)
     # add_comment returns dict
-    result = jira.add_comment(issue_key, comment)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(jira.add_comment, issue_key, comment)
+    return format_output(result)
 
 
 @convert_empty_defaults_to_none
@@ -1070,7 +1432,8 @@ async def add_worklog(
     """
     jira = await get_jira_fetcher(ctx)
     # add_worklog returns dict
-    worklog_result = jira.add_worklog(
+    worklog_result = await run_blocking(
+        jira.add_worklog,
         issue_key=issue_key,
         time_spent=time_spent,
         comment=comment,
@@ -1079,7 +1442,7 @@ async def add_worklog(
         remaining_estimate=remaining_estimate,
     )
     result = {"message": "Worklog added successfully", "worklog": worklog_result}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1107,12 +1470,12 @@ async def link_to_epic(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    issue = jira.link_issue_to_epic(issue_key, epic_key)
+    issue = await run_blocking(jira.link_issue_to_epic, issue_key, epic_key)
     result = {
         "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
         "issue": issue.to_simplified_dict(),
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result)
 
 
 @convert_empty_defaults_to_none
@@ -1180,8 +1543,8 @@ async def create_issue_link(
                 logger.warning("Invalid comment_visibility dictionary structure.")
         link_data["comment"] = comment_obj
 
-    result = jira.create_issue_link(link_data)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(jira.create_issue_link, link_data)
+    return format_output(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1206,8 +1569,10 @@ async def remove_issue_link(
     if not link_id:
         raise ValueError("link_id is required")
 
-    result = jira.remove_issue_link(link_id)  # Returns dict on success
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(
+        jira.remove_issue_link, link_id
+    )  # Returns dict on success
+    return format_output(result)
 
 
 @convert_empty_defaults_to_none
@@ -1270,7 +1635,8 @@ async def transition_issue(
     if not isinstance(update_fields, dict):
         raise ValueError("fields must be a dictionary.")
 
-    issue = jira.transition_issue(
+    issue = await run_blocking(
+        jira.transition_issue,
         issue_key=issue_key,
         transition_id=transition_id,
         fields=update_fields,
@@ -1281,7 +1647,7 @@ async def transition_issue(
         "message": f"Issue {issue_key} transitioned successfully",
         "issue": issue.to_simplified_dict() if issue else None,
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return format_output(result)
 
 
 @convert_empty_defaults_to_none
@@ -1318,14 +1684,15 @@ async def create_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.create_sprint(
+    sprint = await run_blocking(
+        jira.create_sprint,
         board_id=board_id,
         sprint_name=sprint_name,
         start_date=start_date,
         end_date=end_date,
         goal=goal,
     )
-    return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return format_output(sprint.to_simplified_dict())
 
 
 @convert_empty_defaults_to_none
@@ -1367,7 +1734,8 @@ async def update_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.update_sprint(
+    sprint = await run_blocking(
+        jira.update_sprint,
         sprint_id=sprint_id,
         sprint_name=sprint_name,
         state=state,
@@ -1380,9 +1748,9 @@ async def update_sprint(
         error_payload = {
             "error": f"Failed to update sprint {sprint_id}. Check logs for details."
         }
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
+        return format_output(error_payload)
     else:
-        return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+        return format_output(sprint.to_simplified_dict())
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -1392,8 +1760,8 @@ async def get_project_versions(
 ) -> str:
     """Get all fix versions for a specific Jira project."""
     jira = await get_jira_fetcher(ctx)
-    versions = jira.get_project_versions(project_key)
-    return json.dumps(versions, indent=2, ensure_ascii=False)
+    versions = await run_blocking(jira.get_project_versions, project_key)
+    return format_output(versions)
 
 
 @convert_empty_defaults_to_none
@@ -1428,18 +1796,17 @@ async def create_version(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        version = jira.create_project_version(
+        version = await run_blocking(
+            jira.create_project_version,
             project_key=project_key,
             name=name,
             start_date=start_date,
             release_date=release_date,
             description=description,
         )
-        return json.dumps(version, indent=2, ensure_ascii=False)
+        return format_output(version)
     except Exception as e:
         logger.error(
             f"Error creating version in project {project_key}: {str(e)}", exc_info=True
         )
-        return json.dumps(
-            {"success": False, "error": str(e)}, indent=2, ensure_ascii=False
-        )
+        return format_output({"success": False, "error": str(e)})
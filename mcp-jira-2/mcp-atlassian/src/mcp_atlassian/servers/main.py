@@ -1,11 +1,14 @@
 """Main FastMCP server setup for Atlassian integration."""
 
+import hmac
 import logging
+import os
+import threading
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import Any, Literal, Optional
 
-from cachetools import TTLCache
 from fastmcp import FastMCP
 from fastmcp.tools import Tool as FastMCPTool
 from mcp.types import Tool as MCPTool
@@ -17,15 +20,24 @@ from starlette.responses import JSONResponse
 
 from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.confluence.config import ConfluenceConfig
+from mcp_atlassian.confluence.mirror import get_page_mirror
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.jira.mirror import get_issue_mirror
+from mcp_atlassian.jira.user_cache import get_user_identity_cache
+from mcp_atlassian.preprocessing.conversion_cache import get_conversion_cache
+from mcp_atlassian.preprocessing.conversion_pool import get_conversion_pool
 from mcp_atlassian.utils.environment import get_available_services
 from mcp_atlassian.utils.io import is_read_only_mode
 from mcp_atlassian.utils.logging import mask_sensitive
+from mcp_atlassian.utils.rate_limit import get_rate_limiter
+from mcp_atlassian.utils.response_cache import get_response_cache
 from mcp_atlassian.utils.tools import get_enabled_tools, should_include_tool
 
 from .confluence import confluence_mcp
 from .context import MainAppContext
+from .dependencies import close_all_fetchers, get_pooled_fetcher
+from .dispatch import get_dispatcher
 from .jira import jira_mcp
 
 logger = logging.getLogger("mcp-atlassian.server.main")
@@ -35,6 +47,82 @@ async def health_check(request: Request) -> JSONResponse:
     return JSONResponse({"status": "ok"})
 
 
+def is_stats_enabled() -> bool:
+    """Check whether GET /stats is served (ATLASSIAN_STATS_ENABLED, default off)."""
+    value = os.getenv("ATLASSIAN_STATS_ENABLED", "false")
+    return value.lower() in ("true", "1", "yes", "y", "on")
+
+
+def _is_stats_request_authorized(request: Request) -> bool:
+    """Check the request against ATLASSIAN_STATS_TOKEN, if one is configured."""
+    token = os.getenv("ATLASSIAN_STATS_TOKEN")
+    if not token:
+        return True
+    return hmac.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    )
+
+
+def _summarize_mirror(
+    mirror_stats: dict[str, Any], scope_name: str, item_name: str
+) -> dict[str, Any]:
+    """Replace the per-project/space breakdown with totals."""
+    scopes = mirror_stats.pop(scope_name)
+    mirror_stats[scope_name] = len(scopes)
+    mirror_stats[item_name] = sum(scope[item_name] for scope in scopes.values())
+    mirror_stats["max_seconds_since_sync"] = max(
+        (scope["seconds_since_sync"] for scope in scopes.values()), default=None
+    )
+    return mirror_stats
+
+
+def _summarize_rate_limiter(limiter_stats: dict[str, Any]) -> dict[str, Any]:
+    """Drop host names (OAuth cloud ids included) and raw rate-limit headers."""
+    limiter_stats["hosts"] = [
+        {key: value for key, value in host.items() if key != "rate_limit_headers"}
+        for host in limiter_stats["hosts"].values()
+    ]
+    return limiter_stats
+
+
+async def stats(request: Request) -> JSONResponse:
+    if not is_stats_enabled():
+        return JSONResponse({"error": "Not found"}, status_code=404)
+    if not _is_stats_request_authorized(request):
+        return JSONResponse({"error": "Unauthorized"}, status_code=401)
+    return JSONResponse(
+        {
+            "dispatch": get_dispatcher().stats(),
+            "response_cache": get_response_cache().stats(),
+            "jira_user_cache": get_user_identity_cache().stats(),
+            "conversion_cache": get_conversion_cache().stats(),
+            "conversion_pool": get_conversion_pool().stats(),
+            "jira_mirror": _summarize_mirror(
+                get_issue_mirror().stats(), "projects", "issues"
+            ),
+            "confluence_mirror": _summarize_mirror(
+                get_page_mirror().stats(), "spaces", "pages"
+            ),
+            "rate_limiter": _summarize_rate_limiter(get_rate_limiter().stats()),
+        }
+    )
+
+
+def _warm_up_jira_field_catalog(config: JiraConfig) -> None:
+    """Load Jira field metadata into the shared field catalog ahead of first use."""
+    try:
+        fetcher = get_pooled_fetcher(config, JiraFetcher)
+        fields = fetcher.get_fields()
+        logger.info(f"Jira field catalog warmed up with {len(fields)} fields.")
+    except Exception as e:
+        logger.warning(f"Jira field catalog warm-up failed: {e}")
+
+
+def _mirror_fetcher(config: Any, fetcher_class: type) -> Any:
+    """Fetcher the background mirror syncs read with."""
+    return get_pooled_fetcher(config, fetcher_class)
+
+
 @asynccontextmanager
 async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
     logger.info("Main Atlassian MCP server lifespan starting...")
@@ -81,10 +169,43 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
         read_only=read_only,
         enabled_tools=enabled_tools,
     )
+    if loaded_jira_config and os.getenv(
+        "JIRA_FIELD_CACHE_WARMUP", "true"
+    ).lower() not in ("false", "0", "no"):
+        # Warm up in the background so a slow /field call does not delay startup
+        threading.Thread(
+            target=_warm_up_jira_field_catalog,
+            args=(loaded_jira_config,),
+            name="jira-field-catalog-warmup",
+            daemon=True,
+        ).start()
+    mirror_stop = threading.Event()
+    for mirror, config, fetcher_class, thread_name in (
+        (get_issue_mirror(), loaded_jira_config, JiraFetcher, "jira-mirror-sync"),
+        (
+            get_page_mirror(),
+            loaded_confluence_config,
+            ConfluenceFetcher,
+            "confluence-mirror-sync",
+        ),
+    ):
+        if config and mirror.enabled and mirror.sync_interval > 0:
+            threading.Thread(
+                target=mirror.sync_forever,
+                args=(
+                    partial(_mirror_fetcher, config, fetcher_class),
+                    mirror_stop,
+                ),
+                name=thread_name,
+                daemon=True,
+            ).start()
     logger.info(f"Read-only mode: {'ENABLED' if read_only else 'DISABLED'}")
     logger.info(f"Enabled tools filter: {enabled_tools or 'All tools enabled'}")
     yield {"app_lifespan_context": app_context}
     logger.info("Main Atlassian MCP server lifespan shutting down.")
+    mirror_stop.set()
+    get_conversion_pool().shutdown()
+    await close_all_fetchers()
 
 
 class AtlassianMCP(FastMCP[MainAppContext]):
@@ -185,11 +306,6 @@ class AtlassianMCP(FastMCP[MainAppContext]):
         return app
 
 
-token_validation_cache: TTLCache[
-    int, tuple[bool, str | None, JiraFetcher | None, ConfluenceFetcher | None]
-] = TTLCache(maxsize=100, ttl=300)
-
-
 class UserTokenMiddleware(BaseHTTPMiddleware):
     """Middleware to extract Atlassian user tokens/credentials from Authorization headers."""
 
@@ -298,4 +414,9 @@ async def _health_check_route(request: Request) -> JSONResponse:
     return await health_check(request)
 
 
+@main_mcp.custom_route("/stats", methods=["GET"], include_in_schema=False)
+async def _stats_route(request: Request) -> JSONResponse:
+    return await stats(request)
+
+
 logger.info("Added /healthz endpoint for Kubernetes probes")
@@ -0,0 +1,223 @@
+"""Async HTTP transport for Atlassian APIs.
+
+Builds ``httpx.AsyncClient`` instances that mirror the authentication, SSL and
+proxy behaviour of the synchronous ``requests`` sessions used by the
+``atlassian`` client library, with keep-alive connection pooling and HTTP/2
+when the optional ``h2`` package is installed. Their transports go through the
+process-wide rate limit scheduler, like the synchronous sessions.
+"""
+
+import importlib.util
+import logging
+import os
+from typing import Any, Protocol
+
+import httpx
+
+from ..exceptions import MCPAtlassianAuthenticationError
+from .logging import log_config_param
+from .oauth import OAuthConfig
+from .rate_limit import get_rate_limiter
+
+logger = logging.getLogger("mcp-atlassian.utils.async_http")
+
+DEFAULT_TIMEOUT = 75.0  # Matches the default timeout of the atlassian client
+
+
+class AsyncHTTPConfig(Protocol):
+    """The subset of JiraConfig/ConfluenceConfig used to build an async client."""
+
+    url: str
+    auth_type: str
+    username: str | None
+    api_token: str | None
+    personal_token: str | None
+    oauth_config: OAuthConfig | None
+    ssl_verify: bool
+    http_proxy: str | None
+    https_proxy: str | None
+    no_proxy: str | None
+    socks_proxy: str | None
+
+
+def is_http2_available() -> bool:
+    """Check whether HTTP/2 can be used (requires the optional ``h2`` package).
+
+    Returns:
+        True if HTTP/2 is enabled and ``h2`` is installed, False otherwise.
+    """
+    if os.getenv("ATLASSIAN_HTTP2", "true").lower() in ("false", "0", "no"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_pool_limits() -> httpx.Limits:
+    """Connection pool limits for async clients, configurable via environment.
+
+    Returns:
+        httpx.Limits built from ATLASSIAN_HTTP_MAX_CONNECTIONS (default 100),
+        ATLASSIAN_HTTP_MAX_KEEPALIVE (default 20) and
+        ATLASSIAN_HTTP_KEEPALIVE_EXPIRY (seconds, default 30).
+    """
+    return httpx.Limits(
+        max_connections=int(os.getenv("ATLASSIAN_HTTP_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("ATLASSIAN_HTTP_MAX_KEEPALIVE", "20")),
+        keepalive_expiry=float(os.getenv("ATLASSIAN_HTTP_KEEPALIVE_EXPIRY", "30")),
+    )
+
+
+def _build_auth(
+    config: AsyncHTTPConfig,
+) -> tuple[httpx.Auth | None, dict[str, str]]:
+    """Translate the configured auth type into httpx auth and headers.
+
+    Raises:
+        ValueError: If OAuth is configured without a usable access token.
+    """
+    if config.auth_type == "oauth":
+        oauth_config = config.oauth_config
+        if not oauth_config:
+            raise ValueError("OAuth authentication requires an OAuth configuration")
+        if oauth_config.refresh_token and not oauth_config.ensure_valid_token():
+            raise ValueError("Failed to obtain a valid OAuth access token")
+        if not oauth_config.access_token:
+            raise ValueError("OAuth authentication requires an access token")
+        return None, {"Authorization": f"Bearer {oauth_config.access_token}"}
+    if config.auth_type in ("pat", "token"):
+        return None, {"Authorization": f"Bearer {config.personal_token}"}
+    return httpx.BasicAuth(config.username or "", config.api_token or ""), {}
+
+
+def _build_transport(
+    verify: bool, http2: bool, proxy: str | None = None
+) -> httpx.AsyncBaseTransport:
+    """Build a pooled transport admitted by the process-wide rate limiter."""
+    return get_rate_limiter().wrap_async_transport(
+        httpx.AsyncHTTPTransport(
+            verify=verify, http2=http2, limits=get_pool_limits(), proxy=proxy
+        )
+    )
+
+
+def _build_mounts(
+    service_name: str, config: AsyncHTTPConfig, verify: bool, http2: bool
+) -> dict[str, httpx.AsyncBaseTransport | None]:
+    """Build proxy transports equivalent to the requests session proxy setup."""
+
+    def transport(proxy: str | None = None) -> httpx.AsyncBaseTransport:
+        return _build_transport(verify, http2, proxy)
+
+    mounts: dict[str, httpx.AsyncBaseTransport | None] = {}
+    if config.socks_proxy:
+        mounts["all://"] = transport(config.socks_proxy)
+        log_config_param(
+            logger,
+            service_name,
+            "ASYNC_SOCKS_PROXY",
+            config.socks_proxy,
+            sensitive=True,
+        )
+    else:
+        if config.http_proxy:
+            mounts["http://"] = transport(config.http_proxy)
+            log_config_param(
+                logger,
+                service_name,
+                "ASYNC_HTTP_PROXY",
+                config.http_proxy,
+                sensitive=True,
+            )
+        if config.https_proxy:
+            mounts["https://"] = transport(config.https_proxy)
+            log_config_param(
+                logger,
+                service_name,
+                "ASYNC_HTTPS_PROXY",
+                config.https_proxy,
+                sensitive=True,
+            )
+    if mounts and config.no_proxy:
+        for host in config.no_proxy.split(","):
+            host = host.strip().lstrip(".")
+            if host:
+                mounts[f"all://*{host}"] = transport()
+    return mounts
+
+
+def create_async_http_client(
+    service_name: str, config: AsyncHTTPConfig, base_url: str
+) -> httpx.AsyncClient:
+    """Create an async HTTP client for a Jira or Confluence instance.
+
+    Args:
+        service_name: Name of the service for logging (e.g., "Jira", "Confluence")
+        config: The service configuration (auth, SSL and proxy settings)
+        base_url: The effective API base URL (differs from config.url for OAuth)
+
+    Returns:
+        A configured httpx.AsyncClient. The caller owns it and must close it.
+
+    Raises:
+        ValueError: If the authentication configuration is unusable.
+    """
+    auth, headers = _build_auth(config)
+    verify = config.ssl_verify
+    if not verify:
+        logger.warning(
+            f"{service_name} SSL verification disabled for async client. This is insecure and should only be used in testing environments."
+        )
+    http2 = is_http2_available()
+    logger.debug(
+        f"Creating async {service_name} client for {base_url} (http2={http2}, auth_type={config.auth_type})"
+    )
+    return httpx.AsyncClient(
+        base_url=base_url,
+        auth=auth,
+        headers={"Accept": "application/json", **headers},
+        verify=verify,
+        http2=http2,
+        limits=get_pool_limits(),
+        transport=_build_transport(verify, http2),
+        timeout=DEFAULT_TIMEOUT,
+        mounts=_build_mounts(service_name, config, verify, http2),
+    )
+
+
+async def request_json(
+    client: httpx.AsyncClient,
+    service_name: str,
+    method: str,
+    path: str,
+    *,
+    params: dict[str, Any] | None = None,
+    json: Any = None,
+) -> Any:
+    """Send a request with an async client and decode the JSON response.
+
+    Args:
+        client: The async client created by create_async_http_client
+        service_name: Name of the service for logging and error messages
+        method: HTTP method
+        path: Path relative to the client's base URL, or an absolute URL
+        params: Optional query parameters
+        json: Optional JSON body
+
+    Returns:
+        The decoded JSON body, or None for empty responses.
+
+    Raises:
+        MCPAtlassianAuthenticationError: If authentication fails (401/403)
+        httpx.HTTPStatusError: For other unsuccessful responses
+    """
+    response = await client.request(method, path, params=params, json=json)
+    if response.status_code in (401, 403):
+        error_msg = (
+            f"Authentication failed for {service_name} API ({response.status_code}). "
+            "Token may be expired or invalid. Please verify credentials."
+        )
+        logger.error(error_msg)
+        raise MCPAtlassianAuthenticationError(error_msg)
+    response.raise_for_status()
+    if not response.content:
+        return None
+    return response.json()
@@ -0,0 +1,182 @@
+"""Encoding of tool results.
+
+Tools return their results as JSON text. The layout is chosen server-wide with
+ATLASSIAN_OUTPUT_FORMAT, and the list and search tools accept a per-call
+``output_format`` overriding it:
+
+- ``pretty`` (default): JSON indented by two spaces.
+- ``compact``: JSON without whitespace, serialized with the optional
+  ``orjson`` package when it is installed.
+- ``table``: compact JSON in which every non-empty list of objects (issues,
+  pages, comments, ...) becomes
+  ``{"_table": true, "columns": [...], "rows": [[...], ...]}``, so the keys
+  are written once per list instead of once per item. The ``_table`` marker
+  tells tables apart from objects that happen to have columns and rows keys.
+  Empty lists and lists of other values stay JSON arrays.
+
+With ATLASSIAN_OUTPUT_OMIT_EMPTY enabled, null values, empty strings and
+empty lists and objects are dropped from results before they are encoded.
+"""
+
+import importlib.util
+import json
+import logging
+import os
+from typing import Annotated, Any
+
+from pydantic import Field
+
+logger = logging.getLogger("mcp-atlassian.utils.output")
+
+PRETTY = "pretty"
+COMPACT = "compact"
+TABLE = "table"
+OUTPUT_FORMATS = (PRETTY, COMPACT, TABLE)
+
+TABLE_MARKER = "_table"
+
+OutputFormatArg = Annotated[
+    str,
+    Field(
+        description=(
+            "(Optional) Output encoding: 'pretty' (indented JSON), 'compact' "
+            "(JSON without whitespace) or 'table' (compact JSON in which each "
+            'non-empty list of objects is written as {"_table": true, '
+            '"columns": [key, ...], "rows": [[value, ...], ...]}, one row per '
+            "object with null for missing keys; empty lists stay []). "
+            "Defaults to the server's setting."
+        ),
+        default="",
+    ),
+]
+
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+else:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def get_output_format() -> str:
+    """Return the server-wide output format (ATLASSIAN_OUTPUT_FORMAT)."""
+    output_format = os.getenv("ATLASSIAN_OUTPUT_FORMAT", PRETTY).strip().lower()
+    if output_format not in OUTPUT_FORMATS:
+        logger.warning(
+            f"Unknown ATLASSIAN_OUTPUT_FORMAT '{output_format}', using '{PRETTY}' "
+            "instead"
+        )
+        return PRETTY
+    return output_format
+
+
+def is_omit_empty_enabled() -> bool:
+    """Check whether empty values are dropped (ATLASSIAN_OUTPUT_OMIT_EMPTY)."""
+    return os.getenv("ATLASSIAN_OUTPUT_OMIT_EMPTY", "false").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+
+
+def omit_empty(value: Any) -> Any:
+    """Recursively drop None, empty strings and empty lists and dicts.
+
+    Args:
+        value: A JSON-compatible value.
+
+    Returns:
+        The value without empty members. False and 0 are kept.
+    """
+    if isinstance(value, dict):
+        pruned = {}
+        for key, item in value.items():
+            if isinstance(item, dict | list):
+                item = omit_empty(item)
+            if item is not None and item != "" and item != [] and item != {}:
+                pruned[key] = item
+        return pruned
+    if isinstance(value, list):
+        items = (
+            omit_empty(item) if isinstance(item, dict | list) else item
+            for item in value
+        )
+        return [
+            item
+            for item in items
+            if item is not None and item != "" and item != [] and item != {}
+        ]
+    return value
+
+
+def tabulate(value: Any) -> Any:
+    """Recursively turn lists of dicts into column/row tables.
+
+    The columns are the keys of all items in first-seen order; items lacking a
+    key get null in its cell. Lists mixing dicts with other values are kept.
+
+    Args:
+        value: A JSON-compatible value.
+
+    Returns:
+        The value with every non-empty list of dicts replaced by
+        ``{"_table": True, "columns": [...], "rows": [[...], ...]}``.
+    """
+    if isinstance(value, dict):
+        return {key: tabulate(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if value and all(isinstance(item, dict) for item in value):
+            columns = list(dict.fromkeys(key for item in value for key in item))
+            return {
+                TABLE_MARKER: True,
+                "columns": columns,
+                "rows": [
+                    [tabulate(item.get(column)) for column in columns] for item in value
+                ],
+            }
+        return [tabulate(item) for item in value]
+    return value
+
+
+def dumps_compact(value: Any) -> str:
+    """Serialize to JSON without whitespace, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson rejects what json accepts in places (e.g. integers over
+            # 64 bits); let json have the final word.
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def format_output(result: Any, output_format: str | None = None) -> str:
+    """Encode a tool result as JSON text.
+
+    Args:
+        result: JSON-compatible tool result.
+        output_format: 'pretty', 'compact' or 'table'. Defaults to
+            ATLASSIAN_OUTPUT_FORMAT.
+
+    Returns:
+        The encoded result.
+
+    Raises:
+        ValueError: If output_format is not a known format.
+    """
+    if output_format:
+        output_format = output_format.strip().lower()
+        if output_format not in OUTPUT_FORMATS:
+            msg = (
+                f"Invalid output_format '{output_format}', expected one of: "
+                f"{', '.join(OUTPUT_FORMATS)}"
+            )
+            raise ValueError(msg)
+    else:
+        output_format = get_output_format()
+
+    if is_omit_empty_enabled():
+        result = omit_empty(result)
+    if output_format == PRETTY:
+        return json.dumps(result, indent=2, ensure_ascii=False)
+    if output_format == TABLE:
+        result = tabulate(result)
+    return dumps_compact(result)
@@ -0,0 +1,475 @@
+"""Rate-limit-aware scheduling of requests to Atlassian hosts.
+
+Jira and Confluence clients share one scheduler per process, installed on
+their ``requests`` sessions by wrapping the mounted transport adapters, and on
+their async ``httpx`` clients by wrapping the transports. Every
+request to a host (or, behind the OAuth gateway, to a tenant) waits for a
+slot in that host's concurrency window, which is adjusted AIMD-style:
+successful responses grow it by about one slot per window of requests,
+throttling (HTTP 429/503 or ``X-RateLimit-NearLimit``) halves it.
+
+A ``Retry-After`` header holds back every request to the host until it has
+passed, plus a little jitter so the queued requests do not fire at once.
+Idempotent requests (GET, HEAD, OPTIONS) that were throttled are retried up
+to ATLASSIAN_RATE_LIMIT_MAX_RETRIES times, after ``Retry-After`` or a
+jittered exponential backoff. The scheduler is disabled when
+ATLASSIAN_RATE_LIMIT_MAX_CONCURRENCY is 0.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+import anyio
+import anyio.to_thread
+import httpx
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+
+logger = logging.getLogger("mcp-atlassian.utils.rate_limit")
+
+RETRY_STATUS_CODES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+OAUTH_GATEWAY_HOST = "api.atlassian.com"
+
+# Throttled responses arriving together describe the same congestion, so the
+# window is halved at most once per this many seconds.
+DECREASE_INTERVAL = 1.0
+# Upper bound of the random delay added to a Retry-After wait.
+RETRY_AFTER_JITTER = 1.0
+
+
+@dataclass
+class _HostState:
+    limit: float
+    in_flight: int = 0
+    queued: int = 0
+    blocked_until: float = 0.0
+    last_decrease: float = 0.0
+    requests: int = 0
+    throttled: int = 0
+    retries: int = 0
+    queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+    rate_limit_headers: dict[str, str] = field(default_factory=dict)
+
+
+def host_key(url: str) -> str:
+    """Key requests are scheduled under: the host, or the tenant behind OAuth.
+
+    Args:
+        url: The request URL.
+
+    Returns:
+        The host, with the ``/ex/<product>/<cloud id>`` prefix for requests
+        through the Atlassian OAuth gateway, which fronts every tenant.
+    """
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host == OAUTH_GATEWAY_HOST:
+        return host + "/".join(parts.path.split("/")[:4])
+    return host
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or HTTP date).
+
+    Args:
+        value: The header value, if any.
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparsable.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimitScheduler:
+    """Per-host AIMD concurrency windows with Retry-After handling and retries."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Starting and largest concurrency window per host.
+                0 disables the scheduler.
+            min_concurrency: Smallest concurrency window per host.
+            max_retries: Retries of a throttled idempotent request.
+            backoff_base: First backoff in seconds when no Retry-After is sent.
+            max_backoff: Longest wait in seconds. Requests asked to wait longer
+                are not retried and return the throttled response.
+        """
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = max(min(min_concurrency, max_concurrency), 1)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._hosts: dict[str, _HostState] = {}
+
+    @classmethod
+    def from_env(cls) -> "RateLimitScheduler":
+        """Create a scheduler configured from environment variables.
+
+        Returns:
+            RateLimitScheduler with up to ATLASSIAN_RATE_LIMIT_MAX_CONCURRENCY
+            (default 16, 0 disables) concurrent requests per host, retrying
+            throttled reads ATLASSIAN_RATE_LIMIT_MAX_RETRIES times (default 3)
+            and waiting at most ATLASSIAN_RATE_LIMIT_MAX_BACKOFF seconds
+            (default 60) before a retry.
+        """
+        return cls(
+            max_concurrency=int(
+                os.getenv("ATLASSIAN_RATE_LIMIT_MAX_CONCURRENCY", "16")
+            ),
+            max_retries=int(os.getenv("ATLASSIAN_RATE_LIMIT_MAX_RETRIES", "3")),
+            max_backoff=float(os.getenv("ATLASSIAN_RATE_LIMIT_MAX_BACKOFF", "60")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether requests are scheduled at all."""
+        return self.max_concurrency > 0
+
+    def install(self, session: Session) -> None:
+        """Route the requests of a session through the scheduler.
+
+        Wraps every adapter mounted on the session, so adapters mounted
+        beforehand (e.g. for disabled SSL verification) keep working.
+        Installing twice is harmless.
+
+        Args:
+            session: The session of a Jira or Confluence client.
+        """
+        if not self.enabled or not isinstance(session, Session):
+            return
+        for prefix, adapter in list(session.adapters.items()):
+            if not isinstance(adapter, ScheduledAdapter):
+                session.adapters[prefix] = ScheduledAdapter(adapter, self)
+
+    def wrap_async_transport(
+        self, transport: httpx.AsyncBaseTransport
+    ) -> httpx.AsyncBaseTransport:
+        """Route the requests of an async httpx transport through the scheduler.
+
+        Args:
+            transport: A transport of a Jira or Confluence async client.
+
+        Returns:
+            The transport wrapped in a ScheduledAsyncTransport, or unchanged if
+            the scheduler is disabled or it is wrapped already.
+        """
+        if not self.enabled or isinstance(transport, ScheduledAsyncTransport):
+            return transport
+        return ScheduledAsyncTransport(transport, self)
+
+    def _host(self, key: str) -> _HostState:
+        host = self._hosts.get(key)
+        if host is None:
+            host = _HostState(limit=float(self.max_concurrency))
+            self._hosts[key] = host
+        return host
+
+    def acquire(self, key: str) -> float:
+        """Wait for a free slot in the host's window and take it.
+
+        Args:
+            key: Host key of the request (see ``host_key``).
+
+        Returns:
+            Seconds spent waiting.
+        """
+        jitter = random.uniform(0, RETRY_AFTER_JITTER)  # noqa: S311 - not crypto
+        start = time.monotonic()
+        with self._changed:
+            host = self._host(key)
+            host.queued += 1
+            try:
+                while True:
+                    wait_until = host.blocked_until + jitter
+                    now = time.monotonic()
+                    if host.blocked_until and now < wait_until:
+                        self._changed.wait(wait_until - now)
+                    elif host.in_flight >= int(host.limit):
+                        self._changed.wait()
+                    else:
+                        break
+            finally:
+                host.queued -= 1
+            waited = time.monotonic() - start
+            host.in_flight += 1
+            host.requests += 1
+            host.queue_wait += waited
+            host.max_queue_wait = max(host.max_queue_wait, waited)
+        return waited
+
+    def try_acquire(self, key: str) -> bool:
+        """Take a slot in the host's window if one is free right away.
+
+        Args:
+            key: Host key of the request (see ``host_key``).
+
+        Returns:
+            True if a slot was taken, False if the caller has to ``acquire``.
+        """
+        with self._lock:
+            host = self._host(key)
+            if (
+                host.queued
+                or time.monotonic() < host.blocked_until
+                or host.in_flight >= int(host.limit)
+            ):
+                return False
+            host.in_flight += 1
+            host.requests += 1
+            return True
+
+    def release(self, key: str, response: Response | httpx.Response | None) -> None:
+        """Give the slot back and adapt the window to the response.
+
+        Args:
+            key: Host key the slot was acquired for.
+            response: The response, or None if the request failed to complete.
+        """
+        with self._changed:
+            host = self._host(key)
+            host.in_flight -= 1
+            if response is not None:
+                self._observe(host, response)
+            self._changed.notify_all()
+
+    def _observe(self, host: _HostState, response: Response | httpx.Response) -> None:
+        now = time.monotonic()
+        rate_limit_headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower().startswith("x-ratelimit-")
+        }
+        if rate_limit_headers:
+            host.rate_limit_headers = rate_limit_headers
+        near_limit = response.headers.get("X-RateLimit-NearLimit", "").lower() == "true"
+
+        if response.status_code in RETRY_STATUS_CODES or near_limit:
+            if response.status_code in RETRY_STATUS_CODES:
+                host.throttled += 1
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                host.blocked_until = max(
+                    host.blocked_until, now + min(retry_after, self.max_backoff)
+                )
+            if now - host.last_decrease >= DECREASE_INTERVAL:
+                host.limit = max(host.limit / 2, float(self.min_concurrency))
+                host.last_decrease = now
+                logger.info(
+                    f"Throttled by {response.url} ({response.status_code}), "
+                    f"concurrency window now {int(host.limit)}"
+                )
+        elif response.status_code < 400:
+            host.limit = min(host.limit + 1 / host.limit, float(self.max_concurrency))
+
+    def retry_delay(
+        self,
+        key: str,
+        method: str | None,
+        response: Response | httpx.Response,
+        attempt: int,
+    ) -> float | None:
+        """Decide whether and when a throttled request is retried.
+
+        Args:
+            key: Host key of the request.
+            method: HTTP method of the request.
+            response: The response to the attempt.
+            attempt: Number of retries made so far.
+
+        Returns:
+            Seconds to sleep before retrying, or None to return the response.
+            Waits announced by Retry-After are served by ``acquire`` instead.
+        """
+        if (
+            response.status_code not in RETRY_STATUS_CODES
+            or (method or "").upper() not in IDEMPOTENT_METHODS
+            or attempt >= self.max_retries
+        ):
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > self.max_backoff:
+            return None
+        with self._lock:
+            self._host(key).retries += 1
+        if retry_after is not None:
+            return 0.0
+        return random.uniform(  # noqa: S311 - not crypto
+            0, min(self.backoff_base * 2**attempt, self.max_backoff)
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of scheduler metrics.
+
+        Returns:
+            Dictionary with the configuration and, per host, the current
+            concurrency window, requests in flight and queued, request,
+            throttle and retry counters, queue wait times, the remaining
+            Retry-After block and the last X-RateLimit-* headers seen.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "max_concurrency": self.max_concurrency,
+                "max_retries": self.max_retries,
+                "hosts": {
+                    key: {
+                        "limit": int(host.limit),
+                        "in_flight": host.in_flight,
+                        "queued": host.queued,
+                        "requests": host.requests,
+                        "throttled": host.throttled,
+                        "retries": host.retries,
+                        "avg_queue_wait_ms": round(
+                            host.queue_wait / host.requests * 1000, 1
+                        )
+                        if host.requests
+                        else 0.0,
+                        "max_queue_wait_ms": round(host.max_queue_wait * 1000, 1),
+                        "blocked_for_seconds": round(
+                            max(host.blocked_until - now, 0.0), 1
+                        ),
+                        "rate_limit_headers": dict(host.rate_limit_headers),
+                    }
+                    for key, host in self._hosts.items()
+                },
+            }
+
+
+class ScheduledAdapter(BaseAdapter):
+    """Transport adapter sending requests through a RateLimitScheduler."""
+
+    def __init__(self, adapter: BaseAdapter, scheduler: RateLimitScheduler) -> None:
+        """Wrap an adapter.
+
+        Args:
+            adapter: The adapter that actually sends the requests.
+            scheduler: The scheduler admitting them.
+        """
+        super().__init__()
+        self.adapter = adapter
+        self.scheduler = scheduler
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:  # type: ignore[override]
+        """Send a request once the scheduler admits it, retrying if throttled."""
+        key = host_key(request.url or "")
+        attempt = 0
+        while True:
+            self.scheduler.acquire(key)
+            response = None
+            try:
+                response = self.adapter.send(request, **kwargs)
+            finally:
+                self.scheduler.release(key, response)
+            delay = self.scheduler.retry_delay(key, request.method, response, attempt)
+            if delay is None:
+                return response
+            attempt += 1
+            logger.debug(
+                f"Retrying {request.method} {request.url} after "
+                f"{response.status_code} (attempt {attempt})"
+            )
+            response.close()
+            time.sleep(delay)
+
+    def close(self) -> None:
+        """Close the wrapped adapter."""
+        self.adapter.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped adapter's attributes (poolmanager, max_retries...).
+        try:
+            adapter = self.__dict__["adapter"]
+        except KeyError:
+            raise AttributeError(name) from None
+        return getattr(adapter, name)
+
+
+class ScheduledAsyncTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport sending requests through a RateLimitScheduler."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, scheduler: RateLimitScheduler
+    ) -> None:
+        """Wrap a transport.
+
+        Args:
+            transport: The transport that actually sends the requests.
+            scheduler: The scheduler admitting them.
+        """
+        self.transport = transport
+        self.scheduler = scheduler
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request once the scheduler admits it, retrying if throttled."""
+        key = host_key(str(request.url))
+        attempt = 0
+        while True:
+            if not self.scheduler.try_acquire(key):
+                # Not cancellable: a slot taken by the thread must be released
+                await anyio.to_thread.run_sync(self.scheduler.acquire, key)
+            response = None
+            try:
+                response = await self.transport.handle_async_request(request)
+                response.request = request
+            finally:
+                self.scheduler.release(key, response)
+            delay = self.scheduler.retry_delay(key, request.method, response, attempt)
+            if delay is None:
+                return response
+            attempt += 1
+            logger.debug(
+                f"Retrying {request.method} {request.url} after "
+                f"{response.status_code} (attempt {attempt})"
+            )
+            await response.aclose()
+            await anyio.sleep(delay)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
+_rate_limiter: RateLimitScheduler | None = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimitScheduler:
+    """Return the process-wide scheduler, creating it on first use."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimitScheduler.from_env()
+        return _rate_limiter
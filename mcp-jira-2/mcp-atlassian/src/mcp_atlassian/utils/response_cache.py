@@ -0,0 +1,363 @@
+"""Read-through cache for Jira and Confluence read operations.
+
+Fetcher read methods decorated with ``cached_response`` are memoized per
+credential set, method and normalized arguments. Every entry is tagged with
+the Atlassian instance and the entity it describes, so write methods
+decorated with ``invalidates_response_cache`` can drop stale entries for the
+entity they touched, whoever cached them.
+
+Entries older than ATLASSIAN_RESPONSE_CACHE_REVALIDATE_AFTER seconds are
+revalidated with a cheap ``updated``/version check where the API allows it,
+and expire after ATLASSIAN_RESPONSE_CACHE_TTL seconds. The cache is disabled
+unless ATLASSIAN_RESPONSE_CACHE_TTL is set to a positive value.
+
+The cache keeps its own deep copy of each response and hands every caller a
+fresh copy, so callers may modify what they get.
+"""
+
+import copy
+import hashlib
+import inspect
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, TypeVar
+
+from cachetools import TTLCache
+
+logger = logging.getLogger("mcp-atlassian.utils.response_cache")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+Tag = tuple[str, ...]
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    tags: frozenset[Tag]
+    validated_at: float
+
+
+class ResponseCache:
+    """Thread-safe TTL/LRU cache of fetcher responses with tag invalidation."""
+
+    def __init__(self, maxsize: int, ttl: float, revalidate_after: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses.
+            ttl: Seconds after which a response is dropped. 0 disables the cache.
+            revalidate_after: Seconds after which a response is revalidated
+                against the server before being served again.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.revalidate_after = revalidate_after
+        self._lock = threading.Lock()
+        self._entries: TTLCache[Hashable, _CacheEntry] = TTLCache(
+            maxsize=max(maxsize, 1), ttl=max(ttl, 1)
+        )
+        self._tags: dict[Tag, set[Hashable]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._invalidations = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """Create a cache configured from environment variables.
+
+        Returns:
+            ResponseCache sized by ATLASSIAN_RESPONSE_CACHE_MAXSIZE (default 1024),
+            expiring after ATLASSIAN_RESPONSE_CACHE_TTL seconds (default 0, disabled)
+            and revalidating after ATLASSIAN_RESPONSE_CACHE_REVALIDATE_AFTER
+            seconds (default 30).
+        """
+        return cls(
+            maxsize=int(os.getenv("ATLASSIAN_RESPONSE_CACHE_MAXSIZE", "1024")),
+            ttl=float(os.getenv("ATLASSIAN_RESPONSE_CACHE_TTL", "0")),
+            revalidate_after=float(
+                os.getenv("ATLASSIAN_RESPONSE_CACHE_REVALIDATE_AFTER", "30")
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached at all."""
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable) -> _CacheEntry | None:
+        """Return the entry for a key, or None if absent or expired."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def needs_revalidation(self, entry: _CacheEntry) -> bool:
+        """Check whether an entry must be revalidated before being served."""
+        return time.monotonic() - entry.validated_at >= self.revalidate_after
+
+    def mark_validated(self, entry: _CacheEntry) -> None:
+        """Record that an entry was confirmed to be current."""
+        entry.validated_at = time.monotonic()
+
+    def put(self, key: Hashable, value: Any, tags: frozenset[Tag]) -> None:
+        """Store a response under a key, tagged for later invalidation."""
+        with self._lock:
+            self._entries[key] = _CacheEntry(value, tags, time.monotonic())
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            if len(self._tags) > 4 * self.maxsize:
+                self._rebuild_tag_index()
+
+    def invalidate(self, *tags: Tag) -> int:
+        """Drop every entry carrying any of the given tags.
+
+        Returns:
+            The number of entries dropped.
+        """
+        dropped = 0
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, ()):
+                    if self._entries.pop(key, None) is not None:
+                        dropped += 1
+            self._invalidations += dropped
+        if dropped:
+            logger.debug(f"Invalidated {dropped} cached responses for {tags}")
+        return dropped
+
+    def record(self, *, hit: bool = False, revalidated: bool = False) -> None:
+        """Update the hit/miss counters."""
+        with self._lock:
+            if revalidated:
+                self._revalidations += 1
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._hits = self._misses = self._revalidations = 0
+            self._invalidations = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of cache metrics.
+
+        Returns:
+            Dictionary with configuration, current size and hit/miss,
+            revalidation and invalidation counters.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "revalidate_after": self.revalidate_after,
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "revalidations": self._revalidations,
+                "invalidations": self._invalidations,
+            }
+
+    def _rebuild_tag_index(self) -> None:
+        # Called with the lock held; drops index entries of expired/evicted keys
+        self._entries.expire()
+        self._tags = {}
+        for key, entry in self._entries.items():
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+
+_response_cache: ResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, creating it on first use."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache.from_env()
+        return _response_cache
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert arguments into a hashable, order-insensitive where it should be."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, set | frozenset):
+        return tuple(sorted(repr(_freeze(v)) for v in value))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str | int | float | bool | type(None)):
+        return value
+    return repr(value)
+
+
+def _instance_url(config: Any) -> str:
+    return str(getattr(config, "url", "") or "").rstrip("/").lower()
+
+
+def credential_identity(config: Any) -> str:
+    """Fingerprint the credentials so users never see each other's responses.
+
+    The default project/space filters are included as they change query results.
+    """
+    oauth_config = getattr(config, "oauth_config", None)
+    parts = [
+        _instance_url(config),
+        str(getattr(config, "auth_type", "")),
+        str(getattr(config, "username", "") or ""),
+        str(getattr(config, "api_token", "") or ""),
+        str(getattr(config, "personal_token", "") or ""),
+        str(getattr(config, "projects_filter", "") or ""),
+        str(getattr(config, "spaces_filter", "") or ""),
+    ]
+    if oauth_config is not None:
+        parts += [
+            str(getattr(oauth_config, "cloud_id", "") or ""),
+            str(
+                getattr(oauth_config, "refresh_token", None)
+                or getattr(oauth_config, "access_token", "")
+                or ""
+            ),
+        ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _entity_tag(url: str, kind: str, entity: Any) -> Tag:
+    return (url, kind, str(entity).strip().upper())
+
+
+def cached_response(
+    kind: str,
+    *,
+    entity_arg: str | None = None,
+    revalidate: str | None = None,
+    cache_empty: bool = True,
+) -> Callable[[F], F]:
+    """Cache the result of a fetcher read method.
+
+    Args:
+        kind: Entity kind used for invalidation (e.g. "jira-issue").
+        entity_arg: Name of the argument identifying the entity, if any.
+        revalidate: Name of a method ``(cached_value, arguments) -> bool`` that
+            checks whether a cached value is still current.
+        cache_empty: Whether falsy results (e.g. swallowed errors) are cached.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        sig = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            cache = get_response_cache()
+            if not cache.enabled:
+                return func(self, *args, **kwargs)
+
+            bound = sig.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop(next(iter(sig.parameters)), None)  # drop self
+            key = (
+                credential_identity(self.config),
+                func.__qualname__,
+                _freeze(arguments),
+            )
+
+            entry = cache.get(key)
+            if entry is not None:
+                if not cache.needs_revalidation(entry):
+                    cache.record(hit=True)
+                    return copy.deepcopy(entry.value)
+                if revalidate is not None:
+                    try:
+                        current = getattr(self, revalidate)(entry.value, arguments)
+                    except Exception as e:  # noqa: BLE001 - treat as stale
+                        logger.debug(f"Revalidation of {func.__qualname__} failed: {e}")
+                        current = False
+                    if current:
+                        cache.mark_validated(entry)
+                        cache.record(hit=True, revalidated=True)
+                        return copy.deepcopy(entry.value)
+
+            cache.record(hit=False)
+            value = func(self, *args, **kwargs)
+            if value or cache_empty:
+                url = _instance_url(self.config)
+                tags = {(url, kind)}
+                if entity_arg and arguments.get(entity_arg) is not None:
+                    tags.add(_entity_tag(url, kind, arguments[entity_arg]))
+                cache.put(key, copy.deepcopy(value), frozenset(tags))
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidates_response_cache(
+    kind: str,
+    *,
+    entity_arg: str | None = None,
+    also: tuple[str, ...] = (),
+) -> Callable[[F], F]:
+    """Invalidate cached responses affected by a fetcher write method.
+
+    Entries are dropped both before the write (so reads performed by the
+    method itself are fresh) and after it, whether or not it succeeded.
+
+    Args:
+        kind: Entity kind written to (e.g. "jira-issue").
+        entity_arg: Name of the argument identifying the entity. When omitted,
+            every entry of this kind is invalidated.
+        also: Further kinds whose entries are all invalidated, such as
+            search results that may include the entity.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        sig = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            cache = get_response_cache()
+            if not cache.enabled:
+                return func(self, *args, **kwargs)
+
+            url = _instance_url(self.config)
+            tags: list[Tag] = [(url, other) for other in also]
+            entity = None
+            if entity_arg:
+                bound = sig.bind(self, *args, **kwargs)
+                entity = bound.arguments.get(entity_arg)
+            if entity is not None:
+                tags.append(_entity_tag(url, kind, entity))
+            else:
+                tags.append((url, kind))
+
+            cache.invalidate(*tags)
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                cache.invalidate(*tags)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
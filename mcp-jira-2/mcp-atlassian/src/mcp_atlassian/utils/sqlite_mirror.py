@@ -0,0 +1,377 @@
+"""Shared plumbing of the opt-in SQLite mirrors of Jira and Confluence content.
+
+A mirror keeps a copy of some scopes (Jira projects, Confluence spaces) in a
+SQLite database, synced incrementally from a per-scope watermark, and fully
+every full_sync_interval seconds to drop what incremental syncs cannot see
+(deleted content, content moved out of a scope). The data is bound to the
+user it was synced as (site and account, not the token, so refreshed OAuth
+tokens keep it) and is only served to fetchers of the same user. When SQLite
+was built with FTS5, mirrors also maintain a full-text index searched with
+BM25 ranking.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from cachetools import LRUCache
+
+from .response_cache import credential_identity
+
+logger = logging.getLogger("mcp-atlassian")
+
+# Without the user's time zone, JQL/CQL dates are read in an unknown zone;
+# look back far enough to cover any UTC offset
+UNKNOWN_TIMEZONE_MARGIN = timedelta(hours=14)
+
+_BASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    watermark REAL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Snippet markers around matched terms and tokens of context around them
+SNIPPET_MARKERS = ("**", "**")
+SNIPPET_TOKENS = 16
+
+
+@dataclass
+class MirrorRead:
+    """A read answered from a mirror."""
+
+    value: Any
+    staleness: float  # Seconds since the oldest involved scope was synced
+
+
+def fts_match_expression(query: str) -> str:
+    """Turn free text into an FTS5 MATCH expression.
+
+    Every word must match, as a literal term so that FTS5 syntax characters
+    in the input cannot cause errors. A trailing ``*`` makes a prefix search
+    and an upper-case ``OR`` between words keeps its meaning.
+
+    Raises:
+        ValueError: If the query contains no words
+    """
+    terms = []
+    for word in query.split():
+        if word == "OR" and terms and terms[-1] != "OR":
+            terms.append(word)
+            continue
+        prefix = word.endswith("*")
+        word = word.rstrip("*")
+        if word:
+            terms.append('"' + word.replace('"', '""') + '"' + ("*" if prefix else ""))
+    if terms and terms[-1] == "OR":
+        terms.pop()
+    if not terms:
+        msg = "Search query must contain at least one word"
+        raise ValueError(msg)
+    return " ".join(terms)
+
+
+class SQLiteMirror(ABC):
+    """Connection, ownership and sync bookkeeping shared by the mirrors."""
+
+    # Tables of the concrete mirror, and its optional FTS5 tables
+    schema = ""
+    fts_schema = ""
+    # Tables emptied when the mirror changes owner
+    data_tables: tuple[str, ...] = ()
+    # Name used in log and error messages
+    label = "mirror"
+
+    def __init__(
+        self,
+        path: str | None,
+        scopes: list[str],
+        max_age: float | None,
+        sync_interval: float,
+        full_sync_interval: float = 0,
+    ) -> None:
+        """Initialize the mirror; the database is opened on first use.
+
+        Args:
+            path: SQLite database file. None disables the mirror.
+            scopes: Normalized keys of the projects or spaces to mirror.
+            max_age: Seconds after a sync during which reads may be answered,
+                None if the mirror does not answer reads in place of the API.
+            sync_interval: Seconds between background syncs. 0 disables them.
+            full_sync_interval: Seconds between full background syncs. 0 only
+                runs incremental ones.
+        """
+        self.path = path
+        self.scopes = [scope for scope in scopes if scope]
+        self.max_age = max_age
+        self.sync_interval = sync_interval
+        self.full_sync_interval = full_sync_interval
+        self._lock = threading.RLock()
+        # Account of the user behind each credential set
+        self._accounts: LRUCache[str, str] = LRUCache(maxsize=64)
+        self._connection: sqlite3.Connection | None = None
+        self._fts = False
+        self._mirror_reads = 0
+        self._live_reads = 0
+        self._syncs = 0
+        self._sync_errors = 0
+        self._local_searches = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the mirror is configured."""
+        return bool(self.path and self.scopes)
+
+    def _db(self) -> sqlite3.Connection:
+        # Callers hold self._lock
+        if self._connection is None:
+            if not self.path:
+                msg = f"{self.label} is not configured"
+                raise ValueError(msg)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            if self.path != ":memory:":
+                connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_BASE_SCHEMA + self.schema)
+            try:
+                connection.executescript(self.fts_schema)
+                self._fts = bool(self.fts_schema)
+            except sqlite3.OperationalError as e:
+                logger.warning(f"{self.label}: full-text index unavailable: {e}")
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @abstractmethod
+    def _account_id(self, fetcher: Any) -> str:
+        """Stable identifier of the user the fetcher acts as."""
+
+    def _owner_identity(self, fetcher: Any) -> str:
+        """Fingerprint the site and user behind the fetcher's credentials.
+
+        Unlike credential_identity, it survives token refreshes and rotations.
+        """
+        config = fetcher.config
+        credentials = credential_identity(config)
+        with self._lock:
+            account = self._accounts.get(credentials)
+            if account is None:
+                account = self._account_id(fetcher)
+                self._accounts[credentials] = account
+        oauth_config = getattr(config, "oauth_config", None)
+        parts = [
+            str(config.url).rstrip("/"),
+            str(getattr(oauth_config, "cloud_id", "") or ""),
+            account,
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def _claim(self, owner: str) -> None:
+        """Bind the database to a user, dropping another owner's data."""
+        db = self._db()
+        row = db.execute("SELECT value FROM meta WHERE name = 'owner'").fetchone()
+        if row is not None and row[0] == owner:
+            return
+        if row is not None:
+            logger.warning(f"{self.label} was synced as another user, resetting")
+        with db:
+            # Table names are class constants
+            for table in self.data_tables:
+                db.execute(f"DELETE FROM {table}")  # noqa: S608
+            db.execute("DELETE FROM sync_state")
+            db.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('owner', ?)",
+                (owner,),
+            )
+
+    def _owner(self) -> str | None:
+        row = (
+            self._db().execute("SELECT value FROM meta WHERE name = 'owner'").fetchone()
+        )
+        return row[0] if row else None
+
+    def _usable_by(self, fetcher: Any) -> bool:
+        if not self.enabled:
+            return False
+        try:
+            owner = self._owner_identity(fetcher)
+        except Exception as e:  # noqa: BLE001 - an unknown user reads live
+            logger.warning(f"{self.label}: could not identify the user: {e}")
+            return False
+        return self._owner() == owner
+
+    def _watermark(self, scope: str) -> tuple[bool, float | None]:
+        """Whether the scope was synced before, and its watermark."""
+        with self._lock:
+            row = (
+                self._db()
+                .execute("SELECT watermark FROM sync_state WHERE scope = ?", (scope,))
+                .fetchone()
+            )
+        return (False, None) if row is None else (True, row[0])
+
+    def _record_sync(
+        self, db: sqlite3.Connection, scope: str, watermark: float | None, at: float
+    ) -> None:
+        db.execute(
+            "INSERT OR REPLACE INTO sync_state (scope, watermark, synced_at) "
+            "VALUES (?, ?, ?)",
+            (scope, watermark, at),
+        )
+
+    def _staleness(self, scopes: set[str]) -> float | None:
+        """Seconds since the least recently synced scope, None if any is not synced."""
+        if not scopes or not scopes <= set(self.scopes):
+            return None
+        rows = (
+            self._db()
+            .execute(
+                f"SELECT synced_at FROM sync_state WHERE scope IN "  # noqa: S608
+                f"({', '.join('?' for _ in scopes)})",
+                sorted(scopes),
+            )
+            .fetchall()
+        )
+        if len(rows) < len(scopes):
+            return None
+        return max(0.0, time.time() - min(synced_at for (synced_at,) in rows))
+
+    def _freshness(self, scopes: set[str]) -> float | None:
+        """Seconds since the least recently synced scope, if all are fresh."""
+        staleness = self._staleness(scopes)
+        if staleness is None or self.max_age is None or staleness > self.max_age:
+            return None
+        return staleness
+
+    def _searchable(self, fetcher: Any, scopes: Iterable[str] | None) -> set[str]:
+        """Check a local search can be served and return the scopes it covers.
+
+        Raises:
+            ValueError: If the mirror is not configured, synced with other
+                credentials, has no full-text index, or a scope is not mirrored
+        """
+        if not self.enabled:
+            msg = f"Local search needs the {self.label} to be configured"
+            raise ValueError(msg)
+        if not self._usable_by(fetcher):
+            msg = f"The {self.label} was not synced as this user"
+            raise ValueError(msg)
+        if not self._fts:
+            msg = "Local search needs SQLite with FTS5"
+            raise ValueError(msg)
+        selected = set(scopes or self.scopes)
+        unknown = selected - set(self.scopes)
+        if unknown:
+            msg = (
+                f"Not mirrored: {', '.join(sorted(unknown))}. "
+                f"Mirrored: {', '.join(self.scopes)}"
+            )
+            raise ValueError(msg)
+        return selected
+
+    @abstractmethod
+    def sync(self, fetcher: Any, *, full: bool = False) -> dict[str, int]:
+        """Pull new and updated content of every mirrored scope.
+
+        Args:
+            fetcher: Fetcher to read with; its user owns the mirror from now on
+            full: Reload everything and drop content no longer in the scopes
+
+        Returns:
+            Number of items stored per scope
+        """
+
+    def _full_sync_due(self) -> bool:
+        """Whether full_sync_interval seconds passed since the last full sync."""
+        if self.full_sync_interval <= 0:
+            return False
+        with self._lock:
+            row = (
+                self._db()
+                .execute("SELECT value FROM meta WHERE name = 'full_synced_at'")
+                .fetchone()
+            )
+            if row is None:
+                # Initial loads are complete; count from the first round
+                self._record_full_sync()
+                return False
+        return time.time() - float(row[0]) >= self.full_sync_interval
+
+    def _record_full_sync(self) -> None:
+        with self._lock:
+            db = self._db()
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) "
+                    "VALUES ('full_synced_at', ?)",
+                    (str(time.time()),),
+                )
+
+    def sync_forever(
+        self, get_fetcher: Callable[[], Any], stop: threading.Event
+    ) -> None:
+        """Sync every sync_interval seconds until ``stop`` is set.
+
+        Every full_sync_interval seconds the sync is a full one, removing
+        content that was deleted or moved out of the mirrored scopes.
+        """
+        while not stop.is_set():
+            try:
+                full = self._full_sync_due()
+                self.sync(get_fetcher(), full=full)
+                if full:
+                    self._record_full_sync()
+            except Exception as e:  # noqa: BLE001 - keep syncing on the next round
+                logger.warning(f"{self.label} sync failed: {e}")
+            stop.wait(self.sync_interval)
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for name, increment in increments.items():
+                setattr(self, f"_{name}", getattr(self, f"_{name}") + increment)
+
+    def _stats(
+        self, scope_counts_sql: str, scope_name: str, item_name: str
+    ) -> dict[str, Any]:
+        """Mirror metrics; the query yields (scope, item count, synced_at) rows."""
+        with self._lock:
+            scopes: dict[str, Any] = {}
+            if self.enabled and self._connection is not None:
+                now = time.time()
+                for scope, items, synced_at in self._connection.execute(
+                    scope_counts_sql
+                ):
+                    scopes[scope] = {
+                        item_name: items,
+                        "seconds_since_sync": round(now - synced_at, 1),
+                    }
+            return {
+                "enabled": self.enabled,
+                "max_age": self.max_age,
+                "sync_interval": self.sync_interval,
+                "full_sync_interval": self.full_sync_interval,
+                "full_text": self._fts,
+                scope_name: scopes,
+                "mirror_reads": self._mirror_reads,
+                "live_reads": self._live_reads,
+                "local_searches": self._local_searches,
+                "syncs": self._syncs,
+                "sync_errors": self._sync_errors,
+            }
@@ -4,6 +4,8 @@ Root pytest configuration file for MCP Atlassian tests.
 
 import pytest
 
+from mcp_atlassian.preprocessing.conversion_cache import get_conversion_cache
+
 
 def pytest_addoption(parser):
     """Add command-line options for tests."""
@@ -15,6 +17,14 @@ def pytest_addoption(parser):
     )
 
 
+@pytest.fixture(autouse=True)
+def clear_conversion_cache():
+    """Ensure memoized conversions do not leak between tests."""
+    get_conversion_cache().clear()
+    yield
+    get_conversion_cache().clear()
+
+
 @pytest.fixture
 def use_real_jira_data(request):
     """
@@ -1,7 +1,23 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
 import pytest
+from atlassian.errors import ApiNotFoundError
+from requests.exceptions import HTTPError
 
 from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+from mcp_atlassian.preprocessing.conversion_cache import (
+    ConversionCache,
+    get_conversion_cache,
+)
+from mcp_atlassian.preprocessing.conversion_pool import ConversionPool
+from mcp_atlassian.preprocessing.html_to_markdown import get_html_converter
 from mcp_atlassian.preprocessing.jira import JiraPreprocessor
+from mcp_atlassian.preprocessing.user_lookup import (
+    clear_display_name_cache,
+    resolve_display_names,
+)
 from tests.fixtures.confluence_mocks import MOCK_COMMENTS_RESPONSE, MOCK_PAGE_RESPONSE
 from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
 
@@ -16,6 +32,14 @@ class MockConfluenceClient:
         }
 
 
+@pytest.fixture(autouse=True)
+def clear_user_display_names():
+    """Ensure cached Confluence display names do not leak between tests."""
+    clear_display_name_cache()
+    yield
+    clear_display_name_cache()
+
+
 @pytest.fixture
 def preprocessor_with_jira():
     return JiraPreprocessor(base_url="https://example.atlassian.net")
@@ -116,6 +140,19 @@ def test_clean_jira_text_user_mentions(preprocessor_with_jira):
     assert cleaned == "Hello User:123456!"
 
 
+def test_clean_jira_text_renders_known_display_names():
+    """Mentions of known accounts render as names, per preprocessor."""
+    names = {"123456": "Jane Doe"}
+    named = JiraPreprocessor(
+        base_url="https://example.atlassian.net", display_name_for=names.get
+    )
+    anonymous = JiraPreprocessor(base_url="https://example.atlassian.net")
+    text = "Hello [~accountid:123456] and [~accountid:999]!"
+
+    assert named.clean_jira_text(text) == "Hello @Jane Doe and User:999!"
+    assert anonymous.clean_jira_text(text) == "Hello User:123456 and User:999!"
+
+
 def test_clean_jira_text_smart_links(preprocessor_with_jira):
     """Test cleaning Jira text with smart links."""
     base_url = "https://example.atlassian.net"
@@ -174,6 +211,38 @@ def test_process_mentions_error_handling(preprocessor_with_jira):
     assert "User:invalid" in processed
 
 
+def test_process_mentions_and_smart_links_in_long_text(preprocessor_with_jira):
+    """Every mention and smart link in a long text is converted in one pass."""
+    base_url = "https://example.atlassian.net"
+    text = " ".join(
+        f"[~accountid:user{i}] see [Issue|{base_url}/browse/PROJ-{i}|smart-link]"
+        f" and [Docs|https://docs.example.com/page?id={i}|smart-link]."
+        for i in range(300)
+    )
+
+    text = preprocessor_with_jira._process_mentions(text, r"\[~accountid:(.*?)\]")
+    text = preprocessor_with_jira._process_smart_links(text)
+
+    assert "accountid" not in text
+    assert "smart-link" not in text
+    assert "User:user299 see" in text
+    assert f"[PROJ-299]({base_url}/browse/PROJ-299)" in text
+    assert text.count("[Docs](https://docs.example.com/page)") == 300
+
+
+def test_jira_and_markdown_tables(preprocessor_with_jira):
+    """Table headers gain or lose their separator row, other rows are kept."""
+    jira = "||Key||Summary||\n|PROJ-1|First|\n|PROJ-2|Second|"
+    markdown = "| Key | Summary |\n|-----|---------|\n| PROJ-1 | First |"
+
+    assert preprocessor_with_jira.jira_to_markdown(jira) == (
+        "|Key|Summary|\n|---|---|\n|PROJ-1|First|\n|PROJ-2|Second|"
+    )
+    assert preprocessor_with_jira.markdown_to_jira(markdown) == (
+        "|| Key || Summary ||\n| PROJ-1 | First |"
+    )
+
+
 def test_jira_to_markdown(preprocessor_with_jira):
     """Test conversion of Jira markup to Markdown."""
     # Test headers
@@ -498,3 +567,370 @@ More content.
     # Note: md2conf may use different anchor formats, so we check for presence of id attributes
     assert "<h1>" in result_with_anchors
     assert "<h2>" in result_with_anchors
+
+
+class CountingConfluenceClient:
+    """Mock client recording how often each user is looked up."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_user_details_by_accountid(self, account_id):
+        with self.lock:
+            self.calls.append(account_id)
+        if account_id == "missing":
+            raise ApiNotFoundError("The user with the given account does not exist")
+        if account_id == "throttled":
+            raise HTTPError(response=MagicMock(status_code=429))
+        return {"displayName": f"User {account_id}"}
+
+    def get_user_details_by_username(self, username):
+        with self.lock:
+            self.calls.append(username)
+        return {"displayName": f"Server User {username}"}
+
+
+def _mention(account_id):
+    return f'<ac:link><ri:user ri:account-id="{account_id}" /></ac:link>'
+
+
+def _profile_macro(attr, value):
+    return (
+        '<ac:structured-macro ac:name="profile">'
+        f'<ac:parameter ac:name="user"><ri:user {attr}="{value}" /></ac:parameter>'
+        "</ac:structured-macro>"
+    )
+
+
+def test_user_mentions_are_resolved_once_per_user():
+    """Repeated mentions and macros of the same user cost a single lookup."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+    html = (
+        "<p>"
+        + "".join(_mention(f"user{i % 5}") for i in range(40))
+        + _profile_macro("ri:account-id", "user1")
+        + _profile_macro("ri:userkey", "key1")
+        + _mention("missing")
+        + "</p>"
+    )
+
+    processed_html, _ = preprocessor.process_html_content(html)
+
+    assert sorted(client.calls) == sorted(
+        ["user0", "user1", "user2", "user3", "user4", "key1", "missing"]
+    )
+    assert processed_html.count("@User user1") == 9
+    assert "@Server User key1" in processed_html
+    assert "@user_missing" in processed_html
+
+
+def test_user_display_names_are_shared_across_calls():
+    """Display names (and failed lookups) are cached per Confluence URL."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+    other = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net/", confluence_client=client
+    )
+
+    preprocessor.process_html_content(
+        f"<p>{_mention('user1')}{_mention('missing')}</p>"
+    )
+    processed_html, _ = other.process_html_content(
+        f"<p>{_mention('user1')}{_mention('missing')}</p>"
+    )
+
+    assert sorted(client.calls) == ["missing", "user1"]
+    assert "@User user1" in processed_html
+    assert "@user_missing" in processed_html
+
+
+def test_user_display_names_are_keyed_by_credentials():
+    """Names resolved with one set of credentials are not served to another."""
+    client = CountingConfluenceClient()
+    html = f"<p>{_mention('user1')}{_mention('missing')}</p>"
+
+    for token in ("token-a", "token-b", "token-a"):
+        config = SimpleNamespace(
+            url="https://example.atlassian.net", auth_type="pat", personal_token=token
+        )
+        processed_html, _ = ConfluencePreprocessor(
+            base_url=config.url, confluence_client=client, config=config
+        ).process_html_content(html)
+        assert "@User user1" in processed_html
+
+    assert sorted(client.calls) == ["missing", "missing", "user1", "user1"]
+
+
+def test_failed_user_lookups_are_not_cached():
+    """Throttled or failed lookups are retried, unlike users that do not exist."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+
+    for _ in range(2):
+        processed_html, _ = preprocessor.process_html_content(
+            f"<p>{_mention('throttled')}{_mention('missing')}</p>"
+        )
+        assert "@user_throttled" in processed_html
+
+    assert sorted(client.calls) == ["missing", "throttled", "throttled"]
+
+
+def test_conversions_are_memoized_unless_a_user_is_unresolved():
+    """Cacheability follows the users reported unresolved, not the page text."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+    literal = f"<p>Ask @user_admin or [User Profile: x] {_mention('user1')}</p>"
+    failing = f"<p>{_mention('throttled')}</p>"
+
+    assert preprocessor.convert_html_content(literal)[2] == frozenset()
+    assert preprocessor.convert_html_content(failing)[2] == {
+        ("account-id", "throttled")
+    }
+    calls = len(client.calls)
+    get_conversion_cache().clear()
+
+    for _ in range(2):
+        preprocessor.process_html_content(literal)
+        preprocessor.process_html_content(failing)
+
+    assert get_conversion_cache().stats()["hits"] == 1
+    assert client.calls[calls:] == ["throttled", "throttled"]
+
+
+HTML_CONVERSION_SAMPLES = [
+    MOCK_PAGE_RESPONSE["body"]["storage"]["value"],
+    "<p>Hello " + _mention("user1") + " and  " + _mention("user2") + " !</p>",
+    """
+    <h1>Title</h1><h3>Sub  title</h3>
+    <table><thead><tr><th>Key</th><th colspan="2">Summary</th></tr></thead>
+    <tbody><tr><td>A_1</td><td>*bold*</td><td><a href="https://x.y/a_b">https://x.y/a_b</a></td></tr>
+    </tbody></table>
+    <ul><li>one <b> two </b><ul><li>nested<br/>line</li></ul></li><li>three</li></ul>
+    <ol start="3"><li>three</li><li>four</li></ol>
+    <blockquote><p>quoted</p></blockquote><hr/>
+    <pre><code>x = a_b * 2</code></pre><p><code>inline_code</code> <em>em</em></p>
+    """,
+    (
+        '<ac:structured-macro ac:name="code"><ac:plain-text-body>'
+        "<![CDATA[def f(a_b):\n    return a_b * 2]]></ac:plain-text-body>"
+        "</ac:structured-macro>"
+    ),
+]
+
+
+@pytest.mark.parametrize("engine", ["fast", "lxml"])
+@pytest.mark.parametrize("html", HTML_CONVERSION_SAMPLES)
+def test_html_converters_match_markdownify(monkeypatch, engine, html):
+    """The fast conversion engines produce the same output as markdownify."""
+    if engine == "lxml":
+        pytest.importorskip("lxml")
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net",
+        confluence_client=MockConfluenceClient(),
+    )
+    monkeypatch.setenv("ATLASSIAN_HTML_CONVERTER", "markdownify")
+    expected_html, expected_markdown = preprocessor.process_html_content(html)
+
+    monkeypatch.setenv("ATLASSIAN_HTML_CONVERTER", engine)
+    processed_html, processed_markdown = preprocessor.process_html_content(html)
+
+    assert processed_markdown == expected_markdown
+    if engine == "fast":
+        assert processed_html == expected_html
+
+
+def test_jira_html_conversion_matches_markdownify(monkeypatch, preprocessor_with_jira):
+    """HTML embedded in Jira text converts the same with the fast engine."""
+    text = "Intro <b>bold</b> text<ul><li>item_1</li><li>item 2</li></ul>tail"
+    monkeypatch.setenv("ATLASSIAN_HTML_CONVERTER", "markdownify")
+    expected = preprocessor_with_jira.clean_jira_text(text)
+
+    monkeypatch.setenv("ATLASSIAN_HTML_CONVERTER", "fast")
+
+    assert preprocessor_with_jira.clean_jira_text(text) == expected
+
+
+def test_markdownify_is_the_default_html_converter(monkeypatch):
+    """The fast engines are opt-in; unset or unknown names use markdownify."""
+    monkeypatch.delenv("ATLASSIAN_HTML_CONVERTER", raising=False)
+    assert get_html_converter() == "markdownify"
+
+    monkeypatch.setenv("ATLASSIAN_HTML_CONVERTER", "selectolax")
+    assert get_html_converter() == "markdownify"
+
+    monkeypatch.setenv("ATLASSIAN_HTML_CONVERTER", " Fast ")
+    assert get_html_converter() == "fast"
+
+
+def test_process_html_content_is_memoized():
+    """Unchanged page bodies are converted once; space key is part of the key."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+    html = f"<p>{_mention('user1')} wrote this</p>"
+
+    first = preprocessor.process_html_content(html, space_key="DEV")
+    with patch(
+        "mcp_atlassian.preprocessing.base.parse_html", side_effect=AssertionError
+    ):
+        assert preprocessor.process_html_content(html, space_key="DEV") == first
+
+    stats = get_conversion_cache().stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["bytes"] > 0
+
+    preprocessor.process_html_content(html, space_key="OPS")
+    assert get_conversion_cache().stats()["misses"] == 2
+
+
+def test_process_html_content_unresolved_users_are_not_memoized():
+    """Pages whose mentions fell back are converted again on the next read."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+    html = f"<p>{_mention('missing')}</p>"
+
+    preprocessor.process_html_content(html)
+    preprocessor.process_html_content(html)
+
+    assert get_conversion_cache().stats()["entries"] == 0
+
+
+def test_jira_conversions_are_memoized(preprocessor_with_jira):
+    """Jira text conversions return cached results for identical input."""
+    text = "h1. Title\n*bold* and {{code}}"
+
+    markdown = preprocessor_with_jira.jira_to_markdown(text)
+    jira = preprocessor_with_jira.markdown_to_jira(markdown)
+    with patch("mcp_atlassian.preprocessing.jira.re.sub", side_effect=AssertionError):
+        assert preprocessor_with_jira.jira_to_markdown(text) == markdown
+        assert preprocessor_with_jira.markdown_to_jira(markdown) == jira
+
+
+def test_conversion_cache_evicts_by_size():
+    """Least recently used results are evicted once the byte budget is exceeded."""
+    cache = ConversionCache(maxbytes=4000, ttl=60)
+
+    cache.put("a", "x" * 1000)
+    cache.put("b", "y" * 1000)
+    assert cache.get("a") == (True, "x" * 1000)
+    cache.put("c", "z" * 1500)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a")[0]
+    assert cache.get("c")[0]
+    cache.put("huge", "h" * 10000)
+    assert cache.get("huge") == (False, None)
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 4000
+    assert stats["hits"] == 3
+    assert stats["misses"] == 2
+
+
+def test_conversion_cache_disabled(monkeypatch, preprocessor_with_jira):
+    """A zero byte budget disables memoization."""
+    monkeypatch.setattr(
+        "mcp_atlassian.preprocessing.conversion_cache._conversion_cache",
+        ConversionCache(maxbytes=0, ttl=60),
+    )
+
+    preprocessor_with_jira.jira_to_markdown("*bold*")
+    preprocessor_with_jira.jira_to_markdown("*bold*")
+
+    stats = get_conversion_cache().stats()
+    assert not stats["enabled"]
+    assert stats["hits"] == stats["misses"] == 0
+
+
+def test_conversion_pool_converts_small_batches_inline():
+    """Without workers, or below the batch threshold, pages convert in-process."""
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+    pages = [f"<p>Page {i}</p>" for i in range(3)]
+
+    for pool in (ConversionPool(processes=0, min_batch=1), ConversionPool(2, 4)):
+        results = pool.process_html_contents(preprocessor, pages, space_key="DEV")
+
+        assert [markdown.strip() for _, markdown in results] == [
+            "Page 0",
+            "Page 1",
+            "Page 2",
+        ]
+        assert pool.stats()["inline_batches"] == 1
+        assert not pool.stats()["started"]
+
+
+def test_conversion_pool_matches_inline_conversion():
+    """Worker processes return the inline results, in order, sharing the memo."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+    pages = [
+        f"<h2>Page {i}</h2><p>{_mention(f'user{i % 3}')}</p>"
+        + _profile_macro("ri:userkey", "key1")
+        for i in range(6)
+    ]
+    pages[0] += _mention("missing")
+    pages.append(MOCK_PAGE_RESPONSE["body"]["storage"]["value"])
+    pool = ConversionPool(processes=2, min_batch=2)
+    try:
+        results = pool.process_html_contents(preprocessor, pages, space_key="DEV")
+        assert pool.stats()["parallel_pages"] == len(pages)
+
+        # Mentioned users were resolved once, in this process
+        assert sorted(client.calls) == sorted(
+            ["user0", "user1", "user2", "missing", "key1", "user123"]
+        )
+        # Pages without failed lookups were memoized, the rest is too small a
+        # batch for the workers
+        assert pool.process_html_contents(preprocessor, pages, space_key="DEV") == (
+            results
+        )
+        assert pool.stats()["parallel_batches"] == 1
+    finally:
+        pool.shutdown()
+
+    get_conversion_cache().clear()
+    assert results == [
+        preprocessor.process_html_content(page, space_key="DEV") for page in pages
+    ]
+
+
+def test_conversion_pool_resolves_inline_batch_users_at_once():
+    """Users of all pages in an inline batch are looked up in one batch."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+    pages = [f"<p>{_mention(f'user{i}')}</p>" for i in range(3)]
+
+    with patch(
+        "mcp_atlassian.preprocessing.conversion_pool.resolve_display_names",
+        wraps=resolve_display_names,
+    ) as batch_lookup:
+        results = ConversionPool(processes=0, min_batch=1).process_html_contents(
+            preprocessor, pages
+        )
+
+    batch_lookup.assert_called_once()
+    assert sorted(client.calls) == ["user0", "user1", "user2"]
+    assert [markdown.strip() for _, markdown in results] == [
+        "@User user0",
+        "@User user1",
+        "@User user2",
+    ]
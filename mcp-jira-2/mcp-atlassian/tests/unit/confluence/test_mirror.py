@@ -0,0 +1,119 @@
+"""Tests for the Confluence page mirror and its full-text index."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_atlassian.confluence.mirror import PageMirror
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+from mcp_atlassian.utils.sqlite_mirror import fts_match_expression
+
+
+def _result(page_id, title, body, *, version=1, space="DEV"):
+    return {
+        "content": {
+            "id": page_id,
+            "title": title,
+            "space": {"key": space},
+            "version": {"number": version, "when": "2024-03-01T10:00:00.000Z"},
+            "body": {"storage": {"value": body}},
+        }
+    }
+
+
+class FakeFetcher:
+    """Serves raw CQL results per space and records the CQL it was asked for."""
+
+    def __init__(self, results, *, username="user"):
+        self.results = results
+        self.queries = []
+        self.config = SimpleNamespace(
+            url="https://example.atlassian.net/wiki",
+            is_cloud=True,
+            auth_type="basic",
+            username=username,
+            api_token="token",
+            spaces_filter=None,
+        )
+        self.preprocessor = ConfluencePreprocessor(base_url=self.config.url)
+
+    def get_current_user_info(self):
+        return {"accountId": f"account-{self.config.username}"}
+
+    def iter_search_raw(self, cql, expand=None, page_size=50):
+        self.queries.append(cql)
+        space = cql.split('"')[1]
+        yield [r for r in self.results if r["content"]["space"]["key"] == space]
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = PageMirror(
+        path=str(tmp_path / "pages.db"), spaces=["DEV", "TEAM"], sync_interval=0
+    )
+    yield mirror
+    mirror.close()
+
+
+def test_sync_converts_changed_versions_only(mirror):
+    """Incremental syncs skip pages whose version is already mirrored."""
+    fetcher = FakeFetcher(
+        [
+            _result("1", "Runbook", "<p>Restart the <strong>gateway</strong></p>"),
+            _result("2", "Onboarding", "<p>Welcome</p>"),
+        ]
+    )
+    assert mirror.sync(fetcher, ["DEV"]) == {"DEV": 2}
+    assert (
+        fetcher.queries[0] == 'space = "DEV" AND type = page ORDER BY lastModified ASC'
+    )
+
+    fetcher.results[1] = _result("2", "Onboarding", "<p>Welcome aboard</p>", version=2)
+    assert mirror.sync(fetcher, ["DEV"]) == {"DEV": 1}
+    assert 'lastModified >= "2024-02-29 20:00"' in fetcher.queries[1]
+
+
+def test_search_text_ranks_titles_and_builds_urls(mirror):
+    """Title matches rank first; results carry snippets and page URLs."""
+    fetcher = FakeFetcher(
+        [
+            _result("1", "Gateway runbook", "<p>Restart steps</p>"),
+            _result("2", "Incident notes", "<p>The gateway was restarted twice</p>"),
+            _result("3", "Gateway design", "<p>Diagram</p>", space="TEAM"),
+        ]
+    )
+    mirror.sync(fetcher)
+
+    found = mirror.search_text(fetcher, "gateway", spaces=["DEV"])
+
+    assert [r["id"] for r in found.value] == ["1", "2"]
+    assert found.value[0]["url"] == (
+        "https://example.atlassian.net/wiki/spaces/DEV/pages/1"
+    )
+    assert "**gateway**" in found.value[1]["snippet"]
+    with pytest.raises(ValueError, match="not synced as this user"):
+        mirror.search_text(FakeFetcher([], username="other"), "gateway")
+
+
+def test_full_sync_drops_deleted_pages(mirror):
+    """Pages missing from a full sync leave the index."""
+    fetcher = FakeFetcher([_result("1", "Old page", "<p>obsolete</p>")])
+    mirror.sync(fetcher, ["DEV"])
+    fetcher.results = []
+    mirror.sync(fetcher, ["DEV"], full=True)
+
+    assert mirror.stats()["spaces"]["DEV"]["pages"] == 0
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("crash report", '"crash" "report"'),
+        ('say "hi"', '"say" """hi"""'),
+        ("import* OR export", '"import"* OR "export"'),
+        ("OR gateway OR", '"OR" "gateway"'),
+    ],
+)
+def test_fts_match_expression(query, expected):
+    """Free text becomes literal FTS5 terms, keeping prefixes and OR."""
+    assert fts_match_expression(query) == expected
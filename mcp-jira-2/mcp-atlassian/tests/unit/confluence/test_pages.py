@@ -1,6 +1,6 @@
 """Unit tests for the PagesMixin class."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -392,6 +392,21 @@ class TestPagesMixin:
         with pytest.raises(Exception, match="Failed to delete page"):
             pages_mixin.delete_page(page_id)
 
+    def test_is_cached_page_current(self, pages_mixin):
+        """Test cached pages are revalidated against the version number."""
+        page = ConfluencePage.from_api_response(
+            {"id": "123", "title": "Page", "version": {"number": 3}}
+        )
+        pages_mixin.confluence.get_page_by_id.return_value = {"version": {"number": 3}}
+
+        assert pages_mixin._is_cached_page_current(page, {"page_id": "123"})
+        pages_mixin.confluence.get_page_by_id.assert_called_once_with(
+            page_id="123", expand="version"
+        )
+
+        pages_mixin.confluence.get_page_by_id.return_value = {"version": {"number": 4}}
+        assert not pages_mixin._is_cached_page_current(page, {"page_id": "123"})
+
     def test_get_page_children_success(self, pages_mixin):
         """Test successfully getting child pages."""
         # Arrange
@@ -503,6 +518,47 @@ class TestPagesMixin:
         # Assert - should return empty list on error, not raise exception
         assert len(results) == 0
 
+    @pytest.mark.anyio
+    async def test_get_page_children_async(self, pages_mixin):
+        """Test getting child pages through the async transport."""
+        pages_mixin.config.url = "https://example.atlassian.net/wiki"
+        child_pages_data = {
+            "results": [
+                {
+                    "id": "789012",
+                    "title": "Child Page 1",
+                    "space": {"key": "DEMO"},
+                    "version": {"number": 1},
+                }
+            ]
+        }
+
+        with patch.object(
+            pages_mixin, "request_async", AsyncMock(return_value=child_pages_data)
+        ) as mock_request:
+            results = await pages_mixin.get_page_children_async(
+                page_id="123456", limit=10
+            )
+
+        mock_request.assert_awaited_once_with(
+            "GET",
+            "rest/api/content/123456/child/page",
+            params={"start": 0, "limit": 10, "expand": "version"},
+        )
+        assert len(results) == 1
+        assert results[0].id == "789012"
+        assert results[0].space.key == "DEMO"
+
+    @pytest.mark.anyio
+    async def test_get_page_children_async_error(self, pages_mixin):
+        """Test the async variant also returns an empty list on error."""
+        with patch.object(
+            pages_mixin, "request_async", AsyncMock(side_effect=Exception("API Error"))
+        ):
+            results = await pages_mixin.get_page_children_async(page_id="123456")
+
+        assert results == []
+
     def test_get_page_success(self, pages_mixin):
         """Test successful page retrieval."""
         # Setup
@@ -1,6 +1,6 @@
 """Unit tests for the SearchMixin class."""
 
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pytest
 import requests
@@ -56,7 +56,9 @@ class TestSearchMixin:
         result = search_mixin.search("test query")
 
         # Verify API call
-        search_mixin.confluence.cql.assert_called_once_with(cql="test query", limit=10)
+        search_mixin.confluence.cql.assert_called_once_with(
+            cql="test query", start=0, limit=10
+        )
 
         # Verify result
         assert len(result) == 1
@@ -179,6 +181,7 @@ class TestSearchMixin:
         quoted_dev = quote_cql_identifier_if_needed("DEV")
         search_mixin.confluence.cql.assert_called_with(
             cql=f"(test query) AND (space = {quoted_dev})",
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -191,6 +194,7 @@ class TestSearchMixin:
         quoted_team = quote_cql_identifier_if_needed("TEAM")
         search_mixin.confluence.cql.assert_called_with(
             cql=f"(test query) AND (space = {quoted_dev} OR space = {quoted_team})",
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -199,6 +203,7 @@ class TestSearchMixin:
         result = search_mixin.search('space = "EXISTING"', spaces_filter="DEV")
         search_mixin.confluence.cql.assert_called_with(
             cql='space = "EXISTING"',  # Should not add filter when space already exists
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -239,6 +244,7 @@ class TestSearchMixin:
         quoted_team = quote_cql_identifier_if_needed("TEAM")
         search_mixin.confluence.cql.assert_called_with(
             cql=f"(test query) AND (space = {quoted_dev} OR space = {quoted_team})",
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -250,6 +256,7 @@ class TestSearchMixin:
         quoted_override = quote_cql_identifier_if_needed("OVERRIDE")
         search_mixin.confluence.cql.assert_called_with(
             cql=f"(test query) AND (space = {quoted_override})",
+            start=0,
             limit=10,
         )
         assert len(result) == 1
@@ -265,3 +272,74 @@ class TestSearchMixin:
         # Assert
         assert isinstance(results, list)
         assert len(results) == 0
+
+    @staticmethod
+    def _cql_page(ids, *, has_next):
+        response = {
+            "results": [
+                {
+                    "content": {"id": page_id, "title": f"Page {page_id}"},
+                    "excerpt": f"excerpt {page_id}",
+                }
+                for page_id in ids
+            ],
+            "_links": {"next": "/rest/api/search?next=true"} if has_next else {},
+        }
+        return response
+
+    def test_search_follows_start_cursor(self, search_mixin):
+        """Limits above what the server returns per call are filled page by page."""
+        search_mixin.confluence.cql.side_effect = [
+            self._cql_page(["1", "2"], has_next=True),
+            self._cql_page(["3", "4"], has_next=True),
+        ]
+        search_mixin.preprocessor.process_html_content.side_effect = (
+            lambda html, space_key="": (html, html.upper())
+        )
+
+        result = search_mixin.search("type = page", limit=3)
+
+        assert [page.id for page in result] == ["1", "2", "3"]
+        assert [page.content for page in result] == [
+            "EXCERPT 1",
+            "EXCERPT 2",
+            "EXCERPT 3",
+        ]
+        assert search_mixin.confluence.cql.call_args_list == [
+            call(cql="type = page", start=0, limit=3),
+            call(cql="type = page", start=2, limit=1),
+        ]
+
+    def test_iter_search_stops_without_next_link(self, search_mixin):
+        """The iterator fetches lazily and ends on the last page."""
+        search_mixin.confluence.cql.side_effect = [
+            self._cql_page(["1", "2"], has_next=True),
+            self._cql_page(["3"], has_next=False),
+        ]
+
+        pages = search_mixin.iter_search("type = page", page_size=2)
+        assert [page.id for page in next(pages)] == ["1", "2"]
+        assert search_mixin.confluence.cql.call_count == 1
+        assert [page.id for page in next(pages)] == ["3"]
+        assert next(pages, None) is None
+        assert search_mixin.confluence.cql.call_count == 2
+
+    def test_search_uses_first_excerpt_per_content_id(self, search_mixin):
+        """Excerpts are matched to pages by content id."""
+        response = self._cql_page(["1", "2"], has_next=False)
+        response["results"].append(
+            {"content": {"id": "1", "title": "Page 1"}, "excerpt": "duplicate"}
+        )
+        response["results"][1]["excerpt"] = ""
+        search_mixin.confluence.cql.return_value = response
+        search_mixin.preprocessor.process_html_content.side_effect = (
+            lambda html, space_key="": (html, f"md:{html}")
+        )
+
+        result = search_mixin.search("type = page")
+
+        assert [page.content for page in result] == ["md:excerpt 1", "", "md:excerpt 1"]
+        assert {
+            args
+            for args, _ in search_mixin.preprocessor.process_html_content.call_args_list
+        } == {("excerpt 1",)}
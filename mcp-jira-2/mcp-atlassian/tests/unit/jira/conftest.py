@@ -7,6 +7,33 @@ import pytest
 
 from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.jira.epics import clear_epic_strategy_cache
+from mcp_atlassian.jira.field_catalog import invalidate_field_catalog
+from mcp_atlassian.jira.user_cache import get_user_identity_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_field_catalog():
+    """Ensure the process-wide field catalog does not leak between tests."""
+    invalidate_field_catalog()
+    yield
+    invalidate_field_catalog()
+
+
+@pytest.fixture(autouse=True)
+def clear_epic_strategies():
+    """Ensure learned epic lookup strategies do not leak between tests."""
+    clear_epic_strategy_cache()
+    yield
+    clear_epic_strategy_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_user_identity_cache():
+    """Ensure resolved user identities do not leak between tests."""
+    get_user_identity_cache().clear()
+    yield
+    get_user_identity_cache().clear()
 
 
 @pytest.fixture
@@ -1,5 +1,7 @@
 """Tests for the Jira attachments module."""
 
+import json
+import os
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
@@ -27,6 +29,8 @@ from mcp_atlassian.jira.attachments import AttachmentsMixin
 #      - Issue has no fields
 #      - Some attachments fail to download
 #      - Attachment has missing URL
+#    - Concurrency: skips complete files, resumes partial ones, dedupes names
+#    - Manifest: only records complete downloads
 #
 # 3. Single Attachment Upload (upload_attachment method):
 #    - Success case: Uploads file correctly
@@ -41,11 +45,24 @@ from mcp_atlassian.jira.attachments import AttachmentsMixin
 # 4. Multiple Attachments Upload (upload_attachments method):
 #    - Success case: Uploads multiple files correctly
 #    - Partial success: Some files upload successfully, others fail
+#    - Streaming: the multipart body is read from disk as it is sent
 #    - Error cases:
 #      - Empty list of file paths
 #      - No issue key provided
 
 
+def _fake_download(succeeds=lambda url: True):
+    """Stand-in for download_attachment writing a file where it would."""
+
+    def download(url, target_path, *args, **kwargs):
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        with open(target_path, "ab") as f:
+            f.write(b"data")
+        return succeeds(url)
+
+    return download
+
+
 class TestAttachmentsMixin:
     """Tests for the AttachmentsMixin class."""
 
@@ -188,7 +205,7 @@ class TestAttachmentsMixin:
             assert result is False
 
     def test_download_issue_attachments_success(
-        self, attachments_mixin: AttachmentsMixin
+        self, attachments_mixin: AttachmentsMixin, tmp_path
     ):
         """Test successful download of all issue attachments."""
         # Mock the issue data
@@ -224,7 +241,7 @@ class TestAttachmentsMixin:
         # Mock the download_attachment method
         with (
             patch.object(
-                attachments_mixin, "download_attachment", return_value=True
+                attachments_mixin, "download_attachment", side_effect=_fake_download()
             ) as mock_download,
             patch("pathlib.Path.mkdir") as mock_mkdir,
             patch(
@@ -233,7 +250,7 @@ class TestAttachmentsMixin:
             ),
         ):
             result = attachments_mixin.download_issue_attachments(
-                "TEST-123", "/tmp/attachments"
+                "TEST-123", str(tmp_path)
             )
 
             # Assertions
@@ -343,7 +360,7 @@ class TestAttachmentsMixin:
         assert "Could not retrieve issue" in result["error"]
 
     def test_download_issue_attachments_some_failures(
-        self, attachments_mixin: AttachmentsMixin
+        self, attachments_mixin: AttachmentsMixin, tmp_path
     ):
         """Test download when some attachments fail to download."""
         # Mock the issue data
@@ -377,9 +394,12 @@ class TestAttachmentsMixin:
         mock_attachment2.size = 200
 
         # Mock the download_attachment method to succeed for first attachment and fail for second
+        # (keyed by URL, as attachments download concurrently)
         with (
             patch.object(
-                attachments_mixin, "download_attachment", side_effect=[True, False]
+                attachments_mixin,
+                "download_attachment",
+                side_effect=_fake_download(lambda url: url.endswith("1")),
             ) as mock_download,
             patch("pathlib.Path.mkdir") as mock_mkdir,
             patch(
@@ -388,7 +408,7 @@ class TestAttachmentsMixin:
             ),
         ):
             result = attachments_mixin.download_issue_attachments(
-                "TEST-123", "/tmp/attachments"
+                "TEST-123", str(tmp_path)
             )
 
             # Assertions
@@ -442,6 +462,189 @@ class TestAttachmentsMixin:
             assert result["failed"][0]["filename"] == "test1.txt"
             assert "No URL available" in result["failed"][0]["error"]
 
+    def test_download_attachment_resumes_partial_file(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a partial file is completed with an HTTP Range request."""
+        target = tmp_path / "report.log"
+        target.write_bytes(b"first ")
+        mock_response = MagicMock(status_code=206)
+        mock_response.iter_content.return_value = [b"second"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin.download_attachment(
+            "https://test.url/attachment", str(target), expected_size=12, resume=True
+        )
+
+        assert result is True
+        assert target.read_bytes() == b"first second"
+        attachments_mixin.jira._session.get.assert_called_once_with(
+            "https://test.url/attachment", stream=True, headers={"Range": "bytes=6-"}
+        )
+
+    def test_download_attachment_incomplete(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a download shorter than the attachment size is reported failed."""
+        mock_response = MagicMock(status_code=200)
+        mock_response.iter_content.return_value = [b"cut"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        assert not attachments_mixin.download_attachment(
+            "https://test.url/attachment", str(tmp_path / "a.log"), expected_size=10
+        )
+
+    def test_download_issue_attachments_skips_and_resumes(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test complete files are skipped and interrupted downloads resumed."""
+        attachments_mixin.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    {
+                        "id": "1",
+                        "filename": "done.log",
+                        "content": "https://test.url/1",
+                        "size": 4,
+                    },
+                    {
+                        "id": "2",
+                        "filename": "partial.log",
+                        "content": "https://test.url/2",
+                        "size": 8,
+                    },
+                ]
+            }
+        }
+        with patch.object(
+            attachments_mixin,
+            "download_attachment",
+            side_effect=_fake_download(lambda url: url.endswith("1")),
+        ) as mock_download:
+            first = attachments_mixin.download_issue_attachments(
+                "TEST-1", str(tmp_path)
+            )
+            mock_download.reset_mock(side_effect=True)
+            mock_download.side_effect = _fake_download()
+
+            result = attachments_mixin.download_issue_attachments(
+                "TEST-1", str(tmp_path)
+            )
+
+        assert [entry["filename"] for entry in first["failed"]] == ["partial.log"]
+        assert [entry["filename"] for entry in result["skipped"]] == ["done.log"]
+        assert [entry["filename"] for entry in result["downloaded"]] == ["partial.log"]
+        mock_download.assert_called_once_with(
+            "https://test.url/2",
+            str(tmp_path / ".2-partial.log.part"),
+            expected_size=8,
+            resume=True,
+        )
+        assert (tmp_path / "partial.log").read_bytes() == b"datadata"
+        assert not (tmp_path / ".2-partial.log.part").exists()
+
+    def test_manifest_records_only_complete_downloads(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a failed download leaves neither a file nor a manifest entry."""
+        attachments_mixin.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    {"id": n, "filename": f"{n}.log", "content": f"https://t/{n}"}
+                    for n in ("1", "2")
+                ]
+            }
+        }
+        with patch.object(
+            attachments_mixin,
+            "download_attachment",
+            side_effect=_fake_download(lambda url: url.endswith("1")),
+        ):
+            attachments_mixin.download_issue_attachments("TEST-1", str(tmp_path))
+
+        manifest = json.loads((tmp_path / ".jira-attachments.json").read_text())
+        assert manifest == {"1.log": {"id": "1", "size": 0}}
+        assert not (tmp_path / "2.log").exists()
+
+    def test_download_issue_attachments_duplicate_names(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test attachments sharing a filename are saved under distinct names."""
+        attachments_mixin.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    {"id": n, "filename": "log.txt", "content": f"https://test.url/{n}"}
+                    for n in ("10", "11")
+                ]
+            }
+        }
+        with patch.object(
+            attachments_mixin, "download_attachment", side_effect=_fake_download()
+        ):
+            result = attachments_mixin.download_issue_attachments(
+                "TEST-1", str(tmp_path)
+            )
+
+        assert [entry["path"] for entry in result["downloaded"]] == [
+            str(tmp_path / "10_log.txt"),
+            str(tmp_path / "11_log.txt"),
+        ]
+
+    def test_iter_attachment_downloads(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test JQL downloads go to one directory per issue, in search order."""
+        pages = [
+            [
+                {
+                    "key": "TEST-1",
+                    "fields": {
+                        "attachment": [
+                            {"id": "1", "filename": "a.log", "content": "https://t/1"}
+                        ]
+                    },
+                },
+                {"key": "TEST-2", "fields": {"attachment": []}},
+            ],
+            [
+                {
+                    "key": "TEST-3",
+                    "fields": {
+                        "attachment": [
+                            {"id": "3", "filename": "b.log", "content": "https://t/3"}
+                        ]
+                    },
+                },
+                {"key": "TEST-4", "fields": {"attachment": []}},
+            ],
+        ]
+        with (
+            patch.object(
+                attachments_mixin, "iter_search_raw", return_value=iter(pages)
+            ) as mock_search,
+            patch.object(
+                attachments_mixin,
+                "download_attachment",
+                side_effect=_fake_download(lambda url: url.endswith("1")),
+            ),
+        ):
+            result = attachments_mixin.download_attachments_for_jql(
+                "project = TEST", str(tmp_path), max_issues=3
+            )
+
+        mock_search.assert_called_once_with(
+            "project = TEST", fields="attachment", page_size=3
+        )
+        assert [issue["issue_key"] for issue in result["issues"]] == [
+            "TEST-1",
+            "TEST-3",
+        ]
+        assert result["issues"][0]["downloaded"][0]["path"] == str(
+            tmp_path / "TEST-1" / "a.log"
+        )
+        assert result["issues_processed"] == 3
+        assert (result["downloaded"], result["failed"]) == (1, 1)
+
     # Tests for upload_attachment method
 
     def test_upload_attachment_success(self, attachments_mixin: AttachmentsMixin):
@@ -452,7 +655,9 @@ class TestAttachmentsMixin:
             "filename": "test_file.txt",
             "size": 100,
         }
-        attachments_mixin.jira.add_attachment.return_value = mock_attachment_response
+        attachments_mixin._post_attachment = MagicMock(
+            return_value=[mock_attachment_response]
+        )
 
         # Mock file operations
         with (
@@ -480,8 +685,8 @@ class TestAttachmentsMixin:
             assert result["filename"] == "test_file.txt"
             assert result["size"] == 100
             assert result["id"] == "12345"
-            attachments_mixin.jira.add_attachment.assert_called_once_with(
-                issue_key="TEST-123", filename="/absolute/path/test_file.txt"
+            attachments_mixin._post_attachment.assert_called_once_with(
+                "TEST-123", "/absolute/path/test_file.txt"
             )
 
     def test_upload_attachment_relative_path(self, attachments_mixin: AttachmentsMixin):
@@ -492,7 +697,9 @@ class TestAttachmentsMixin:
             "filename": "test_file.txt",
             "size": 100,
         }
-        attachments_mixin.jira.add_attachment.return_value = mock_attachment_response
+        attachments_mixin._post_attachment = MagicMock(
+            return_value=[mock_attachment_response]
+        )
 
         # Mock file operations
         with (
@@ -516,32 +723,35 @@ class TestAttachmentsMixin:
             assert result["success"] is True
             mock_isabs.assert_called_once_with("test_file.txt")
             mock_abspath.assert_called_once_with("test_file.txt")
-            attachments_mixin.jira.add_attachment.assert_called_once_with(
-                issue_key="TEST-123", filename="/absolute/path/test_file.txt"
+            attachments_mixin._post_attachment.assert_called_once_with(
+                "TEST-123", "/absolute/path/test_file.txt"
             )
 
     def test_upload_attachment_no_issue_key(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with no issue key."""
+        attachments_mixin._post_attachment = MagicMock()
         result = attachments_mixin.upload_attachment("", "/path/to/file.txt")
 
         # Assertions
         assert result["success"] is False
         assert "No issue key provided" in result["error"]
-        attachments_mixin.jira.add_attachment.assert_not_called()
+        attachments_mixin._post_attachment.assert_not_called()
 
     def test_upload_attachment_no_file_path(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with no file path."""
+        attachments_mixin._post_attachment = MagicMock()
         result = attachments_mixin.upload_attachment("TEST-123", "")
 
         # Assertions
         assert result["success"] is False
         assert "No file path provided" in result["error"]
-        attachments_mixin.jira.add_attachment.assert_not_called()
+        attachments_mixin._post_attachment.assert_not_called()
 
     def test_upload_attachment_file_not_found(
         self, attachments_mixin: AttachmentsMixin
     ):
         """Test attachment upload when file doesn't exist."""
+        attachments_mixin._post_attachment = MagicMock()
         # Mock file operations
         with (
             patch("os.path.exists") as mock_exists,
@@ -560,12 +770,14 @@ class TestAttachmentsMixin:
             # Assertions
             assert result["success"] is False
             assert "File not found" in result["error"]
-            attachments_mixin.jira.add_attachment.assert_not_called()
+            attachments_mixin._post_attachment.assert_not_called()
 
     def test_upload_attachment_api_error(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with an API error."""
         # Mock the Jira API to raise an exception
-        attachments_mixin.jira.add_attachment.side_effect = Exception("API Error")
+        attachments_mixin._post_attachment = MagicMock(
+            side_effect=Exception("API Error")
+        )
 
         # Mock file operations
         with (
@@ -591,7 +803,7 @@ class TestAttachmentsMixin:
     def test_upload_attachment_no_response(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload when API returns no response."""
         # Mock the Jira API to return None
-        attachments_mixin.jira.add_attachment.return_value = None
+        attachments_mixin._post_attachment = MagicMock(return_value=None)
 
         # Mock file operations
         with (
@@ -637,8 +849,11 @@ class TestAttachmentsMixin:
             for i, ext in enumerate(["txt", "pdf", "jpg"])
         ]
 
+        results_by_path = dict(zip(file_paths, mock_results, strict=True))
         with patch.object(
-            attachments_mixin, "upload_attachment", side_effect=mock_results
+            attachments_mixin,
+            "upload_attachment",
+            side_effect=lambda issue_key, path: results_by_path[path],
         ) as mock_upload:
             # Call the method
             result = attachments_mixin.upload_attachments("TEST-123", file_paths)
@@ -697,8 +912,11 @@ class TestAttachmentsMixin:
             },
         ]
 
+        results_by_path = dict(zip(file_paths, mock_results, strict=True))
         with patch.object(
-            attachments_mixin, "upload_attachment", side_effect=mock_results
+            attachments_mixin,
+            "upload_attachment",
+            side_effect=lambda issue_key, path: results_by_path[path],
         ) as mock_upload:
             # Call the method
             result = attachments_mixin.upload_attachments("TEST-123", file_paths)
@@ -744,3 +962,59 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No issue key provided" in result["error"]
+
+    def test_upload_attachment_streams_multipart_body(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test the file is posted as a streamed multipart body of known length."""
+        file_path = tmp_path / "bundle.log"
+        file_path.write_bytes(b"x" * 300_000)
+        attachments_mixin.jira.url = "https://test.atlassian.net"
+        attachments_mixin.jira.url_joiner = lambda url, path: f"{url}/{path}"
+        attachments_mixin.jira.resource_url.return_value = "rest/api/2/issue"
+        attachments_mixin.jira.no_check_headers = {"X-Atlassian-Token": "no-check"}
+        sent = {}
+
+        def post(url, data, headers, **kwargs):
+            sent.update(url=url, headers=headers, length=len(data))
+            sent["body"] = b"".join(data)
+            return MagicMock(text="[]", json=lambda: [{"id": "10001"}])
+
+        attachments_mixin.jira._session.post.side_effect = post
+
+        result = attachments_mixin.upload_attachment("TEST-1", str(file_path))
+
+        assert result["success"] is True
+        assert result["id"] == "10001"
+        assert sent["url"] == (
+            "https://test.atlassian.net/rest/api/2/issue/TEST-1/attachments"
+        )
+        assert sent["headers"]["X-Atlassian-Token"] == "no-check"
+        boundary = sent["headers"]["Content-Type"].split("boundary=")[1]
+        assert sent["length"] == len(sent["body"])
+        assert sent["body"].startswith(f"--{boundary}\r\n".encode())
+        assert b'filename="bundle.log"' in sent["body"]
+        assert b"x" * 300_000 in sent["body"]
+        assert sent["body"].endswith(f"\r\n--{boundary}--\r\n".encode())
+
+    def test_upload_attachments_continues_after_failure(
+        self, attachments_mixin: AttachmentsMixin
+    ):
+        """Test an upload raising does not stop the remaining uploads."""
+        attachments_mixin._post_attachment = MagicMock(
+            side_effect=lambda issue_key, path: (
+                [{"id": path[-1]}] if not path.endswith("2") else 1 / 0
+            )
+        )
+        file_paths = [f"/path/to/file{n}" for n in range(1, 5)]
+
+        with (
+            patch("os.path.exists", return_value=True),
+            patch("os.path.getsize", return_value=10),
+        ):
+            result = attachments_mixin.upload_attachments(
+                "TEST-1", file_paths, max_concurrent=2
+            )
+
+        assert [entry["id"] for entry in result["uploaded"]] == ["1", "3", "4"]
+        assert result["failed"] == [{"filename": "file2", "error": "division by zero"}]
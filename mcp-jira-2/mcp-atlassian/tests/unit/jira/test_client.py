@@ -1,10 +1,12 @@
 """Tests for the Jira client module."""
 
+import json
 import os
 from copy import deepcopy
 from typing import Literal
 from unittest.mock import MagicMock, call, patch
 
+import httpx
 import pytest
 
 from mcp_atlassian.jira.client import JiraClient
@@ -237,6 +239,72 @@ def test_get_paged_without_cloud():
             client.get_paged("get", "/test/url")
 
 
+@pytest.mark.anyio
+async def test_get_paged_async():
+    """Test get_paged_async follows nextPageToken over the async transport."""
+    requests_seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if len(requests_seen) == 1:
+            return httpx.Response(200, json={"values": [1], "nextPageToken": "p2"})
+        return httpx.Response(200, json={"values": [2]})
+
+    with patch("mcp_atlassian.jira.client.configure_ssl_verification"):
+        config = JiraConfig(
+            url="https://test.atlassian.net",
+            auth_type="basic",
+            username="test_username",
+            api_token="test_token",
+        )
+        client = JiraClient(config=config)
+    client._async_client = httpx.AsyncClient(
+        base_url=config.url, transport=httpx.MockTransport(handler)
+    )
+
+    results = await client.get_paged_async("post", "rest/api/3/test", {"a": 1})
+    await client.aclose()
+
+    assert results == [{"values": [1], "nextPageToken": "p2"}, {"values": [2]}]
+    assert [json.loads(r.content) for r in requests_seen] == [
+        {"a": 1},
+        {"a": 1, "nextPageToken": "p2"},
+    ]
+    assert client._async_client is None
+
+
+@pytest.mark.anyio
+async def test_get_paged_async_without_cloud():
+    """Test get_paged_async rejects non-cloud instances."""
+    with patch("mcp_atlassian.jira.client.configure_ssl_verification"):
+        config = JiraConfig(
+            url="https://jira.example.com",
+            auth_type="pat",
+            personal_token="test_token",
+        )
+        client = JiraClient(config=config)
+        with pytest.raises(
+            ValueError,
+            match="Paged requests are only available for Jira Cloud platform",
+        ):
+            await client.get_paged_async("get", "/test/url")
+
+
+def test_async_client_is_lazy_and_reused():
+    """Test the async client is created on first access and then reused."""
+    with patch("mcp_atlassian.jira.client.configure_ssl_verification"):
+        config = JiraConfig(
+            url="https://jira.example.com",
+            auth_type="pat",
+            personal_token="test_token",
+        )
+        client = JiraClient(config=config)
+
+    assert client._async_client is None
+    assert client.async_client is client.async_client
+    assert client.async_client.headers["Authorization"] == "Bearer test_token"
+
+
 def test_init_sets_proxies_and_no_proxy(monkeypatch):
     """Test that JiraClient sets session proxies and NO_PROXY env var from config."""
     # Patch Jira and its _session
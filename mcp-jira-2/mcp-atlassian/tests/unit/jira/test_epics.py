@@ -1,12 +1,20 @@
 """Tests for the Jira Epics mixin."""
 
+import threading
+import time
 from unittest.mock import MagicMock, call
 
 import pytest
 
 from mcp_atlassian.jira import JiraFetcher
-from mcp_atlassian.jira.epics import EpicsMixin
-from mcp_atlassian.models.jira import JiraIssue
+from mcp_atlassian.jira.epics import (
+    MAX_CONCURRENT_EPIC_STRATEGIES,
+    EpicLookupStrategy,
+    EpicsMixin,
+    _get_cached_epic_strategy,
+    _store_epic_strategy,
+)
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
 
 
 class TestEpicsMixin:
@@ -445,15 +453,14 @@ class TestEpicsMixin:
         # Call the method with start parameter
         result = epics_mixin.get_epic_issues("EPIC-123", start=5, limit=10)
 
-        # Verify search_issues was called with the right JQL
-        epics_mixin.search_issues.assert_called_once()
-        call_args = epics_mixin.search_issues.call_args[0]
-        assert 'issueFunction in issuesScopedToEpic("EPIC-123")' in call_args[0]
-
-        # Verify keyword arguments for start and limit
-        call_kwargs = epics_mixin.search_issues.call_args[1]
-        assert call_kwargs.get("start") == 5
-        assert call_kwargs.get("limit") == 10
+        # Verify search_issues was called with the right JQL (strategies are
+        # raced, so others may have been tried concurrently)
+        epics_mixin.search_issues.assert_any_call(
+            'issueFunction in issuesScopedToEpic("EPIC-123")',
+            start=5,
+            limit=10,
+            include_total=False,
+        )
 
         # Verify result
         assert len(result) == 2
@@ -546,10 +553,161 @@ class TestEpicsMixin:
 
         # Verify the start parameter was passed to search_issues
         assert epics_mixin.search_issues.call_count >= 2
-        # Check last call (which should be the one that returned results)
-        last_call_kwargs = epics_mixin.search_issues.call_args[1]
-        assert last_call_kwargs.get("start") == 3
-        assert last_call_kwargs.get("limit") == 10
+        for search_call in epics_mixin.search_issues.call_args_list:
+            assert search_call.kwargs.get("start") == 3
+            assert search_call.kwargs.get("limit") == 10
+
+    def test_get_epic_issues_learns_strategy(self, epics_mixin: EpicsMixin):
+        """Test the working strategy is reused on later calls without racing."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        def search_side_effect(jql, **kwargs):
+            if jql.startswith("parent"):
+                return JiraSearchResult(
+                    issues=[JiraIssue(key="CHILD-1", summary="Child 1")]
+                )
+            msg = f"Unsupported JQL {jql}"
+            raise ValueError(msg)
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        first = epics_mixin.get_epic_issues("EPIC-123")
+        raced_calls = epics_mixin.search_issues.call_count
+        epics_mixin.search_issues.reset_mock()
+        second = epics_mixin.get_epic_issues("EPIC-456")
+
+        assert [issue.key for issue in first] == ["CHILD-1"]
+        assert [issue.key for issue in second] == ["CHILD-1"]
+        assert raced_calls >= 2
+        epics_mixin.search_issues.assert_called_once_with(
+            'parent = "EPIC-456"', start=0, limit=50, include_total=False
+        )
+        # The type check only fetches the issue type
+        epics_mixin.jira.get_issue.assert_called_with("EPIC-456", fields="issuetype")
+
+    def test_get_epic_issues_reprobes_failed_strategy(self, epics_mixin: EpicsMixin):
+        """Test a learned strategy that starts failing is dropped and re-raced."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        working_prefix = ["parent"]
+
+        def search_side_effect(jql, **kwargs):
+            if jql.startswith(working_prefix[0]):
+                return JiraSearchResult(
+                    issues=[JiraIssue(key="CHILD-1", summary="Child 1")]
+                )
+            msg = f"Unsupported JQL {jql}"
+            raise ValueError(msg)
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+        epics_mixin.get_epic_issues("EPIC-123")
+
+        working_prefix[0] = '"Epic Link"'
+        result = epics_mixin.get_epic_issues("EPIC-123")
+
+        assert [issue.key for issue in result] == ["CHILD-1"]
+        assert (
+            _get_cached_epic_strategy(epics_mixin.config.url).name
+            == "'Epic Link' field name"
+        )
+
+    def test_get_epic_issues_reprobes_empty_learned_strategy(
+        self, epics_mixin: EpicsMixin
+    ):
+        """Test a learned strategy that finds nothing falls back to probing."""
+        _store_epic_strategy(
+            epics_mixin.config.url,
+            EpicLookupStrategy("parent relationship", 'parent = "{epic_key}"'),
+        )
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        def search_side_effect(jql, **kwargs):
+            if jql.startswith('"Epic Link"'):
+                return JiraSearchResult(
+                    issues=[JiraIssue(key="CHILD-1", summary="Child 1")]
+                )
+            if jql.startswith("parent"):
+                return JiraSearchResult(issues=[])
+            msg = f"Unsupported JQL {jql}"
+            raise ValueError(msg)
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        result = epics_mixin.get_epic_issues("EPIC-123")
+
+        assert [issue.key for issue in result] == ["CHILD-1"]
+        assert (
+            _get_cached_epic_strategy(epics_mixin.config.url).name
+            == "'Epic Link' field name"
+        )
+
+    def test_get_epic_issues_races_strategies_in_waves(self, epics_mixin: EpicsMixin):
+        """Test at most MAX_CONCURRENT_EPIC_STRATEGIES queries run at once."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def search_side_effect(jql, **kwargs):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            msg = f"Unsupported JQL {jql}"
+            raise ValueError(msg)
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        assert epics_mixin.get_epic_issues("EPIC-123") == []
+        assert epics_mixin.search_issues.call_count > MAX_CONCURRENT_EPIC_STRATEGIES
+        assert peak[0] <= MAX_CONCURRENT_EPIC_STRATEGIES
+
+    def test_remember_epic_link_field_replaces_cache(self, epics_mixin: EpicsMixin):
+        """Test a learned field id is added once without mutating the old list."""
+        original = [{"id": "summary", "name": "Summary"}]
+        epics_mixin._field_ids_cache = original
+
+        epics_mixin._remember_epic_link_field("customfield_10014")
+        epics_mixin._remember_epic_link_field("customfield_10014")
+
+        assert original == [{"id": "summary", "name": "Summary"}]
+        assert epics_mixin._field_ids_cache == [
+            {"id": "summary", "name": "Summary"},
+            {"id": "customfield_10014", "name": "epic_link"},
+        ]
+
+    def test_get_epic_issues_not_epic_with_learned_strategy(
+        self, epics_mixin: EpicsMixin
+    ):
+        """Test the epic type is still checked when a strategy is cached."""
+        _store_epic_strategy(
+            epics_mixin.config.url,
+            EpicLookupStrategy("parent relationship", 'parent = "{epic_key}"'),
+        )
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "TEST-123",
+            "fields": {"issuetype": {"name": "Task"}},
+        }
+
+        with pytest.raises(ValueError, match="is not an Epic"):
+            epics_mixin.get_epic_issues("TEST-123")
 
     def test_get_epic_issues_api_error(self, epics_mixin: EpicsMixin):
         """Test get_epic_issues with API error."""
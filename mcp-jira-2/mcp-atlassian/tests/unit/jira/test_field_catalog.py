@@ -0,0 +1,100 @@
+"""Tests for the process-wide Jira field catalog."""
+
+import json
+import time
+
+from mcp_atlassian.jira.field_catalog import (
+    FieldCatalog,
+    build_field_indexes,
+    get_field_catalog,
+    invalidate_field_catalog,
+    store_field_catalog,
+)
+
+FIELDS = [
+    {"id": "summary", "name": "Summary"},
+    {"id": "customfield_10010", "name": "Epic Link"},
+    {"id": "customfield_10011", "name": "Epic Link"},
+    {"id": "customfield_10012"},
+]
+
+
+def test_build_field_indexes():
+    """Names map case-insensitively to the first matching id; ids map to themselves."""
+    name_to_id, by_id = build_field_indexes(FIELDS)
+
+    assert name_to_id["summary"] == "summary"
+    assert name_to_id["epic link"] == "customfield_10010"
+    assert name_to_id["customfield_10012"] == "customfield_10012"
+    assert by_id["customfield_10011"] is FIELDS[2]
+    assert len(by_id) == 4
+
+
+def test_store_and_get_is_keyed_by_base_url():
+    """Catalogs are shared per instance, ignoring trailing slashes and case."""
+    store_field_catalog("https://test.atlassian.net/", FIELDS)
+
+    catalog = get_field_catalog("https://TEST.atlassian.net")
+
+    assert catalog is not None
+    assert catalog.fields == FIELDS
+    assert get_field_catalog("https://other.atlassian.net") is None
+
+
+def test_catalog_expires(monkeypatch):
+    """Entries older than JIRA_FIELD_CACHE_TTL are not returned."""
+    store_field_catalog("https://test.atlassian.net", FIELDS)
+    monkeypatch.setenv("JIRA_FIELD_CACHE_TTL", "0")
+
+    assert get_field_catalog("https://test.atlassian.net") is None
+
+
+def test_invalidate():
+    """Invalidation drops one instance or all of them."""
+    store_field_catalog("https://a.atlassian.net", FIELDS)
+    store_field_catalog("https://b.atlassian.net", FIELDS)
+
+    invalidate_field_catalog("https://a.atlassian.net")
+    assert get_field_catalog("https://a.atlassian.net") is None
+    assert get_field_catalog("https://b.atlassian.net") is not None
+
+    invalidate_field_catalog()
+    assert get_field_catalog("https://b.atlassian.net") is None
+
+
+def test_disk_snapshot_survives_restart(monkeypatch, tmp_path):
+    """With JIRA_FIELD_CACHE_DIR set, catalogs are reloaded from disk."""
+    monkeypatch.setenv("JIRA_FIELD_CACHE_DIR", str(tmp_path))
+    store_field_catalog("https://test.atlassian.net", FIELDS)
+    assert len(list(tmp_path.glob("jira-fields-*.json"))) == 1
+
+    invalidate_field_catalog()  # simulate a restart
+    catalog = get_field_catalog("https://test.atlassian.net")
+
+    assert catalog is not None
+    assert catalog.fields == FIELDS
+    assert catalog.by_id["summary"] == {"id": "summary", "name": "Summary"}
+
+
+def test_stale_or_corrupt_snapshot_is_ignored(monkeypatch, tmp_path):
+    """Expired or unreadable snapshots fall back to a refetch."""
+    monkeypatch.setenv("JIRA_FIELD_CACHE_DIR", str(tmp_path))
+    store_field_catalog("https://test.atlassian.net", FIELDS)
+    invalidate_field_catalog()
+    snapshot = next(tmp_path.glob("jira-fields-*.json"))
+
+    data = json.loads(snapshot.read_text())
+    data["fetched_at"] = time.time() - 10 * 3600
+    snapshot.write_text(json.dumps(data))
+    assert get_field_catalog("https://test.atlassian.net") is None
+
+    snapshot.write_text("{not json")
+    assert get_field_catalog("https://test.atlassian.net") is None
+
+
+def test_is_fresh():
+    """Freshness is measured from the fetch time."""
+    catalog = FieldCatalog.from_fields(FIELDS, fetched_at=time.time() - 100)
+
+    assert catalog.is_fresh(ttl=200)
+    assert not catalog.is_fresh(ttl=50)
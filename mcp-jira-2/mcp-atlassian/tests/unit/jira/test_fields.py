@@ -107,6 +107,33 @@ class TestFieldsMixin:
         # Verify empty list is returned on error
         assert result == []
 
+    def test_get_fields_shared_between_fetchers(
+        self, fields_mixin: FieldsMixin, mock_fields, mock_config
+    ):
+        """Test fields fetched by one fetcher are reused by another for the same URL."""
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        fields_mixin.get_fields()
+
+        other = JiraFetcher(config=mock_config)
+        other.jira = MagicMock()
+
+        assert other.get_fields() == mock_fields
+        other.jira.get_all_fields.assert_not_called()
+        assert other.get_field_id("story points") == "customfield_10012"
+        assert other.get_field_by_id("customfield_10012") == mock_fields[6]
+
+    def test_get_fields_local_additions_not_shared(
+        self, fields_mixin: FieldsMixin, mock_fields, mock_config
+    ):
+        """Test appending to one fetcher's field cache leaves the shared catalog intact."""
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        fields_mixin.get_fields().append({"id": "customfield_1", "name": "epic_link"})
+
+        other = JiraFetcher(config=mock_config)
+        other.jira = MagicMock()
+
+        assert other.get_fields() == mock_fields
+
     def test_get_field_id_by_exact_match(self, fields_mixin: FieldsMixin, mock_fields):
         """Test get_field_id finds field by exact name match."""
         # Set up the fields
@@ -1,9 +1,13 @@
 """Tests for the Jira Issues mixin."""
 
-from unittest.mock import ANY, MagicMock, patch
+import time
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from requests.exceptions import HTTPError
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.issues import IssuesMixin, logger
 from mcp_atlassian.models.jira import JiraIssue
@@ -998,17 +1002,14 @@ class TestIssuesMixin:
         }
         issues_mixin.jira.create_issues.return_value = bulk_response
 
-        # Mock get_issue responses
-        def get_issue_side_effect(key):
-            if key == "TEST-1":
-                return {
-                    "id": "1",
-                    "key": "TEST-1",
-                    "fields": {"summary": "Test Issue 1"},
-                }
-            return {"id": "2", "key": "TEST-2", "fields": {"summary": "Test Issue 2"}}
-
-        issues_mixin.jira.get_issue.side_effect = get_issue_side_effect
+        # Mock the search hydrating the created issues (returned out of order)
+        issues_mixin.config = MagicMock(is_cloud=False, url="https://jira.example.com")
+        issues_mixin.jira.jql.return_value = {
+            "issues": [
+                {"id": "2", "key": "TEST-2", "fields": {"summary": "Test Issue 2"}},
+                {"id": "1", "key": "TEST-1", "fields": {"summary": "Test Issue 1"}},
+            ]
+        }
         issues_mixin._get_account_id.return_value = "user123"
 
         # Call the method
@@ -1026,6 +1027,16 @@ class TestIssuesMixin:
         assert call_args[0]["fields"]["summary"] == "Test Issue 1"
         assert call_args[1]["fields"]["summary"] == "Test Issue 2"
 
+        # Created issues are fetched with one search instead of one call each
+        # with all fields, like the per-issue reads they replace
+        issues_mixin.jira.jql.assert_called_once_with(
+            'key in ("TEST-1", "TEST-2")',
+            fields="*all",
+            limit=2,
+            expand=None,
+        )
+        issues_mixin.jira.get_issue.assert_not_called()
+
     def test_batch_create_issues_validate_only(self, issues_mixin: IssuesMixin):
         """Test batch_create_issues with validate_only=True."""
         # Setup test data
@@ -1099,12 +1110,10 @@ class TestIssuesMixin:
         }
         issues_mixin.jira.create_issues.return_value = bulk_response
 
-        # Mock get_issue response for successful creation
-        issues_mixin.jira.get_issue.return_value = {
-            "id": "1",
-            "key": "TEST-1",
-            "fields": {"summary": "Test Issue 1"},
-        }
+        # Mock the search response for the successful creation
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            {"id": "1", "key": "TEST-1", "fields": {"summary": "Test Issue 1"}}
+        ]
 
         # Call the method
         result = issues_mixin.batch_create_issues(issues)
@@ -1115,7 +1124,207 @@ class TestIssuesMixin:
 
         # Verify error was logged
         issues_mixin.jira.create_issues.assert_called_once()
-        assert len(issues_mixin.jira.get_issue.mock_calls) == 1
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_called_once_with(
+            'key in ("TEST-1")',
+            fields="*all",
+            limit=1,
+            expand=None,
+        )
+
+    def test_batch_create_issues_resolves_each_assignee_once(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test that repeated assignees are resolved with a single lookup."""
+        issues = [
+            {
+                "project_key": "TEST",
+                "summary": f"Test Issue {i}",
+                "issue_type": "Task",
+                "assignee": "john.doe" if i % 2 else "jane.doe",
+            }
+            for i in range(6)
+        ]
+        issues_mixin.jira.create_issues.return_value = {"issues": [], "errors": []}
+        issues_mixin._get_account_id.side_effect = lambda name: f"id-{name}"
+
+        issues_mixin.batch_create_issues(issues)
+
+        assert sorted(
+            c.args[0] for c in issues_mixin._get_account_id.call_args_list
+        ) == [
+            "jane.doe",
+            "john.doe",
+        ]
+        call_args = issues_mixin.jira.create_issues.call_args[0][0]
+        assignees = [update["fields"]["assignee"] for update in call_args]
+        assert len(assignees) == 6
+        assert assignees[0] != assignees[1]
+        assert assignees[0] == assignees[2]
+
+    def test_batch_create_issues_unresolvable_assignee(self, issues_mixin: IssuesMixin):
+        """Test that an unknown assignee is skipped instead of failing the batch."""
+        issues = [
+            {
+                "project_key": "TEST",
+                "summary": "Test Issue 1",
+                "issue_type": "Task",
+                "assignee": "ghost",
+            }
+        ]
+        issues_mixin.jira.create_issues.return_value = {"issues": [], "errors": []}
+        issues_mixin._get_account_id.side_effect = ValueError("no such user")
+
+        issues_mixin.batch_create_issues(issues)
+
+        call_args = issues_mixin.jira.create_issues.call_args[0][0]
+        assert "assignee" not in call_args[0]["fields"]
+
+    def test_batch_create_issues_hydrates_in_chunks(self, issues_mixin: IssuesMixin):
+        """Test that large batches are fetched with chunked key searches."""
+        keys = [f"TEST-{i}" for i in range(1, 121)]
+        issues = [
+            {"project_key": "TEST", "summary": key, "issue_type": "Task"}
+            for key in keys
+        ]
+        issues_mixin.jira.create_issues.return_value = {
+            "issues": [{"id": key[5:], "key": key} for key in keys],
+            "errors": [],
+        }
+
+        def search_side_effect(jql, fields, limit, expand):
+            chunk = [k.strip('"') for k in jql[len("key in (") : -1].split(", ")]
+            assert len(chunk) == limit
+            # TEST-7 is missing from the results, e.g. due to permissions
+            return [
+                {"id": k[5:], "key": k, "fields": {"summary": k}}
+                for k in reversed(chunk)
+                if k != "TEST-7"
+            ]
+
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = (
+            search_side_effect
+        )
+        issues_mixin.jira.get_issue.side_effect = HTTPError(
+            response=MagicMock(status_code=404)
+        )
+
+        result = issues_mixin.batch_create_issues(issues)
+
+        assert issues_mixin.jira.enhanced_jql_get_list_of_tickets.call_count == 3
+        assert [issue.key for issue in result] == [k for k in keys if k != "TEST-7"]
+        issues_mixin.jira.get_issue.assert_called_once_with("TEST-7")
+
+    def test_batch_create_issues_reads_unindexed_issues(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test created issues the search index does not list yet are read by key."""
+        issues_mixin.jira.create_issues.return_value = {
+            "issues": [{"id": n, "key": f"TEST-{n}"} for n in ("1", "2", "3")],
+            "errors": [],
+        }
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            {"id": n, "key": f"TEST-{n}", "fields": {"summary": n}} for n in ("3", "1")
+        ]
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "2",
+            "key": "TEST-2",
+            "fields": {"summary": "Not indexed yet"},
+        }
+
+        result = issues_mixin.batch_create_issues(
+            [
+                {"project_key": "TEST", "summary": n, "issue_type": "Task"}
+                for n in ("1", "2", "3")
+            ]
+        )
+
+        assert [issue.key for issue in result] == ["TEST-1", "TEST-2", "TEST-3"]
+        assert result[1].summary == "Not indexed yet"
+        issues_mixin.jira.get_issue.assert_called_once_with("TEST-2")
+
+    def test_get_issues_preserves_order_and_reports_missing(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test get_issues returns issues in input order and lists missing keys."""
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            {"id": "3", "key": "TEST-3", "fields": {"summary": "Third"}},
+            {"id": "1", "key": "TEST-1", "fields": {"summary": "First"}},
+        ]
+
+        issues, missing = issues_mixin.get_issues(
+            ["test-1", "TEST-2", "TEST-3", "test-1"],
+            fields=["summary"],
+            expand="renderedFields",
+        )
+
+        assert [issue.key for issue in issues] == ["TEST-1", "TEST-3"]
+        assert missing == ["TEST-2"]
+        assert issues[0].to_simplified_dict()["summary"] == "First"
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_called_once_with(
+            'key in ("test-1", "TEST-2", "TEST-3")',
+            fields="summary",
+            limit=3,
+            expand="renderedFields",
+        )
+        issues_mixin.jira.get_issue.assert_not_called()
+
+    def test_get_issues_empty(self, issues_mixin: IssuesMixin):
+        """Test get_issues without keys makes no request."""
+        assert issues_mixin.get_issues([]) == ([], [])
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_not_called()
+
+    def test_get_issues_failed_chunk_is_reported_missing(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test a failing chunk only marks its own keys as missing."""
+        keys = [f"TEST-{i}" for i in range(1, 61)]
+
+        def search_side_effect(jql, fields, limit, expand):
+            if '"TEST-1"' in jql:
+                raise ValueError("boom")
+            chunk = [k.strip('"') for k in jql[len("key in (") : -1].split(", ")]
+            return [{"id": k[5:], "key": k, "fields": {}} for k in chunk]
+
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = (
+            search_side_effect
+        )
+
+        issues, missing = issues_mixin.get_issues(keys)
+
+        assert missing == keys[:50]
+        assert [issue.key for issue in issues] == keys[50:]
+
+    def test_get_issues_bad_key_only_misses_itself(self, issues_mixin: IssuesMixin):
+        """Test a key rejected with 400 is isolated instead of failing its chunk."""
+        keys = [f"TEST-{i}" for i in range(1, 51)]
+        keys[17] = "NOPE-1"
+
+        def search_side_effect(jql, fields, limit, expand):
+            if '"NOPE-1"' in jql:
+                raise HTTPError(response=MagicMock(status_code=400))
+            chunk = [k.strip('"') for k in jql[len("key in (") : -1].split(", ")]
+            return [{"id": k[5:], "key": k, "fields": {}} for k in chunk]
+
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = (
+            search_side_effect
+        )
+
+        issues, missing = issues_mixin.get_issues(keys)
+
+        assert missing == ["NOPE-1"]
+        assert [issue.key for issue in issues] == keys[:17] + keys[18:]
+        # One rejected query per halving step down to the bad key
+        assert issues_mixin.jira.enhanced_jql_get_list_of_tickets.call_count <= 13
+
+    def test_get_issues_authentication_error(self, issues_mixin: IssuesMixin):
+        """Test get_issues raises on 401/403 instead of reporting keys missing."""
+        response = MagicMock(status_code=401)
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = HTTPError(
+            response=response
+        )
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            issues_mixin.get_issues(["TEST-1"])
 
     def test_batch_create_issues_empty_list(self, issues_mixin: IssuesMixin):
         """Test batch_create_issues with an empty list."""
@@ -1143,11 +1352,9 @@ class TestIssuesMixin:
             "errors": [],
         }
         issues_mixin.jira.create_issues.return_value = bulk_response
-        issues_mixin.jira.get_issue.return_value = {
-            "id": "1",
-            "key": "TEST-1",
-            "fields": {"summary": "Test Issue 1"},
-        }
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            {"id": "1", "key": "TEST-1", "fields": {"summary": "Test Issue 1"}}
+        ]
 
         # Call the method
         result = issues_mixin.batch_create_issues(issues)
@@ -1193,16 +1400,102 @@ class TestIssuesMixin:
         # Verify result
         assert fields["assignee"] == {"name": "jdoe"}
 
+    def test_is_cached_issue_current(self, issues_mixin: IssuesMixin):
+        """Test cached issues are revalidated against the updated timestamp."""
+        issue = JiraIssue(key="TEST-1", updated="2024-01-01T10:00:00.000+0000")
+        issues_mixin.jira.get_issue.return_value = {
+            "fields": {"updated": "2024-01-01T10:00:00.000+0000"}
+        }
+
+        assert issues_mixin._is_cached_issue_current(issue, {"issue_key": "TEST-1"})
+        issues_mixin.jira.get_issue.assert_called_once_with(
+            "TEST-1", fields="updated", update_history=False
+        )
+
+        issues_mixin.jira.get_issue.return_value = {
+            "fields": {"updated": "2024-01-02T10:00:00.000+0000"}
+        }
+        assert not issues_mixin._is_cached_issue_current(issue, {"issue_key": "TEST-1"})
+        assert not issues_mixin._is_cached_issue_current(
+            JiraIssue(key="TEST-1"), {"issue_key": "TEST-1"}
+        )
+
     def test_batch_get_changelogs_not_cloud(self, issues_mixin: IssuesMixin):
-        """Test batch_get_changelogs method on non-cloud instance."""
+        """Test batch_get_changelogs falls back to expand=changelog on Server/DC."""
         issues_mixin.config = MagicMock()
         issues_mixin.config.is_cloud = False
 
-        with pytest.raises(NotImplementedError):
-            issues_mixin.batch_get_changelogs(
-                issue_ids_or_keys=["TEST-123"],
-                fields=["summary", "description"],
-            )
+        def get_issue_side_effect(key, **kwargs):
+            if key == "TEST-404":
+                raise ValueError("Issue does not exist")
+            if key == "TEST-1":
+                time.sleep(0.05)  # Finishes last, but is still yielded first
+            return {
+                "id": key[5:],
+                "key": key,
+                "changelog": {
+                    "histories": [
+                        {
+                            "id": "1",
+                            "created": "2024-01-05T10:06:03.548+0800",
+                            "items": [
+                                {"field": "status", "fromString": "Open"},
+                                {"field": "labels", "toString": "x"},
+                            ],
+                        },
+                        {
+                            "id": "2",
+                            "created": "2024-01-06T10:06:03.548+0800",
+                            "items": [{"field": "labels", "toString": "y"}],
+                        },
+                    ]
+                },
+            }
+
+        issues_mixin.jira.get_issue.side_effect = get_issue_side_effect
+
+        result = issues_mixin.batch_get_changelogs(
+            issue_ids_or_keys=["TEST-1", "TEST-404", "TEST-2"],
+            fields=["status"],
+        )
+
+        assert [issue.id for issue in result] == ["1", "2"]
+        for issue in result:
+            assert len(issue.changelogs) == 1
+            assert [item.field for item in issue.changelogs[0].items] == ["status"]
+        issues_mixin.jira.get_issue.assert_any_call(
+            "TEST-1", fields="summary", expand="changelog", update_history=False
+        )
+        assert issues_mixin.jira.get_issue.call_count == 3
+
+    def test_iter_changelogs_chunks_cloud_requests(self, issues_mixin: IssuesMixin):
+        """Test iter_changelogs splits large key sets into bulkfetch chunks."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = True
+        keys = [f"TEST-{i}" for i in range(1, 251)]
+
+        def get_paged_side_effect(method, url, params_or_json):
+            return [
+                {
+                    "issueChangeLogs": [
+                        {"issueId": key, "changeHistories": []}
+                        for key in params_or_json["issueIdsOrKeys"]
+                    ]
+                }
+            ]
+
+        issues_mixin.get_paged = MagicMock(side_effect=get_paged_side_effect)
+
+        iterator = issues_mixin.iter_changelogs(keys)
+        first = next(iterator)
+        rest = list(iterator)
+
+        assert [issue.id for issue in [first, *rest]] == keys
+        chunk_sizes = sorted(
+            len(call.kwargs["params_or_json"]["issueIdsOrKeys"])
+            for call in issues_mixin.get_paged.call_args_list
+        )
+        assert chunk_sizes == [50, 100, 100]
 
     def test_batch_get_changelogs_cloud(self, issues_mixin: IssuesMixin):
         """Test batch_get_changelogs method on cloud instance."""
@@ -1436,6 +1729,70 @@ class TestIssuesMixin:
             },
         )
 
+    @pytest.mark.anyio
+    async def test_batch_get_changelogs_async(self, issues_mixin: IssuesMixin):
+        """Test batch_get_changelogs_async parses pages from the async transport."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = True
+        issues_mixin.get_paged_async = AsyncMock(
+            return_value=[
+                {
+                    "issueChangeLogs": [
+                        {"issueId": "1", "changeHistories": [{"id": "10"}]},
+                        {"issueId": "2", "changeHistories": []},
+                    ]
+                },
+                {
+                    "issueChangeLogs": [
+                        {"issueId": "1", "changeHistories": [{"id": "11"}]}
+                    ]
+                },
+            ]
+        )
+
+        result = await issues_mixin.batch_get_changelogs_async(["1", "2"])
+
+        assert [issue.id for issue in result] == ["1", "2"]
+        assert len(result[0].changelogs) == 2
+        assert result[1].changelogs == []
+        issues_mixin.get_paged_async.assert_awaited_once_with(
+            method="post",
+            url=issues_mixin.jira.resource_url("changelog/bulkfetch"),
+            params_or_json={"fieldIds": None, "issueIdsOrKeys": ["1", "2"]},
+        )
+
+    @pytest.mark.anyio
+    async def test_batch_get_changelogs_async_not_cloud(
+        self, issues_mixin: IssuesMixin
+    ):
+        """On Server/DC each issue is read concurrently, in order, skipping errors."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = False
+        issues_mixin.jira.resource_url.return_value = "rest/api/2/issue"
+        missing = httpx.HTTPStatusError(
+            "404", request=MagicMock(), response=MagicMock(status_code=404)
+        )
+
+        async def request_async(method, path, params=None, json=None):
+            key = path.rsplit("/", 1)[1]
+            if key == "TEST-404":
+                raise missing
+            return {"id": key[5:], "key": key, "changelog": {"histories": []}}
+
+        issues_mixin.request_async = AsyncMock(side_effect=request_async)
+
+        result = await issues_mixin.batch_get_changelogs_async(
+            ["TEST-1", "TEST-404", "TEST-2"]
+        )
+
+        assert [issue.id for issue in result] == ["1", "2"]
+        issues_mixin.request_async.assert_any_await(
+            "GET",
+            "rest/api/2/issue/TEST-1",
+            params={"fields": "summary", "expand": "changelog"},
+        )
+        issues_mixin.jira.get_issue.assert_not_called()
+
     def test_create_issue_with_labels(self, issues_mixin: IssuesMixin):
         """Test creating an issue with labels in additional_fields."""
         # Mock create_issue response
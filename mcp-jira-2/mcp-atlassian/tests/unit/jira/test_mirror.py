@@ -0,0 +1,274 @@
+"""Tests for the SQLite issue mirror."""
+
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_atlassian.jira.mirror import IssueMirror, translate_jql
+
+NOW = datetime(2024, 3, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+def _issue(key, *, updated="2024-03-01T10:00:00.000+0000", **fields):
+    return {
+        "id": str(abs(hash(key)) % 100000),
+        "key": key,
+        "fields": {
+            "summary": f"Summary of {key}",
+            "status": {"name": "Open", "statusCategory": {"name": "To Do"}},
+            "issuetype": {"name": "Bug"},
+            "project": {"key": key.split("-")[0]},
+            "labels": [],
+            "created": "2024-02-01T10:00:00.000+0000",
+            "updated": updated,
+            **fields,
+        },
+    }
+
+
+class FakeFetcher:
+    """Serves pages of raw issues and records the JQL it was asked for."""
+
+    def __init__(
+        self, issues, *, username="user", api_token="token", projects_filter=None
+    ):
+        self.issues = issues
+        self.queries = []
+        self.config = SimpleNamespace(
+            url="https://test.atlassian.net",
+            auth_type="basic",
+            username=username,
+            api_token=api_token,
+            projects_filter=projects_filter,
+        )
+        self.jira = MagicMock()
+        self.jira.myself.return_value = {"timeZone": "UTC"}
+
+    def get_current_user_account_id(self):
+        return f"account-{self.config.username}"
+
+    def iter_search_raw(self, jql, fields="*all", page_size=100):
+        self.queries.append(jql)
+        project = jql.split('"')[1]
+        yield [i for i in self.issues if i["key"].startswith(f"{project}-")]
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = IssueMirror(
+        path=str(tmp_path / "mirror.db"),
+        projects=["PROJ", "DEV"],
+        max_age=300,
+        sync_interval=0,
+    )
+    yield mirror
+    mirror.close()
+
+
+def test_translate_supported_jql():
+    """AND-joined clauses on mirrored columns translate to SQL."""
+    query = translate_jql(
+        'project = proj AND status IN ("Open", "In Progress") AND '
+        "assignee IS NOT EMPTY AND updated >= -1d ORDER BY updated DESC",
+        now=NOW,
+    )
+
+    assert query is not None
+    assert query.projects == {"PROJ"}
+    assert query.params[:3] == ["PROJ", "Open", "In Progress"]
+    assert query.params[3] == NOW - 86400
+    assert query.order_by == "updated_epoch DESC"
+
+
+@pytest.mark.parametrize(
+    "jql",
+    [
+        "project = PROJ OR project = DEV",
+        "assignee = currentUser()",
+        'text ~ "crash"',
+        "sprint = 12",
+        "project = PROJ ORDER BY rank",
+    ],
+)
+def test_translate_unsupported_jql(jql):
+    """Anything outside the supported subset is left to Jira."""
+    assert translate_jql(jql) is None
+
+
+def test_initial_then_incremental_sync(mirror):
+    """The first sync loads everything, later ones only what was updated."""
+    fetcher = FakeFetcher([_issue("PROJ-1"), _issue("PROJ-2"), _issue("DEV-1")])
+
+    assert mirror.sync(fetcher) == {"PROJ": 2, "DEV": 1}
+    assert fetcher.queries[0] == 'project = "PROJ" ORDER BY updated ASC'
+
+    fetcher.queries.clear()
+    mirror.sync(fetcher, ["PROJ"])
+    assert fetcher.queries == [
+        'project = "PROJ" AND updated >= "2024-03-01 10:00" ORDER BY updated ASC'
+    ]
+    assert mirror.stats()["projects"]["PROJ"]["issues"] == 2
+
+
+def test_full_sync_drops_deleted_issues(mirror):
+    """Issues no longer returned by a full sync are removed."""
+    fetcher = FakeFetcher([_issue("PROJ-1"), _issue("PROJ-2")])
+    mirror.sync(fetcher, ["PROJ"])
+
+    fetcher.issues = [_issue("PROJ-1")]
+    mirror.sync(fetcher, ["PROJ"])
+    assert mirror.stats()["projects"]["PROJ"]["issues"] == 2
+
+    mirror.sync(fetcher, ["PROJ"], full=True)
+    assert mirror.stats()["projects"]["PROJ"]["issues"] == 1
+
+
+def test_search_served_from_fresh_mirror(mirror):
+    """Fresh, supported searches are answered locally with their staleness."""
+    fetcher = FakeFetcher(
+        [
+            _issue("PROJ-1"),
+            _issue("PROJ-2", status={"name": "Done"}, labels=["backend"]),
+            _issue("PROJ-10", labels=["backend"]),
+        ]
+    )
+    mirror.sync(fetcher)
+
+    read = mirror.search_issues(
+        fetcher, "project = PROJ AND labels = backend ORDER BY key ASC", limit=1
+    )
+
+    assert read is not None
+    assert read.staleness < 5
+    assert read.value.total == 2
+    assert [issue.key for issue in read.value.issues] == ["PROJ-2"]
+
+
+def test_search_falls_back_when_not_answerable(mirror):
+    """Unmirrored projects, stale data and unsupported JQL go to Jira."""
+    fetcher = FakeFetcher([_issue("PROJ-1")])
+    mirror.sync(fetcher, ["PROJ"])
+
+    assert mirror.search_issues(fetcher, "project = OTHER") is None
+    assert mirror.search_issues(fetcher, "project = DEV") is None
+    assert mirror.search_issues(fetcher, "status = Open") is None
+    assert mirror.search_issues(fetcher, "project = PROJ OR key = DEV-1") is None
+
+    mirror.max_age = 0
+    assert mirror.search_issues(fetcher, "project = PROJ") is None
+    assert mirror.stats()["live_reads"] == 5
+
+
+def test_search_applies_projects_filter(mirror):
+    """The default projects filter scopes unrestricted queries like live search."""
+    fetcher = FakeFetcher([_issue("PROJ-1"), _issue("DEV-1")], projects_filter="DEV")
+    mirror.sync(fetcher)
+
+    read = mirror.search_issues(fetcher, "issuetype = Bug")
+
+    assert read is not None
+    assert [issue.key for issue in read.value.issues] == ["DEV-1"]
+
+
+def test_get_issue_only_for_owner(mirror):
+    """Only fetchers with the credentials the mirror was synced with read it."""
+    comments = {"comments": [{"id": str(n), "body": f"c{n}"} for n in range(5)]}
+    fetcher = FakeFetcher([_issue("PROJ-1", comment=comments)])
+    mirror.sync(fetcher, ["PROJ"])
+
+    read = mirror.get_issue(fetcher, "proj-1", comment_limit=2)
+    assert read is not None
+    assert read.value.key == "PROJ-1"
+    assert len(read.value.comments) == 2
+
+    assert mirror.get_issue(fetcher, "PROJ-404") is None
+    assert mirror.get_issue(FakeFetcher([], username="other"), "PROJ-1") is None
+
+
+def test_sync_as_other_user_resets(mirror):
+    """Syncing as another user drops the data of the previous owner."""
+    mirror.sync(FakeFetcher([_issue("PROJ-1")]), ["PROJ"])
+    mirror.sync(FakeFetcher([], username="other"), ["DEV"])
+
+    assert "PROJ" not in mirror.stats()["projects"]
+
+
+def test_new_token_of_same_user_keeps_mirror(mirror):
+    """A refreshed or rotated token of the same user reads and syncs the mirror."""
+    mirror.sync(FakeFetcher([_issue("PROJ-1")]), ["PROJ"])
+    refreshed = FakeFetcher([_issue("PROJ-2")], api_token="new-token")
+
+    assert mirror.get_issue(refreshed, "PROJ-1") is not None
+    mirror.sync(refreshed, ["PROJ"])
+    assert mirror.stats()["projects"]["PROJ"]["issues"] == 2
+
+
+def test_sync_forever_runs_periodic_full_syncs(mirror):
+    """The background loop reloads fully once full_sync_interval has passed."""
+    fetcher = FakeFetcher([_issue("PROJ-1"), _issue("PROJ-2")])
+    mirror.full_sync_interval = 3600
+    stop = threading.Event()
+    calls = []
+
+    def sync(fetcher, *, full=False):
+        calls.append(full)
+        IssueMirror.sync(mirror, fetcher, ["PROJ"], full=full)
+        if len(calls) % 2 == 0:
+            stop.set()
+
+    with patch.object(mirror, "sync", side_effect=sync):
+        mirror.sync_forever(lambda: fetcher, stop)
+        assert calls == [False, False]
+
+        fetcher.issues = [_issue("PROJ-1")]
+        with patch("mcp_atlassian.utils.sqlite_mirror.time.time", return_value=1e12):
+            stop.clear()
+            mirror.sync_forever(lambda: fetcher, stop)
+
+    assert calls == [False, False, True, False]
+    assert mirror.stats()["projects"]["PROJ"]["issues"] == 1
+
+
+def test_local_search_ranks_and_filters(mirror):
+    """Text search ranks summary matches first and honours the projects filter."""
+    fetcher = FakeFetcher(
+        [
+            _issue("PROJ-1", description="The importer crashes on empty files"),
+            _issue("PROJ-2", summary="Importer crash on startup"),
+            _issue(
+                "PROJ-3",
+                comment={"comments": [{"body": "Seen the importer crash again"}]},
+            ),
+            _issue("DEV-1", summary="Importer crashes in staging"),
+        ]
+    )
+    mirror.sync(fetcher)
+
+    found = mirror.search_text(fetcher, "importer crash*", projects=["proj"])
+
+    assert [r["key"] for r in found.value] == ["PROJ-2", "PROJ-1", "PROJ-3"]
+    assert "**Importer**" in found.value[0]["snippet"]
+    assert found.staleness < 5
+
+    fetcher.issues = [_issue("PROJ-2", summary="Exporter timeout")]
+    mirror.sync(fetcher, ["PROJ"])
+    found = mirror.search_text(fetcher, "importer crash*")
+    assert [r["key"] for r in found.value] == ["DEV-1", "PROJ-1", "PROJ-3"]
+
+
+def test_local_search_errors(mirror):
+    """Local search explains why it cannot answer instead of returning nothing."""
+    fetcher = FakeFetcher([_issue("PROJ-1")])
+
+    with pytest.raises(ValueError, match="not synced as this user"):
+        mirror.search_text(fetcher, "summary")
+
+    mirror.sync(fetcher, ["PROJ"])
+    with pytest.raises(ValueError, match="first sync"):
+        mirror.search_text(fetcher, "summary")
+    with pytest.raises(ValueError, match="Not mirrored: OTHER"):
+        mirror.search_text(fetcher, "summary", projects=["OTHER"])
+    assert mirror.search_text(fetcher, "summary", projects=["PROJ"]).value
@@ -1,10 +1,12 @@
 """Tests for the Jira Search mixin."""
 
+import threading
 from unittest.mock import ANY, MagicMock
 
 import pytest
 import requests
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.search import SearchMixin
 from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
@@ -672,3 +674,174 @@ class TestSearchMixin:
         api_method_mock.assert_called_with(
             "(text ~ 'test') AND project = OVERRIDE", **expected_kwargs
         )
+
+    @staticmethod
+    def _issue_page(keys: list[str], **extra) -> dict:
+        """Build a raw search response page for the given issue keys."""
+        return {
+            "issues": [
+                {"id": key.split("-")[1], "key": key, "fields": {"summary": key}}
+                for key in keys
+            ],
+            **extra,
+        }
+
+    def test_iter_search_issues_server_follows_start_at(
+        self, search_mixin: SearchMixin
+    ):
+        """Test iter_search_issues pages through startAt on Server/DC."""
+        search_mixin.jira.jql.side_effect = [
+            self._issue_page(["TEST-1", "TEST-2"], total=5),
+            self._issue_page(["TEST-3", "TEST-4"], total=5),
+            self._issue_page(["TEST-5"], total=5),
+        ]
+
+        pages = list(search_mixin.iter_search_issues("project = TEST", page_size=2))
+
+        assert [[i.key for i in page] for page in pages] == [
+            ["TEST-1", "TEST-2"],
+            ["TEST-3", "TEST-4"],
+            ["TEST-5"],
+        ]
+        assert [c.kwargs["start"] for c in search_mixin.jira.jql.call_args_list] == [
+            0,
+            2,
+            4,
+        ]
+        assert all(isinstance(i, JiraIssue) for page in pages for i in page)
+
+    def test_iter_search_issues_server_caps_page_size(self, search_mixin: SearchMixin):
+        """Test the Server/DC page size is capped at 50."""
+        search_mixin.jira.jql.return_value = self._issue_page(["TEST-1"], total=1)
+
+        list(search_mixin.iter_search_issues("project = TEST", page_size=500))
+
+        assert search_mixin.jira.jql.call_args.kwargs["limit"] == 50
+
+    def test_iter_search_issues_cloud_follows_next_page_token(
+        self, search_mixin: SearchMixin
+    ):
+        """Test iter_search_issues follows nextPageToken on Cloud."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.get.side_effect = [
+            self._issue_page(["TEST-1", "TEST-2"], nextPageToken="t1"),
+            self._issue_page(["TEST-3"]),
+        ]
+
+        pages = list(
+            search_mixin.iter_search_issues(
+                "project = TEST", fields="summary", page_size=2
+            )
+        )
+
+        assert [[i.key for i in page] for page in pages] == [
+            ["TEST-1", "TEST-2"],
+            ["TEST-3"],
+        ]
+        first_params = search_mixin.jira.get.call_args_list[0].kwargs["params"]
+        assert first_params["jql"] == "project = TEST"
+        assert first_params["fields"] == "summary"
+        assert first_params["maxResults"] == 2
+
+    def test_iter_search_issues_respects_budget_lazily(self, search_mixin: SearchMixin):
+        """Test max_results truncates the last page and stops fetching."""
+        search_mixin.jira.jql.side_effect = [
+            self._issue_page(["TEST-1", "TEST-2"], total=100),
+            self._issue_page(["TEST-3", "TEST-4"], total=100),
+            self._issue_page(["TEST-5", "TEST-6"], total=100),
+        ]
+
+        pages = search_mixin.iter_search_issues(
+            "project = TEST", page_size=2, max_results=3
+        )
+        first = next(pages)
+        assert search_mixin.jira.jql.call_count == 1
+
+        rest = list(pages)
+
+        assert [i.key for i in first] == ["TEST-1", "TEST-2"]
+        assert [[i.key for i in page] for page in rest] == [["TEST-3"]]
+        assert search_mixin.jira.jql.call_count == 2
+
+    def test_iter_search_issues_auth_error(self, search_mixin: SearchMixin):
+        """Test authentication failures are surfaced during iteration."""
+        response = MagicMock(status_code=401)
+        search_mixin.jira.jql.side_effect = requests.HTTPError(response=response)
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            list(search_mixin.iter_search_issues("project = TEST"))
+
+    def test_search_issues_cloud_fetches_total_concurrently(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test the Cloud total-count request overlaps the issue request."""
+        search_mixin.config.is_cloud = True
+        issues_started = threading.Event()
+        overlapped = []
+
+        def get_total(*args, **kwargs):
+            overlapped.append(issues_started.wait(timeout=2))
+            return {"total": 42}
+
+        def get_issues(*args, **kwargs):
+            issues_started.set()
+            return mock_issues_response["issues"]
+
+        search_mixin.jira.get.side_effect = get_total
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = get_issues
+
+        result = search_mixin.search_issues("project = TEST")
+
+        assert result.total == 42
+        assert overlapped == [True]
+
+    def test_search_issues_cloud_total_is_cached(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test totals are reused for the same (whitespace-normalized) search."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.get.return_value = {"total": 7}
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = (
+            mock_issues_response["issues"]
+        )
+
+        first = search_mixin.search_issues("project = TEST")
+        second = search_mixin.search_issues("project  =  TEST ")
+        other = search_mixin.search_issues("project = OTHER")
+        other_fields = search_mixin.search_issues("project = TEST", fields="summary")
+        other_filter = search_mixin.search_issues(
+            "project = TEST", projects_filter="TEST"
+        )
+
+        assert first.total == second.total == other.total == 7
+        assert other_fields.total == other_filter.total == 7
+        # Only the JQL and the projects filter change the count
+        assert search_mixin.jira.get.call_count == 3
+
+    def test_search_issues_cloud_failed_total_not_cached(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test a failed count request reports -1 and is retried next time."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.get.side_effect = [Exception("boom"), {"total": 3}]
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = (
+            mock_issues_response["issues"]
+        )
+
+        assert search_mixin.search_issues("project = TEST").total == -1
+        assert search_mixin.search_issues("project = TEST").total == 3
+
+    def test_search_issues_cloud_without_total(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test include_total=False skips the count request entirely."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = (
+            mock_issues_response["issues"]
+        )
+
+        result = search_mixin.search_issues("project = TEST", include_total=False)
+
+        assert result.total == -1
+        assert len(result.issues) == 1
+        search_mixin.jira.get.assert_not_called()
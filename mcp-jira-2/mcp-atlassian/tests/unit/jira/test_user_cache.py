@@ -0,0 +1,101 @@
+"""Tests for the process-wide Jira user identity cache."""
+
+from types import SimpleNamespace
+
+from mcp_atlassian.jira.user_cache import UserIdentityCache
+
+
+def _config(
+    url: str = "https://test.atlassian.net", token: str = "token-a"
+) -> SimpleNamespace:
+    return SimpleNamespace(url=url, auth_type="pat", personal_token=token)
+
+
+CONFIG = _config()
+
+
+def test_lookup_is_keyed_by_credentials_and_normalized_identifier():
+    """Identifiers match case-insensitively for the same credentials only."""
+    cache = UserIdentityCache(maxsize=10, ttl=60, negative_ttl=60)
+    cache.store(_config("https://test.atlassian.net/"), "John.Doe@example.com", "acc-1")
+
+    assert cache.lookup(
+        _config("https://TEST.atlassian.net"), "john.doe@example.com"
+    ) == (
+        True,
+        "acc-1",
+    )
+    assert cache.lookup(
+        _config("https://other.atlassian.net"), "john.doe@example.com"
+    ) == (False, None)
+    assert cache.lookup(_config(token="token-b"), "john.doe@example.com") == (
+        False,
+        None,
+    )
+
+
+def test_store_user_indexes_both_directions():
+    """A stored user resolves from any of its names and back, per credentials."""
+    cache = UserIdentityCache(maxsize=10, ttl=60, negative_ttl=60)
+    cache.store_not_found(CONFIG, "jdoe@example.com")
+    cache.store_user(
+        CONFIG,
+        {
+            "accountId": "acc-1",
+            "displayName": "John Doe",
+            "emailAddress": "jdoe@example.com",
+        },
+    )
+    cache.store(CONFIG, "johnny", "acc-1")
+
+    assert cache.lookup(CONFIG, "john doe") == (True, "acc-1")
+    assert cache.lookup(CONFIG, "JDOE@example.com") == (True, "acc-1")
+    assert cache.identifiers_for(CONFIG, "acc-1") == {
+        "John Doe",
+        "jdoe@example.com",
+        "johnny",
+    }
+    assert cache.display_name_for(CONFIG, "acc-1") == "John Doe"
+    assert cache.user_for(CONFIG, "acc-1")["emailAddress"] == "jdoe@example.com"
+
+    other = _config(token="token-b")
+    assert cache.identifiers_for(other, "acc-1") == frozenset()
+    assert cache.display_name_for(other, "acc-1") is None
+    assert cache.user_for(other, "acc-1") is None
+
+
+def test_negative_entries():
+    """Failed lookups are remembered until a successful store replaces them."""
+    cache = UserIdentityCache(maxsize=10, ttl=60, negative_ttl=60)
+    cache.store_not_found(CONFIG, "ghost")
+
+    assert cache.lookup(CONFIG, "ghost") == (True, None)
+    assert cache.lookup(_config(token="token-b"), "ghost") == (False, None)
+
+    cache.store(CONFIG, "ghost", "acc-2")
+    assert cache.lookup(CONFIG, "ghost") == (True, "acc-2")
+
+
+def test_negative_caching_can_be_disabled():
+    """With a negative TTL of 0, failed lookups are not remembered."""
+    cache = UserIdentityCache(maxsize=10, ttl=60, negative_ttl=0)
+    cache.store_not_found(CONFIG, "ghost")
+
+    assert cache.lookup(CONFIG, "ghost") == (False, None)
+
+
+def test_disabled_cache_and_stats():
+    """A TTL of 0 disables the cache; stats count hits and misses."""
+    disabled = UserIdentityCache(maxsize=10, ttl=0, negative_ttl=60)
+    disabled.store(CONFIG, "jdoe", "acc-1")
+    assert disabled.lookup(CONFIG, "jdoe") == (False, None)
+
+    cache = UserIdentityCache(maxsize=10, ttl=60, negative_ttl=60)
+    cache.store(CONFIG, "jdoe", "acc-1")
+    cache.lookup(CONFIG, "jdoe")
+    cache.lookup(CONFIG, "unknown")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
@@ -4,8 +4,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
+from requests.exceptions import HTTPError
 
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.jira.user_cache import get_user_identity_cache
 from mcp_atlassian.jira.users import UsersMixin
 
 
@@ -212,6 +214,84 @@ class TestUsersMixin:
             ):
                 users_mixin._get_account_id("testuser")
 
+    def test_get_account_id_is_cached(self, users_mixin):
+        """Test that resolved and unresolvable users are looked up only once."""
+        with (
+            patch.object(
+                users_mixin,
+                "_lookup_user_directly",
+                side_effect=lambda name: "account-1" if name == "john" else None,
+            ) as mock_direct,
+            patch.object(
+                users_mixin, "_lookup_user_by_permissions", return_value=None
+            ) as mock_permissions,
+        ):
+            assert users_mixin._get_account_id("john") == "account-1"
+            assert users_mixin._get_account_id(" John ") == "account-1"
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Could not find account ID"):
+                    users_mixin._get_account_id("ghost")
+
+            assert mock_direct.call_count == 2
+            mock_permissions.assert_called_once_with("ghost")
+        assert get_user_identity_cache().lookup(users_mixin.config, "JOHN") == (
+            True,
+            "account-1",
+        )
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            HTTPError(response=MagicMock(status_code=429)),
+            HTTPError(response=MagicMock(status_code=503)),
+            requests.ConnectionError("connection reset"),
+        ],
+    )
+    def test_get_account_id_transient_errors_are_not_cached(self, users_mixin, error):
+        """Test throttling and outages are not remembered as unknown users."""
+        users_mixin.jira.user_find_by_user_string.side_effect = error
+
+        with (
+            patch.object(
+                users_mixin, "_lookup_user_by_permissions", return_value=None
+            ) as mock_permissions,
+            pytest.raises(ValueError, match="Could not find account ID"),
+        ):
+            users_mixin._get_account_id("john")
+        mock_permissions.assert_not_called()
+        assert get_user_identity_cache().lookup(users_mixin.config, "john") == (
+            False,
+            None,
+        )
+
+    def test_lookup_user_by_permissions_raises_transient_errors(self, users_mixin):
+        """Test a throttled permission search is raised, not reported missing."""
+        response = requests.Response()
+        response.status_code = 429
+        with (
+            patch("requests.get", return_value=response),
+            pytest.raises(HTTPError),
+        ):
+            users_mixin._lookup_user_by_permissions("john")
+
+    def test_resolve_accounts(self, users_mixin):
+        """Test that resolve_accounts resolves each distinct user once."""
+
+        def get_account_id(name):
+            if name == "ghost":
+                msg = f"Could not find account ID for user: {name}"
+                raise ValueError(msg)
+            return f"id-{name}"
+
+        users_mixin._get_account_id = MagicMock(side_effect=get_account_id)
+
+        result = users_mixin.resolve_accounts(
+            ["john", "jane", "john", "ghost", "", "jane"]
+        )
+
+        assert result == {"john": "id-john", "jane": "id-jane", "ghost": None}
+        assert users_mixin._get_account_id.call_count == 3
+
     def test_lookup_user_directly(self, users_mixin):
         """Test _lookup_user_directly when user is found."""
         # Mock the API response
@@ -578,10 +658,39 @@ class TestUsersMixin:
             )
             mock_from_api_response.assert_called_once_with(mock_response_data)
 
+    def test_get_user_profile_by_identifier_served_from_cache(self, users_mixin):
+        """A profile already seen is served by account or identifier without a call."""
+        user_data = {
+            "accountId": "5b10ac8d82e05b22cc7d4ef5",
+            "displayName": "Cloud User",
+            "emailAddress": "cloud@example.com",
+            "active": True,
+        }
+        users_mixin.jira.user = MagicMock(return_value=user_data)
+
+        first = users_mixin.get_user_profile_by_identifier("5b10ac8d82e05b22cc7d4ef5")
+        by_account = users_mixin.get_user_profile_by_identifier(
+            "5b10ac8d82e05b22cc7d4ef5"
+        )
+        by_email = users_mixin.get_user_profile_by_identifier("Cloud@example.com")
+
+        users_mixin.jira.user.assert_called_once_with(
+            account_id="5b10ac8d82e05b22cc7d4ef5"
+        )
+        assert first.display_name == by_account.display_name == "Cloud User"
+        assert by_email.email == "cloud@example.com"
+        assert (
+            get_user_identity_cache().display_name_for(
+                users_mixin.config, "5b10ac8d82e05b22cc7d4ef5"
+            )
+            == "Cloud User"
+        )
+
     def test_get_user_profile_by_identifier_not_found(self, users_mixin):
         """Test get_user_profile_by_identifier when user is not found (404 or cannot resolve)."""
         users_mixin.config = MagicMock(spec=JiraConfig)
         users_mixin.config.is_cloud = True
+        users_mixin.config.url = "https://test.atlassian.net"
         users_mixin._lookup_user_directly = MagicMock(return_value=None)
         users_mixin._lookup_user_by_permissions = MagicMock(return_value=None)
         # Simulate the identifier cannot be resolved to an account ID
@@ -21,12 +21,14 @@ from src.mcp_atlassian.models.jira import (
     JiraIssue,
     JiraIssueLink,
     JiraIssueLinkType,
+    JiraIssueProjection,
     JiraIssueType,
     JiraLinkedIssue,
     JiraLinkedIssueFields,
     JiraPriority,
     JiraProject,
     JiraResolution,
+    JiraSearchProjection,
     JiraSearchResult,
     JiraStatus,
     JiraStatusCategory,
@@ -1099,6 +1101,103 @@ class TestJiraSearchResult:
         assert len(search_result.issues) == 1  # Assuming mock data has issues
 
 
+class TestJiraIssueProjection:
+    """Tests for the projections matching JiraIssue.to_simplified_dict."""
+
+    RICH_ISSUE = {
+        "id": "10001",
+        "key": "PROJ-7",
+        "self": "https://example.atlassian.net/rest/api/2/issue/10001",
+        "names": {
+            "customfield_10010": "Story Points",
+            "customfield_10014": "Epic Link",
+        },
+        "fields": {
+            "summary": "Rich issue",
+            "description": "Body",
+            "status": {
+                "name": "In Progress",
+                "statusCategory": {"name": "In Progress", "colorName": "yellow"},
+            },
+            "issuetype": {"name": "Story"},
+            "priority": {"name": "High"},
+            "assignee": {
+                "displayName": "Ada",
+                "emailAddress": "ada@example.com",
+                "avatarUrls": {"48x48": "https://avatar/48"},
+            },
+            "reporter": "unexpected",
+            "project": {
+                "key": "PROJ",
+                "name": "Project",
+                "projectCategory": {"name": "Team"},
+                "lead": {"displayName": "Lead"},
+            },
+            "resolution": {"id": "1", "name": "Done"},
+            "duedate": "2024-03-01",
+            "resolutiondate": None,
+            "parent": {"key": "PROJ-1"},
+            "subtasks": [{"key": "PROJ-8"}, "junk"],
+            "labels": ["a", "", "b"],
+            "components": [{"name": "api"}, "ui"],
+            "fixVersions": [{"name": "1.0"}],
+            "timetracking": {"originalEstimate": "1d", "timeSpent": "2h"},
+            "created": "2024-01-01T10:00:00.000+0000",
+            "updated": None,
+            "comment": {"comments": [{"id": "1", "body": "hi"}]},
+            "attachment": [
+                {"id": "5", "filename": "a.log", "size": 3, "content": "https://a"}
+            ],
+            "customfield_10010": 5,
+            "customfield_10014": "PROJ-1",
+            "customfield_10020": {"value": "Option"},
+        },
+        "changelog": {"histories": [{"id": "9", "items": [{"field": "status"}]}]},
+    }
+
+    @pytest.mark.parametrize(
+        "requested_fields",
+        [
+            "summary,description,status,assignee,reporter,labels,priority,created,updated,issuetype",
+            "summary,url,issue_type,project,resolution,duedate,resolutiondate,parent,subtasks",
+            "fix_versions,components,timetracking,comment,attachment,epic_key,epic_name",
+            "summary,story points,cf_10020,customfield_10014,issuelinks",
+            "key",
+            "*all",
+            None,
+        ],
+    )
+    def test_matches_full_model(self, jira_issue_data, requested_fields):
+        """Projections give the same output as the full model for any fields."""
+        for data in (self.RICH_ISSUE, jira_issue_data):
+            full = JiraIssue.from_api_response(data, requested_fields=requested_fields)
+            projection = JiraIssueProjection.from_api_response(
+                data, requested_fields=requested_fields
+            )
+            assert projection.to_simplified_dict() == full.to_simplified_dict()
+            assert projection.key == full.key
+
+    def test_search_projection_matches_search_result(self, jira_search_data):
+        """Search projections have the search result's simplified form."""
+        fields = "summary,status,assignee"
+        full = JiraSearchResult.from_api_response(
+            jira_search_data, requested_fields=fields
+        )
+        projection = JiraSearchProjection.from_api_response(
+            jira_search_data, requested_fields=fields
+        )
+        assert projection.to_simplified_dict() == full.to_simplified_dict()
+        assert projection.to_simplified_dict()["issues"][0]["key"] == "PROJ-123"
+        assert JiraSearchProjection.from_api_response({}).issues == []
+
+    def test_slotted(self, jira_issue_data):
+        """Projections carry no per-instance dictionary."""
+        projection = JiraIssueProjection.from_api_response(
+            jira_issue_data, requested_fields=["summary"]
+        )
+        assert not hasattr(projection, "__dict__")
+
+
 class TestJiraProject:
     """Tests for the JiraProject model."""
 
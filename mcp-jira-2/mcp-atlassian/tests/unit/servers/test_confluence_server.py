@@ -43,7 +43,7 @@ def mock_confluence_fetcher():
     # Set up mock responses for each method
     mock_fetcher.search.return_value = [mock_page]
     mock_fetcher.get_page_content.return_value = mock_page
-    mock_fetcher.get_page_children.return_value = [mock_page]
+    mock_fetcher.get_page_children_async = AsyncMock(return_value=[mock_page])
     mock_fetcher.create_page.return_value = mock_page
     mock_fetcher.update_page.return_value = mock_page
     mock_fetcher.delete_page.return_value = True
@@ -109,6 +109,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
         get_page,
         get_page_children,
         search,
+        search_all,
         update_page,
     )
 
@@ -130,6 +131,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
     # Create and configure the sub-MCP for Confluence tools
     confluence_sub_mcp = FastMCP(name="TestConfluenceSubMCP")
     confluence_sub_mcp.tool()(search)
+    confluence_sub_mcp.tool()(search_all)
     confluence_sub_mcp.tool()(get_page)
     confluence_sub_mcp.tool()(get_page_children)
     confluence_sub_mcp.tool()(get_comments)
@@ -251,6 +253,41 @@ async def test_search(client, mock_confluence_fetcher):
     assert result_data[0]["title"] == "Test Page Mock Title"
 
 
+@pytest.mark.anyio
+async def test_search_all(client, mock_confluence_fetcher):
+    """Test search_all pages through iter_search and falls back to text search."""
+
+    def make_page(page_id):
+        page = MagicMock()
+        page.to_simplified_dict.return_value = {"id": page_id}
+        return page
+
+    def failing_pages():
+        raise ValueError("siteSearch is not supported")
+        yield
+
+    mock_confluence_fetcher.iter_search.side_effect = [
+        failing_pages(),
+        iter([[make_page("1"), make_page("2")], [make_page("3")]]),
+    ]
+
+    response = await client.call_tool(
+        "confluence_search_all", {"query": "roadmap", "max_results": 5}
+    )
+
+    content = json.loads(response[0].text)
+    assert [page["id"] for page in content["results"]] == ["1", "2", "3"]
+    assert content["total_fetched"] == 3
+    assert content["budget_reached"] is False
+    assert [c.args[0] for c in mock_confluence_fetcher.iter_search.call_args_list] == [
+        'siteSearch ~ "roadmap"',
+        'text ~ "roadmap"',
+    ]
+    mock_confluence_fetcher.iter_search.assert_called_with(
+        'text ~ "roadmap"', page_size=50, max_results=5, spaces_filter=""
+    )
+
+
 @pytest.mark.anyio
 async def test_get_page(client, mock_confluence_fetcher):
     """Test the get_page tool with default parameters."""
@@ -323,8 +360,8 @@ async def test_get_page_children(client, mock_confluence_fetcher):
         "confluence_get_page_children", {"parent_id": "123456"}
     )
 
-    mock_confluence_fetcher.get_page_children.assert_called_once()
-    call_kwargs = mock_confluence_fetcher.get_page_children.call_args.kwargs
+    mock_confluence_fetcher.get_page_children_async.assert_awaited_once()
+    call_kwargs = mock_confluence_fetcher.get_page_children_async.call_args.kwargs
     assert call_kwargs["page_id"] == "123456"
     assert call_kwargs.get("start") == 0
     assert call_kwargs.get("limit") == 25
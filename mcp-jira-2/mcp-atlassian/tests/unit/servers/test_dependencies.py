@@ -0,0 +1,205 @@
+"""Unit tests for the fetcher dependency providers and the pooled fetcher cache."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.mcp_atlassian.confluence.config import ConfluenceConfig
+from src.mcp_atlassian.jira.config import JiraConfig
+from src.mcp_atlassian.servers import dependencies
+from src.mcp_atlassian.servers.dependencies import (
+    _get_fetcher_cache_key,
+    _get_fetcher_expiry,
+    _get_or_create_fetcher,
+    clear_fetcher_cache,
+    close_all_fetchers,
+)
+from src.mcp_atlassian.utils.oauth import OAuthConfig
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Ensure every test starts and ends with an empty fetcher pool."""
+    clear_fetcher_cache()
+    yield
+    clear_fetcher_cache()
+
+
+@pytest.fixture
+def pat_config():
+    return JiraConfig(
+        url="https://jira.example.com", auth_type="pat", personal_token="token-a"
+    )
+
+
+class _FakeFetcher:
+    """Stand-in for JiraFetcher that records how often it was constructed."""
+
+    instances = 0
+
+    def __init__(self, config):
+        type(self).instances += 1
+        self.config = config
+
+
+@pytest.fixture
+def fake_fetcher_class():
+    _FakeFetcher.instances = 0
+    return _FakeFetcher
+
+
+def test_cache_key_is_stable_and_credential_sensitive(pat_config):
+    """Equal configs share a key; any credential or transport change alters it."""
+    same = JiraConfig(
+        url="https://jira.example.com", auth_type="pat", personal_token="token-a"
+    )
+    other_token = JiraConfig(
+        url="https://jira.example.com", auth_type="pat", personal_token="token-b"
+    )
+    other_proxy = JiraConfig(
+        url="https://jira.example.com",
+        auth_type="pat",
+        personal_token="token-a",
+        https_proxy="http://proxy:8080",
+    )
+    no_ssl = JiraConfig(
+        url="https://jira.example.com",
+        auth_type="pat",
+        personal_token="token-a",
+        ssl_verify=False,
+    )
+    confluence = ConfluenceConfig(
+        url="https://jira.example.com", auth_type="token", personal_token="token-a"
+    )
+
+    key = _get_fetcher_cache_key(pat_config)
+    assert key == _get_fetcher_cache_key(same)
+    assert "token-a" not in key
+    assert key != _get_fetcher_cache_key(other_token)
+    assert key != _get_fetcher_cache_key(other_proxy)
+    assert key != _get_fetcher_cache_key(no_ssl)
+    assert key != _get_fetcher_cache_key(confluence)
+
+
+def test_fetcher_is_reused_and_validated_once(pat_config, fake_fetcher_class):
+    """A second lookup reuses the pooled fetcher and the remembered validation."""
+    validate = MagicMock(return_value="account-1")
+
+    first, first_result = _get_or_create_fetcher(
+        pat_config, fake_fetcher_class, validate=validate
+    )
+    second, second_result = _get_or_create_fetcher(
+        pat_config, fake_fetcher_class, validate=validate
+    )
+
+    assert first is second
+    assert first_result == second_result == "account-1"
+    assert fake_fetcher_class.instances == 1
+    validate.assert_called_once_with(first)
+
+
+def test_unvalidated_entry_is_validated_on_demand(pat_config, fake_fetcher_class):
+    """A fetcher pooled without validation is rebuilt when validation is requested."""
+    _get_or_create_fetcher(pat_config, fake_fetcher_class)
+    validate = MagicMock(return_value="account-1")
+
+    _, result = _get_or_create_fetcher(pat_config, fake_fetcher_class, validate)
+
+    assert result == "account-1"
+    validate.assert_called_once()
+
+
+def test_failed_validation_is_not_cached(pat_config, fake_fetcher_class):
+    """Invalid credentials raise and leave nothing behind in the pool."""
+    validate = MagicMock(side_effect=Exception("401 Unauthorized"))
+
+    with pytest.raises(Exception, match="401"):
+        _get_or_create_fetcher(pat_config, fake_fetcher_class, validate=validate)
+
+    assert len(dependencies._fetcher_cache) == 0
+
+
+def test_entries_expire_after_ttl(pat_config, fake_fetcher_class):
+    """Entries are rebuilt once their TTL has elapsed."""
+    with patch.object(dependencies, "FETCHER_CACHE_TTL", 0):
+        first, _ = _get_or_create_fetcher(pat_config, fake_fetcher_class)
+        time.sleep(0.01)
+        second, _ = _get_or_create_fetcher(pat_config, fake_fetcher_class)
+
+    assert first is not second
+    assert fake_fetcher_class.instances == 2
+
+
+def test_expiry_never_outlives_oauth_token():
+    """OAuth entries expire before the access token does."""
+    token_expiry = time.time() + 600
+    config = JiraConfig(
+        url="https://test.atlassian.net",
+        auth_type="oauth",
+        oauth_config=OAuthConfig(
+            client_id="id",
+            client_secret="secret",
+            redirect_uri="http://localhost",
+            scope="read:jira-work",
+            cloud_id="cloud",
+            access_token="access",
+            expires_at=token_expiry,
+        ),
+    )
+
+    with patch.object(dependencies, "FETCHER_CACHE_TTL", 3600):
+        assert _get_fetcher_expiry(config) <= token_expiry
+
+
+def test_pool_is_bounded(fake_fetcher_class):
+    """The least recently used entry is evicted when the pool is full."""
+    cache = dependencies.TLRUCache(
+        maxsize=2, ttu=dependencies._fetcher_entry_ttu, timer=time.time
+    )
+    with patch.object(dependencies, "_fetcher_cache", cache):
+        for token in ("a", "b", "c"):
+            _get_or_create_fetcher(
+                JiraConfig(
+                    url="https://jira.example.com",
+                    auth_type="pat",
+                    personal_token=token,
+                ),
+                fake_fetcher_class,
+            )
+        assert len(cache) == 2
+
+
+@pytest.mark.anyio
+async def test_evicted_async_clients_are_closed(fake_fetcher_class):
+    """Fetchers leaving the pool with an open async client get it closed."""
+    cache = dependencies._FetcherCache(
+        maxsize=1, ttu=dependencies._fetcher_entry_ttu, timer=time.time
+    )
+    fetchers = []
+    with patch.object(dependencies, "_fetcher_cache", cache):
+        for token in ("a", "b", "c"):
+            fetcher, _ = _get_or_create_fetcher(
+                JiraConfig(
+                    url="https://jira.example.com",
+                    auth_type="pat",
+                    personal_token=token,
+                ),
+                fake_fetcher_class,
+            )
+            # Only "a" and "c" ever opened an async client
+            fetcher._async_client = (
+                MagicMock(spec=httpx.AsyncClient) if token != "b" else None
+            )
+            fetcher.aclose = AsyncMock()
+            fetchers.append(fetcher)
+
+        assert dependencies._retired_fetchers == [fetchers[0]]
+        await close_all_fetchers()
+
+    assert len(cache) == 0
+    assert dependencies._retired_fetchers == []
+    fetchers[0].aclose.assert_awaited_once()
+    fetchers[1].aclose.assert_not_awaited()
+    fetchers[2].aclose.assert_awaited_once()
@@ -0,0 +1,126 @@
+"""Unit tests for the blocking-call dispatcher."""
+
+import threading
+import time
+
+import anyio
+import pytest
+
+from src.mcp_atlassian.servers.dispatch import ToolDispatcher, run_blocking
+
+
+class _ConcurrencyProbe:
+    """Blocking callable that records the peak number of concurrent calls."""
+
+    def __init__(self, duration: float = 0.05) -> None:
+        self.duration = duration
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, value: int) -> int:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(self.duration)
+        with self._lock:
+            self.current -= 1
+        return value
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        ToolDispatcher(max_workers=0, max_concurrent_per_user=1)
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("ATLASSIAN_MAX_WORKERS", "7")
+    monkeypatch.setenv("ATLASSIAN_MAX_CONCURRENT_PER_USER", "3")
+    dispatcher = ToolDispatcher.from_env()
+    assert dispatcher.max_workers == 7
+    assert dispatcher.max_concurrent_per_user == 3
+
+
+@pytest.mark.anyio
+async def test_run_returns_result_off_the_event_loop():
+    dispatcher = ToolDispatcher(max_workers=2, max_concurrent_per_user=2)
+    main_thread = threading.get_ident()
+
+    worker_thread = await dispatcher.run(threading.get_ident)
+
+    assert worker_thread != main_thread
+    assert dispatcher.stats()["completed"] == 1
+
+
+@pytest.mark.anyio
+async def test_run_passes_args_and_kwargs():
+    dispatcher = ToolDispatcher(max_workers=2, max_concurrent_per_user=2)
+
+    result = await dispatcher.run(lambda a, b=0: a + b, 1, b=2)
+
+    assert result == 3
+
+
+@pytest.mark.anyio
+async def test_run_blocking_uses_shared_dispatcher():
+    assert await run_blocking(sum, [1, 2, 3]) == 6
+
+
+@pytest.mark.anyio
+async def test_per_user_limit():
+    dispatcher = ToolDispatcher(max_workers=8, max_concurrent_per_user=2)
+    probe = _ConcurrencyProbe()
+
+    async with anyio.create_task_group() as tg:
+        for i in range(6):
+            tg.start_soon(lambda i=i: dispatcher.run(probe, i, user_key="alice"))
+
+    assert probe.peak == 2
+    stats = dispatcher.stats()
+    assert stats["completed"] == 6
+    assert stats["max_queue_depth"] >= 4
+    assert stats["queue_depth"] == 0
+    assert stats["active"] == 0
+
+
+@pytest.mark.anyio
+async def test_global_limit_across_users():
+    dispatcher = ToolDispatcher(max_workers=3, max_concurrent_per_user=3)
+    probe = _ConcurrencyProbe()
+
+    async with anyio.create_task_group() as tg:
+        for i in range(9):
+            tg.start_soon(lambda i=i: dispatcher.run(probe, i, user_key=f"user-{i}"))
+
+    assert probe.peak == 3
+
+
+@pytest.mark.anyio
+async def test_failures_are_counted_and_propagated():
+    dispatcher = ToolDispatcher(max_workers=1, max_concurrent_per_user=1)
+
+    def boom() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await dispatcher.run(boom)
+
+    assert dispatcher.stats()["failed"] == 1
+
+
+@pytest.mark.anyio
+async def test_cancelled_queued_call_never_runs():
+    dispatcher = ToolDispatcher(max_workers=1, max_concurrent_per_user=1)
+    probe = _ConcurrencyProbe(duration=0.2)
+    calls: list[int] = []
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(dispatcher.run, probe, 1)
+        await anyio.sleep(0.05)
+        with anyio.move_on_after(0.05):
+            await dispatcher.run(calls.append, 2)
+
+    assert calls == []
+    stats = dispatcher.stats()
+    assert stats["cancelled"] == 1
+    assert stats["queue_depth"] == 0
@@ -96,6 +96,7 @@ def mock_jira_fetcher():
         return mock_search_result
 
     mock_fetcher.search_issues.side_effect = mock_search_issues
+    mock_fetcher.search_issue_projections.side_effect = mock_search_issues
 
     # Configure create_issue
     def mock_create_issue(
@@ -247,10 +248,12 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         add_worklog,
         batch_create_issues,
         batch_get_changelogs,
+        batch_get_issues,
         create_issue,
         create_issue_link,
         delete_issue,
         download_attachments,
+        download_attachments_for_jql,
         get_agile_boards,
         get_board_issues,
         get_issue,
@@ -263,8 +266,10 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         get_user_profile,
         get_worklog,
         link_to_epic,
+        local_search,
         remove_issue_link,
         search,
+        search_all,
         search_fields,
         transition_issue,
         update_issue,
@@ -273,13 +278,17 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
 
     jira_sub_mcp = FastMCP(name="TestJiraSubMCP")
     jira_sub_mcp.tool()(get_issue)
+    jira_sub_mcp.tool()(batch_get_issues)
     jira_sub_mcp.tool()(search)
+    jira_sub_mcp.tool()(search_all)
+    jira_sub_mcp.tool()(local_search)
     jira_sub_mcp.tool()(search_fields)
     jira_sub_mcp.tool()(get_project_issues)
     jira_sub_mcp.tool()(get_project_versions)
     jira_sub_mcp.tool()(get_transitions)
     jira_sub_mcp.tool()(get_worklog)
     jira_sub_mcp.tool()(download_attachments)
+    jira_sub_mcp.tool()(download_attachments_for_jql)
     jira_sub_mcp.tool()(get_agile_boards)
     jira_sub_mcp.tool()(get_board_issues)
     jira_sub_mcp.tool()(get_sprints_from_board)
@@ -393,6 +402,27 @@ async def test_get_issue(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_batch_get_issues(jira_client, mock_jira_fetcher):
+    """Test the batch_get_issues tool reports found issues and missing keys."""
+    issue = MagicMock()
+    issue.to_simplified_dict.return_value = {"key": "PROJ-1"}
+    mock_jira_fetcher.get_issues.return_value = ([issue], ["PROJ-404"])
+
+    response = await jira_client.call_tool(
+        "jira_batch_get_issues",
+        {"issue_keys": ["PROJ-1", "PROJ-404"], "fields": "summary, status"},
+    )
+
+    content = json.loads(response[0].text)
+    assert content == {"issues": [{"key": "PROJ-1"}], "not_found": ["PROJ-404"]}
+    mock_jira_fetcher.get_issues.assert_called_once_with(
+        issue_keys=["PROJ-1", "PROJ-404"],
+        fields=["summary", "status"],
+        expand=None,
+    )
+
+
 @pytest.mark.anyio
 async def test_search(jira_client, mock_jira_fetcher):
     """Test the search tool with fixture data."""
@@ -418,7 +448,7 @@ async def test_search(jira_client, mock_jira_fetcher):
     assert content["total"] > 0
     assert content["start_at"] == 0
     assert content["max_results"] == 10
-    mock_jira_fetcher.search_issues.assert_called_once_with(
+    mock_jira_fetcher.search_issue_projections.assert_called_once_with(
         jql="project = TEST",
         fields=["summary", "status"],
         limit=10,
@@ -428,6 +458,159 @@ async def test_search(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_search_from_mirror(jira_client, mock_jira_fetcher):
+    """source=mirror answers from the mirror and reports its staleness."""
+    search_result = MagicMock()
+    search_result.to_simplified_dict.return_value = {"total": 1, "issues": []}
+    mirror = MagicMock()
+    mirror.search_issues.return_value = MagicMock(value=search_result, staleness=12.34)
+    with patch("src.mcp_atlassian.servers.jira.get_issue_mirror", return_value=mirror):
+        response = await jira_client.call_tool(
+            "jira_search", {"jql": "project = TEST", "source": "mirror"}
+        )
+
+    content = json.loads(response[0].text)
+    assert content["source"] == "mirror"
+    assert content["staleness_seconds"] == 12.3
+    mock_jira_fetcher.search_issue_projections.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_get_issue_mirror_falls_back_to_live(jira_client, mock_jira_fetcher):
+    """source=mirror reads Jira when the mirror cannot answer."""
+    mirror = MagicMock()
+    mirror.get_issue.return_value = None
+    with patch("src.mcp_atlassian.servers.jira.get_issue_mirror", return_value=mirror):
+        response = await jira_client.call_tool(
+            "jira_get_issue", {"issue_key": "TEST-123", "source": "mirror"}
+        )
+
+    content = json.loads(response[0].text)
+    assert content["key"] == "TEST-123"
+    assert content["source"] == "live"
+    mock_jira_fetcher.get_issue.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_local_search(jira_client, mock_jira_fetcher):
+    """local_search answers from the mirror's full-text index."""
+    mirror = MagicMock()
+    mirror.search_text.return_value = MagicMock(
+        value=[{"key": "PROJ-1", "snippet": "**crash**"}], staleness=4.56
+    )
+    with patch("src.mcp_atlassian.servers.jira.get_issue_mirror", return_value=mirror):
+        response = await jira_client.call_tool(
+            "jira_local_search", {"query": "crash", "projects_filter": "PROJ,DEV"}
+        )
+
+    content = json.loads(response[0].text)
+    assert content == {
+        "source": "local",
+        "staleness_seconds": 4.6,
+        "results": [{"key": "PROJ-1", "snippet": "**crash**"}],
+    }
+    mirror.search_text.assert_called_once_with(
+        mock_jira_fetcher, "crash", projects=["PROJ", "DEV"], limit=10
+    )
+
+
+@pytest.mark.anyio
+async def test_download_attachments_for_jql(jira_client, mock_jira_fetcher):
+    """The JQL download tool totals the results of the issues with attachments."""
+    mock_jira_fetcher.iter_attachment_downloads.return_value = iter(
+        [
+            {
+                "issue_key": "TEST-1",
+                "total": 2,
+                "downloaded": [{"filename": "a.log"}],
+                "skipped": [{"filename": "b.log"}],
+                "failed": [],
+            },
+            {
+                "issue_key": "TEST-2",
+                "total": 0,
+                "downloaded": [],
+                "skipped": [],
+                "failed": [],
+            },
+            {
+                "issue_key": "TEST-3",
+                "total": 1,
+                "downloaded": [],
+                "skipped": [],
+                "failed": [{"filename": "c.log", "error": "Download failed"}],
+            },
+        ]
+    )
+
+    response = await jira_client.call_tool(
+        "jira_download_attachments_for_jql",
+        {"jql": "project = TEST", "target_dir": "/tmp/evidence", "max_issues": 10},
+    )
+
+    content = json.loads(response[0].text)
+    assert [issue["issue_key"] for issue in content["issues"]] == ["TEST-1", "TEST-3"]
+    assert content["issues_processed"] == 3
+    assert (content["downloaded"], content["skipped"], content["failed"]) == (1, 1, 1)
+    mock_jira_fetcher.iter_attachment_downloads.assert_called_once_with(
+        jql="project = TEST", target_dir="/tmp/evidence", max_issues=10
+    )
+
+
+@pytest.mark.anyio
+async def test_search_all(jira_client, mock_jira_fetcher):
+    """Test the search_all tool collects every page from the iterator."""
+
+    def make_issue(key):
+        issue = MagicMock()
+        issue.to_simplified_dict.return_value = {"key": key}
+        return issue
+
+    mock_jira_fetcher.iter_search_projections.return_value = iter(
+        [[make_issue("PROJ-1"), make_issue("PROJ-2")], [make_issue("PROJ-3")]]
+    )
+
+    response = await jira_client.call_tool(
+        "jira_search_all",
+        {"jql": "project = PROJ", "fields": "summary", "max_results": 3},
+    )
+
+    content = json.loads(response[0].text)
+    assert [issue["key"] for issue in content["issues"]] == [
+        "PROJ-1",
+        "PROJ-2",
+        "PROJ-3",
+    ]
+    assert content["total_fetched"] == 3
+    assert content["budget_reached"] is True
+    mock_jira_fetcher.iter_search_projections.assert_called_once_with(
+        jql="project = PROJ",
+        fields=["summary"],
+        page_size=50,
+        max_results=3,
+        projects_filter="",
+    )
+
+
+@pytest.mark.anyio
+async def test_search_all_table_output(jira_client, mock_jira_fetcher):
+    """output_format=table writes the issue keys once as columns."""
+    issue = MagicMock()
+    issue.to_simplified_dict.return_value = {"key": "PROJ-1", "summary": "Crash"}
+    mock_jira_fetcher.iter_search_projections.return_value = iter([[issue]])
+
+    response = await jira_client.call_tool(
+        "jira_search_all",
+        {"jql": "project = PROJ", "max_results": 1, "output_format": "table"},
+    )
+
+    assert response[0].text == (
+        '{"total_fetched":1,"budget_reached":true,"issues":'
+        '{"_table":true,"columns":["key","summary"],"rows":[["PROJ-1","Crash"]]}}'
+    )
+
+
 @pytest.mark.anyio
 async def test_create_issue(jira_client, mock_jira_fetcher):
     """Test the create_issue tool with fixture data."""
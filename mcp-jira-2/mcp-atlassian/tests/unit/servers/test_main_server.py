@@ -1,10 +1,12 @@
 """Tests for the main MCP server implementation."""
 
-from unittest.mock import patch
+import os
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
+from mcp_atlassian.servers import main
 from mcp_atlassian.servers.main import main_mcp
 
 
@@ -66,6 +68,55 @@ async def test_health_check_endpoint():
         assert response.json() == {"status": "ok"}
 
 
+@pytest.mark.anyio
+async def test_stats_endpoint():
+    """Test the /stats endpoint reports dispatcher and cache metrics."""
+    app = main_mcp.sse_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        with patch.dict(os.environ, {"ATLASSIAN_STATS_ENABLED": "true"}):
+            response = await client.get("/stats")
+
+        assert response.status_code == 200
+        dispatch_stats = response.json()["dispatch"]
+        assert "queue_depth" in dispatch_stats
+        assert "active" in dispatch_stats
+        cache_stats = response.json()["response_cache"]
+        assert {"hits", "misses", "size"} <= cache_stats.keys()
+        user_cache_stats = response.json()["jira_user_cache"]
+        assert {"hits", "misses", "size"} <= user_cache_stats.keys()
+        conversion_stats = response.json()["conversion_cache"]
+        assert {"hits", "misses", "bytes", "evictions"} <= conversion_stats.keys()
+        pool_stats = response.json()["conversion_pool"]
+        assert {"enabled", "started", "parallel_pages"} <= pool_stats.keys()
+        mirror_stats = response.json()["jira_mirror"]
+        assert {"enabled", "projects", "issues", "mirror_reads"} <= mirror_stats.keys()
+        assert isinstance(mirror_stats["projects"], int)
+        page_mirror_stats = response.json()["confluence_mirror"]
+        assert {"enabled", "spaces", "local_searches"} <= page_mirror_stats.keys()
+        rate_limit_stats = response.json()["rate_limiter"]
+        assert {"enabled", "max_concurrency", "hosts"} <= rate_limit_stats.keys()
+        assert isinstance(rate_limit_stats["hosts"], list)
+
+
+@pytest.mark.anyio
+async def test_stats_endpoint_is_opt_in_and_token_protected():
+    """/stats is off by default and requires ATLASSIAN_STATS_TOKEN when set."""
+    app = main_mcp.sse_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        with patch.dict(os.environ, {}, clear=True):
+            assert (await client.get("/stats")).status_code == 404
+
+        env = {"ATLASSIAN_STATS_ENABLED": "true", "ATLASSIAN_STATS_TOKEN": "s3cret"}
+        with patch.dict(os.environ, env):
+            assert (await client.get("/stats")).status_code == 401
+            response = await client.get(
+                "/stats", headers={"Authorization": "Bearer s3cret"}
+            )
+            assert response.status_code == 200
+
+
 @pytest.mark.anyio
 async def test_sse_app_health_check_endpoint():
     """Test the /healthz endpoint on the SSE app returns 200 and correct JSON response."""
@@ -86,3 +137,21 @@ async def test_streamable_http_app_health_check_endpoint():
         response = await client.get("/healthz")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
+
+
+def test_warm_up_jira_field_catalog():
+    """Test the lifespan warm-up loads fields through the pooled fetcher."""
+    fetcher = MagicMock()
+    fetcher.get_fields.return_value = [{"id": "summary"}]
+    config = MagicMock()
+    with patch.object(main, "get_pooled_fetcher", return_value=fetcher) as mock_get:
+        main._warm_up_jira_field_catalog(config)
+
+    mock_get.assert_called_once_with(config, main.JiraFetcher)
+    fetcher.get_fields.assert_called_once_with()
+
+
+def test_warm_up_jira_field_catalog_failure_is_logged():
+    """Test warm-up failures never propagate."""
+    with patch.object(main, "get_pooled_fetcher", side_effect=Exception("unreachable")):
+        main._warm_up_jira_field_catalog(MagicMock())
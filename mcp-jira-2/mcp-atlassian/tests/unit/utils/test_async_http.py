@@ -0,0 +1,199 @@
+"""Tests for the async HTTP transport."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mcp_atlassian.confluence.config import ConfluenceConfig
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.utils.async_http import (
+    _build_mounts,
+    create_async_http_client,
+    get_pool_limits,
+    is_http2_available,
+    request_json,
+)
+from mcp_atlassian.utils.oauth import OAuthConfig
+from mcp_atlassian.utils.rate_limit import ScheduledAsyncTransport
+
+
+def _mock_client(handler, **kwargs) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url="https://test.atlassian.net",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def test_basic_auth_client():
+    """Basic auth uses the username and API token."""
+    config = JiraConfig(
+        url="https://test.atlassian.net",
+        auth_type="basic",
+        username="user",
+        api_token="token",
+    )
+
+    client = create_async_http_client("Jira", config, config.url)
+
+    assert isinstance(client.auth, httpx.BasicAuth)
+    assert "Authorization" not in client.headers
+    assert client.headers["Accept"] == "application/json"
+    assert str(client.base_url) == "https://test.atlassian.net"
+
+
+def test_personal_token_client():
+    """PAT/token auth sends a bearer token for both services."""
+    jira = JiraConfig(
+        url="https://jira.example.com", auth_type="pat", personal_token="pat"
+    )
+    confluence = ConfluenceConfig(
+        url="https://wiki.example.com", auth_type="token", personal_token="pat"
+    )
+
+    for service, config in (("Jira", jira), ("Confluence", confluence)):
+        client = create_async_http_client(service, config, config.url)
+        assert client.headers["Authorization"] == "Bearer pat"
+
+
+def test_oauth_client_uses_access_token():
+    """OAuth sends the access token and targets the given API base URL."""
+    oauth_config = OAuthConfig(
+        client_id="id",
+        client_secret="secret",
+        redirect_uri="http://localhost",
+        scope="read:jira-work",
+        cloud_id="cloud",
+        access_token="access",
+    )
+    config = JiraConfig(
+        url="https://test.atlassian.net", auth_type="oauth", oauth_config=oauth_config
+    )
+
+    client = create_async_http_client(
+        "Jira", config, "https://api.atlassian.com/ex/jira/cloud"
+    )
+
+    assert client.headers["Authorization"] == "Bearer access"
+    assert str(client.base_url).startswith("https://api.atlassian.com/ex/jira/cloud")
+
+
+def test_oauth_client_requires_token():
+    """OAuth without an access token is rejected."""
+    oauth_config = OAuthConfig(
+        client_id="id",
+        client_secret="secret",
+        redirect_uri="http://localhost",
+        scope="read:jira-work",
+        cloud_id="cloud",
+    )
+    config = JiraConfig(
+        url="https://test.atlassian.net", auth_type="oauth", oauth_config=oauth_config
+    )
+
+    with pytest.raises(ValueError, match="access token"):
+        create_async_http_client("Jira", config, config.url)
+
+
+def test_proxy_mounts():
+    """Proxies are mounted per scheme and no_proxy hosts bypass them."""
+    config = JiraConfig(
+        url="https://jira.example.com",
+        auth_type="pat",
+        personal_token="pat",
+        http_proxy="http://proxy:8080",
+        https_proxy="http://proxy:8443",
+        no_proxy="localhost,.internal.example.com",
+    )
+
+    mounts = _build_mounts("Jira", config, verify=True, http2=False)
+
+    assert set(mounts) == {
+        "http://",
+        "https://",
+        "all://*localhost",
+        "all://*internal.example.com",
+    }
+
+
+def test_transports_go_through_the_rate_limiter():
+    """The default and proxy transports are admitted by the rate limiter."""
+    config = JiraConfig(
+        url="https://jira.example.com",
+        auth_type="pat",
+        personal_token="pat",
+        https_proxy="http://proxy:8443",
+    )
+
+    client = create_async_http_client("Jira", config, config.url)
+    mounts = _build_mounts("Jira", config, verify=True, http2=False)
+
+    assert isinstance(client._transport, ScheduledAsyncTransport)
+    assert isinstance(mounts["https://"], ScheduledAsyncTransport)
+
+
+def test_no_proxy_mounts_without_proxies():
+    """Without proxies no transports are mounted."""
+    config = JiraConfig(
+        url="https://jira.example.com", auth_type="pat", personal_token="pat"
+    )
+
+    assert _build_mounts("Jira", config, verify=True, http2=False) == {}
+
+
+def test_pool_limits_from_env(monkeypatch):
+    """Pool limits are configurable via environment variables."""
+    monkeypatch.setenv("ATLASSIAN_HTTP_MAX_CONNECTIONS", "10")
+    monkeypatch.setenv("ATLASSIAN_HTTP_MAX_KEEPALIVE", "5")
+    monkeypatch.setenv("ATLASSIAN_HTTP_KEEPALIVE_EXPIRY", "2.5")
+
+    limits = get_pool_limits()
+
+    assert limits.max_connections == 10
+    assert limits.max_keepalive_connections == 5
+    assert limits.keepalive_expiry == 2.5
+
+
+def test_http2_can_be_disabled(monkeypatch):
+    """ATLASSIAN_HTTP2=false disables HTTP/2 even when h2 is installed."""
+    monkeypatch.setenv("ATLASSIAN_HTTP2", "false")
+    with patch("importlib.util.find_spec", return_value=object()):
+        assert is_http2_available() is False
+    monkeypatch.setenv("ATLASSIAN_HTTP2", "true")
+    with patch("importlib.util.find_spec", return_value=object()):
+        assert is_http2_available() is True
+
+
+@pytest.mark.anyio
+async def test_request_json_decodes_response():
+    """Successful responses are decoded; empty bodies become None."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/empty"):
+            return httpx.Response(204)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async with _mock_client(handler) as client:
+        assert await request_json(client, "Jira", "GET", "rest/api/2/x") == {
+            "path": "/rest/api/2/x"
+        }
+        assert await request_json(client, "Jira", "DELETE", "rest/empty") is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("status_code", [401, 403])
+async def test_request_json_auth_errors(status_code):
+    """401/403 responses raise MCPAtlassianAuthenticationError."""
+    async with _mock_client(lambda request: httpx.Response(status_code)) as client:
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            await request_json(client, "Jira", "GET", "rest/api/2/myself")
+
+
+@pytest.mark.anyio
+async def test_request_json_other_errors():
+    """Other error responses raise httpx.HTTPStatusError."""
+    async with _mock_client(lambda request: httpx.Response(500)) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await request_json(client, "Jira", "GET", "rest/api/2/issue/X-1")
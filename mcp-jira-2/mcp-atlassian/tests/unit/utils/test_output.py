@@ -0,0 +1,109 @@
+"""Tests for tool output encoding."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from mcp_atlassian.utils import output
+from mcp_atlassian.utils.output import (
+    format_output,
+    get_output_format,
+    omit_empty,
+    tabulate,
+)
+
+RESULT = {
+    "total": 2,
+    "issues": [
+        {"key": "PROJ-1", "summary": "Crash", "labels": ["bug"], "assignee": None},
+        {"key": "PROJ-2", "summary": "Ünïcode", "epic": "PROJ-0"},
+    ],
+}
+
+
+def test_pretty_is_the_default():
+    """Without configuration results are indented JSON, as before."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert format_output(RESULT) == json.dumps(RESULT, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_compact(use_orjson):
+    """Compact output has no whitespace and keeps non-ASCII text as is."""
+    with (
+        patch.dict(os.environ, {}, clear=True),
+        patch.object(output, "orjson", output.orjson if use_orjson else None),
+    ):
+        text = format_output(RESULT, "compact")
+
+    assert text == json.dumps(RESULT, ensure_ascii=False, separators=(",", ":"))
+    assert "Ünïcode" in text
+
+
+def test_compact_falls_back_to_json_for_big_integers():
+    """Values orjson cannot encode are left to json."""
+    assert format_output({"n": 2**70}, "compact") == '{"n":1180591620717411303424}'
+
+
+def test_table_writes_keys_once():
+    """Lists of objects become columns and rows, missing keys null."""
+    assert json.loads(format_output(RESULT, "table")) == {
+        "total": 2,
+        "issues": {
+            "_table": True,
+            "columns": ["key", "summary", "labels", "assignee", "epic"],
+            "rows": [
+                ["PROJ-1", "Crash", ["bug"], None, None],
+                ["PROJ-2", "Ünïcode", None, None, "PROJ-0"],
+            ],
+        },
+    }
+
+
+def test_tabulate_nested_and_mixed_lists():
+    """Nested lists of objects are tabulated; other lists are kept."""
+    value = [{"comments": [{"id": 1}, {"id": 2}]}]
+
+    assert tabulate(value) == {
+        "_table": True,
+        "columns": ["comments"],
+        "rows": [[{"_table": True, "columns": ["id"], "rows": [[1], [2]]}]],
+    }
+    assert tabulate([{"id": 1}, "x"]) == [{"id": 1}, "x"]
+    assert tabulate([]) == []
+
+
+def test_tabulated_lists_are_marked():
+    """Objects with their own columns/rows keys are not mistaken for tables."""
+    value = {"report": {"columns": ["a"], "rows": [[1]]}, "items": [{"a": 1}]}
+
+    assert tabulate(value) == {
+        "report": {"columns": ["a"], "rows": [[1]]},
+        "items": {"_table": True, "columns": ["a"], "rows": [[1]]},
+    }
+
+
+def test_omit_empty():
+    """None, empty strings and empty containers go, False and 0 stay."""
+    value = {"a": None, "b": "", "c": [], "d": {"e": {}}, "f": False, "g": 0}
+
+    assert omit_empty(value) == {"f": False, "g": 0}
+    assert omit_empty([None, "x", {}]) == ["x"]
+
+
+def test_server_wide_settings():
+    """The environment selects the default format and omission."""
+    env = {"ATLASSIAN_OUTPUT_FORMAT": "compact", "ATLASSIAN_OUTPUT_OMIT_EMPTY": "true"}
+    with patch.dict(os.environ, env, clear=True):
+        assert format_output({"a": None, "b": [1]}) == '{"b":[1]}'
+        assert format_output({"a": 1}, "pretty") == '{\n  "a": 1\n}'
+
+
+def test_invalid_formats():
+    """Unknown per-call formats are errors; unknown settings fall back."""
+    with pytest.raises(ValueError, match="Invalid output_format 'xml'"):
+        format_output({}, "xml")
+    with patch.dict(os.environ, {"ATLASSIAN_OUTPUT_FORMAT": "yaml"}, clear=True):
+        assert get_output_format() == "pretty"
@@ -0,0 +1,240 @@
+"""Tests for the rate-limit-aware request scheduler."""
+
+import io
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from mcp_atlassian.utils.rate_limit import (
+    RateLimitScheduler,
+    ScheduledAdapter,
+    ScheduledAsyncTransport,
+    host_key,
+    parse_retry_after,
+)
+from mcp_atlassian.utils.ssl import SSLIgnoreAdapter
+
+
+class FakeAdapter(BaseAdapter):
+    """Answers with queued (status, headers) pairs and records the requests."""
+
+    def __init__(self, *answers, delay=0.0):
+        super().__init__()
+        self.answers = list(answers)
+        self.delay = delay
+        self.sent = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.sent.append(request.method)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            status, headers = self.answers.pop(0) if self.answers else (200, {})
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response.url = request.url
+        response.request = request
+        response.raw = io.BytesIO(b"")
+        return response
+
+    def close(self):
+        pass
+
+
+def _session(scheduler, adapter):
+    session = requests.Session()
+    session.mount("https://", adapter)
+    scheduler.install(session)
+    return session
+
+
+def test_retries_throttled_get_after_retry_after():
+    """A 429 on a GET is retried once Retry-After has passed."""
+    scheduler = RateLimitScheduler(max_concurrency=4)
+    adapter = FakeAdapter((429, {"Retry-After": "0.2"}), (200, {}))
+    session = _session(scheduler, adapter)
+
+    start = time.monotonic()
+    response = session.get("https://example.atlassian.net/rest/api/2/myself")
+
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 0.2
+    assert adapter.sent == ["GET", "GET"]
+    host = scheduler.stats()["hosts"]["example.atlassian.net"]
+    assert host["throttled"] == 1
+    assert host["retries"] == 1
+    assert host["limit"] == 2
+
+
+def test_writes_and_long_waits_are_not_retried():
+    """POSTs, exhausted retries and waits over max_backoff return the 429."""
+    scheduler = RateLimitScheduler(max_concurrency=4, max_retries=1, max_backoff=5)
+    adapter = FakeAdapter(
+        (429, {"Retry-After": "0"}),
+        (429, {}),
+        (429, {"Retry-After": "0"}),
+        (429, {"Retry-After": "3600"}),
+    )
+    session = _session(scheduler, adapter)
+    url = "https://example.atlassian.net/rest/api/2/issue"
+
+    assert session.post(url, json={}).status_code == 429
+    assert session.get(url).status_code == 429
+    assert session.get(url).status_code == 429
+    assert adapter.sent == ["POST", "GET", "GET", "GET"]
+
+
+def _async_client(scheduler, *answers):
+    sent = []
+    queued = list(answers)
+
+    def handler(request):
+        sent.append(request.method)
+        status, headers = queued.pop(0) if queued else (200, {})
+        return httpx.Response(status, headers=headers)
+
+    transport = scheduler.wrap_async_transport(httpx.MockTransport(handler))
+    return httpx.AsyncClient(transport=transport), sent
+
+
+@pytest.mark.anyio
+async def test_async_transport_retries_throttled_get_after_retry_after():
+    """The async path shares the window and retries a throttled GET."""
+    scheduler = RateLimitScheduler(max_concurrency=4)
+    client, sent = _async_client(
+        scheduler, (429, {"Retry-After": "0.2"}), (200, {}), (429, {})
+    )
+    url = "https://example.atlassian.net/rest/api/2/issue"
+
+    start = time.monotonic()
+    async with client:
+        assert (await client.get(url)).status_code == 200
+        assert time.monotonic() - start >= 0.2
+        assert (await client.post(url, json={})).status_code == 429
+
+    assert sent == ["GET", "GET", "POST"]
+    host = scheduler.stats()["hosts"]["example.atlassian.net"]
+    assert host["throttled"] == 2
+    assert host["retries"] == 1
+    assert host["in_flight"] == 0
+    assert host["limit"] < 4
+
+
+def test_wrap_async_transport_once_and_only_when_enabled():
+    """Transports are wrapped once, and not at all by a disabled scheduler."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    scheduler = RateLimitScheduler(max_concurrency=4)
+
+    wrapped = scheduler.wrap_async_transport(transport)
+
+    assert isinstance(wrapped, ScheduledAsyncTransport)
+    assert scheduler.wrap_async_transport(wrapped) is wrapped
+    assert (
+        RateLimitScheduler(max_concurrency=0).wrap_async_transport(transport)
+        is transport
+    )
+
+
+def test_window_limits_concurrency_and_grows_back():
+    """Requests beyond the window queue; successes grow it additively."""
+    scheduler = RateLimitScheduler(max_concurrency=2)
+    adapter = FakeAdapter(delay=0.05)
+    session = _session(scheduler, adapter)
+
+    threads = [
+        threading.Thread(target=session.get, args=("https://example.com/x",))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert adapter.max_active == 2
+    stats = scheduler.stats()["hosts"]["example.com"]
+    assert stats["requests"] == 6
+    assert stats["max_queue_wait_ms"] > 0
+
+    for status, limit in ((429, 1), (200, 2), (200, 2)):
+        scheduler.acquire("example.com")
+        scheduler.release("example.com", _response(status))
+        assert scheduler.stats()["hosts"]["example.com"]["limit"] == limit
+
+
+def test_near_limit_shrinks_window_and_headers_are_reported():
+    """X-RateLimit-NearLimit is a congestion signal; headers land in stats."""
+    scheduler = RateLimitScheduler(max_concurrency=8)
+    scheduler.acquire("example.com")
+    scheduler.release(
+        "example.com",
+        _response(200, {"X-RateLimit-NearLimit": "true", "X-RateLimit-Remaining": "3"}),
+    )
+
+    host = scheduler.stats()["hosts"]["example.com"]
+    assert host["limit"] == 4
+    assert host["rate_limit_headers"]["X-RateLimit-Remaining"] == "3"
+
+
+def test_install_wraps_existing_adapters_once():
+    """Adapters mounted before, like the SSL one, keep serving their prefix."""
+    scheduler = RateLimitScheduler(max_concurrency=4)
+    session = requests.Session()
+    session.mount("https://example.com", SSLIgnoreAdapter())
+    scheduler.install(session)
+    scheduler.install(session)
+
+    adapter = session.get_adapter("https://example.com/rest")
+    assert isinstance(adapter, ScheduledAdapter)
+    assert isinstance(adapter.adapter, SSLIgnoreAdapter)
+    assert isinstance(session.get_adapter("https://other.com").adapter, HTTPAdapter)
+    assert adapter.max_retries is adapter.adapter.max_retries
+
+    disabled = requests.Session()
+    RateLimitScheduler(max_concurrency=0).install(disabled)
+    assert not any(isinstance(a, ScheduledAdapter) for a in disabled.adapters.values())
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://Example.atlassian.net/rest/api/2/search", "example.atlassian.net"),
+        (
+            "https://api.atlassian.com/ex/jira/cloud-1/rest/api/2/search",
+            "api.atlassian.com/ex/jira/cloud-1",
+        ),
+    ],
+)
+def test_host_key(url, expected):
+    """Hosts are keyed by name; OAuth gateway requests by tenant."""
+    assert host_key(url) == expected
+
+
+def test_parse_retry_after():
+    """Retry-After is either seconds or an HTTP date."""
+    in_a_minute = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+    assert parse_retry_after("5") == 5
+    assert 55 < parse_retry_after(format_datetime(in_a_minute, usegmt=True)) <= 60
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def _response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response.url = "https://example.com/x"
+    return response
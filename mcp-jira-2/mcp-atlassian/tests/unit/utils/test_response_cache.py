@@ -0,0 +1,226 @@
+"""Tests for the read-through response cache."""
+
+import contextlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.jira.attachments import AttachmentsMixin
+from mcp_atlassian.jira.epics import EpicsMixin
+from mcp_atlassian.jira.links import LinksMixin
+from mcp_atlassian.utils import response_cache
+from mcp_atlassian.utils.response_cache import (
+    ResponseCache,
+    cached_response,
+    invalidates_response_cache,
+)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Install an enabled cache that never needs revalidation."""
+    cache = ResponseCache(maxsize=100, ttl=300, revalidate_after=300)
+    monkeypatch.setattr(response_cache, "_response_cache", cache)
+    return cache
+
+
+class _FakeFetcher:
+    """Fetcher with cached reads and invalidating writes backed by a mock API."""
+
+    def __init__(self, token: str = "token-a", url: str = "https://jira.example.com"):
+        self.config = SimpleNamespace(
+            url=url, auth_type="pat", personal_token=token, oauth_config=None
+        )
+        self.api = MagicMock(side_effect=lambda *args: {"args": args})
+        self.current = True
+
+    @cached_response("jira-issue", entity_arg="issue_key", revalidate="_is_current")
+    def get_issue(self, issue_key: str, fields: list[str] | None = None) -> dict:
+        return self.api("get_issue", issue_key, fields)
+
+    @cached_response("jira-search", cache_empty=False)
+    def search(self, jql: str) -> list:
+        return self.api("search", jql)["args"][1:] if jql else []
+
+    @invalidates_response_cache(
+        "jira-issue", entity_arg="issue_key", also=("jira-search",)
+    )
+    def update_issue(self, issue_key: str) -> None:
+        self.api("update_issue", issue_key)
+
+    def _is_current(self, value: dict, arguments: dict) -> bool:
+        return self.current
+
+
+def test_disabled_by_default(monkeypatch):
+    """With no TTL configured every call reaches the API."""
+    monkeypatch.delenv("ATLASSIAN_RESPONSE_CACHE_TTL", raising=False)
+    monkeypatch.setattr(response_cache, "_response_cache", None)
+    fetcher = _FakeFetcher()
+
+    fetcher.get_issue("TEST-1")
+    fetcher.get_issue("TEST-1")
+
+    assert fetcher.api.call_count == 2
+    assert response_cache.get_response_cache().stats()["enabled"] is False
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE_TTL", "120")
+    monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE_MAXSIZE", "10")
+    monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE_REVALIDATE_AFTER", "5")
+
+    cache = ResponseCache.from_env()
+
+    assert cache.enabled
+    assert (cache.ttl, cache.maxsize, cache.revalidate_after) == (120, 10, 5)
+
+
+def test_hits_and_argument_normalization(cache):
+    """Positional and keyword spellings of the same call share an entry."""
+    fetcher = _FakeFetcher()
+
+    first = fetcher.get_issue("TEST-1", ["summary"])
+    second = fetcher.get_issue(issue_key="TEST-1", fields=["summary"])
+    fetcher.get_issue("TEST-1", ["status"])
+
+    assert first == second
+    assert fetcher.api.call_count == 2
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+
+
+def test_callers_get_their_own_copies(cache):
+    """Modifying a returned response changes neither the cache nor other callers."""
+    fetcher = _FakeFetcher()
+
+    first = fetcher.get_issue("TEST-1")
+    first["args"] = "changed"
+    second = fetcher.get_issue("TEST-1")
+    second["extra"] = True
+
+    assert fetcher.get_issue("TEST-1") == {"args": ("get_issue", "TEST-1", None)}
+    assert fetcher.api.call_count == 1
+
+
+def test_entries_are_isolated_per_credentials(cache):
+    """Different credentials never share cached responses."""
+    alice = _FakeFetcher(token="alice")
+    bob = _FakeFetcher(token="bob")
+
+    alice.get_issue("TEST-1")
+    bob.get_issue("TEST-1")
+
+    assert alice.api.call_count == 1
+    assert bob.api.call_count == 1
+
+
+def test_write_invalidates_entity_and_searches_for_all_users(cache):
+    """A write drops the written issue and searches, but not other issues."""
+    alice = _FakeFetcher(token="alice")
+    bob = _FakeFetcher(token="bob")
+    alice.get_issue("TEST-1")
+    alice.get_issue("TEST-2")
+    bob.get_issue("TEST-1")
+    alice.search("project = TEST")
+
+    bob.update_issue("test-1")
+
+    alice.get_issue("TEST-1")
+    alice.get_issue("TEST-2")
+    alice.search("project = TEST")
+    bob.get_issue("TEST-1")
+    assert alice.api.call_count == 3 + 2  # TEST-1 and the search refetched
+    assert bob.api.call_count == 1 + 1 + 1  # read, write, refetch
+    assert cache.stats()["invalidations"] == 3
+
+
+def test_writes_on_other_instances_are_ignored(cache):
+    fetcher = _FakeFetcher()
+    other_instance = _FakeFetcher(url="https://other.example.com")
+    fetcher.get_issue("TEST-1")
+
+    other_instance.update_issue("TEST-1")
+    fetcher.get_issue("TEST-1")
+
+    assert fetcher.api.call_count == 1
+
+
+def test_empty_results_not_cached_when_requested(cache):
+    fetcher = _FakeFetcher()
+
+    fetcher.search("")
+    fetcher.search("")
+
+    assert cache.stats()["size"] == 0
+
+
+def test_revalidation(cache):
+    """Stale entries are served after a successful revalidation, else refetched."""
+    cache.revalidate_after = 0
+    fetcher = _FakeFetcher()
+    fetcher.get_issue("TEST-1")
+
+    fetcher.get_issue("TEST-1")
+    assert fetcher.api.call_count == 1
+    assert cache.stats()["revalidations"] == 1
+
+    fetcher.current = False
+    fetcher.get_issue("TEST-1")
+    assert fetcher.api.call_count == 2
+
+
+def test_revalidation_errors_count_as_stale(cache):
+    cache.revalidate_after = 0
+    fetcher = _FakeFetcher()
+    fetcher._is_current = MagicMock(side_effect=Exception("boom"))
+    fetcher.get_issue("TEST-1")
+
+    fetcher.get_issue("TEST-1")
+
+    assert fetcher.api.call_count == 2
+
+
+def test_failed_reads_are_not_cached(cache):
+    fetcher = _FakeFetcher()
+    fetcher.api.side_effect = [Exception("boom"), {"ok": True}]
+
+    with pytest.raises(Exception, match="boom"):
+        fetcher.get_issue("TEST-1")
+
+    assert fetcher.get_issue("TEST-1") == {"ok": True}
+
+
+def test_size_is_bounded():
+    cache = ResponseCache(maxsize=2, ttl=300, revalidate_after=300)
+    for i in range(5):
+        cache.put(("key", i), i, frozenset({("url", "kind", str(i))}))
+
+    assert cache.stats()["size"] == 2
+
+
+@pytest.mark.parametrize(
+    ("method", "args"),
+    [
+        (EpicsMixin.link_issue_to_epic, ("TEST-1", "EPIC-1")),
+        (EpicsMixin.update_epic_fields, ("TEST-1", {})),
+        (LinksMixin.create_issue_link, ({"type": {"name": "Blocks"}},)),
+        (LinksMixin.remove_issue_link, ("10000",)),
+        (AttachmentsMixin.upload_attachment, ("TEST-1", "missing.txt")),
+        (AttachmentsMixin.upload_attachments, ("TEST-1", [])),
+    ],
+)
+def test_jira_writes_invalidate_issue_and_searches(cache, method, args):
+    """Links, epic changes and uploads drop the cached issue and searches."""
+    fetcher = _FakeFetcher()
+    fetcher.get_issue("TEST-1")
+    fetcher.search("project = TEST")
+    writer = MagicMock(config=fetcher.config)
+
+    with contextlib.suppress(Exception):
+        method(writer, *args)
+    fetcher.get_issue("TEST-1")
+    fetcher.search("project = TEST")
+
+    assert fetcher.api.call_count == 4